@@ -26,7 +26,19 @@ setup(
         (f"lib/integreat-{root}", [os.path.join(root, f) for f in files])
         for root, _, files in os.walk("src/cms/static/")
     ]
-    + [("usr/lib/systemd/system/", ["systemd/integreat-cms@.service"])],
+    + [
+        (
+            "usr/lib/systemd/system/",
+            [
+                "systemd/integreat-cms@.service",
+                "systemd/integreat-cms-push-dispatcher.service",
+                "systemd/integreat-cms-push-scheduler.service",
+                "systemd/integreat-cms-region-duplicator.service",
+                "systemd/integreat-cms-statistics-import.service",
+                "systemd/integreat-cms-statistics-import.timer",
+            ],
+        )
+    ],
     install_requires=[
         "cffi",
         "Django~=2.2.13",
@@ -24,12 +24,12 @@ def languages(request, region_slug):
         result = list(
             map(
                 lambda l: {
-                    "id": l.language.id,
-                    "code": l.language.code,
-                    "native_name": l.language.name,
-                    "dir": l.language.text_direction,
+                    "id": l.id,
+                    "code": l.code,
+                    "native_name": l.native_name,
+                    "dir": l.text_direction,
                 },
-                region.language_tree_nodes.filter(active=True),
+                region.language_tree.active_languages,
             )
         )
         return JsonResponse(
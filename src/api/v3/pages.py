@@ -36,9 +36,18 @@ def transform_page(page_translation):
 def pages(request, region_slug, language_code):
     region = Region.get_current_region(request)
     result = []
-    for page in region.pages.all():
+    # Fetch the public translations and the latest translations (needed for the parents) of all pages at once
+    region_pages = list(
+        region.pages.with_translation(language_code).with_translation(
+            language_code, public=True
+        )
+    )
+    pages_by_id = {page.id: page for page in region_pages}
+    for page in region_pages:
         page_translation = page.get_public_translation(language_code)
         if page_translation:
+            if page.parent_id:
+                page.parent = pages_by_id[page.parent_id]
             result.append(transform_page(page_translation))
     return JsonResponse(
         result, safe=False
@@ -2,6 +2,7 @@
 Context processors pass additional variables to templates (see :ref:`context-processors`).
 """
 from cms.models import Region
+from cms.utils.region_utils import get_quick_access_regions
 
 
 def region_slug_processor(request):
@@ -9,7 +10,8 @@ def region_slug_processor(request):
     This context processor retrieves the current ``region`` parameter and passes it to the templates.
     Additionally, the ``other_regions``-variable contains all other regions which are available via quick access.
     Usually, these are the regions configured in each user's user profile, but if there are none set, we just list all
-    available regions, ordered by the ``last_updated`` attribute.
+    available regions, ordered by the ``last_updated`` attribute. The quick access regions are cached per user (see
+    :func:`~cms.utils.region_utils.get_quick_access_regions`).
 
     :param request: The current http request
     :type request: ~django.http.HttpRequest
@@ -18,13 +20,7 @@ def region_slug_processor(request):
     :rtype: dict
     """
     current_region = Region.get_current_region(request)
-    if request.user.is_authenticated and request.user.profile.regions.exists():
-        other_regions = request.user.profile.regions
-    else:
-        other_regions = Region.objects
-    if current_region:
-        other_regions = other_regions.exclude(slug=current_region.slug)
     return {
-        "other_regions": other_regions.order_by("-last_updated")[:10],
+        "other_regions": get_quick_access_regions(request.user, current_region),
         "region": current_region,
     }
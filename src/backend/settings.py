@@ -34,6 +34,128 @@ The URL to our GVZ (Gemeindeverzeichnis) API. This is used to automatically impo
 Default: ``True``
 
 Whether or not the GVZ (Gemeindeverzeichnis) API is enabled (see :mod:`gvz_api` for more information).
+
+.. setting:: GVZ_API_TIMEOUT
+
+``GVZ_API_TIMEOUT``
+-------------------
+
+Default: ``10``
+
+The timeout in seconds of requests to the GVZ API.
+
+.. setting:: GVZ_API_CACHE_TTL
+
+``GVZ_API_CACHE_TTL``
+---------------------
+
+Default: ``30 * 24 * 60 * 60`` (30 days)
+
+The number of seconds for which responses of the GVZ API are stored in the database before they are requested again
+(see :class:`~gvz_api.models.GvzCacheEntry`).
+
+.. setting:: GVZ_API_MAX_WORKERS
+
+``GVZ_API_MAX_WORKERS``
+-----------------------
+
+Default: ``8``
+
+The maximum number of concurrent requests to the GVZ API, e.g. when the details of the children of a region are fetched.
+
+.. setting:: XLIFF_UPLOAD_MAX_ENTRIES
+
+``XLIFF_UPLOAD_MAX_ENTRIES``
+----------------------------
+
+Default: ``1000``
+
+The maximum number of XLIFF files in an uploaded zip archive (see :mod:`cms.page_xliff_converter`).
+
+.. setting:: XLIFF_UPLOAD_MAX_SIZE
+
+``XLIFF_UPLOAD_MAX_SIZE``
+-------------------------
+
+Default: ``100 * 1024 * 1024`` (100 MiB)
+
+The maximum total uncompressed size in bytes of the XLIFF files in an uploaded zip archive.
+
+.. setting:: XLIFF_WORKER_PROCESSES
+
+``XLIFF_WORKER_PROCESSES``
+--------------------------
+
+Default: The number of CPUs, but at most ``4``
+
+The number of worker processes which are used to parse XLIFF files and to generate diffs of large XLIFF uploads.
+
+.. setting:: USER_REGIONS_CACHE_TTL
+
+``USER_REGIONS_CACHE_TTL``
+--------------------------
+
+Default: ``5 * 60`` (5 minutes)
+
+The number of seconds for which the quick access regions of a user are cached (see :mod:`cms.utils.region_utils`).
+The cache is invalidated when regions or region memberships change, but with a process-local cache backend, other
+processes only notice the change after this timeout. The region memberships which are used for permission checks are
+not cached across requests.
+
+.. setting:: LANGUAGE_TREE_CACHE_TTL
+
+``LANGUAGE_TREE_CACHE_TTL``
+---------------------------
+
+Default: ``5 * 60`` (5 minutes)
+
+The number of seconds for which the language trees of regions are cached (see :mod:`cms.utils.language_tree_utils`).
+The cache is invalidated in all processes when languages or language tree nodes change.
+
+.. setting:: CONFIGURATION_CACHE_TTL
+
+``CONFIGURATION_CACHE_TTL``
+---------------------------
+
+Default: ``60`` (1 minute)
+
+The maximum number of seconds for which a process uses its loaded
+:class:`~cms.models.config.configuration.Configuration` values (see :mod:`cms.utils.configuration_utils`). Changes which
+are saved via the model are noticed by all processes on their next request, this timeout only applies to changes which
+bypass the model signals (e.g. bulk updates).
+
+.. setting:: REVISION_RETENTION_COUNT
+
+``REVISION_RETENTION_COUNT``
+----------------------------
+
+Default: ``50``
+
+The number of latest revisions of each page, event and POI translation which are kept by the management command
+``archive_revisions`` (see :mod:`cms.utils.retention_utils`). Older revisions are moved to the
+:class:`~cms.models.revisions.archived_revision.ArchivedRevision` table. If ``None``, only
+:setting:`REVISION_RETENTION_DAYS` is applied.
+
+.. setting:: REVISION_RETENTION_DAYS
+
+``REVISION_RETENTION_DAYS``
+---------------------------
+
+Default: ``None``
+
+The number of days for which revisions are kept regardless of :setting:`REVISION_RETENTION_COUNT`. If
+:setting:`REVISION_RETENTION_COUNT` is ``None``, all older revisions are archived. If both settings are ``None``, no
+revisions are archived.
+
+.. setting:: REVISION_RETENTION_KEEP_PUBLIC
+
+``REVISION_RETENTION_KEEP_PUBLIC``
+----------------------------------
+
+Default: ``True``
+
+Whether public revisions which are no minor edits are kept regardless of their age. The latest revision and the latest
+public revision of each translation are always kept.
 """
 import os
 import logging
@@ -98,6 +220,8 @@ MIDDLEWARE = [
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "cms.middleware.RegionMiddleware",
+    "cms.middleware.TranslationLoaderMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
     "nplusone.ext.django.NPlusOneMiddleware",
@@ -319,6 +443,28 @@ COMPRESS_OFFLINE = True
 # GVZ (Gemeindeverzeichnis) API URL
 GVZ_API_URL = "https://gvz.integreat-app.de/api"
 GVZ_API_ENABLED = True
+GVZ_API_TIMEOUT = 10
+GVZ_API_CACHE_TTL = 30 * 24 * 60 * 60
+GVZ_API_MAX_WORKERS = 8
+
+# XLIFF import
+XLIFF_UPLOAD_MAX_ENTRIES = 1000
+XLIFF_UPLOAD_MAX_SIZE = 100 * 1024 * 1024
+XLIFF_WORKER_PROCESSES = min(os.cpu_count() or 1, 4)
+
+# Cache of the regions of users
+USER_REGIONS_CACHE_TTL = 5 * 60
+
+# Cache of the language trees of regions
+LANGUAGE_TREE_CACHE_TTL = 5 * 60
+
+# Maximum age of the configurations loaded by each process
+CONFIGURATION_CACHE_TTL = 60
+
+# Retention policy of old revisions
+REVISION_RETENTION_COUNT = 50
+REVISION_RETENTION_DAYS = None
+REVISION_RETENTION_KEEP_PUBLIC = True
 
 # Allow access to all domains by setting the following variable to TRUE
 CORS_ORIGIN_ALLOW_ALL = True
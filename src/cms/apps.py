@@ -8,6 +8,7 @@ from django.contrib.auth.signals import (
     user_logged_out,
     user_login_failed,
 )
+from django.db.models.signals import m2m_changed, post_delete, post_save
 from django.dispatch import receiver
 
 logger = logging.getLogger(__name__)
@@ -40,6 +41,69 @@ class CmsConfig(AppConfig):
                 "You are running the Integreat CMS in production mode. Change the SECRET_KEY in the settings.py!"
             )
             sys.exit(1)
+        # pylint: disable=import-outside-toplevel
+        from mptt.signals import node_moved
+        from .models import (
+            Configuration,
+            Language,
+            LanguageTreeNode,
+            Region,
+            UserProfile,
+        )
+
+        # Invalidate the cached regions of users when regions or region memberships change
+        post_save.connect(region_cache_callback, sender=Region)
+        post_delete.connect(region_cache_callback, sender=Region)
+        post_delete.connect(region_cache_callback, sender=UserProfile)
+        m2m_changed.connect(region_cache_callback, sender=UserProfile.regions.through)
+        # Invalidate the cached language trees when languages or language tree nodes change
+        for model in (Language, LanguageTreeNode):
+            post_save.connect(language_tree_cache_callback, sender=model)
+            post_delete.connect(language_tree_cache_callback, sender=model)
+        node_moved.connect(language_tree_cache_callback, sender=LanguageTreeNode)
+        # Reload the configurations when they change
+        post_save.connect(configuration_cache_callback, sender=Configuration)
+        post_delete.connect(configuration_cache_callback, sender=Configuration)
+
+
+def region_cache_callback(sender, **kwargs):  # pylint: disable=unused-argument
+    """
+    Invalidate the cached regions of all users (see :mod:`cms.utils.region_utils`)
+
+    :param sender: The model class which sent the signal
+    :type sender: type
+    """
+    # pylint: disable=import-outside-toplevel
+    from .utils.region_utils import invalidate_region_cache
+
+    invalidate_region_cache()
+
+
+def language_tree_cache_callback(sender, **kwargs):  # pylint: disable=unused-argument
+    """
+    Invalidate the cached language trees of all regions (see :mod:`cms.utils.language_tree_utils`)
+
+    :param sender: The model class which sent the signal
+    :type sender: type
+    """
+    # pylint: disable=import-outside-toplevel
+    from .utils.language_tree_utils import invalidate_language_tree_cache
+
+    invalidate_language_tree_cache()
+
+
+def configuration_cache_callback(sender, **kwargs):  # pylint: disable=unused-argument
+    """
+    Invalidate the loaded configurations of all processes (see :mod:`cms.utils.configuration_utils`). The version is
+    renewed in the same transaction, so other processes notice the change when it is committed.
+
+    :param sender: The model class which sent the signal
+    :type sender: type
+    """
+    # pylint: disable=import-outside-toplevel
+    from .utils.configuration_utils import invalidate_configuration_cache
+
+    invalidate_configuration_cache()
 
 
 authlog = logging.getLogger("auth")
@@ -0,0 +1,25 @@
+"""
+This module contains the possible status of region duplications:
+
+* ``PENDING``: The duplication is queued
+
+* ``RUNNING``: The duplication is in progress
+
+* ``DONE``: The duplication is finished
+
+* ``FAILED``: The duplication failed
+"""
+from django.utils.translation import ugettext_lazy as _
+
+
+PENDING = "PENDING"
+RUNNING = "RUNNING"
+DONE = "DONE"
+FAILED = "FAILED"
+
+CHOICES = (
+    (PENDING, _("Pending")),
+    (RUNNING, _("Running")),
+    (DONE, _("Done")),
+    (FAILED, _("Failed")),
+)
@@ -3,6 +3,13 @@ This module contains the possible modes for push notifications:
 
 * ``ONLY_AVAILABLE``: Send only available translations
 * ``USE_MAIN_LANGUAGE``: Use main language if no translation is available
+
+It also contains the possible delivery states of push notification translations:
+
+* ``PENDING``: The translation is queued for sending
+* ``SENDING``: The translation is currently sent by a dispatcher
+* ``SENT``: The translation was sent successfully
+* ``FAILED``: The translation could not be sent
 """
 from django.utils.translation import ugettext_lazy as _
 
@@ -14,3 +21,16 @@ PN_MODES = (
     (ONLY_AVAILABLE, _("Only send available translations")),
     (USE_MAIN_LANGUAGE, _("Use main language if no translation is available")),
 )
+
+
+PENDING = "PENDING"
+SENDING = "SENDING"
+SENT = "SENT"
+FAILED = "FAILED"
+
+DELIVERY_STATUS = (
+    (PENDING, _("Pending")),
+    (SENDING, _("Sending")),
+    (SENT, _("Sent")),
+    (FAILED, _("Failed")),
+)
@@ -10,6 +10,7 @@ from django.core.exceptions import PermissionDenied
 from django.shortcuts import redirect
 
 from .models import Region
+from .utils.region_utils import get_user_region_ids
 
 
 def staff_required(function):
@@ -52,7 +53,7 @@ def region_permission_required(function):
         if user.is_superuser or user.is_staff:
             return function(request, *args, **kwargs)
         region = Region.get_current_region(request)
-        if region in user.profile.regions.all():
+        if region and region.id in get_user_region_ids(user):
             return function(request, *args, **kwargs)
         raise PermissionDenied
 
@@ -6,7 +6,7 @@ from django.utils.translation import ugettext_lazy as _
 
 from ...constants import status
 from ...models import EventTranslation
-from ...utils.slug_utils import generate_unique_slug
+from ...utils.slug_utils import generate_unique_slug, save_with_unique_slug
 
 logger = logging.getLogger(__name__)
 
@@ -83,7 +83,7 @@ class EventTranslationForm(forms.ModelForm):
             event_translation.version = event_translation.version + 1
             event_translation.pk = None
 
-        event_translation.save()
+        save_with_unique_slug(self, "event", event_translation)
         return event_translation
 
     def clean_slug(self):
@@ -44,7 +44,11 @@ class LanguageTreeNodeForm(forms.ModelForm):
         super().__init__(*args, **kwargs)
 
         parent_queryset = region.language_tree_nodes
-        excluded_languages = region.languages.exclude(language_tree_nodes=self.instance)
+        excluded_language_ids = [
+            language.id
+            for language in region.languages
+            if language.id != self.instance.language_id
+        ]
 
         if self.instance.id:
             children = self.instance.get_descendants(include_self=True)
@@ -56,7 +60,7 @@ class LanguageTreeNodeForm(forms.ModelForm):
         self.fields["parent"].queryset = parent_queryset
         # limit possible languages to those which are not yet included in the tree
         self.fields["language"].queryset = Language.objects.exclude(
-            id__in=excluded_languages
+            id__in=excluded_language_ids
         )
 
     def save(self, commit=True):
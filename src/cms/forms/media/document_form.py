@@ -1,6 +1,8 @@
 from django import forms
+from django.db import transaction
+from django.utils.translation import ugettext_lazy as _
 
-from ...models import Document
+from ...models import Document, MediaBlob
 
 
 class DocumentForm(forms.ModelForm):
@@ -8,9 +10,40 @@ class DocumentForm(forms.ModelForm):
     Form for creating and modifying document objects
     """
 
+    document = forms.FileField(label=_("Document"))
+
     class Meta:
         model = Document
-        fields = (
-            "description",
-            "document",
-        )
+        fields = ("description",)
+
+    # pylint: disable=arguments-differ
+    def save(self, region=None):
+        """
+        Store the content of the uploaded file as blob (or reuse the existing blob with the same content) and save the
+        document referencing it. If the file of an existing document is replaced, its previous blob is released (or its
+        previous file is deleted if it was not converted to a blob yet).
+
+        :param region: The region of the document
+        :type region: ~cms.models.regions.region.Region
+
+        :return: The saved document
+        :rtype: ~cms.models.media.document.Document
+        """
+        uploaded_file = self.cleaned_data["document"]
+        document = super().save(commit=False)
+        previous_blob = document.blob if document.blob_id else None
+        legacy_file = document.document
+        with transaction.atomic():
+            document.blob = MediaBlob.store(uploaded_file)
+            document.name = uploaded_file.name
+            if legacy_file:
+                document.document = ""
+                transaction.on_commit(
+                    lambda: legacy_file.storage.delete(legacy_file.name)
+                )
+            if not document.id:
+                document.region = region
+            document.save()
+            if previous_blob and previous_blob != document.blob:
+                previous_blob.release()
+        return document
@@ -1,7 +1,7 @@
 from django import forms
 
 from ...models import OfferTemplate
-from ...utils.slug_utils import generate_unique_slug
+from ...utils.slug_utils import generate_unique_slug, save_with_unique_slug
 
 
 class OfferTemplateForm(forms.ModelForm):
@@ -16,6 +16,13 @@ class OfferTemplateForm(forms.ModelForm):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
+    # pylint: disable=arguments-differ
+    def save(self):
+        offer_template = super().save(commit=False)
+        save_with_unique_slug(self, "offer-template", offer_template)
+        self.save_m2m()
+        return offer_template
+
     def clean_slug(self):
         return generate_unique_slug(self, "offer-template")
 
@@ -9,6 +9,10 @@ from django.utils.translation import ugettext as _, get_language
 
 from ...constants import position
 from ...models import Page, Region
+from ...utils.translation_loader import (
+    get_first_translation,
+    get_translation_loader,
+)
 
 
 logger = logging.getLogger(__name__)
@@ -61,7 +65,7 @@ class ParentField(forms.ModelChoiceField):
     def label_from_instance(self, page):
         label = " 🡒 ".join(
             [
-                page.get_first_translation([get_language(), self.language.code]).title
+                get_first_translation(page, [get_language(), self.language.code]).title
                 for page in page.get_ancestors(include_self=True)
             ]
         )
@@ -78,7 +82,9 @@ class MirrorPageField(forms.ModelChoiceField):
     def label_from_instance(self, page):
         return " -> ".join(
             [
-                page_iter.best_language_title()
+                get_first_translation(
+                    page_iter, [get_language(), page.region.default_language.code]
+                ).title
                 for page_iter in page.get_ancestors(include_self=True)
             ]
         )
@@ -182,7 +188,7 @@ class PageForm(forms.ModelForm):
         if self.instance.mirrored_page:
             self.fields["mirrored_page"].queryset = Page.objects.filter(
                 region=self.instance.mirrored_page.region
-            )
+            ).select_related("region")
             self.fields["mirrored_page"].initial = self.instance.mirrored_page
             self.fields[
                 "mirrored_page_first"
@@ -194,6 +200,10 @@ class PageForm(forms.ModelForm):
         # add the language to the parent field to make sure the translated page titles are shown
         self.fields["parent"].language = language
         self.fields["parent"].queryset = parent_queryset
+        # load the titles of all pages of the pickers at once
+        get_translation_loader().register(self.region.pages.all())
+        if self.instance.mirrored_page:
+            get_translation_loader().register(self.fields["mirrored_page"].queryset)
 
     # pylint: disable=signature-differs
     def save(self, *args, **kwargs):
@@ -6,7 +6,7 @@ from django.utils.translation import ugettext_lazy as _
 
 from ...constants import status
 from ...models import PageTranslation
-from ...utils.slug_utils import generate_unique_slug
+from ...utils.slug_utils import generate_unique_slug, save_with_unique_slug
 
 
 logger = logging.getLogger(__name__)
@@ -81,7 +81,7 @@ class PageTranslationForm(forms.ModelForm):
         if not {"slug", "title", "text"}.isdisjoint(self.changed_data):
             page_translation.version = page_translation.version + 1
             page_translation.pk = None
-        page_translation.save()
+        save_with_unique_slug(self, "page", page_translation)
 
         return page_translation
 
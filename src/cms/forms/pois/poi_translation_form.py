@@ -6,7 +6,7 @@ from django.utils.translation import ugettext_lazy as _
 
 from ...constants import status
 from ...models import POITranslation
-from ...utils.slug_utils import generate_unique_slug
+from ...utils.slug_utils import generate_unique_slug, save_with_unique_slug
 
 
 logger = logging.getLogger(__name__)
@@ -85,7 +85,7 @@ class POITranslationForm(forms.ModelForm):
         ):
             poi_translation.version = poi_translation.version + 1
             poi_translation.pk = None
-        poi_translation.save()
+        save_with_unique_slug(self, "poi", poi_translation)
 
         return poi_translation
 
@@ -1,4 +1,6 @@
 from django import forms
+from django.utils import timezone
+from django.utils.translation import ugettext_lazy as _
 
 from ...models import PushNotification, PushNotificationTranslation
 
@@ -10,7 +12,48 @@ class PushNotificationForm(forms.ModelForm):
 
     class Meta:
         model = PushNotification
-        fields = ["channel", "mode"]
+        fields = ["channel", "mode", "scheduled_for"]
+        widgets = {
+            "scheduled_for": forms.DateTimeInput(
+                format="%Y-%m-%dT%H:%M", attrs={"type": "datetime-local"}
+            ),
+        }
+
+    def __init__(self, *args, **kwargs):
+        """
+        Initialize push notification form
+
+        :param user: The user who edits the push notification
+        :type user: ~django.contrib.auth.models.User
+        """
+        user = kwargs.pop("user", None)
+        super().__init__(*args, **kwargs)
+        # Scheduled push notifications are sent without further checks, so only users who can send them can schedule them
+        if user is None or not user.has_perm("cms.send_push_notifications"):
+            del self.fields["scheduled_for"]
+        else:
+            self.fields["scheduled_for"].input_formats = ["%Y-%m-%dT%H:%M"]
+
+    def clean_scheduled_for(self):
+        """
+        Validate that push notifications can only be scheduled in the future
+
+        :raises ~django.core.exceptions.ValidationError: If the date is in the past
+
+        :return: The validated date and time
+        :rtype: ~datetime.datetime
+        """
+        scheduled_for = self.cleaned_data["scheduled_for"]
+        if (
+            scheduled_for
+            and "scheduled_for" in self.changed_data
+            and scheduled_for < timezone.now()
+        ):
+            raise forms.ValidationError(
+                _("Push notifications cannot be scheduled in the past."),
+                code="invalid",
+            )
+        return scheduled_for
 
 
 class PushNotificationTranslationForm(forms.ModelForm):
@@ -1,12 +1,14 @@
 import logging
 
+from requests.exceptions import RequestException
+
 from django import forms
 from django.utils.translation import ugettext_lazy as _
-from django.apps import apps
 
-from gvz_api.utils import GvzRegion
-from ...models import Region, PageTranslation, LanguageTreeNode
-from ...utils.slug_utils import generate_unique_slug
+from gvz_api.utils import GvzRegion, get_gvz_api
+from ...models import Region, RegionDuplication
+from ...utils.duplication_utils import duplicate_language_tree
+from ...utils.slug_utils import generate_unique_slug, save_with_unique_slug
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +23,7 @@ class RegionForm(forms.ModelForm):
         empty_label=_("Do no import initial content"),
         required=False,
     )
+    only_latest_revisions = forms.BooleanField(required=False)
 
     class Meta:
         model = Region
@@ -37,6 +40,7 @@ class RegionForm(forms.ModelForm):
             "admin_mail",
             "statistics_enabled",
             "matomo_url",
+            "matomo_id",
             "matomo_token",
             "matomo_ssl_verify",
             "status",
@@ -60,8 +64,10 @@ class RegionForm(forms.ModelForm):
             not self.instance.id and self.cleaned_data["duplicated_region"]
         )
 
-        # Save region with the default method from ModelForm
-        region = super().save(*args, **kwargs)
+        # Save region and make sure its slug is still unique
+        region = super().save(commit=False)
+        save_with_unique_slug(self, "region", region)
+        self.save_m2m()
 
         if duplicate_region:
             source_region = self.cleaned_data["duplicated_region"]
@@ -70,21 +76,29 @@ class RegionForm(forms.ModelForm):
             )
             # Duplicate language tree
             duplicate_language_tree(source_region, region)
-            # Duplicate pages
-            duplicate_pages(source_region, region)
-            # Duplicate media content
-            duplicate_media(source_region, region)
+            # Queue the duplication of pages and media, which can take a while for big regions
+            RegionDuplication.objects.create(
+                source_region=source_region,
+                target_region=region,
+                only_latest_revisions=self.cleaned_data["only_latest_revisions"],
+            )
 
         return region
 
     def clean(self):
         cleaned_data = super().clean()
-        if apps.get_app_config("gvz_api").api_available:
-            gvz_region = GvzRegion(
-                region_name=cleaned_data["name"],
-                region_key=cleaned_data["common_id"],
-                region_type=cleaned_data["administrative_division"],
-            )
+        gvz_api = get_gvz_api()
+        if gvz_api:
+            try:
+                gvz_region = GvzRegion(
+                    region_name=cleaned_data["name"],
+                    region_key=cleaned_data["common_id"],
+                    region_type=cleaned_data["administrative_division"],
+                    api=gvz_api,
+                )
+            except RequestException as e:
+                logger.warning("GVZ API request failed: %s", e)
+                return cleaned_data
             if gvz_region.aliases and cleaned_data["aliases"] == "":
                 cleaned_data["aliases"] = gvz_region.aliases
             if gvz_region.longitude and cleaned_data["longitude"] == 0.0:
@@ -95,140 +109,3 @@ class RegionForm(forms.ModelForm):
 
     def clean_slug(self):
         return generate_unique_slug(self, "region")
-
-
-def duplicate_language_tree(
-    source_region, target_region, source_parent_id=None, target_parent=None
-):
-    """
-    Function to duplicate the language tree of one region to another.
-
-    Usage: duplicate_language_tree(source_region, target_region)
-
-    This is a recursive function to walk the whole language tree. It starts at root level with the default parent None.
-    The recursion is necessary because the new nodes need their correct (also duplicated) parent node.
-
-    :param source_region: The region from which the language tree should be duplicated
-    :type source_region: cms.models.regions.region.Region
-
-    :param target_region: The region to which the language tree should be added
-    :type target_region: cms.models.regions.region.Region
-
-    :param source_parent_id: The current parent node id of the recursion
-    :type source_parent_id: int
-
-    :param target_parent: The node of the target region which is the duplicate of the source parent node
-    :type target_parent: cms.models.pages.page.Page
-    """
-
-    # Iterate over all children of the current source parent, beginning with the root node
-    for node in LanguageTreeNode.objects.filter(
-        region=source_region, parent__id=source_parent_id
-    ).all():
-        # Store the source node id for the next iteration
-        source_node_id = node.pk
-        # Change the region and parent to its new values
-        node.region = target_region
-        node.parent = target_parent
-        # Delete the primary key to force an insert
-        node.pk = None
-        # Check if the resulting node is valid
-        node.full_clean()
-        # Save the duplicated node
-        node.save()
-        # Call the function recursively for all children of the current node
-        duplicate_language_tree(source_region, target_region, source_node_id, node)
-
-
-def duplicate_pages(
-    source_region, target_region, source_parent_id=None, target_parent=None, level=0
-):
-    """
-    Function to duplicate all pages of one region to another.
-
-    Usage: duplicate_pages(source_region, target_region)
-
-    This is a recursive function to walk the whole page tree. It starts at root level with the default parent None.
-    The recursion is necessary because the new pages need their correct (also duplicated) parent page.
-
-    :param source_region: The region from which the pages should be duplicated
-    :type source_region: cms.models.regions.region.Region
-
-    :param target_region: The region to which the pages should be added
-    :type target_region: cms.models.regions.region.Region
-
-    :param source_parent_id: The current parent page id of the recursion
-    :type source_parent_id: int
-
-    :param target_parent: The page of the target region which is the duplicate of the source parent page
-    :type target_parent: cms.models.pages.page.Page
-
-    :param level: recursion level to get a pretty log output
-    :type level: int
-    """
-
-    logger.info(
-        "%s Source parent %s started (target parent %s)",
-        "|  " * level + "├" + "─",
-        source_parent_id,
-        target_parent,
-    )
-
-    # At first, get all pages from the source region with a specific parent page
-    # As the parent will be None for the initial call, this returns all pages from the root level
-    for target_page in source_region.pages.filter(parent__id=source_parent_id):
-        logger.info(
-            "%s Source page %s started", "|  " * (level + 1) + "├" + "─", target_page
-        )
-        # Store the source page id into a buffer (if we store the whole object instance instead of only the id,
-        # it will also change when we change target_page, because both variables would reference the same object)
-        source_page_id = target_page.pk
-        # Set the parent of the new page to the previously created target parent
-        target_page.parent = target_parent
-        # Set the region of the new page to the target region
-        target_page.region = target_region
-        # Delete the primary key to duplicate the object instance instead of updating it
-        target_page.pk = None
-        # Check if the page is valid
-        target_page.full_clean()
-        # Save duplicated page
-        target_page.save()
-        # Clone all page translations of the source page
-        for page_translation in PageTranslation.objects.filter(page__id=source_page_id):
-            # Set the page of the source translation to the new page
-            page_translation.page = target_page
-            # Delete the primary key to duplicate the object instance instead of updating it
-            page_translation.pk = None
-            # Check if the page translation is valid
-            page_translation.full_clean()
-            # Save duplicated page translation
-            page_translation.save()
-            logger.info(
-                "%s Page translation %s finished",
-                "|  " * (level + 3) + "├" + "─",
-                page_translation,
-            )
-        # Recursively call this function with the current pages as new parents
-        duplicate_pages(
-            source_region, target_region, source_page_id, target_page, level + 2
-        )
-        logger.info(
-            "%s Source page %s finished (target page %s)",
-            "|  " * (level + 1) + "├" + "─",
-            source_page_id,
-            target_page,
-        )
-    logger.info(
-        "%s Source parent %s finished (target parent %s)",
-        "|  " * level + "├" + "─",
-        source_parent_id,
-        target_parent,
-    )
-
-
-# pylint: disable=unused-argument
-def duplicate_media(source_region, target_region):
-    """
-    Function to duplicate all media of one region to another.
-    """
-    # TODO: implement duplication of all media files
@@ -0,0 +1,3 @@
+"""
+This package contains custom management commands of the cms (see :doc:`django:howto/custom-management-commands`).
+"""
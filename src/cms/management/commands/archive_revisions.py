@@ -0,0 +1,85 @@
+"""
+Management command to enforce the retention policy of old revisions
+"""
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from ...utils.retention_utils import CONTENT_MODELS, archive_revisions
+
+
+class Command(BaseCommand):
+    """
+    Move old revisions of pages, events and POIs into the archive (see :mod:`~cms.utils.retention_utils`). The
+    defaults of the retention policy are taken from the settings. The command can be interrupted and run again at any
+    time.
+    """
+
+    help = "Archive old revisions of pages, events and POIs"
+
+    def add_arguments(self, parser):
+        """
+        Define the arguments of this command
+
+        :param parser: The argument parser
+        :type parser: ~django.core.management.base.CommandParser
+        """
+        parser.add_argument(
+            "--keep",
+            type=int,
+            default=settings.REVISION_RETENTION_COUNT,
+            help="The number of latest revisions of each translation which are kept",
+        )
+        parser.add_argument(
+            "--max-age-days",
+            type=int,
+            default=settings.REVISION_RETENTION_DAYS,
+            help="The number of days for which revisions are kept",
+        )
+        parser.add_argument(
+            "--archive-public",
+            action="store_true",
+            default=not settings.REVISION_RETENTION_KEEP_PUBLIC,
+            help="Also archive old public revisions which are no minor edits",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=100,
+            help="The number of translations which are archived in one transaction",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only count the revisions which would be archived",
+        )
+
+    def handle(self, *args, **options):
+        """
+        Archive the revisions of all content models
+
+        :param args: The positional arguments
+        :type args: list
+
+        :param options: The parsed command line options
+        :type options: dict
+        """
+        if options["keep"] is None and options["max_age_days"] is None:
+            self.stdout.write("No retention policy configured")
+            return
+        for content_model in CONTENT_MODELS:
+            archived = sum(
+                archive_revisions(
+                    content_model,
+                    keep_count=options["keep"],
+                    max_age_days=options["max_age_days"],
+                    keep_public=not options["archive_public"],
+                    batch_size=options["batch_size"],
+                    dry_run=options["dry_run"],
+                )
+            )
+            verbose_name = (
+                content_model.translations.field.model._meta.verbose_name_plural
+            )
+            self.stdout.write(
+                f"{verbose_name}: {'found' if options['dry_run'] else 'archived'} {archived} revisions"
+            )
@@ -0,0 +1,88 @@
+"""
+Management command to compact the existing revisions of pages
+"""
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Func, IntegerField, Sum
+from django.db.models.functions import Coalesce
+
+from ...models import PageTranslation
+from ...utils.revision_utils import compact_revisions
+
+
+class Command(BaseCommand):
+    """
+    Compact all revisions of pages except the latest revision and the latest public revision of each
+    translation (see :mod:`~cms.utils.revision_utils`). The command can be interrupted and run again at any time.
+    """
+
+    help = "Compress old page revisions"
+
+    def add_arguments(self, parser):
+        """
+        Define the arguments of this command
+
+        :param parser: The argument parser
+        :type parser: ~django.core.management.base.CommandParser
+        """
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=100,
+            help="The number of page translations which are compacted in one transaction",
+        )
+
+    def handle(self, *args, **options):
+        """
+        Compact the revisions of all page translations and report the storage size before and after
+
+        :param args: The positional arguments
+        :type args: list
+
+        :param options: The parsed command line options
+        :type options: dict
+        """
+        size_before = self.get_storage_size()
+        translations = list(
+            PageTranslation.objects.order_by("page_id", "language_id")
+            .values_list("page_id", "language_id")
+            .distinct()
+        )
+        batch_size = options["batch_size"]
+        compacted = 0
+        for start in range(0, len(translations), batch_size):
+            with transaction.atomic():
+                for page_id, language_id in translations[start : start + batch_size]:
+                    compacted += compact_revisions(
+                        PageTranslation, page_id, language_id
+                    )
+        self.stdout.write(
+            f"Compacted {compacted} revisions of {len(translations)} page translations "
+            f"({size_before} -> {self.get_storage_size()} bytes)"
+        )
+
+    @staticmethod
+    def get_storage_size():
+        """
+        Get the size of the full and the compressed texts of all page revisions
+
+        :return: The size in bytes
+        :rtype: int
+        """
+        return sum(
+            PageTranslation.objects.aggregate(
+                **{
+                    field: Coalesce(
+                        Sum(
+                            Func(
+                                field,
+                                function="OCTET_LENGTH",
+                                output_field=IntegerField(),
+                            )
+                        ),
+                        0,
+                    )
+                    for field in ("text", "compressed_text")
+                }
+            ).values()
+        )
@@ -0,0 +1,38 @@
+"""
+Management command to store the files of existing documents in blobs
+"""
+from django.core.management.base import BaseCommand
+
+from ...models import Document
+
+
+class Command(BaseCommand):
+    """
+    Store the files of all documents which were uploaded before blobs were introduced in content-addressed blobs (see
+    :meth:`~cms.models.media.document.Document.convert_to_blob`). Documents with the same content share one blob
+    afterwards. The command can be interrupted and run again at any time.
+    """
+
+    help = "Store the files of existing documents in blobs"
+
+    def handle(self, *args, **options):
+        """
+        Convert all documents which are not stored in a blob yet
+
+        :param args: The positional arguments
+        :type args: list
+
+        :param options: The parsed command line options
+        :type options: dict
+        """
+        converted = 0
+        missing = 0
+        for document in Document.objects.filter(blob=None).exclude(document=""):
+            try:
+                converted += document.convert_to_blob()
+            except FileNotFoundError:
+                missing += 1
+                self.stderr.write(f"The file {document.document.name} does not exist")
+        self.stdout.write(
+            f"Converted {converted} documents ({missing} files were missing)"
+        )
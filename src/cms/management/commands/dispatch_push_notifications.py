@@ -0,0 +1,60 @@
+"""
+Management command to process the dispatch queue of push notifications
+"""
+import time
+
+from django.core.management.base import BaseCommand
+
+from ...views.push_notifications.push_notification_dispatcher import (
+    dispatch_pending_deliveries,
+)
+
+
+class Command(BaseCommand):
+    """
+    Send queued push notifications. Multiple instances of this command can run in parallel.
+    """
+
+    help = "Send queued push notifications"
+
+    def add_arguments(self, parser):
+        """
+        Define the arguments of this command
+
+        :param parser: The argument parser
+        :type parser: ~django.core.management.base.CommandParser
+        """
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=50,
+            help="The maximum number of translations which are sent at once",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=5,
+            help="The number of seconds to wait when the queue is empty",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Exit as soon as the queue is empty",
+        )
+
+    def handle(self, *args, **options):
+        """
+        Process the queue until it is empty (with ``--once``) or forever
+
+        :param args: The positional arguments
+        :type args: list
+
+        :param options: The parsed command line options
+        :type options: dict
+        """
+        while True:
+            if dispatch_pending_deliveries(options["batch_size"]):
+                continue
+            if options["once"]:
+                return
+            time.sleep(options["interval"])
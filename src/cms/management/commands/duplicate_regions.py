@@ -0,0 +1,64 @@
+"""
+Management command to process the queue of region duplications
+"""
+import time
+
+from django.core.management.base import BaseCommand
+
+from ...utils.duplication_utils import run_pending_region_duplication
+
+
+class Command(BaseCommand):
+    """
+    Duplicate the pages and media of newly created regions. Multiple instances of this command can run in parallel.
+    """
+
+    help = "Duplicate the content of queued regions"
+
+    def add_arguments(self, parser):
+        """
+        Define the arguments of this command
+
+        :param parser: The argument parser
+        :type parser: ~django.core.management.base.CommandParser
+        """
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="The number of page translations which are inserted at once",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=5,
+            help="The number of seconds to wait when the queue is empty",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Exit as soon as the queue is empty",
+        )
+
+    def handle(self, *args, **options):
+        """
+        Process the queue until it is empty (with ``--once``) or forever
+
+        :param args: The positional arguments
+        :type args: list
+
+        :param options: The parsed command line options
+        :type options: dict
+        """
+        while True:
+            duplication = run_pending_region_duplication(options["batch_size"])
+            if duplication:
+                duplication.refresh_from_db()
+                self.stdout.write(
+                    f"{duplication.source_region.slug} -> {duplication.target_region.slug}: "
+                    f"{duplication.get_status_display()} ({duplication.progress}/{duplication.total})"
+                )
+                continue
+            if options["once"]:
+                return
+            time.sleep(options["interval"])
@@ -0,0 +1,84 @@
+"""
+Management command to export the pages of a region to XLIFF files for multiple target languages at once.
+This is intended for big regions whose export would take too long to be executed within a request.
+"""
+import logging
+import os
+
+from django.core.management.base import BaseCommand, CommandError
+
+from ...models import Language, Region
+from ...page_xliff_converter import PageXliffHelper
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """
+    Export the pages of a region to a zip file containing XLIFF files for all (or the given) target languages
+    """
+
+    help = "Export the pages of a region to XLIFF files for multiple target languages"
+
+    def add_arguments(self, parser):
+        """
+        Define the arguments of this command
+
+        :param parser: The argument parser
+        :type parser: ~django.core.management.base.CommandParser
+        """
+        parser.add_argument("region_slug", help="The slug of the region")
+        parser.add_argument(
+            "--languages",
+            nargs="+",
+            metavar="LANGUAGE_CODE",
+            help="The codes of the target languages (default: all except the root language)",
+        )
+        parser.add_argument(
+            "--pages",
+            nargs="+",
+            type=int,
+            metavar="PAGE_ID",
+            help="The ids of the pages (default: all non-archived pages)",
+        )
+        parser.add_argument(
+            "--output", help="The path of the zip file (default: a new file)"
+        )
+
+    def handle(self, *args, **options):
+        """
+        Execute the export
+
+        :param args: The positional arguments
+        :type args: list
+
+        :param options: The parsed command line options
+        :type options: dict
+
+        :raises ~django.core.management.base.CommandError: If the region or a language does not exist
+        """
+        region = Region.objects.filter(slug=options["region_slug"]).first()
+        if region is None:
+            raise CommandError(f'Region "{options["region_slug"]}" does not exist.')
+        target_languages = None
+        if options["languages"]:
+            target_languages = list(
+                Language.objects.filter(code__in=options["languages"])
+            )
+            unknown_codes = set(options["languages"]) - {
+                language.code for language in target_languages
+            }
+            if unknown_codes:
+                raise CommandError(
+                    f"Unknown languages: {', '.join(sorted(unknown_codes))}"
+                )
+        pages = region.pages.filter(archived=False)
+        if options["pages"]:
+            pages = pages.filter(id__in=options["pages"])
+        zip_path = PageXliffHelper().pages_to_zipped_multilingual_xliffs(
+            region,
+            pages,
+            target_languages,
+            os.path.abspath(options["output"]) if options["output"] else None,
+        )
+        self.stdout.write(zip_path)
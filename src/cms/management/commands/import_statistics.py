@@ -0,0 +1,88 @@
+"""
+Management command to import the visitor statistics of all regions from Matomo
+"""
+from datetime import date, timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from requests.exceptions import RequestException
+
+from ...models import Region
+from ...views.statistics.matomo_api_manager import MatomoException
+from ...views.statistics.statistics_importer import import_visitor_counts
+
+
+class Command(BaseCommand):
+    """
+    Import the daily visitor counts of all regions with enabled statistics. Only days which have not been imported yet
+    are fetched, so this command can be run regularly (e.g. by a daily cronjob).
+    """
+
+    help = "Import the daily visitor counts of all regions from Matomo"
+
+    def add_arguments(self, parser):
+        """
+        Define the arguments of this command
+
+        :param parser: The argument parser
+        :type parser: ~django.core.management.base.CommandParser
+        """
+        parser.add_argument(
+            "--region",
+            dest="region_slugs",
+            action="append",
+            help="The slug of a region which should be imported (can be given multiple times)",
+        )
+        parser.add_argument(
+            "--end-date",
+            type=date.fromisoformat,
+            default=date.today() - timedelta(days=1),
+            help="The last day which should be imported in ISO format (defaults to yesterday)",
+        )
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=365,
+            help="The maximum number of days which are imported for regions without statistics",
+        )
+        parser.add_argument(
+            "--chunk-days",
+            type=int,
+            default=31,
+            help="The maximum number of days which are requested from Matomo at once",
+        )
+
+    def handle(self, *args, **options):
+        """
+        Import the statistics of the selected regions. Errors of single regions do not abort the import of the others.
+
+        :param args: The positional arguments
+        :type args: list
+
+        :param options: The parsed command line options
+        :type options: dict
+
+        :raises ~django.core.management.base.CommandError: If the import of at least one region failed
+        """
+        regions = Region.objects.filter(
+            statistics_enabled=True, matomo_id__isnull=False
+        ).exclude(matomo_url="")
+        if options["region_slugs"]:
+            regions = regions.filter(slug__in=options["region_slugs"])
+        failed_regions = []
+        for region in regions:
+            try:
+                imported = import_visitor_counts(
+                    region,
+                    end_date=options["end_date"],
+                    max_days=options["days"],
+                    chunk_days=options["chunk_days"],
+                )
+            except (RequestException, MatomoException) as e:
+                self.stderr.write(f"{region.slug}: {e}")
+                failed_regions.append(region.slug)
+                continue
+            self.stdout.write(f"{region.slug}: {imported}")
+        if failed_regions:
+            raise CommandError(
+                f"The import of the following regions failed: {', '.join(failed_regions)}"
+            )
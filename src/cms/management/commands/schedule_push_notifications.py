@@ -0,0 +1,64 @@
+"""
+Management command to hand scheduled push notifications to the dispatch queue when they are due
+"""
+import time
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from ...views.push_notifications.push_notification_dispatcher import (
+    enqueue_due_push_notifications,
+    get_next_scheduled_date,
+)
+
+
+class Command(BaseCommand):
+    """
+    Queue scheduled push notifications as soon as they are due. Instead of polling all push notifications, the
+    scheduler sleeps until the next scheduled date (but at most ``--max-interval`` seconds, so newly scheduled push
+    notifications are noticed). Multiple instances of this command can run in parallel.
+    """
+
+    help = "Queue scheduled push notifications when they are due"
+
+    def add_arguments(self, parser):
+        """
+        Define the arguments of this command
+
+        :param parser: The argument parser
+        :type parser: ~django.core.management.base.CommandParser
+        """
+        parser.add_argument(
+            "--max-interval",
+            type=float,
+            default=60,
+            help="The maximum number of seconds to sleep",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Exit after queueing the push notifications which are due now",
+        )
+
+    def handle(self, *args, **options):
+        """
+        Queue due push notifications and sleep until the next one is due
+
+        :param args: The positional arguments
+        :type args: list
+
+        :param options: The parsed command line options
+        :type options: dict
+        """
+        while True:
+            enqueue_due_push_notifications()
+            if options["once"]:
+                return
+            delay = options["max_interval"]
+            next_scheduled_date = get_next_scheduled_date()
+            if next_scheduled_date is not None:
+                delay = min(
+                    delay,
+                    max(0, (next_scheduled_date - timezone.now()).total_seconds()),
+                )
+            time.sleep(delay)
@@ -0,0 +1,89 @@
+"""
+Django middlewares can be used to process each request before and after the view is executed.
+
+For more information, see :doc:`topics/http/middleware`.
+"""
+from .models import Region
+from .utils.translation_loader import TranslationLoader, current_translation_loader
+
+
+class RegionMiddleware:
+    """
+    This middleware resolves the current region once per request and attaches it to the request as ``request.region``,
+    so the view decorators, the views and the context processors do not query it again (see
+    :meth:`~cms.models.regions.region.Region.get_current_region`).
+    """
+
+    def __init__(self, get_response):
+        """
+        Initialize the middleware
+
+        :param get_response: The next middleware or the view
+        :type get_response: ~collections.abc.Callable
+        """
+        self.get_response = get_response
+
+    def __call__(self, request):
+        """
+        Process the request
+
+        :param request: The current request
+        :type request: ~django.http.HttpRequest
+
+        :return: The response
+        :rtype: ~django.http.HttpResponse
+        """
+        return self.get_response(request)
+
+    # pylint: disable=unused-argument
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        """
+        Resolve the current region after the url was resolved and before the view is called
+
+        :param request: The current request
+        :type request: ~django.http.HttpRequest
+
+        :param view_func: The view function
+        :type view_func: ~collections.abc.Callable
+
+        :param view_args: The positional arguments of the view
+        :type view_args: list
+
+        :param view_kwargs: The keyword arguments of the view
+        :type view_kwargs: dict
+
+        :raises ~django.http.Http404: If the requested region does not exist
+        """
+        request.region = Region.get_current_region(request)
+
+
+class TranslationLoaderMiddleware:
+    """
+    This middleware installs a new :class:`~cms.utils.translation_loader.TranslationLoader` for each request, so the
+    translations which are needed by the template tags are loaded in batches and only once per request.
+    """
+
+    def __init__(self, get_response):
+        """
+        Initialize the middleware
+
+        :param get_response: The next middleware or the view
+        :type get_response: ~collections.abc.Callable
+        """
+        self.get_response = get_response
+
+    def __call__(self, request):
+        """
+        Process the request with a new translation loader
+
+        :param request: The current request
+        :type request: ~django.http.HttpRequest
+
+        :return: The response
+        :rtype: ~django.http.HttpResponse
+        """
+        token = current_translation_loader.set(TranslationLoader())
+        try:
+            return self.get_response(request)
+        finally:
+            current_translation_loader.reset(token)
@@ -3,6 +3,7 @@ This package contains all data models of the Integreat CMS.
 Please refer to :mod:`django.db.models` for general information about Django models.
 """
 
+from .config.cache_version import CacheVersion
 from .config.configuration import Configuration
 
 from .events.event import Event
@@ -23,7 +24,9 @@ from .feedback.search_result_feedback import SearchResultFeedback
 
 from .languages.language import Language
 from .languages.language_tree_node import LanguageTreeNode
+from .languages.translation_memory_segment import TranslationMemorySegment
 
+from .media.media_blob import MediaBlob
 from .media.document import Document
 
 from .pages.page import Page
@@ -37,8 +40,14 @@ from .push_notifications.push_notification import PushNotification
 from .push_notifications.push_notification_translation import (
     PushNotificationTranslation,
 )
+from .push_notifications.push_notification_delivery import PushNotificationDelivery
 
 from .regions.region import Region
+from .regions.region_duplication import RegionDuplication
+
+from .revisions.archived_revision import ArchivedRevision
+
+from .statistics.visitor_count import VisitorCount
 
 from .users.organization import Organization
 from .users.user_profile import UserProfile
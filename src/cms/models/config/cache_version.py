@@ -0,0 +1,20 @@
+from django.db import models
+
+
+class CacheVersion(models.Model):
+    """
+    The CacheVersion model stores the current versions of process-local caches in the database, so all processes notice
+    when a cache is invalidated (see :mod:`cms.utils.cache_version_utils`).
+
+    :param id: The database id of the cache version
+    :param key: The key of the cache
+    :param version: The current version of the cache (a new random value whenever the cache is invalidated)
+    :param last_updated: The date and time when the cache was last invalidated
+    """
+
+    key = models.CharField(max_length=100, unique=True)
+    version = models.CharField(max_length=32)
+    last_updated = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        default_permissions = ()
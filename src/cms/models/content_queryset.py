@@ -0,0 +1,108 @@
+"""
+This module contains the QuerySet methods which are shared by all content models
+(:class:`~cms.models.pages.page.Page`, :class:`~cms.models.events.event.Event` and :class:`~cms.models.pois.poi.POI`).
+"""
+from django.db import models
+from django.db.models import Prefetch
+from mptt.querysets import TreeQuerySet
+
+from ..constants import status
+
+
+def get_translation_attribute(language_code, public=False):
+    """
+    Get the name of the attribute which contains the translation prefetched by
+    :meth:`ContentQuerySet.with_translation`
+
+    :param language_code: The code of the requested language
+    :type language_code: str
+
+    :param public: Whether the public translation was requested
+    :type public: bool
+
+    :return: The attribute name
+    :rtype: str
+    """
+    return f"_{'public' if public else 'latest'}_translation_{language_code}"
+
+
+def get_prefetched_translation(instance, language_code, public=False):
+    """
+    Get a translation which was prefetched by :meth:`ContentQuerySet.with_translation`
+
+    :param instance: The content object
+    :type instance: ~django.db.models.Model
+
+    :param language_code: The code of the requested language
+    :type language_code: str
+
+    :param public: Whether the public translation was requested
+    :type public: bool
+
+    :return: A list containing the translation, an empty list if the object has no such translation or ``None`` if the
+             translation was not prefetched
+    :rtype: list
+    """
+    return getattr(instance, get_translation_attribute(language_code, public), None)
+
+
+class ContentQuerySet(models.QuerySet):
+    """
+    QuerySet for content models with translations
+    """
+
+    def with_translation(self, language_code, public=False):
+        """
+        Prefetch the latest translation (or the latest public translation) of all objects in the requested language.
+        The translations of all objects are fetched with a single query which selects the latest matching revision per
+        object. Afterwards, ``get_translation()`` and ``get_public_translation()`` of the objects return the prefetched
+        translation without additional queries.
+
+        :param language_code: The code of the requested language
+        :type language_code: str
+
+        :param public: Whether only public translations should be considered
+        :type public: bool
+
+        :return: The QuerySet with the prefetched translations
+        :rtype: ~django.db.models.query.QuerySet
+        """
+        related_field = self.model.translations.field
+        translations = related_field.model.objects.filter(
+            language__code=language_code
+        ).select_related("language")
+        if public:
+            translations = translations.filter(status=status.PUBLIC)
+        # Ordering by the relation would expand to the ordering of the content model, so the column is used instead
+        translations = translations.order_by(
+            related_field.attname, "-version"
+        ).distinct(related_field.attname)
+        return self.prefetch_related(
+            Prefetch(
+                "translations",
+                queryset=translations,
+                to_attr=get_translation_attribute(language_code, public),
+            )
+        )
+
+
+class PageQuerySet(ContentQuerySet, TreeQuerySet):
+    """
+    QuerySet for page trees with translations
+    """
+
+
+class TranslationQuerySet(models.QuerySet):
+    """
+    QuerySet for the translations of content models
+    """
+
+    def without_content(self):
+        """
+        Defer the large text columns of the translations (see ``content_fields`` of the translation model). This is
+        meant for list views and tree pickers, which only show titles and the status of the translations.
+
+        :return: The QuerySet without the content fields
+        :rtype: ~django.db.models.query.QuerySet
+        """
+        return self.defer(*self.model.content_fields)
@@ -4,8 +4,10 @@ from dateutil.rrule import weekday, rrule, DAILY, WEEKLY, MONTHLY, YEARLY
 from django.db import models
 
 from .recurrence_rule import RecurrenceRule
+from ..content_queryset import ContentQuerySet, get_prefetched_translation
 from ..pois.poi import POI
-from ..regions.region import Region, Language
+from ..languages.language import Language
+from ..regions.region import Region
 from ...constants import status
 
 
@@ -35,6 +37,8 @@ class Event(models.Model):
     :param feedback: The feedback to this event
     """
 
+    objects = ContentQuerySet.as_manager()
+
     region = models.ForeignKey(Region, related_name="events", on_delete=models.CASCADE)
     location = models.ForeignKey(
         POI, related_name="events", on_delete=models.PROTECT, null=True, blank=True
@@ -105,6 +109,9 @@ class Event(models.Model):
                  if no translation exists
         :rtype: ~cms.models.events.event_translation.EventTranslation
         """
+        prefetched = get_prefetched_translation(self, language_code)
+        if prefetched is not None:
+            return next(iter(prefetched), None)
         return self.translations.filter(language__code=language_code).first()
 
     def get_occurrences(self, start, end):
@@ -185,6 +192,9 @@ class Event(models.Model):
         :return: The public translation of an event
         :rtype: ~cms.models.events.event_translation.EventTranslation
         """
+        prefetched = get_prefetched_translation(self, language_code, public=True)
+        if prefetched is not None:
+            return next(iter(prefetched), None)
         return self.translations.filter(
             language__code=language_code,
             status=status.PUBLIC,
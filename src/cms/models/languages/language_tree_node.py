@@ -1,11 +1,12 @@
 from mptt.fields import TreeForeignKey
 from mptt.models import MPTTModel, raise_if_unsaved
 
-from django.db import models
+from django.db import models, transaction
 from django.utils import timezone
 
 from .language import Language
 from ..regions.region import Region
+from ..tree_manager import LockingTreeManager
 
 
 class LanguageTreeNode(MPTTModel):
@@ -39,6 +40,8 @@ class LanguageTreeNode(MPTTModel):
     :param children: The children of this language tree node
     """
 
+    objects = LockingTreeManager()
+
     language = models.ForeignKey(
         Language, related_name="language_tree_nodes", on_delete=models.PROTECT
     )
@@ -108,9 +111,9 @@ class LanguageTreeNode(MPTTModel):
         Counts how many ancestors the node has. If the node is the root node, its depth is `0`.
 
         :return: The depth of this language node
-        :rtype: str
+        :rtype: int
         """
-        return len(self.get_ancestors())
+        return self.level
 
     # Explicitly define functions to show documentation of base model
     @raise_if_unsaved
@@ -154,6 +157,20 @@ class LanguageTreeNode(MPTTModel):
     def move_to(self, target, position="first-child"):
         return super().move_to(target, position)
 
+    def save(self, *args, **kwargs):
+        """
+        Save the node in one transaction, so the tree id of a new root node stays locked until it is inserted (see
+        :class:`~cms.models.tree_manager.LockingTreeManager`).
+
+        :param args: The supplied arguments
+        :type args: list
+
+        :param kwargs: The supplied keyword arguments
+        :type kwargs: dict
+        """
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+
     def __str__(self):
         """
         This overwrites the default Python __str__ method which would return <LanguageTreeNode object at 0xDEADBEEF>
@@ -0,0 +1,68 @@
+from django.db import models
+
+from .language import Language
+
+
+class TranslationMemorySegment(models.Model):
+    """
+    Data model representing a previously translated segment (usually a paragraph or a title) of content. The
+    translation memory is filled during the XLIFF import and is used to pre-fill the targets of exported segments and
+    to exclude already translated segments from translation.
+
+    :param id: The database id of the segment
+    :param source_hash: A hash of the source text which identifies the segment per language pair
+    :param source_text: The text of the segment in the source language
+    :param target_text: The translated text of the segment
+    :param created_date: The date and time when the segment was created
+    :param last_updated: The date and time when the segment was last updated
+
+    Relationship fields:
+
+    :param source_language: The language of the source text (related name: ``source_translation_memory_segments``)
+    :param target_language: The language of the translated text (related name: ``target_translation_memory_segments``)
+    """
+
+    source_language = models.ForeignKey(
+        Language,
+        related_name="source_translation_memory_segments",
+        on_delete=models.CASCADE,
+    )
+    target_language = models.ForeignKey(
+        Language,
+        related_name="target_translation_memory_segments",
+        on_delete=models.CASCADE,
+    )
+    source_hash = models.CharField(max_length=16)
+    source_text = models.TextField()
+    target_text = models.TextField()
+    created_date = models.DateTimeField(auto_now_add=True)
+    last_updated = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        """
+        This overwrites the default Python __str__ method which would return <TranslationMemorySegment object at 0xDEADBEEF>
+
+        :return: The string representation of the segment with information about the most important fields
+        :rtype: str
+        """
+        return "(id: {}, {} -> {}, hash: {})".format(
+            self.id,
+            self.source_language.code,
+            self.target_language.code,
+            self.source_hash,
+        )
+
+    class Meta:
+        """
+        This class contains additional meta configuration of the model class, see the
+        `official Django docs <https://docs.djangoproject.com/en/2.2/ref/models/options/>`_ for more information.
+
+        :param unique_together: There can be only one translation of a segment per language pair
+        :type unique_together: tuple
+
+        :param default_permissions: The default permissions for this model
+        :type default_permissions: tuple
+        """
+
+        unique_together = (("source_language", "target_language", "source_hash"),)
+        default_permissions = ()
@@ -1,3 +1,4 @@
 """
-This package contains only the :class:`~cms.models.media.document.Document` model.
+This package contains the :class:`~cms.models.media.document.Document` model and the
+:class:`~cms.models.media.media_blob.MediaBlob` model which stores the content of documents.
 """
@@ -1,23 +1,86 @@
-from django.db import models
+import os
+
+from django.core.files import File
+from django.db import models, transaction
+
+from .media_blob import MediaBlob
+from ..regions.region import Region
 
 
 class Document(models.Model):
     """
-    The Document model is used to store meta-data about files which are uploaded to the CMS.
+    The Document model is used to store meta-data about files which are uploaded to the CMS. The content of the file
+    is stored in a :class:`~cms.models.media.media_blob.MediaBlob` which is shared by all documents with the same
+    content. Documents which were uploaded before blobs were introduced still store their file in ``document`` until
+    they are converted with the management command ``convert_documents``.
 
     :param id: The database id of the document
+    :param name: The original file name of the document
     :param description: The description of the document
-    :param document: The actual document file
+    :param document: The file of a document which is not converted to a blob yet (empty for all other documents)
     :param uploaded_at: The date and time when the document was uploaded
+
+    Relationship fields:
+
+    :param region: The region of the document (related name: ``documents``, documents without region are shared
+                   between all regions)
+    :param blob: The blob containing the content of the document (related name: ``documents``)
     """
 
+    region = models.ForeignKey(
+        Region,
+        null=True,
+        blank=True,
+        related_name="documents",
+        on_delete=models.CASCADE,
+    )
+    name = models.CharField(max_length=255, default="")
     description = models.CharField(max_length=255, blank=True)
-    document = models.FileField(upload_to="")
+    document = models.FileField(upload_to="", blank=True)
+    blob = models.ForeignKey(
+        MediaBlob,
+        null=True,
+        blank=True,
+        related_name="documents",
+        on_delete=models.PROTECT,
+    )
     uploaded_at = models.DateTimeField(auto_now_add=True)
 
+    @property
+    def file(self):
+        """
+        The actual document file
+
+        :return: The file of the blob (or the file of the document if it is not converted to a blob yet)
+        :rtype: ~django.db.models.fields.files.FieldFile
+        """
+        return self.blob.file if self.blob_id else self.document
+
+    def convert_to_blob(self):
+        """
+        Store the file of a document which was uploaded before blobs were introduced in a blob. The previous file is
+        deleted after the current transaction is committed.
+
+        :return: Whether the document was converted
+        :rtype: bool
+        """
+        if self.blob_id or not self.document:
+            return False
+        legacy_file = self.document
+        legacy_name = legacy_file.name
+        with transaction.atomic():
+            with legacy_file.open("rb") as file:
+                self.blob = MediaBlob.store(File(file, name=legacy_name))
+            self.name = self.name or os.path.basename(legacy_name)
+            self.document = ""
+            self.save(update_fields=["blob", "name", "document"])
+            if not Document.objects.filter(document=legacy_name).exists():
+                transaction.on_commit(lambda: legacy_file.storage.delete(legacy_name))
+        return True
+
     def delete(self, using=None, keep_parents=False):
         """
-        Deletes both the database entry and the actual file of a document.
+        Deletes the database entry of a document and its blob if no other document references the same content.
 
         :param using: The alias of the database which should be used, defaults to ``DEFAULT_DB_ALIAS``
         :type using: str, optional
@@ -29,8 +92,16 @@ class Document(models.Model):
         :return: The number of objects deleted and a dictionary with the number of deletions per object type.
         :rtype: tuple ( int, dict )
         """
-        self.document.delete()
-        super().delete(using=using, keep_parents=keep_parents)
+        with transaction.atomic(using=using):
+            deleted = super().delete(using=using, keep_parents=keep_parents)
+            if self.blob_id:
+                self.blob.release()
+            elif self.document:
+                legacy_file = self.document
+                transaction.on_commit(
+                    lambda: legacy_file.storage.delete(legacy_file.name)
+                )
+        return deleted
 
     def __str__(self):
         """
@@ -39,7 +110,7 @@ class Document(models.Model):
         :return: The string representation (in this case the filename) of the document
         :rtype: str
         """
-        return self.document.name
+        return self.name or os.path.basename(self.document.name)
 
     class Meta:
         """
@@ -0,0 +1,110 @@
+import hashlib
+import os
+
+from django.db import IntegrityError, models, transaction
+
+
+class MediaBlob(models.Model):
+    """
+    The MediaBlob model is used to store the content of uploaded files exactly once. Blobs are addressed by the SHA-256
+    hash of their content, so identical files which are uploaded multiple times or duplicated to other regions share
+    the same file on disk. The documents referencing a blob are counted via the ``documents`` relation and the blob is
+    deleted together with its last reference.
+
+    :param id: The database id of the blob
+    :param sha256: The hex digest of the SHA-256 hash of the file content
+    :param file: The stored file (located at ``blobs/<first two hash characters>/<hash><extension>``)
+    :param size: The size of the file in bytes
+    :param created_date: The date and time when the blob was stored
+
+    Reverse relationships:
+
+    :param documents: All documents referencing this blob
+    """
+
+    sha256 = models.CharField(max_length=64, unique=True)
+    file = models.FileField(upload_to="")
+    size = models.PositiveIntegerField()
+    created_date = models.DateTimeField(auto_now_add=True)
+
+    @classmethod
+    def store(cls, uploaded_file):
+        """
+        Get the blob of the given file content or store it if it does not exist yet. The blob is locked until the end
+        of the current transaction, so it cannot be deleted before the new reference is saved.
+
+        :param uploaded_file: The uploaded file
+        :type uploaded_file: ~django.core.files.uploadedfile.UploadedFile
+
+        :return: The blob containing the file content
+        :rtype: ~cms.models.media.media_blob.MediaBlob
+        """
+        sha256 = hashlib.sha256()
+        for chunk in uploaded_file.chunks():
+            sha256.update(chunk)
+        digest = sha256.hexdigest()
+        blob = cls.objects.select_for_update().filter(sha256=digest).first()
+        if blob:
+            return blob
+        extension = os.path.splitext(uploaded_file.name)[1].lower()
+        blob = cls(sha256=digest, size=uploaded_file.size)
+        blob.file.save(
+            f"blobs/{digest[:2]}/{digest}{extension}", uploaded_file, save=False
+        )
+        try:
+            with transaction.atomic():
+                blob.save()
+        except IntegrityError:
+            # The same content was stored concurrently
+            blob.file.delete(save=False)
+            blob = cls.objects.select_for_update().get(sha256=digest)
+        return blob
+
+    def release(self):
+        """
+        Delete the blob and its file if it is not referenced by any document anymore. The file is removed after the
+        current transaction is committed, so it is kept if the deletion is rolled back.
+
+        :return: Whether the blob was deleted
+        :rtype: bool
+        """
+        with transaction.atomic():
+            if (
+                not MediaBlob.objects.select_for_update().filter(id=self.id).exists()
+                or self.documents.exists()
+            ):
+                return False
+            self.delete()
+            transaction.on_commit(lambda: self.file.storage.delete(self.file.name))
+        return True
+
+    @classmethod
+    def release_unreferenced(cls):
+        """
+        Delete all blobs which are not referenced by any document anymore (e.g. after the documents of a region were
+        deleted in bulk)
+
+        :return: The number of deleted blobs
+        :rtype: int
+        """
+        return sum(blob.release() for blob in cls.objects.filter(documents=None))
+
+    def __str__(self):
+        """
+        This overwrites the default Python __str__ method which would return <MediaBlob object at 0xDEADBEEF>
+
+        :return: The string representation (in this case the hash) of the blob
+        :rtype: str
+        """
+        return self.sha256
+
+    class Meta:
+        """
+        This class contains additional meta configuration of the model class, see the
+        `official Django docs <https://docs.djangoproject.com/en/2.2/ref/models/options/>`_ for more information.
+
+        :param default_permissions: The default permissions for this model
+        :type default_permissions: tuple
+        """
+
+        default_permissions = ()
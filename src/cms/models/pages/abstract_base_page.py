@@ -2,6 +2,7 @@ from django.db import models
 from django.utils.translation import get_language
 from django.utils import timezone
 
+from ..content_queryset import get_prefetched_translation
 from ...constants import status
 
 
@@ -67,6 +68,9 @@ class AbstractBasePage(models.Model):
                  if no translation exists
         :rtype: ~cms.models.pages.page_translation.PageTranslation
         """
+        prefetched = get_prefetched_translation(self, language_code)
+        if prefetched is not None:
+            return next(iter(prefetched), None)
         return self.translations.filter(language__code=language_code).first()
 
     def get_first_translation(self, priority_language_codes=None):
@@ -102,6 +106,9 @@ class AbstractBasePage(models.Model):
         :return: The public translation of a page
         :rtype: ~cms.models.pages.page_translation.PageTranslation
         """
+        prefetched = get_prefetched_translation(self, language_code, public=True)
+        if prefetched is not None:
+            return next(iter(prefetched), None)
         return self.translations.filter(
             language__code=language_code,
             status=status.PUBLIC,
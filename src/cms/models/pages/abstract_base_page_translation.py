@@ -1,11 +1,15 @@
+from functools import partial
+
 import shortuuid
 
-from django.db import models
+from django.db import models, transaction
 from django.utils import timezone
 
 from backend.settings import WEBAPP_URL
 
+from ..content_queryset import TranslationQuerySet
 from ...constants import status
+from ...utils.revision_utils import compact_revisions, load_revision_texts
 
 
 class AbstractBasePageTranslation(models.Model):
@@ -21,6 +25,8 @@ class AbstractBasePageTranslation(models.Model):
                        languages
     :param created_date: The date and time when the page translation was created
     :param last_updated: The date and time when the page translation was last updated
+    :param compressed_text: The compressed content of old revisions (see :mod:`~cms.utils.revision_utils`)
+    :param base_version: The version of the keyframe if ``compressed_text`` is stored as delta
 
     Fields to be implemented in the inheriting model:
 
@@ -41,6 +47,33 @@ class AbstractBasePageTranslation(models.Model):
     created_date = models.DateTimeField(default=timezone.now)
     last_updated = models.DateTimeField(auto_now=True)
     short_url_id = models.CharField(max_length=5, default="")
+    compressed_text = models.BinaryField(null=True, editable=False)
+    base_version = models.PositiveIntegerField(null=True, editable=False)
+
+    #: The large text columns which are deferred by :meth:`~cms.models.content_queryset.TranslationQuerySet.without_content`
+    content_fields = ("text", "compressed_text")
+
+    objects = TranslationQuerySet.as_manager()
+
+    def save(self, *args, **kwargs):
+        """
+        This overwrites the default Django :meth:`~django.db.models.Model.save` method to store new revisions in full
+        (e.g. when an old, compacted revision is restored) and to compact the older revisions afterwards.
+
+        :param args: The supplied arguments
+        :type args: list
+
+        :param kwargs: The supplied kwargs
+        :type kwargs: dict
+        """
+        adding = self.pk is None
+        if adding:
+            load_revision_texts([self])
+        super().save(*args, **kwargs)
+        if adding:
+            transaction.on_commit(
+                partial(compact_revisions, type(self), self.page_id, self.language_id)
+            )
 
     @property
     def page(self):
@@ -177,11 +210,11 @@ class AbstractBasePageTranslation(models.Model):
                  :class:`~cms.models.languages.language.Language`)
         :rtype: ~cms.models.pages.page_translation.PageTranslation
         """
-        source_language_tree_node = self.page.region.language_tree_nodes.get(
-            language=self.language
-        ).parent
-        if source_language_tree_node:
-            return self.page.get_translation(source_language_tree_node.code)
+        source_language = self.page.region.language_tree.get_parent_language(
+            self.language.code
+        )
+        if source_language:
+            return self.page.get_translation(source_language.code)
         return None
 
     @property
@@ -229,15 +262,15 @@ class AbstractBasePageTranslation(models.Model):
     @property
     def previous_revision(self):
         """
-        This property is a shortcut to the previous revision of this translation
+        This property is a shortcut to the previous revision of this translation (older revisions may have been
+        archived, so the versions are not necessarily consecutive)
 
         :return: The previous translation
         :rtype: ~cms.models.pages.page_translation.PageTranslation
         """
-        version = self.version - 1
         return self.page.translations.filter(
             language=self.language,
-            version=version,
+            version__lt=self.version,
         ).first()
 
     @property
@@ -3,10 +3,12 @@ import logging
 from mptt.models import MPTTModel, TreeForeignKey
 
 from django.conf import settings
-from django.db import models
+from django.db import models, transaction
 
 from .abstract_base_page import AbstractBasePage
+from ..content_queryset import PageQuerySet
 from ..regions.region import Region
+from ..tree_manager import LockingTreeManager
 
 logger = logging.getLogger(__name__)
 
@@ -52,6 +54,8 @@ class Page(MPTTModel, AbstractBasePage):
     :param feedback: The feedback to this page
     """
 
+    objects = LockingTreeManager.from_queryset(PageQuerySet)()
+
     parent = TreeForeignKey(
         "self", blank=True, null=True, related_name="children", on_delete=models.PROTECT
     )
@@ -94,6 +98,20 @@ class Page(MPTTModel, AbstractBasePage):
             super().get_siblings(include_self=include_self).filter(region=self.region)
         )
 
+    def save(self, *args, **kwargs):
+        """
+        Save the page in one transaction, so the tree id of a new root page stays locked until it is inserted (see
+        :class:`~cms.models.tree_manager.LockingTreeManager`).
+
+        :param args: The supplied arguments
+        :type args: list
+
+        :param kwargs: The supplied keyword arguments
+        :type kwargs: dict
+        """
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+
     def get_mirrored_text(self, language_code):
         """
         Mirrored content always includes the live content from another page. This content needs to be added when
@@ -215,7 +215,18 @@ class PageTranslation(AbstractBasePageTranslation):
 
         :param default_permissions: The default permissions for this model
         :type default_permissions: tuple
+
+        :param indexes: The indexes of the model (the slug index supports the prefix lookups of
+                        :func:`~cms.utils.slug_utils.get_unique_slug`)
+        :type indexes: list [ ~django.db.models.Index ]
         """
 
         ordering = ["page", "-version"]
         default_permissions = ()
+        indexes = [
+            models.Index(
+                fields=["language", "slug"],
+                name="page_translation_slug",
+                opclasses=["int4_ops", "varchar_pattern_ops"],
+            )
+        ]
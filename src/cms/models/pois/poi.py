@@ -1,6 +1,8 @@
 from django.db import models
 
-from ..regions.region import Region, Language
+from ..content_queryset import ContentQuerySet, get_prefetched_translation
+from ..languages.language import Language
+from ..regions.region import Region
 from ...constants import status
 
 
@@ -28,6 +30,8 @@ class POI(models.Model):
     :param translations: All translations of this POI
     """
 
+    objects = ContentQuerySet.as_manager()
+
     region = models.ForeignKey(Region, related_name="pois", on_delete=models.CASCADE)
     address = models.CharField(max_length=250)
     postcode = models.CharField(max_length=10)
@@ -60,6 +64,9 @@ class POI(models.Model):
                  if no translation exists
         :rtype: ~cms.models.pois.poi_translation.POITranslation
         """
+        prefetched = get_prefetched_translation(self, language_code)
+        if prefetched is not None:
+            return next(iter(prefetched), None)
         return self.translations.filter(language__code=language_code).first()
 
     def get_public_translation(self, language_code):
@@ -72,6 +79,9 @@ class POI(models.Model):
         :return: The public translation of a POI
         :rtype: ~cms.models.pois.poi_translation.POITranslation
         """
+        prefetched = get_prefetched_translation(self, language_code, public=True)
+        if prefetched is not None:
+            return next(iter(prefetched), None)
         return self.translations.filter(
             language__code=language_code,
             status=status.PUBLIC,
@@ -5,6 +5,7 @@ from django.utils import timezone
 from backend.settings import WEBAPP_URL
 
 from .poi import POI
+from ..content_queryset import TranslationQuerySet
 from ..languages.language import Language
 from ...constants import status
 
@@ -57,6 +58,11 @@ class POITranslation(models.Model):
         on_delete=models.SET_NULL,
     )
 
+    #: The large text columns which are deferred by :meth:`~cms.models.content_queryset.TranslationQuerySet.without_content`
+    content_fields = ("description",)
+
+    objects = TranslationQuerySet.as_manager()
+
     @property
     def foreign_object(self):
         """
@@ -154,11 +160,11 @@ class POITranslation(models.Model):
                  :class:`~cms.models.languages.language.Language`)
         :rtype: ~cms.models.pois.poi_translation.POITranslation
         """
-        source_language_tree_node = self.poi.region.language_tree_nodes.get(
-            language=self.language
-        ).parent
-        if source_language_tree_node:
-            return self.poi.get_translation(source_language_tree_node.code)
+        source_language = self.poi.region.language_tree.get_parent_language(
+            self.language.code
+        )
+        if source_language:
+            return self.poi.get_translation(source_language.code)
         return None
 
     @property
@@ -206,15 +212,15 @@ class POITranslation(models.Model):
     @property
     def previous_revision(self):
         """
-        This property is a shortcut to the previous revision of this translation
+        This property is a shortcut to the previous revision of this translation (older revisions may have been
+        archived, so the versions are not necessarily consecutive)
 
         :return: The previous translation
         :rtype: ~cms.models.pois.poi_translation.POITranslation
         """
-        version = self.version - 1
         return self.poi.translations.filter(
             language=self.language,
-            version=version,
+            version__lt=self.version,
         ).first()
 
     @property
@@ -275,7 +281,18 @@ class POITranslation(models.Model):
 
         :param default_permissions: The default permissions for this model
         :type default_permissions: tuple
+
+        :param indexes: The indexes of the model (the slug index supports the prefix lookups of
+                        :func:`~cms.utils.slug_utils.get_unique_slug`)
+        :type indexes: list [ ~django.db.models.Index ]
         """
 
         ordering = ["poi", "-version"]
         default_permissions = ()
+        indexes = [
+            models.Index(
+                fields=["language", "slug"],
+                name="poi_translation_slug",
+                opclasses=["int4_ops", "varchar_pattern_ops"],
+            )
+        ]
@@ -12,6 +12,8 @@ class PushNotification(models.Model):
     :param draft: Whether or not the push notification is a draft (drafts cannot be sent)
     :param sent_date: The date and time when the push notification was sent (:obj:`None` if the push notification is
                       not yet sent)
+    :param scheduled_for: The date and time when the push notification should be sent automatically (:obj:`None` if
+                          the push notification is not scheduled or was already handed to the dispatch queue)
     :param created_date: The date and time when the push notification was created
     :param last_updated: The date and time when the push notification was last updated
     :param mode: Sets behavior for dealing with not existing push notification translations
@@ -35,6 +37,7 @@ class PushNotification(models.Model):
     )
     draft = models.BooleanField(default=True)
     sent_date = models.DateTimeField(null=True, blank=True)
+    scheduled_for = models.DateTimeField(null=True, blank=True)
     created_date = models.DateTimeField(auto_now_add=True)
     last_updated = models.DateTimeField(auto_now=True)
     mode = models.CharField(max_length=128, choices=PN_MODES)
@@ -61,6 +64,9 @@ class PushNotification(models.Model):
 
         :param permissions: The custom permissions for this model
         :type permissions: tuple
+
+        :param indexes: The database indexes of this model (the scheduler only needs the scheduled push notifications)
+        :type indexes: list [ ~django.db.models.Index ]
         """
 
         default_permissions = ()
@@ -69,3 +75,10 @@ class PushNotification(models.Model):
             ("edit_push_notifications", "Can edit push notification"),
             ("send_push_notifications", "Can send push notification"),
         )
+        indexes = [
+            models.Index(
+                fields=["scheduled_for"],
+                name="push_notification_scheduled",
+                condition=models.Q(scheduled_for__isnull=False),
+            )
+        ]
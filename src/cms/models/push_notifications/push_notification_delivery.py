@@ -0,0 +1,73 @@
+from django.db import models
+from django.utils import timezone
+
+from .push_notification_translation import PushNotificationTranslation
+from ...constants.push_notifications import DELIVERY_STATUS, PENDING
+
+
+class PushNotificationDelivery(models.Model):
+    """
+    Data model representing the delivery of a push notification translation. Pending deliveries form the dispatch queue
+    which is processed by the ``dispatch_push_notifications`` management command.
+
+    :param id: The database id of the delivery
+    :param status: The delivery status (choices: :mod:`cms.constants.push_notifications`)
+    :param attempts: The number of delivery attempts
+    :param last_error: The error of the last failed delivery attempt
+    :param next_attempt_at: The date and time before which a pending delivery is not attempted
+    :param leased_until: The date and time until which a delivery with status ``SENDING`` is claimed by a dispatcher
+    :param created_date: The date and time when the delivery was queued
+    :param last_updated: The date and time when the delivery was last updated
+
+    Relationship fields:
+
+    :param translation: The push notification translation which should be delivered (related name: ``deliveries``)
+    """
+
+    translation = models.ForeignKey(
+        PushNotificationTranslation,
+        related_name="deliveries",
+        on_delete=models.CASCADE,
+    )
+    status = models.CharField(
+        max_length=16, choices=DELIVERY_STATUS, default=PENDING, db_index=True
+    )
+    attempts = models.PositiveIntegerField(default=0)
+    last_error = models.CharField(max_length=1000, blank=True)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    leased_until = models.DateTimeField(null=True, blank=True)
+    created_date = models.DateTimeField(default=timezone.now)
+    last_updated = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        """
+        This overwrites the default Python __str__ method which would return <PushNotificationDelivery object at 0xDEADBEEF>
+
+        :return: The string representation of the delivery with information about the most important fields
+        :rtype: str
+        """
+        return f"(id: {self.id}, translation_id: {self.translation_id}, status: {self.status}, attempts: {self.attempts})"
+
+    class Meta:
+        """
+        This class contains additional meta configuration of the model class, see the
+        `official Django docs <https://docs.djangoproject.com/en/2.2/ref/models/options/>`_ for more information.
+
+        :param ordering: The fields which are used to sort the returned objects of a QuerySet
+        :type ordering: list [ str ]
+
+        :param default_permissions: The default permissions for this model
+        :type default_permissions: tuple
+
+        :param indexes: The indexes of the model (the queue index supports the lookup of due deliveries)
+        :type indexes: list [ ~django.db.models.Index ]
+        """
+
+        ordering = ["-created_date"]
+        default_permissions = ()
+        indexes = [
+            models.Index(
+                fields=["status", "next_attempt_at"],
+                name="push_notification_queue",
+            )
+        ]
@@ -17,6 +17,10 @@ class PushNotificationTranslation(models.Model):
     :param push_notification: The push notification the translation belongs to (related name: ``translations``)
     :param language: The language of the push notification translation (related name:
                      ``push_notification_translations``)
+
+    Reverse relationships:
+
+    :param deliveries: All delivery attempts of this push notification translation
     """
 
     title = models.CharField(max_length=250, blank=True)
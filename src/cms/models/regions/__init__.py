@@ -1,3 +1,4 @@
 """
-This package contains only the :class:`~cms.models.regions.region.Region` model.
+This package contains the :class:`~cms.models.regions.region.Region` model and the
+:class:`~cms.models.regions.region_duplication.RegionDuplication` model.
 """
@@ -4,7 +4,7 @@ from django.http import Http404
 from django.utils import timezone
 
 from ...constants import region_status, administrative_division
-from ..languages.language import Language
+from ...utils.language_tree_utils import get_language_tree
 
 
 class Region(models.Model):
@@ -33,6 +33,7 @@ class Region(models.Model):
     :param admin_mail: The email address of the region's administrator
     :param statistics_enabled: Whether or not statistics are enabled for the region
     :param matomo_url: If statistics are enabled, this contains the matomo url of the region
+    :param matomo_id: If statistics are enabled, this contains the id of the region's site in matomo
     :param matomo_token: If statistics are enabled, this contains the secret matomo access token of the region
     :param matomo_ssl_verify: If statistics are enabled, this field denotes whether matomo should use ssl
     :param page_permissions_enabled: Whether or not page-specific permissions_are enabled for this region. This adds the
@@ -87,21 +88,33 @@ class Region(models.Model):
 
     statistics_enabled = models.BooleanField(default=False)
     matomo_url = models.CharField(max_length=150, blank=True, default="")
+    matomo_id = models.PositiveIntegerField(null=True, blank=True)
     matomo_token = models.CharField(max_length=150, blank=True, default="")
     matomo_ssl_verify = models.BooleanField(default=True)
 
     page_permissions_enabled = models.BooleanField(default=False)
 
+    @property
+    def language_tree(self):
+        """
+        This property returns the cached language tree of this region (see :mod:`cms.utils.language_tree_utils`).
+
+        :return: The language tree of this region
+        :rtype: ~cms.utils.language_tree_utils.LanguageTree
+        """
+        return get_language_tree(self)
+
     @property
     def languages(self):
         """
-        This property returns a QuerySet of all :class:`~cms.models.languages.language.Language` objects which have a
+        This property returns a list of all :class:`~cms.models.languages.language.Language` objects which have a
         :class:`~cms.models.languages.language_tree_node.LanguageTreeNode` which belongs to this region.
 
-        :return: A QuerySet of all :class:`~cms.models.languages.language.Language` object instances of a region
-        :rtype: ~django.db.models.query.QuerySet [ ~cms.models.languages.language.Language ]
+        :return: A list of all :class:`~cms.models.languages.language.Language` object instances of a region in tree
+                 order
+        :rtype: list [ ~cms.models.languages.language.Language ]
         """
-        return Language.objects.filter(language_tree_nodes__region=self)
+        return list(self.language_tree.languages)
 
     @property
     def default_language(self):
@@ -112,31 +125,56 @@ class Region(models.Model):
         :return: The root :class:`~cms.models.languages.language.Language` of a region
         :rtype: ~cms.models.languages.language.Language
         """
-        tree_root = self.language_tree_nodes.filter(level=0).first()
-        return tree_root.language if tree_root else None
+        return self.language_tree.default_language
+
+    def get_language_or_404(self, language_code):
+        """
+        This function returns a :class:`~cms.models.languages.language.Language` of this region.
+
+        :param language_code: The code of the requested language
+        :type language_code: str
+
+        :raises ~django.http.Http404: If the language is not part of the region's language tree
+
+        :return: The requested language
+        :rtype: ~cms.models.languages.language.Language
+        """
+        language = self.language_tree.get_language(language_code)
+        if not language:
+            raise Http404
+        return language
 
     @classmethod
     def get_current_region(cls, request):
         """
         This class method returns the current region based on the current request and is used in
-        :func:`backend.context_processors.region_slug_processor`
+        :func:`backend.context_processors.region_slug_processor`. The region is resolved only once per request by
+        :class:`~cms.middleware.RegionMiddleware`, subsequent calls return the region attached to the request.
 
-        :return: The root :class:`~cms.models.languages.language.Language` of a region
-        :rtype: ~cms.models.languages.language.Language
+        :param request: The current request
+        :type request: ~django.http.HttpRequest
+
+        :raises ~django.http.Http404: If the requested region does not exist
+
+        :return: The current region (or ``None`` if the request does not refer to a region)
+        :rtype: ~cms.models.regions.region.Region
         """
+        if hasattr(request, "region"):
+            return request.region
         # if rendered url is edit_region, the region slug originates from the region form.
         if (
             not hasattr(request, "resolver_match")
+            or request.resolver_match is None
             or request.resolver_match.url_name == "edit_region"
         ):
             return None
         region_slug = request.resolver_match.kwargs.get("region_slug")
         if not region_slug:
             return None
-        region = cls.objects.filter(slug=region_slug)
-        if not region.exists():
+        region = cls.objects.filter(slug=region_slug).first()
+        if not region:
             raise Http404
-        return region.first()
+        return region
 
     def __str__(self):
         """
@@ -0,0 +1,83 @@
+from django.db import models
+from django.utils import timezone
+
+from .region import Region
+from ...constants import duplication_status
+
+
+class RegionDuplication(models.Model):
+    """
+    Data model representing the duplication of the pages and media of one region to another. Pending duplications
+    are processed in the background by the ``duplicate_regions`` management command.
+
+    :param id: The database id of the duplication
+    :param only_latest_revisions: Whether only the latest revision of each page translation is duplicated
+    :param status: The status of the duplication (choices: :mod:`cms.constants.duplication_status`)
+    :param progress: The number of page translations which are already duplicated
+    :param total: The total number of page translations which have to be duplicated
+    :param error: The error of the failed duplication
+    :param created_date: The date and time when the duplication was queued
+    :param last_updated: The date and time when the duplication was last updated
+
+    Relationship fields:
+
+    :param source_region: The region whose content is duplicated (related name: ``source_duplications``)
+    :param target_region: The region to which the content is added (related name: ``duplications``)
+    """
+
+    source_region = models.ForeignKey(
+        Region, related_name="source_duplications", on_delete=models.CASCADE
+    )
+    target_region = models.ForeignKey(
+        Region, related_name="duplications", on_delete=models.CASCADE
+    )
+    only_latest_revisions = models.BooleanField(default=False)
+    status = models.CharField(
+        max_length=8,
+        choices=duplication_status.CHOICES,
+        default=duplication_status.PENDING,
+        db_index=True,
+    )
+    progress = models.PositiveIntegerField(default=0)
+    total = models.PositiveIntegerField(default=0)
+    error = models.CharField(max_length=1000, blank=True)
+    created_date = models.DateTimeField(default=timezone.now)
+    last_updated = models.DateTimeField(auto_now=True)
+
+    @property
+    def percentage(self):
+        """
+        The progress of the duplication in percent
+
+        :return: The percentage of the duplicated page translations
+        :rtype: int
+        """
+        if self.status == duplication_status.DONE:
+            return 100
+        if not self.total:
+            return 0
+        return self.progress * 100 // self.total
+
+    def __str__(self):
+        """
+        This overwrites the default Python __str__ method which would return <RegionDuplication object at 0xDEADBEEF>
+
+        :return: The string representation of the duplication with information about the most important fields
+        :rtype: str
+        """
+        return f"(id: {self.id}, source_region: {self.source_region_id}, target_region: {self.target_region_id}, status: {self.status})"
+
+    class Meta:
+        """
+        This class contains additional meta configuration of the model class, see the
+        `official Django docs <https://docs.djangoproject.com/en/2.2/ref/models/options/>`_ for more information.
+
+        :param ordering: The fields which are used to sort the returned objects of a QuerySet
+        :type ordering: list [ str ]
+
+        :param default_permissions: The default permissions for this model
+        :type default_permissions: tuple
+        """
+
+        ordering = ["-created_date"]
+        default_permissions = ()
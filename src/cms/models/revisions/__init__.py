@@ -0,0 +1,3 @@
+"""
+This package contains only the :class:`~cms.models.revisions.archived_revision.ArchivedRevision` model.
+"""
@@ -0,0 +1,115 @@
+import zlib
+
+from django.contrib.contenttypes.models import ContentType
+from django.core import serializers
+from django.db import models
+from django.utils import timezone
+
+from ..languages.language import Language
+from ...constants import status
+
+
+class ArchivedRevision(models.Model):
+    """
+    Data model representing a revision of a page, event or POI translation which was removed from its table by the
+    revision retention policy (see :mod:`~cms.utils.retention_utils`). The complete revision is stored as compressed
+    JSON, so it can be inspected or restored later.
+
+    :param id: The database id of the archived revision
+    :param object_id: The id of the page, event or POI of the revision
+    :param revision_id: The database id the revision had before it was archived
+    :param version: The revision number
+    :param status: The status of the revision (choices: :mod:`cms.constants.status`)
+    :param last_updated: The date and time when the revision was last updated
+    :param archived_date: The date and time when the revision was archived
+    :param data: The zlib-compressed JSON serialization of the revision
+
+    Relationship fields:
+
+    :param content_type: The model of the revision, e.g. :class:`~cms.models.pages.page_translation.PageTranslation`
+    :param language: The language of the revision (related name: ``archived_revisions``)
+    """
+
+    content_type = models.ForeignKey(ContentType, on_delete=models.CASCADE)
+    object_id = models.PositiveIntegerField()
+    language = models.ForeignKey(
+        Language, related_name="archived_revisions", on_delete=models.CASCADE
+    )
+    revision_id = models.PositiveIntegerField()
+    version = models.PositiveIntegerField()
+    status = models.CharField(max_length=6, choices=status.CHOICES)
+    last_updated = models.DateTimeField()
+    archived_date = models.DateTimeField(default=timezone.now)
+    data = models.BinaryField()
+
+    @classmethod
+    def from_revision(cls, revision, object_id):
+        """
+        Create an (unsaved) archived revision. The text of compacted page revisions has to be restored beforehand (see
+        :func:`~cms.utils.revision_utils.load_revision_texts`).
+
+        :param revision: The revision
+        :type revision: ~django.db.models.Model
+
+        :param object_id: The id of the page, event or POI of the revision
+        :type object_id: int
+
+        :return: The archived revision
+        :rtype: ~cms.models.revisions.archived_revision.ArchivedRevision
+        """
+        return cls(
+            content_type=ContentType.objects.get_for_model(revision),
+            object_id=object_id,
+            language_id=revision.language_id,
+            revision_id=revision.id,
+            version=revision.version,
+            status=revision.status,
+            last_updated=revision.last_updated,
+            data=zlib.compress(serializers.serialize("json", [revision]).encode(), 9),
+        )
+
+    @property
+    def revision(self):
+        """
+        The archived revision as unsaved instance of its original model
+
+        :return: The revision
+        :rtype: ~django.db.models.Model
+        """
+        deserialized = next(
+            serializers.deserialize("json", zlib.decompress(bytes(self.data)).decode())
+        )
+        return deserialized.object
+
+    def __str__(self):
+        """
+        This overwrites the default Python __str__ method which would return <ArchivedRevision object at 0xDEADBEEF>
+
+        :return: The string representation of the archived revision with information about the most important fields
+        :rtype: str
+        """
+        return f"(id: {self.id}, model: {self.content_type.model}, object_id: {self.object_id}, language_id: {self.language_id}, version: {self.version})"
+
+    class Meta:
+        """
+        This class contains additional meta configuration of the model class, see the
+        `official Django docs <https://docs.djangoproject.com/en/2.2/ref/models/options/>`_ for more information.
+
+        :param ordering: The fields which are used to sort the returned objects of a QuerySet
+        :type ordering: list [ str ]
+
+        :param default_permissions: The default permissions for this model
+        :type default_permissions: tuple
+
+        :param indexes: The indexes of the model
+        :type indexes: list [ ~django.db.models.Index ]
+        """
+
+        ordering = ["content_type", "object_id", "language", "-version"]
+        default_permissions = ()
+        indexes = [
+            models.Index(
+                fields=["content_type", "object_id", "language"],
+                name="archived_revision_object",
+            )
+        ]
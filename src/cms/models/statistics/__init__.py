@@ -0,0 +1,4 @@
+"""
+This package contains the data model of the locally stored statistics:
+:class:`~cms.models.statistics.visitor_count.VisitorCount`
+"""
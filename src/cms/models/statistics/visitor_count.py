@@ -0,0 +1,58 @@
+from django.db import models
+
+from ..languages.language import Language
+from ..regions.region import Region
+
+
+class VisitorCount(models.Model):
+    """
+    Data model representing the number of unique visitors of a region in a specific language on a single day. The
+    counts are imported from Matomo by the ``import_statistics`` management command, so the statistics can be
+    displayed without querying Matomo.
+
+    :param id: The database id of the visitor count
+    :param date: The day of the visits
+    :param visitors: The number of unique visitors on this day
+
+    Relationship fields:
+
+    :param region: The region of the visitor count (related name: ``visitor_counts``)
+    :param language: The language of the visitor count (related name: ``visitor_counts``)
+    """
+
+    region = models.ForeignKey(
+        Region, related_name="visitor_counts", on_delete=models.CASCADE
+    )
+    language = models.ForeignKey(
+        Language, related_name="visitor_counts", on_delete=models.CASCADE
+    )
+    date = models.DateField()
+    visitors = models.PositiveIntegerField(default=0)
+
+    def __str__(self):
+        """
+        This overwrites the default Python __str__ method which would return <VisitorCount object at 0xDEADBEEF>
+
+        :return: The string representation of the visitor count with information about the most important fields
+        :rtype: str
+        """
+        return f"(region_id: {self.region_id}, language_id: {self.language_id}, date: {self.date}, visitors: {self.visitors})"
+
+    class Meta:
+        """
+        This class contains additional meta configuration of the model class, see the
+        `official Django docs <https://docs.djangoproject.com/en/2.2/ref/models/options/>`_ for more information.
+
+        :param unique_together: There can be only one visitor count per region, language and day
+        :type unique_together: tuple
+
+        :param ordering: The fields which are used to sort the returned objects of a QuerySet
+        :type ordering: list [ str ]
+
+        :param default_permissions: The default permissions for this model
+        :type default_permissions: tuple
+        """
+
+        unique_together = (("region", "language", "date"),)
+        ordering = ["date"]
+        default_permissions = ()
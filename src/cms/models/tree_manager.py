@@ -0,0 +1,64 @@
+from mptt.managers import TreeManager
+
+from django.db import connection, transaction
+
+from ..utils.slug_utils import get_lock_key
+
+
+class LockingTreeManager(TreeManager):
+    """
+    MPTT tree manager which serializes the allocation of tree ids. MPTT determines the id of a new tree with
+    ``Max("tree_id") + 1``, so two concurrent transactions which create root nodes (or duplicate whole trees) would
+    otherwise get the same tree id and merge their trees. The lock is a transaction-level advisory lock, so it is held
+    until the transaction which inserts the new tree is committed.
+    """
+
+    def lock_tree_ids(self):
+        """
+        Acquire the advisory lock for the tree ids of this model. Has to be called inside the transaction which inserts
+        the new trees, otherwise the lock is released immediately.
+        """
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT pg_advisory_xact_lock(%s)",
+                [get_lock_key(self.model._meta.db_table, "tree_id")],
+            )
+
+    def _get_next_tree_id(self):
+        """
+        Determine the next unused tree id while holding the tree id lock
+
+        :return: The next tree id
+        :rtype: int
+        """
+        self.lock_tree_ids()
+        return super()._get_next_tree_id()
+
+    def _create_tree_space(self, target_tree_id, num_trees=1):
+        """
+        Shift all tree ids greater than ``target_tree_id`` while holding the tree id lock
+
+        :param target_tree_id: The tree id after which the space is created
+        :type target_tree_id: int
+
+        :param num_trees: The number of trees for which space is created
+        :type num_trees: int
+        """
+        self.lock_tree_ids()
+        super()._create_tree_space(target_tree_id, num_trees)
+
+    def move_node(self, node, target, position="last-child"):
+        """
+        Move a node in one transaction, so a newly allocated tree id stays locked until the node is updated
+
+        :param node: The node which should be moved
+        :type node: ~mptt.models.MPTTModel
+
+        :param target: The node relative to which ``node`` is moved
+        :type target: ~mptt.models.MPTTModel
+
+        :param position: The position relative to ``target``
+        :type position: str
+        """
+        with transaction.atomic():
+            super().move_node(node, target, position)
@@ -2,16 +2,40 @@ import os
 import uuid
 import datetime
 import difflib
+import hashlib
+import logging
 
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from zipfile import ZipFile
-from lxml import etree
+from lxml import etree, html
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.db import connection, transaction
+from django.db.models import Q
+from django.utils import timezone
 from django.utils.text import slugify
+from django.utils.translation import ugettext as _
 
-from .models import Page, PageTranslation, Language
+from .models import PageTranslation, Language, TranslationMemorySegment
+from .utils.slug_utils import (
+    get_lock_key,
+    get_slug_candidates_regex,
+    get_next_free_slug,
+)
+
+logger = logging.getLogger(__name__)
 
 
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 XLIFFS_DIR = os.path.join(BASE_DIR, "xliffs")
+#: How long parsed XLIFF files and diffs are cached (in seconds)
+XLIFF_CACHE_TIMEOUT = 60 * 60
+#: The minimum number of files for which a worker pool is started
+XLIFF_PARALLEL_THRESHOLD = 8
+#: The prefix of the ids of translation units which contain a segment of the content
+SEGMENT_UNIT_PREFIX = "content-"
 
 
 class TranslationXliffConverter:  # pylint: disable=R0902
@@ -24,7 +48,15 @@ class TranslationXliffConverter:  # pylint: disable=R0902
         b'<xliff xmlns="urn:oasis:names:tc:xliff:document:2.0" version="2.0"><file></file></xliff>'
     )
 
-    def __init__(self, src_lang=None, tgt_lang=None, xliff_code=None):
+    # pylint: disable=too-many-arguments
+    def __init__(
+        self,
+        src_lang=None,
+        tgt_lang=None,
+        xliff_code=None,
+        languages=None,
+        resolve_languages=True,
+    ):
         """
         Builds an LXML ETree from either the template or xliff_code parameter
 
@@ -35,14 +67,29 @@ class TranslationXliffConverter:  # pylint: disable=R0902
         :type tgt_lang: ~cms.models.languages.language.Language
 
         :param xliff_code: XML Code of XLIFF file to import
-        :type xliff_code: str
+        :type xliff_code: str or bytes
+
+        :param languages: cache of already resolved languages (keys are language codes), which can be shared between
+                          multiple converters to avoid repeated database lookups
+        :type languages: dict
+
+        :param resolve_languages: whether the language codes of the XLIFF should be resolved to language objects. If
+                                  ``False``, the converter does not access the database at all, which allows parsing
+                                  XLIFF files in worker processes.
+        :type resolve_languages: bool
         """
         self.src_lang = src_lang
         self.tgt_lang = tgt_lang
-        self.elem_files = None
+        self.src_lang_code = src_lang.code if src_lang else None
+        self.tgt_lang_code = tgt_lang.code if tgt_lang else None
+        self.languages = languages if languages is not None else {}
+        self.resolve_languages = resolve_languages
+        self.elem_file = None
         self.elem_title = None
         self.elem_content = None
         self.elem_trans_version = None
+        self.elem_segments = None
+        self.segment_units = {}
         self.page_id = None
 
         if xliff_code is None:
@@ -64,18 +111,34 @@ class TranslationXliffConverter:  # pylint: disable=R0902
             self.elem_file = file_elements[0]
 
         if self.tgt_lang is None:
-            tgt_langs = Language.objects.filter(code=self.xliff.attrib["trgLang"])
-            if len(tgt_langs) == 1:
-                self.tgt_lang = tgt_langs[0]
+            self.tgt_lang_code = self.xliff.attrib.get("trgLang")
+            self.tgt_lang = self.get_language(self.tgt_lang_code)
 
         if self.src_lang is None:
-            src_langs = Language.objects.filter(code=self.xliff.attrib["srcLang"])
-            if len(src_langs) == 1:
-                self.src_lang = src_langs[0]
+            self.src_lang_code = self.xliff.attrib.get("srcLang")
+            self.src_lang = self.get_language(self.src_lang_code)
 
         if self.elem_file is not None and "original" in self.elem_file.attrib:
             self.page_id = int(self.elem_file.attrib["original"])
 
+    def get_language(self, language_code):
+        """
+        Get the language with the given code, either from the shared language cache or from the database
+
+        :param language_code: code of the requested language
+        :type language_code: str
+
+        :return: the language or ``None`` if no language with this code exists (or languages are not resolved)
+        :rtype: ~cms.models.languages.language.Language
+        """
+        if language_code is None or not self.resolve_languages:
+            return None
+        if language_code not in self.languages:
+            self.languages[language_code] = Language.objects.filter(
+                code=language_code
+            ).first()
+        return self.languages[language_code]
+
     def validate_meta_info(self):
         """
         Validate if XLIFF meta information is present
@@ -85,11 +148,13 @@ class TranslationXliffConverter:  # pylint: disable=R0902
         """
         if (
             self.elem_file is None
-            or self.tgt_lang is None
-            or self.src_lang is None
+            or self.tgt_lang_code is None
+            or self.src_lang_code is None
             or self.page_id is None
         ):
             return False
+        if self.resolve_languages and (self.tgt_lang is None or self.src_lang is None):
+            return False
         return True
 
     def parse_xliff_content(self):
@@ -113,17 +178,46 @@ class TranslationXliffConverter:  # pylint: disable=R0902
         )
         if len(elem_trans_version) == 1:
             self.elem_trans_version = elem_trans_version[0]
+        elem_segments = self.xliff.xpath(
+            '//x:file/x:notes/x:note[@id="segments"]', namespaces=namespaces
+        )
+        if len(elem_segments) == 1:
+            self.elem_segments = elem_segments[0]
+        for unit in self.xliff.xpath(
+            f'//x:file/x:unit[starts-with(@id, "{SEGMENT_UNIT_PREFIX}")]',
+            namespaces=namespaces,
+        ):
+            source = unit.xpath("x:segment/x:source", namespaces=namespaces)
+            target = unit.xpath("x:segment/x:target", namespaces=namespaces)
+            if len(source) == 1 and len(target) == 1:
+                self.segment_units[unit.attrib["id"][len(SEGMENT_UNIT_PREFIX) :]] = {
+                    "source": source[0].text or "",
+                    "target": target[0].text or "",
+                }
+        # The title is added to the translation memory like the segments of the content
+        title_source = self.xliff.xpath(
+            '//x:file/x:unit[@id="title"]/x:segment/x:source', namespaces=namespaces
+        )
+        if (
+            len(title_source) == 1
+            and title_source[0].text
+            and self.elem_title is not None
+        ):
+            self.segment_units[get_segment_hash(title_source[0].text)] = {
+                "source": title_source[0].text,
+                "target": self.elem_title.text or "",
+            }
 
     def validate_content(self):
         """
         Validate if content data is present
 
-        :return: content and title elements are available
+        :return: title element and either the content element or the list of content segments are available
         :rtype: bool
         """
         if (
             self.elem_title is None
-            or self.elem_content is None
+            or (self.elem_content is None and self.elem_segments is None)
             or self.elem_trans_version is None
         ):
             return False
@@ -142,12 +236,22 @@ class TranslationXliffConverter:  # pylint: disable=R0902
             return True
         return False
 
-    def translation_to_xliff(self, page_id, src_trans, tgt_trans, xliff_id):
+    # pylint: disable=too-many-arguments
+    def translation_to_xliff(
+        self, page_id, src_trans, tgt_trans, xliff_id, translation_memory=None
+    ):
         """
         Create a XLIFF that contains a page translation
         Add origin attribute with page id as value to file element. as this id is unique
         across all regions, it can be used to import a XLIFF file.
 
+        The content is split into paragraph-level segments (see :func:`~cms.page_xliff_converter.segment_html`). The
+        hashes of all segments are stored in the ``segments`` note and each distinct segment is exported as translation
+        unit. The targets are pre-filled with the existing translation of the segment (see
+        :meth:`~cms.page_xliff_converter.TranslationXliffConverter.get_target_segment`). Units whose target is taken
+        from the translation memory are already translated, so they are marked as final and excluded from translation
+        (``translate="no"``). Only new or changed segments have to be translated.
+
         :param page_id: the id of the page to which the translation is related
         :type page_id: int
 
@@ -160,9 +264,21 @@ class TranslationXliffConverter:  # pylint: disable=R0902
         :param xliff_id: XLIFF ID
         :type xliff_id: str
 
+        :param translation_memory: the translations of already translated segments and the date of their last update
+                                   with the segment hashes as keys
+        :type translation_memory: dict
+
         :return: UTF-8 encoded XML
         :rtype: str
         """
+        if translation_memory is None:
+            translation_memory = {}
+        segments = segment_html(src_trans.text)
+        segment_hashes = [get_segment_hash(segment) for segment in segments]
+        # The segments of the current target translation can only be assigned if the structure matches the source
+        target_segments = segment_html(tgt_trans.text)
+        if len(target_segments) != len(segments):
+            target_segments = [None] * len(segments)
         self.elem_file.attrib["original"] = str(page_id)
         notes = {
             "translation_id": xliff_id,
@@ -170,12 +286,65 @@ class TranslationXliffConverter:  # pylint: disable=R0902
             "src_version": src_trans.version,
             "tgt_version": tgt_trans.version,
             "page_id": page_id,
+            "segments": " ".join(segment_hashes),
         }
         self.add_notes(notes)
-        self.add_translation_unit("title", src_trans.title, tgt_trans.title)
-        self.add_translation_unit("content", src_trans.text, tgt_trans.text)
+        self.add_translation_unit(
+            "title",
+            src_trans.title,
+            *self.get_target_segment(
+                tgt_trans,
+                tgt_trans.title,
+                translation_memory.get(get_segment_hash(src_trans.title)),
+            ),
+        )
+        exported_hashes = set()
+        for segment_hash, segment, target_segment in zip(
+            segment_hashes, segments, target_segments
+        ):
+            # Repeated segments are only exported once
+            if segment_hash not in exported_hashes:
+                self.add_translation_unit(
+                    SEGMENT_UNIT_PREFIX + segment_hash,
+                    segment,
+                    *self.get_target_segment(
+                        tgt_trans, target_segment, translation_memory.get(segment_hash)
+                    ),
+                )
+                exported_hashes.add(segment_hash)
         return self.get_xml().decode("utf-8")
 
+    @staticmethod
+    def get_target_segment(tgt_trans, target_segment, memory_segment):
+        """
+        Get the existing translation of a segment. The translation memory only learns from XLIFF imports, so it is
+        only preferred over the segment of the current target translation if the target translation was not edited
+        after the translation memory entry was saved.
+
+        :param tgt_trans: target language page translation
+        :type tgt_trans: ~cms.models.pages.page_translation.PageTranslation
+
+        :param target_segment: the segment at the same position of the target translation (``None`` if unknown)
+        :type target_segment: str
+
+        :param memory_segment: the translation and the date of the last update of the translation memory entry
+                               (``None`` if the segment is not contained in the translation memory)
+        :type memory_segment: tuple ( str, ~datetime.datetime )
+
+        :return: the existing translation of the segment (an empty string if the segment is not translated yet) and
+                 whether it is a final translation of the segment from the translation memory
+        :rtype: tuple ( str, bool )
+        """
+        if memory_segment:
+            memory_text, memory_updated = memory_segment
+            if (
+                not target_segment
+                or tgt_trans.last_updated is None
+                or memory_updated >= tgt_trans.last_updated
+            ):
+                return memory_text, True
+        return target_segment or "", False
+
     def add_notes(self, notes):
         """
         Add notes section with additional information to XLIFF
@@ -190,7 +359,7 @@ class TranslationXliffConverter:  # pylint: disable=R0902
             note.attrib["id"] = item
             note.text = str(notes[item])
 
-    def add_translation_unit(self, unit_id, source_text, target_text):
+    def add_translation_unit(self, unit_id, source_text, target_text, final=False):
         """
         Add a translation unit to the file element
 
@@ -202,10 +371,17 @@ class TranslationXliffConverter:  # pylint: disable=R0902
 
         :param target_text: already available translation
         :type target_text: str
+
+        :param final: whether the available translation is final and the unit does not have to be translated
+        :type final: bool
         """
         unit = etree.SubElement(self.elem_file, "unit")
         unit.attrib["id"] = unit_id
+        if final:
+            unit.attrib["translate"] = "no"
         segment = etree.SubElement(unit, "segment")
+        if final:
+            segment.attrib["state"] = "final"
         source = etree.SubElement(segment, "source")
         source.text = etree.CDATA(source_text)
         target = etree.SubElement(segment, "target")
@@ -223,10 +399,17 @@ class TranslationXliffConverter:  # pylint: disable=R0902
 
         return {
             "title": self.elem_title.text,
-            "content": self.elem_content.text,
+            # The content of segmented files is composed after the translation memory has been queried
+            "content": self.elem_content.text
+            if self.elem_content is not None
+            else None,
+            "segments": (self.elem_segments.text or "").split()
+            if self.elem_segments is not None
+            else None,
+            "segment_units": self.segment_units,
             "page_id": self.page_id,
-            "tgt_lang_code": self.tgt_lang.code,
-            "src_lang_code": self.src_lang.code,
+            "tgt_lang_code": self.tgt_lang_code,
+            "src_lang_code": self.src_lang_code,
             "tgt_version": self.elem_trans_version.text,
         }
 
@@ -283,8 +466,6 @@ class PageXliffHelper:
         :return: file path to XLIFF file
         :rtype: str or None
         """
-        converter = TranslationXliffConverter(self.src_lang, self.tgt_lang)
-
         src_trans = PageTranslation.objects.filter(
             page=page, language=self.src_lang
         ).first()
@@ -293,33 +474,107 @@ class PageXliffHelper:
         tgt_trans = PageTranslation.objects.filter(
             page=page, language=self.tgt_lang
         ).first()
+        translation_memory = self.get_translation_memory(
+            self.src_lang, self.tgt_lang, [src_trans]
+        )
+
+        filename, xliff_content = self.translation_to_xliff_file(
+            page, self.src_lang, self.tgt_lang, src_trans, tgt_trans, translation_memory
+        )
+
+        if xliff_content:
+            file_path = os.path.join(XLIFFS_DIR, str(uuid.uuid4()), filename)
+            self.save_file(xliff_content, file_path)
+            return file_path
+        return None
+
+    @staticmethod
+    def get_translation_memory(src_lang, tgt_lang, translations):
+        """
+        Get the translations of the titles and all segments of the given translations which are contained in the
+        translation memory
+
+        :param src_lang: source language of translation
+        :type src_lang: ~cms.models.languages.language.Language
+
+        :param tgt_lang: target language of translation
+        :type tgt_lang: ~cms.models.languages.language.Language
+
+        :param translations: the page translations in the source language
+        :type translations: list [ ~cms.models.pages.page_translation.PageTranslation ]
+
+        :return: the translated segments and the dates of their last update with the segment hashes as keys
+        :rtype: dict
+        """
+        segment_hashes = {
+            get_segment_hash(segment)
+            for translation in translations
+            for segment in segment_html(translation.text) + [translation.title]
+            if segment
+        }
+        if not segment_hashes:
+            return {}
+        return {
+            source_hash: (target_text, last_updated)
+            for source_hash, target_text, last_updated in TranslationMemorySegment.objects.filter(
+                source_language=src_lang,
+                target_language=tgt_lang,
+                source_hash__in=segment_hashes,
+            ).values_list(
+                "source_hash", "target_text", "last_updated"
+            )
+        }
+
+    # pylint: disable=too-many-arguments
+    @staticmethod
+    def translation_to_xliff_file(
+        page, src_lang, tgt_lang, src_trans, tgt_trans, translation_memory=None
+    ):
+        """
+        Create the file name and the content of the XLIFF file for a page translation
+
+        :param page: page of translation that should be exported
+        :type page: ~cms.models.pages.page.Page
+
+        :param src_lang: source language of translation
+        :type src_lang: ~cms.models.languages.language.Language
+
+        :param tgt_lang: target language of translation
+        :type tgt_lang: ~cms.models.languages.language.Language
+
+        :param src_trans: source language page translation
+        :type src_trans: ~cms.models.pages.page_translation.PageTranslation
+
+        :param tgt_trans: target language page translation (``None`` if the page is not translated yet)
+        :type tgt_trans: ~cms.models.pages.page_translation.PageTranslation
+
+        :param translation_memory: the translations of already translated segments and the date of their last update
+                                   with the segment hashes as keys
+        :type translation_memory: dict
+
+        :return: file name and XML code of the XLIFF file
+        :rtype: tuple ( str, str )
+        """
         if not tgt_trans:
             tgt_trans = PageTranslation(
                 title="",
                 text="",
                 status=src_trans.status,
-                language=self.tgt_lang,
+                language=tgt_lang,
                 page=page,
             )
 
-        region_slug = page.region.slug
-        slug = src_trans.slug
-
         # properties that make a translation unique: page id, target language, source version
-        xliff_id = (
-            self.tgt_lang.code + "_" + str(page.id) + "_" + str(src_trans.version)
-        )
+        xliff_id = tgt_lang.code + "_" + str(page.id) + "_" + str(src_trans.version)
 
-        filename = f"{region_slug}_{self.src_lang.code}__{xliff_id}__{slug}.xliff"
+        filename = (
+            f"{page.region.slug}_{src_lang.code}__{xliff_id}__{src_trans.slug}.xliff"
+        )
+        converter = TranslationXliffConverter(src_lang, tgt_lang)
         xliff_content = converter.translation_to_xliff(
-            page.id, src_trans, tgt_trans, xliff_id
+            page.id, src_trans, tgt_trans, xliff_id, translation_memory
         )
-
-        if xliff_content:
-            file_path = os.path.join(XLIFFS_DIR, str(uuid.uuid4()), filename)
-            self.save_file(xliff_content, file_path)
-            return file_path
-        return None
+        return filename, xliff_content
 
     @staticmethod
     def _create_zip_file(source_file_paths, zip_file_path):
@@ -363,185 +618,795 @@ class PageXliffHelper:
         return zip_path
 
     @staticmethod
-    def _get_page_translation_slug(title):
+    def get_translation_targets(region, target_languages=None):
         """
-        Create slug (readable unique identifier) for page translation from title
+        Get the pairs of source and target language for the translation of a region's content. The source language of
+        each target language is the language of its parent node in the region's language tree.
+
+        :param region: region whose languages should be translated
+        :type region: ~cms.models.regions.region.Region
 
-        :param title: title of page translation
-        :type title: str
+        :param target_languages: the requested target languages (if ``None``, all languages except the root language)
+        :type target_languages: ~collections.abc.Iterable [ ~cms.models.languages.language.Language ]
 
-        :return: slug
-        :rtype: str
+        :return: pairs of source and target language
+        :rtype: list [ tuple ]
         """
-        slug = slugify(title)
-        if PageTranslation.objects.filter(slug=slug).exists():
-            old_slug = slug
-            i = 1
-            while True:
-                i += 1
-                slug = old_slug + "-" + str(i)
-                if not PageTranslation.objects.filter(slug=slug).exists():
-                    break
-        return slug
+        language_tree = region.language_tree
+        target_language_ids = (
+            {language.id for language in target_languages}
+            if target_languages is not None
+            else None
+        )
+        language_pairs = []
+        for language in language_tree.languages:
+            source_language = language_tree.get_parent_language(language.code)
+            if source_language and (
+                target_language_ids is None or language.id in target_language_ids
+            ):
+                language_pairs.append((source_language, language))
+        return language_pairs
 
-    @staticmethod
-    def save_page_translation(trans_fields, user):
+    def pages_to_zipped_multilingual_xliffs(
+        self, region, pages, target_languages=None, zip_path=None
+    ):
         """
-        Save XLIFF input to page translation
+        Export a list of pages to a zip file containing XLIFFs for multiple target languages at once. The archive
+        contains one folder per target language. The latest source translations are fetched with a single query and
+        shared between all target languages with the same source language, so each source translation is only read
+        once.
 
-        :param trans_fields: translated fields extracted from XLIFF file
-        :type trans_fields: dict
+        :param region: region from which the XLIFFs should be exported
+        :type region: ~cms.models.regions.region.Region
 
-        :param user: author of translations
-        :type user: ~django.contrib.auth.models.User
+        :param pages: list of pages which should be translated
+        :type pages: list [ ~cms.models.pages.page.Page ]
+
+        :param target_languages: the requested target languages (if ``None``, all languages except the root language)
+        :type target_languages: ~collections.abc.Iterable [ ~cms.models.languages.language.Language ]
+
+        :param zip_path: path of the zip file (if ``None``, a new file in the XLIFF directory is created)
+        :type zip_path: str
 
-        :return: failure/success for each page or overall failed
-        :rtype: list or bool
+        :return: path to the zip file
+        :rtype: str
         """
-        page = Page.objects.filter(id=int(trans_fields["page_id"])).first()
-        tgt_lang = Language.objects.filter(code=trans_fields["tgt_lang_code"]).first()
-        src_lang = Language.objects.filter(code=trans_fields["src_lang_code"]).first()
-        if tgt_lang is None or src_lang is None or page is None:
-            return False
-        tgt_trans = PageTranslation.objects.filter(page=page, language=tgt_lang).first()
-        src_trans = PageTranslation.objects.filter(page=page, language=src_lang).first()
-        if src_trans is None:
-            return False
-        if tgt_trans is None:
-            tgt_trans = PageTranslation(language=tgt_lang, page=page, version=0)
-        else:
-            tgt_trans.version = tgt_trans.version + 1
-        tgt_trans.creator = user
-        tgt_trans.title = trans_fields["title"]
-        tgt_trans.text = trans_fields["content"]
-        tgt_trans.slug = PageXliffHelper._get_page_translation_slug(tgt_trans.title)
-        if tgt_trans.save():
-            return True
-        return False
+        translation_targets = self.get_translation_targets(region, target_languages)
+        pages = list(pages)
+        latest_translations = self._get_latest_translations(
+            {page.id for page in pages},
+            {
+                language
+                for translation_target in translation_targets
+                for language in translation_target
+            },
+        )
+        if zip_path is None:
+            timestamp = datetime.datetime.now().strftime("%Y-%m-%d_%H-%M")
+            zip_path = os.path.join(
+                XLIFFS_DIR, str(uuid.uuid4()), f"{region.slug}_{timestamp}.zip"
+            )
+        os.makedirs(os.path.dirname(zip_path), exist_ok=True)
+        with ZipFile(zip_path, "w") as zip_file:
+            for src_lang, tgt_lang in translation_targets:
+                translation_memory = self.get_translation_memory(
+                    src_lang,
+                    tgt_lang,
+                    [
+                        latest_translations[(page.id, src_lang.id)]
+                        for page in pages
+                        if (page.id, src_lang.id) in latest_translations
+                    ],
+                )
+                for page in pages:
+                    src_trans = latest_translations.get((page.id, src_lang.id))
+                    if not src_trans:
+                        continue
+                    filename, xliff_content = self.translation_to_xliff_file(
+                        page,
+                        src_lang,
+                        tgt_lang,
+                        src_trans,
+                        latest_translations.get((page.id, tgt_lang.id)),
+                        translation_memory,
+                    )
+                    zip_file.writestr(f"{tgt_lang.code}/{filename}", xliff_content)
+        logger.info(
+            "Exported %d pages of region %s to %d languages",
+            len(pages),
+            region.slug,
+            len(translation_targets),
+        )
+        return zip_path
 
-    def import_xliff_files(self, xliff_paths, user):
+    @staticmethod
+    def read_xliff_files(xliff_paths, languages=None):
         """
-        Import single (usually translated) XLIFF file and
-        save to page translation.
+        Read and parse XLIFF files without saving anything to the database.
+        The files are parsed in worker processes and the results are cached by the hash of the file content, so the
+        same upload is not parsed again for the confirmation of the import. The content of segmented files is composed
+        of the translated units and the translation memory (see
+        :meth:`~cms.page_xliff_converter.PageXliffHelper.compose_segmented_content`).
 
         :param xliff_paths: paths to XLIFF files
         :type xliff_paths: list [ str ]
 
-        :param user: author of page
-        :type user: int
+        :param languages: cache of already resolved languages (keys are language codes)
+        :type languages: dict
 
-        :return: failure/success
-        :rtype: bool
+        :return: pairs of file path and translated fields (``None`` if the file is invalid)
+        :rtype: list [ tuple ]
         """
-        result = []
+        if languages is None:
+            languages = {}
+        xliff_files = []
         for xliff_path in xliff_paths:
-            if (
+            if not (
                 xliff_path.startswith(XLIFFS_DIR)
                 and xliff_path.endswith((".xlf", ".xliff"))
                 and os.path.isfile(xliff_path)
             ):
-                with open(xliff_path, "r", encoding="utf-8") as f:
-                    xliff_content = f.read()
-                    converter = TranslationXliffConverter(xliff_code=xliff_content)
-                    trans_fields = converter.xliff_to_translation_data()
-                    if trans_fields is not None:
-                        result.append(
-                            (xliff_path, self.save_page_translation(trans_fields, user))
+                continue
+            with open(xliff_path, "rb") as f:
+                xliff_content = f.read()
+            xliff_files.append(
+                (xliff_path, xliff_content, hashlib.sha256(xliff_content).hexdigest())
+            )
+
+        cache_keys = {
+            content_hash: f"xliff-fields-{content_hash}"
+            for _, _, content_hash in xliff_files
+        }
+        cached_fields = cache.get_many(cache_keys.values())
+        uncached_files = {
+            content_hash: xliff_content
+            for _, xliff_content, content_hash in xliff_files
+            if cache_keys[content_hash] not in cached_fields
+        }
+        parsed_fields = dict(
+            zip(
+                uncached_files.keys(),
+                parallel_map(parse_xliff, uncached_files.values()),
+            )
+        )
+        cache.set_many(
+            {
+                cache_keys[content_hash]: trans_fields
+                for content_hash, trans_fields in parsed_fields.items()
+                if trans_fields is not None
+            },
+            XLIFF_CACHE_TIMEOUT,
+        )
+        for content_hash, cache_key in cache_keys.items():
+            if cache_key in cached_fields:
+                parsed_fields[content_hash] = cached_fields[cache_key]
+
+        # Resolve the languages of all files at once
+        language_codes = {
+            trans_fields[key]
+            for trans_fields in parsed_fields.values()
+            if trans_fields is not None
+            for key in ("src_lang_code", "tgt_lang_code")
+        }
+        languages.update(
+            {
+                language.code: language
+                for language in Language.objects.filter(
+                    code__in=language_codes - languages.keys()
+                )
+            }
+        )
+
+        parsed_files = []
+        for xliff_path, _, content_hash in xliff_files:
+            trans_fields = parsed_fields[content_hash]
+            if trans_fields is None:
+                logger.warning("Could not parse XLIFF file %s", xliff_path)
+            elif not (
+                languages.get(trans_fields["src_lang_code"])
+                and languages.get(trans_fields["tgt_lang_code"])
+            ):
+                logger.warning("Unknown languages in XLIFF file %s", xliff_path)
+                trans_fields = None
+            parsed_files.append((xliff_path, trans_fields))
+        return PageXliffHelper.compose_segmented_content(parsed_files, languages)
+
+    @staticmethod
+    def compose_segmented_content(parsed_files, languages):
+        """
+        Compose the content of segmented XLIFF files from the translated units and the translation memory. The
+        translation memory is queried once for all files. If a segment is neither translated in the file nor contained
+        in the translation memory, the content is set to ``None``.
+
+        :param parsed_files: pairs of file path and translated fields
+        :type parsed_files: list [ tuple ]
+
+        :param languages: the resolved languages (keys are language codes)
+        :type languages: dict
+
+        :return: pairs of file path and translated fields with composed content
+        :rtype: list [ tuple ]
+        """
+        missing_segments = defaultdict(set)
+        for _, trans_fields in parsed_files:
+            if trans_fields is None or trans_fields["segments"] is None:
+                continue
+            language_pair = (
+                languages[trans_fields["src_lang_code"]].id,
+                languages[trans_fields["tgt_lang_code"]].id,
+            )
+            for segment_hash in trans_fields["segments"]:
+                if (
+                    not trans_fields["segment_units"]
+                    .get(segment_hash, {})
+                    .get("target")
+                ):
+                    missing_segments[language_pair].add(segment_hash)
+        translation_memory = {}
+        if missing_segments:
+            query = Q()
+            for (src_lang_id, tgt_lang_id), segment_hashes in missing_segments.items():
+                query |= Q(
+                    source_language__id=src_lang_id,
+                    target_language__id=tgt_lang_id,
+                    source_hash__in=segment_hashes,
+                )
+            translation_memory = {
+                (src_lang_id, tgt_lang_id, segment_hash): target_text
+                for src_lang_id, tgt_lang_id, segment_hash, target_text in TranslationMemorySegment.objects.filter(
+                    query
+                ).values_list(
+                    "source_language__id",
+                    "target_language__id",
+                    "source_hash",
+                    "target_text",
+                )
+            }
+
+        composed_files = []
+        for xliff_path, trans_fields in parsed_files:
+            if trans_fields is not None and trans_fields["segments"] is not None:
+                src_lang_id = languages[trans_fields["src_lang_code"]].id
+                tgt_lang_id = languages[trans_fields["tgt_lang_code"]].id
+                segments = []
+                for segment_hash in trans_fields["segments"]:
+                    segment = trans_fields["segment_units"].get(segment_hash, {}).get(
+                        "target"
+                    ) or translation_memory.get(
+                        (src_lang_id, tgt_lang_id, segment_hash)
+                    )
+                    if not segment:
+                        logger.warning(
+                            "Segment %s of XLIFF file %s is not translated",
+                            segment_hash,
+                            xliff_path,
                         )
-                    else:
-                        result.append((xliff_path, False))
-        return result
+                        segments = None
+                        break
+                    segments.append(segment)
+                trans_fields = {
+                    **trans_fields,
+                    "content": "\n".join(segments) if segments is not None else None,
+                }
+            composed_files.append((xliff_path, trans_fields))
+        return composed_files
+
+    @staticmethod
+    def _update_translation_memory(translated_segments):
+        """
+        Save translated segments to the translation memory. Existing segments of the same language pair are updated.
+
+        :param translated_segments: pairs of source and target text with (source language id, target language id,
+                                    segment hash) as keys
+        :type translated_segments: dict
+        """
+        if not translated_segments:
+            return
+        query = Q()
+        for src_lang_id, tgt_lang_id, segment_hash in translated_segments:
+            query |= Q(
+                source_language__id=src_lang_id,
+                target_language__id=tgt_lang_id,
+                source_hash=segment_hash,
+            )
+        existing_segments = {
+            (
+                segment.source_language_id,
+                segment.target_language_id,
+                segment.source_hash,
+            ): segment
+            for segment in TranslationMemorySegment.objects.filter(query)
+        }
+        changed_segments = []
+        new_segments = []
+        for key, (source_text, target_text) in translated_segments.items():
+            segment = existing_segments.get(key)
+            if segment is None:
+                new_segments.append(
+                    TranslationMemorySegment(
+                        source_language_id=key[0],
+                        target_language_id=key[1],
+                        source_hash=key[2],
+                        source_text=source_text,
+                        target_text=target_text,
+                    )
+                )
+            elif segment.target_text != target_text:
+                segment.target_text = target_text
+                segment.last_updated = timezone.now()
+                changed_segments.append(segment)
+        TranslationMemorySegment.objects.bulk_update(
+            changed_segments, ["target_text", "last_updated"]
+        )
+        TranslationMemorySegment.objects.bulk_create(new_segments)
+
+    @staticmethod
+    def _get_latest_translations(page_ids, languages):
+        """
+        Get the most recent revisions of the given pages in the given languages with a single query
+
+        :param page_ids: ids of the requested pages
+        :type page_ids: set [ int ]
+
+        :param languages: the requested languages
+        :type languages: ~collections.abc.Iterable [ ~cms.models.languages.language.Language ]
+
+        :return: the latest page translations with (page id, language id) as keys
+        :rtype: dict
+        """
+        page_translations = (
+            PageTranslation.objects.filter(
+                page__id__in=page_ids, language__in=languages
+            )
+            .order_by("page__id", "language__id", "-version")
+            .distinct("page__id", "language__id")
+        )
+        return {
+            (page_translation.page_id, page_translation.language_id): page_translation
+            for page_translation in page_translations
+        }
+
+    @staticmethod
+    def _get_taken_slugs(slug_requests):
+        """
+        Get all existing page translation slugs which could conflict with the requested slugs with a single query.
+
+        :param slug_requests: the desired slugs with (region id, language id) as keys
+        :type slug_requests: dict
+
+        :return: for each (region id, language id) and slug the ids of the pages which use this slug
+        :rtype: dict
+        """
+        taken_slugs = defaultdict(lambda: defaultdict(set))
+        if not slug_requests:
+            return taken_slugs
+        query = Q()
+        for (region_id, language_id), slugs in slug_requests.items():
+            query |= Q(
+                page__region__id=region_id,
+                language__id=language_id,
+                slug__regex=get_slug_candidates_regex(slugs),
+            )
+        existing_slugs = (
+            PageTranslation.objects.filter(query)
+            .values_list("page__region__id", "language__id", "slug", "page__id")
+            .distinct()
+        )
+        for region_id, language_id, slug, page_id in existing_slugs:
+            taken_slugs[(region_id, language_id)][slug].add(page_id)
+        return taken_slugs
+
+    # pylint: disable=too-many-locals
+    def import_xliff_files(self, xliff_paths, region, user):
+        """
+        Import (usually translated) XLIFF files and save them as new page translation revisions.
+
+        All files are parsed and validated first, then the affected pages, languages and current translations are
+        fetched in bulk. Only pages of the given region can be imported into languages of its language tree. The unique
+        slugs are allocated per language with a single query and all new revisions are created in one transaction, so
+        either all valid files are imported or none. Like
+        :func:`~cms.utils.slug_utils.save_with_unique_slug`, the allocation of slugs is serialized per region and
+        language with an advisory lock.
+
+        :param xliff_paths: paths to XLIFF files
+        :type xliff_paths: list [ str ]
+
+        :param region: the region of the imported pages
+        :type region: ~cms.models.regions.region.Region
+
+        :param user: author of translations
+        :type user: ~django.contrib.auth.models.User
+
+        :return: a result report for each file containing the keys ``xliff_name``, ``success`` and ``error``
+        :rtype: list [ dict ]
+        """
+        languages = {}
+        parsed_files = self.read_xliff_files(xliff_paths, languages)
+        valid_files = [
+            (xliff_path, trans_fields)
+            for xliff_path, trans_fields in parsed_files
+            if trans_fields is not None
+        ]
+        pages = region.pages.select_related("region").in_bulk(
+            {int(trans_fields["page_id"]) for _, trans_fields in valid_files}
+        )
+        region_language_ids = {language.id for language in region.languages}
+        latest_translations = self._get_latest_translations(
+            pages.keys(), [language for language in languages.values() if language]
+        )
+
+        report = {}
+        imports = []
+        slug_requests = defaultdict(set)
+        for xliff_path, trans_fields in parsed_files:
+            report[xliff_path] = {
+                "xliff_name": os.path.basename(xliff_path),
+                "success": False,
+                "error": None,
+            }
+            if trans_fields is None:
+                report[xliff_path]["error"] = _("The file is not a valid XLIFF file.")
+                continue
+            page = pages.get(int(trans_fields["page_id"]))
+            tgt_lang = languages.get(trans_fields["tgt_lang_code"])
+            src_lang = languages.get(trans_fields["src_lang_code"])
+            if page is None:
+                report[xliff_path]["error"] = _("The page does not exist.")
+                continue
+            if tgt_lang.id not in region_language_ids:
+                report[xliff_path]["error"] = _(
+                    "The target language is not available in this region."
+                )
+                continue
+            if not trans_fields["title"]:
+                report[xliff_path]["error"] = _("The title must not be empty.")
+                continue
+            if trans_fields["content"] is None and trans_fields["segments"] is not None:
+                report[xliff_path]["error"] = _(
+                    "Not all segments of the page are translated."
+                )
+                continue
+            src_trans = latest_translations.get((page.id, src_lang.id))
+            if src_trans is None:
+                report[xliff_path]["error"] = _(
+                    "The page has no translation in the source language."
+                )
+                continue
+            slug = slugify(trans_fields["title"], allow_unicode=True) or "page"
+            slug_requests[(page.region_id, tgt_lang.id)].add(slug)
+            imports.append((xliff_path, trans_fields, page, tgt_lang, src_trans, slug))
+
+        with transaction.atomic():
+            with connection.cursor() as cursor:
+                # Lock the groups in a fixed order to avoid deadlocks between concurrent imports
+                for region_id, language_id in sorted(slug_requests):
+                    cursor.execute(
+                        "SELECT pg_advisory_xact_lock(%s)",
+                        [
+                            get_lock_key(
+                                PageTranslation._meta.db_table, region_id, language_id
+                            )
+                        ],
+                    )
+            taken_slugs = self._get_taken_slugs(slug_requests)
+            new_translations = []
+            translated_segments = {}
+            for xliff_path, trans_fields, page, tgt_lang, src_trans, slug in imports:
+                group_slugs = taken_slugs[(page.region_id, tgt_lang.id)]
+                # Other revisions of the same page are allowed to have the same slug
+                unique_slug = get_next_free_slug(
+                    slug,
+                    [
+                        taken_slug
+                        for taken_slug, page_ids in group_slugs.items()
+                        if page_ids - {page.id}
+                    ],
+                )
+                group_slugs[unique_slug].add(page.id)
+                tgt_trans = latest_translations.get((page.id, tgt_lang.id))
+                new_translation = PageTranslation(
+                    page=page,
+                    language=tgt_lang,
+                    creator=user,
+                    title=trans_fields["title"],
+                    text=trans_fields["content"] or "",
+                    slug=unique_slug,
+                    status=tgt_trans.status if tgt_trans else src_trans.status,
+                    version=tgt_trans.version + 1 if tgt_trans else 1,
+                )
+                # Subsequent files for the same page and language create further revisions
+                latest_translations[(page.id, tgt_lang.id)] = new_translation
+                new_translations.append(new_translation)
+                for segment_hash, unit in trans_fields["segment_units"].items():
+                    if unit["target"]:
+                        translated_segments[
+                            (src_trans.language_id, tgt_lang.id, segment_hash)
+                        ] = (unit["source"], unit["target"])
+                report[xliff_path]["success"] = True
+
+            PageTranslation.objects.bulk_create(new_translations)
+            self._update_translation_memory(translated_segments)
+        logger.info(
+            "Imported %d of %d XLIFF files", len(new_translations), len(parsed_files)
+        )
+        return list(report.values())
 
     @staticmethod
     def extract_zip_file(zip_file_path):
         """
-        Extract zip file and return file paths of content
+        Extract the XLIFF files of a zip file and return their file paths.
+        To make sure a malicious archive cannot exhaust the disk or memory, the number of entries and the total
+        uncompressed size are limited by :setting:`XLIFF_UPLOAD_MAX_ENTRIES` and :setting:`XLIFF_UPLOAD_MAX_SIZE`.
 
         :param zip_file_path: path to zip file
         :type zip_file_path: str
 
+        :raises ~django.core.exceptions.ValidationError: If the archive exceeds the limits
+
         :return: list of filenames
         :rtype: list
         """
         file_paths = []
+        target_dir = os.path.dirname(zip_file_path)
         with ZipFile(zip_file_path, "r") as zip_ref:
-            zip_ref.extractall(os.path.dirname(zip_file_path))
-            for file_name in zip_ref.namelist():
-                file_paths.append(
-                    os.path.join(os.path.dirname(zip_file_path), file_name)
+            entries = [
+                entry
+                for entry in zip_ref.infolist()
+                if not entry.is_dir() and entry.filename.endswith((".xlf", ".xliff"))
+            ]
+            if len(entries) > settings.XLIFF_UPLOAD_MAX_ENTRIES:
+                raise ValidationError(
+                    _("The archive contains more than {count} XLIFF files.").format(
+                        count=settings.XLIFF_UPLOAD_MAX_ENTRIES
+                    )
                 )
+            # The sizes in the archive headers are only a first hint, the actual size is checked during extraction
+            if (
+                sum(entry.file_size for entry in entries)
+                > settings.XLIFF_UPLOAD_MAX_SIZE
+            ):
+                raise ValidationError(_("The uncompressed archive is too large."))
+            remaining_size = settings.XLIFF_UPLOAD_MAX_SIZE
+            file_names = set()
+            for entry in entries:
+                # Flatten the directory structure to prevent path traversal
+                file_name = os.path.basename(entry.filename)
+                # Files with the same name in different directories must not overwrite each other
+                base_name, extension = os.path.splitext(file_name)
+                suffix = 1
+                while file_name in file_names:
+                    suffix += 1
+                    file_name = f"{base_name}_{suffix}{extension}"
+                file_names.add(file_name)
+                file_path = os.path.join(target_dir, file_name)
+                with zip_ref.open(entry) as source, open(file_path, "wb") as target:
+                    while True:
+                        chunk = source.read(64 * 1024)
+                        if not chunk:
+                            break
+                        remaining_size -= len(chunk)
+                        if remaining_size < 0:
+                            raise ValidationError(
+                                _("The uncompressed archive is too large.")
+                            )
+                        target.write(chunk)
+                file_paths.append(file_path)
         return file_paths
 
-    def generate_xliff_import_diff(self, xliff_paths):
+    def generate_xliff_import_diff(self, xliff_paths, region):
         """
-        Generate diff between XLIFF content and current translation content
+        Generate diff between XLIFF content and current translation content.
+        The diffs are computed in worker processes and cached by the hash of the XLIFF content and the current
+        translation revision. Files of pages in other regions are skipped.
 
         :param xliff_paths: list of paths to XLIFF files
         :type xliff_paths: [ str ]
 
+        :param region: the region of the imported pages
+        :type region: ~cms.models.regions.region.Region
+
         :return: dictionaries containing diffs between XLIFF and current translation versions
         :rtype: list [ dict ]
         """
-        diffs = []
-        for xliff_path in xliff_paths:
-            if xliff_path.endswith((".xlf", ".xliff")) and os.path.isfile(xliff_path):
-                with open(xliff_path, "r", encoding="utf-8") as f:
-                    xliff_content = f.read()
-                    converter = TranslationXliffConverter(xliff_code=xliff_content)
-                    trans_fields = converter.xliff_to_translation_data()
-                    if trans_fields is None:
-                        continue
-                    diffs.append(
-                        self.generate_translation_diff(
-                            trans_fields, os.path.basename(xliff_path)
+        languages = {}
+        parsed_files = [
+            (xliff_path, trans_fields)
+            for xliff_path, trans_fields in self.read_xliff_files(
+                xliff_paths, languages
+            )
+            if trans_fields is not None
+        ]
+        page_ids = set(
+            region.pages.filter(
+                id__in={
+                    int(trans_fields["page_id"]) for _, trans_fields in parsed_files
+                }
+            ).values_list("id", flat=True)
+        )
+        latest_translations = self._get_latest_translations(
+            page_ids, languages.values()
+        )
+
+        diff_jobs = []
+        for xliff_path, trans_fields in parsed_files:
+            page_id = int(trans_fields["page_id"])
+            if page_id not in page_ids:
+                continue
+            tgt_trans = latest_translations.get(
+                (page_id, languages[trans_fields["tgt_lang_code"]].id)
+            )
+            if tgt_trans is None:
+                tgt_trans = PageTranslation(title="", text="")
+            diff_jobs.append((xliff_path, trans_fields, tgt_trans))
+
+        cache_keys = [
+            "xliff-diff-{}-{}".format(
+                hashlib.sha256(
+                    "\n".join(
+                        [
+                            trans_fields["title"] or "",
+                            trans_fields["content"] or "",
+                        ]
+                    ).encode("utf-8")
+                ).hexdigest(),
+                tgt_trans.id,
+            )
+            for _, trans_fields, tgt_trans in diff_jobs
+        ]
+        cached_diffs = cache.get_many(cache_keys)
+        uncached_jobs = [
+            (cache_key, trans_fields, tgt_trans)
+            for cache_key, (_, trans_fields, tgt_trans) in zip(cache_keys, diff_jobs)
+            if cache_key not in cached_diffs
+        ]
+        computed_diffs = dict(
+            zip(
+                [cache_key for cache_key, _, _ in uncached_jobs],
+                parallel_map(
+                    generate_translation_diff,
+                    [
+                        (
+                            tgt_trans.title,
+                            tgt_trans.text,
+                            trans_fields["title"] or "",
+                            trans_fields["content"] or "",
                         )
-                    )
+                        for _, trans_fields, tgt_trans in uncached_jobs
+                    ],
+                ),
+            )
+        )
+        cache.set_many(computed_diffs, XLIFF_CACHE_TIMEOUT)
+        cached_diffs.update(computed_diffs)
+
+        diffs = []
+        for cache_key, (xliff_path, trans_fields, tgt_trans) in zip(
+            cache_keys, diff_jobs
+        ):
+            diffs.append(
+                {
+                    **cached_diffs[cache_key],
+                    "title": tgt_trans.title,
+                    "current_version_newer": tgt_trans.version
+                    > int(trans_fields["tgt_version"]),
+                    "xliff_name": os.path.basename(xliff_path),
+                }
+            )
         return diffs
 
-    @staticmethod
-    def generate_translation_diff(trans_fields, xliff_name):
-        """
-        Generate diff to current translation from translation fields dictionary
 
-        :param trans_fields: content extracted from XLIFF
-        :type trans_fields: dict
+def segment_html(text):
+    """
+    Split HTML content into paragraph-level segments. Each top-level element (e.g. a paragraph, heading or list) and
+    each piece of text between the top-level elements is a separate segment.
 
-        :param xliff_name: file name of XLIFF
-        :type xliff_name: str
+    :param text: The HTML content
+    :type text: str
 
-        :return: dictionary containing diff between XLIFF and current translation version
-        :rtype: dict
-        """
-        page = Page.objects.filter(id=int(trans_fields["page_id"])).first()
-        tgt_lang = Language.objects.filter(code=trans_fields["tgt_lang_code"]).first()
-        if tgt_lang is None or page is None:
-            return False
-        tgt_trans = PageTranslation.objects.filter(page=page, language=tgt_lang).first()
-        if tgt_trans is None:
-            tgt_trans = PageTranslation()
-            tgt_trans.title = ""
-            tgt_trans.text = ""
-
-        old_lines_content = tgt_trans.text.splitlines()
-        new_lines_content = trans_fields["content"].splitlines()
-        result_diff = {
-            "title": tgt_trans.title,
-            "title_diff": "\n".join(
-                difflib.unified_diff(
-                    [tgt_trans.title],
-                    [trans_fields["title"]],
-                    "cms",
-                    "xliff",
-                    lineterm="",
-                )
-            ),
-            "content_diff": "\n".join(
-                difflib.unified_diff(
-                    old_lines_content, new_lines_content, "cms", "xliff", lineterm=""
-                )
-            ),
-            "current_version_newer": tgt_trans.version
-            > int(trans_fields["tgt_version"]),
-            "xliff_name": xliff_name,
-        }
-        return result_diff
+    :return: The HTML code of the segments
+    :rtype: list [ str ]
+    """
+    if not text or not text.strip():
+        return []
+    segments = []
+    for fragment in html.fragments_fromstring(text):
+        if isinstance(fragment, str):
+            segments.append(fragment.strip())
+            continue
+        segments.append(
+            etree.tostring(
+                fragment, encoding="unicode", method="html", with_tail=False
+            ).strip()
+        )
+        if fragment.tail:
+            segments.append(fragment.tail.strip())
+    return [segment for segment in segments if segment]
+
+
+def get_segment_hash(segment):
+    """
+    Get the stable identifier of a segment, which only depends on its content
+
+    :param segment: The HTML code of the segment
+    :type segment: str
+
+    :return: The hash of the segment
+    :rtype: str
+    """
+    return hashlib.sha256(segment.encode("utf-8")).hexdigest()[:16]
+
+
+def parse_xliff(xliff_content):
+    """
+    Parse the content of a XLIFF file without accessing the database, so this function can be executed in worker
+    processes.
+
+    :param xliff_content: XML Code of XLIFF file
+    :type xliff_content: bytes
+
+    :return: if successful, the content for the translation
+    :rtype: dict or None
+    """
+    try:
+        converter = TranslationXliffConverter(
+            xliff_code=xliff_content, resolve_languages=False
+        )
+        return converter.xliff_to_translation_data()
+    except (etree.XMLSyntaxError, ValueError):
+        return None
+
+
+def generate_translation_diff(contents):
+    """
+    Generate diff between the current translation and the XLIFF content. This function does not access the database, so
+    it can be executed in worker processes.
+
+    :param contents: current title, current text, XLIFF title and XLIFF text
+    :type contents: tuple ( str, str, str, str )
+
+    :return: dictionary containing the diffs of title and content
+    :rtype: dict
+    """
+    old_title, old_text, new_title, new_text = contents
+    return {
+        "title_diff": "\n".join(
+            difflib.unified_diff([old_title], [new_title], "cms", "xliff", lineterm="")
+        ),
+        "content_diff": "\n".join(
+            difflib.unified_diff(
+                old_text.splitlines(),
+                new_text.splitlines(),
+                "cms",
+                "xliff",
+                lineterm="",
+            )
+        ),
+    }
+
+
+def parallel_map(function, items):
+    """
+    Apply a CPU-bound function to all items. If there are enough items, the work is distributed to a pool of
+    :setting:`XLIFF_WORKER_PROCESSES` worker processes, otherwise the items are processed in the current process.
+    The function must not access the database.
+
+    :param function: The function which should be applied (must be defined at module level)
+    :type function: ~collections.abc.Callable
+
+    :param items: The arguments for the function
+    :type items: ~collections.abc.Iterable
+
+    :return: The results in the order of the items
+    :rtype: list
+    """
+    items = list(items)
+    if settings.XLIFF_WORKER_PROCESSES < 2 or len(items) < XLIFF_PARALLEL_THRESHOLD:
+        return [function(item) for item in items]
+    with ProcessPoolExecutor(max_workers=settings.XLIFF_WORKER_PROCESSES) as executor:
+        return list(
+            executor.map(
+                function,
+                items,
+                chunksize=max(1, len(items) // (4 * settings.XLIFF_WORKER_PROCESSES)),
+            )
+        )
@@ -15,10 +15,15 @@ For a given user and page, the following permissions are added:
     * :func:`~cms.rules.can_publish_all_pages`
     * :func:`~cms.rules.is_page_publisher`
 
+The region memberships and page permissions of the user are loaded once per request and cached on the user object
+(see :mod:`cms.utils.permission_utils`), so the predicates do not cause database queries for each checked page.
+
 See the project's `README <https://github.com/dfunckt/django-rules/blob/master/README.rst>`_ to learn more.
 """
 from rules import add_perm, predicate
 
+from .utils.permission_utils import get_page_permission_cache
+
 
 # Predicates
 
@@ -39,7 +44,7 @@ def is_page_editor(user, page):
     """
     if not page:
         return False
-    return user in page.editors.all()
+    return page.id in get_page_permission_cache(user).editable_page_ids
 
 
 @predicate
@@ -58,7 +63,7 @@ def is_page_publisher(user, page):
     """
     if not page:
         return False
-    return user in page.publishers.all()
+    return page.id in get_page_permission_cache(user).publishable_page_ids
 
 
 @predicate
@@ -69,15 +74,14 @@ def can_edit_all_pages(user, page):
     :param user: The user who's permission should be checked
     :type user: ~django.contrib.auth.models.User
 
-    :param page: The page parameter is used for the region check
+    :param page: The page parameter is used for the region check (if it is ``None``, only the permission is checked)
     :type page: ~cms.models.pages.page.Page
 
     :return: Whether or not ``user`` can edit all pages
     :rtype: bool
     """
-    if not (user.is_superuser or user.is_staff):
-        if page.region not in user.profile.regions.all():
-            return False
+    if page and not get_page_permission_cache(user).is_region_member(page.region_id):
+        return False
     return user.has_perm("cms.edit_pages")
 
 
@@ -89,15 +93,14 @@ def can_publish_all_pages(user, page):
     :param user: The user who's permission should be checked
     :type user: ~django.contrib.auth.models.User
 
-    :param page: The page parameter is used for the region check
+    :param page: The page parameter is used for the region check (if it is ``None``, only the permission is checked)
     :type page: ~cms.models.pages.page.Page
 
     :return: Whether or not ``user`` can publish all pages
     :rtype: bool
     """
-    if not (user.is_superuser or user.is_staff):
-        if page.region not in user.profile.regions.all():
-            return False
+    if page and not get_page_permission_cache(user).is_region_member(page.region_id):
+        return False
     return user.has_perm("cms.publish_pages")
 
 
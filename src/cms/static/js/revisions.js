@@ -8,39 +8,57 @@
 
 import HtmlDiff from 'htmldiff-js';
 
-// Iterate over revisions and calculate diff
-u(".revision-plain").each(function(node, i){
-    // The plain content div of the revision
-    const revision = u(node);
+// Calculate the diff of the selected revision (only the selected revision and its predecessor are rendered with their content)
+u(".revision-diff").each(function(node){
+    // The diff div of the revision
+    const diff = u(node);
     // The div wrapper around plain content and diff
-    const parent = revision.parent();
-    // The numeric id of the revision
+    const parent = diff.parent();
+    // The position of the revision (old revisions may be archived, so this is not necessarily the version)
     const id = parseInt(parent.attr('id').substring(9));
+    // The plain content div of the revision
+    const revision = parent.children(".revision-plain");
     // The plain content div of the previous revision
     let prev_revision = u("#revision-" + (id - 1)).children(".revision-plain");
     // Calculate the actual diff and insert into the diff div
-    parent.children(".revision-diff").html(HtmlDiff.execute(prev_revision.html(), revision.html()));
+    diff.html(HtmlDiff.execute(prev_revision.html(), revision.html()));
 });
 
 // Add event handler for slider input
 u("#revision-slider").handle("input", handle_revision_slider_input);
+// Load the content of another revision when the slider is released
+u("#revision-slider").handle("change", handle_revision_slider_change);
 // Simulate initial input after page load
 u("#revision-slider").trigger("input");
 
+// function to load the selected revision if its diff is not contained in the page
+function handle_revision_slider_change(event) {
+    const revision = u("#revision-" + event.target.value);
+    if (!revision.children(".revision-diff").length) {
+        window.location.href = revision.data("url");
+    }
+}
+
 // function to update the revision info and hide/show the current revision diff
 function handle_revision_slider_input(event) {
     const revision_info = u("#revision-info").first();
-    // The current revision
+    // The position of the current revision
     const current_revision = event.target.value;
+    // The wrapper of the current revision
+    const revision = u("#revision-" + current_revision);
     // The total number of revisions
     const num_revisions = event.target.max;
     // The percentage of the current slider position (left = 0%, right = 100%)
     // If num_revisions == 1, the division results in NaN and the part || 0 converts this case to 0%
     const position = Number(((current_revision - 1) / (num_revisions - 1)) * 100) || 0;
+    // The version of the revision
+    const revision_version = revision.data("version");
     // The last updated date of the revision
-    const revision_date = u("#revision-" + current_revision).data("date");
+    const revision_date = revision.data("date");
     // Update the revision info box
-    revision_info.innerHTML = "Revision: " + current_revision + "<br>" + revision_date;
+    revision_info.innerHTML = "Revision: " + revision_version + "<br>" + revision_date;
+    // Restore the selected version when the form is submitted
+    u("#revision-version").first().value = revision_version;
     // Calculate position of revision info box to make sure it stays within the area of the slider position
     revision_info.style.left = `calc(${position}% + (${125 - position * 2.5}px))`;
     // Hide all other revisions
@@ -48,5 +66,5 @@ function handle_revision_slider_input(event) {
         u(node).addClass("hidden");
     });
     // Show the current revision diff
-    u("#revision-" + current_revision).removeClass("hidden");
+    revision.removeClass("hidden");
 }
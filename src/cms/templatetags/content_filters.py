@@ -7,6 +7,7 @@ import logging
 from django import template
 
 from ..models import Language
+from ..utils.translation_loader import get_translation_loader
 
 logger = logging.getLogger(__name__)
 register = template.Library()
@@ -15,7 +16,9 @@ register = template.Library()
 @register.simple_tag
 def get_translation(instance, language_code):
     """
-    This tag returns the most recent translation of the requested content object in the requested language.
+    This tag returns the most recent translation of the requested content object in the requested language. The
+    translations are loaded in batches by the :class:`~cms.utils.translation_loader.TranslationLoader` of the current
+    request.
 
     :param instance: The content object instance
     :type instance: ~cms.models.pages.page.Page, ~cms.models.events.event.Event or ~cms.models.pois.poi.POI
@@ -27,7 +30,7 @@ def get_translation(instance, language_code):
     :rtype: ~cms.models.pages.page_translation.PageTranslation, ~cms.models.events.event_translation.EventTranslation,
             or ~cms.models.pois.poi_translation.POITranslation
     """
-    return instance.translations.filter(language__code=language_code).first()
+    return get_translation_loader().get_translation(instance, language_code)
 
 
 @register.simple_tag
@@ -3,13 +3,16 @@ This is a collection of tags and filters for :class:`~cms.models.offers.offer.Of
 """
 from django import template
 
+from ..utils.translation_loader import get_translation_loader
+
 register = template.Library()
 
 
 @register.filter
 def active_since(region_offers, offer_template):
     """
-    This filter returns the date when a specific offer template was activated for the given region.
+    This filter returns the date when a specific offer template was activated for the given region. The activation
+    dates of all offer templates are loaded once per request.
 
     :param region_offers: The offer objects of a given region
     :type region_offers: ~django.db.models.query.QuerySet [ ~cms.models.offers.offer.Offer ]
@@ -20,4 +23,8 @@ def active_since(region_offers, offer_template):
     :return: The date and time when the offer was activated
     :rtype: datetime
     """
-    return region_offers.filter(template=offer_template).first().created_date
+    activation_dates = get_translation_loader().memoize(
+        ("offer-activation-dates", str(region_offers.all().query)),
+        lambda: dict(region_offers.values_list("template_id", "created_date")),
+    )
+    return activation_dates[offer_template.id]
@@ -3,6 +3,8 @@ This is a collection of tags and filters for points of interest (:class:`~cms.mo
 """
 from django import template
 
+from ..utils.translation_loader import get_translation_loader
+
 register = template.Library()
 
 
@@ -10,6 +12,7 @@ register = template.Library()
 def poi_translation_title(poi, language):
     """
     This tag returns the title of the most recent translation of the requested point of interest in the requested language.
+    If the point of interest is not translated into this language, the title of its latest translation is returned.
 
     :param poi: The requested point of interest
     :type poi: ~cms.models.pois.poi.POI
@@ -20,11 +23,12 @@ def poi_translation_title(poi, language):
     :return: The title of the requested translation
     :rtype: str
     """
-    all_poi_translations = poi.translations
-    poi_translation = all_poi_translations.filter(language__code=language.code)
-    if poi_translation.exists():
-        return poi_translation.first().title
-    if all_poi_translations.exists():
-        poi_translation = all_poi_translations.first()
+    poi_translations = get_translation_loader().get_translations(poi)
+    if language.code in poi_translations:
+        return poi_translations[language.code].title
+    if poi_translations:
+        poi_translation = max(
+            poi_translations.values(), key=lambda translation: translation.version
+        )
         return f"{poi_translation.title} ({poi_translation.language})"
     return ""
@@ -3,6 +3,10 @@ This is a collection of tags and filters for :class:`~cms.models.push_notificati
 objects.
 """
 from django import template
+from django.db.models import Prefetch, prefetch_related_objects
+
+from ..models import PushNotification, PushNotificationDelivery
+from ..utils.translation_loader import get_translation_loader
 
 register = template.Library()
 
@@ -21,4 +25,45 @@ def translation(push_notification, language):
     :return: The push notification translation
     :rtype: ~cms.models.push_notifications.push_notification_translation.PushNotificationTranslation
     """
-    return push_notification.translations.filter(language=language).first()
+    return get_translation_loader().get_translation(push_notification, language.code)
+
+
+@register.filter
+def latest_delivery(push_notification_translation):
+    """
+    This tag returns the most recent delivery of the requested push notification translation. On the first call, the
+    latest deliveries of all push notification translations of the current request's
+    :class:`~cms.utils.translation_loader.TranslationLoader` are prefetched with a single query.
+
+    :param push_notification_translation: The requested push notification translation
+    :type push_notification_translation: ~cms.models.push_notifications.push_notification_translation.PushNotificationTranslation
+
+    :return: The latest delivery (or ``None`` if the translation was never queued for sending)
+    :rtype: ~cms.models.push_notifications.push_notification_delivery.PushNotificationDelivery
+    """
+    if push_notification_translation is None:
+        return None
+    if not hasattr(push_notification_translation, "latest_deliveries"):
+        loaded = get_translation_loader().translations.get(PushNotification, {})
+        translations = [
+            translation
+            for translations in loaded.values()
+            for translation in translations.values()
+            if not hasattr(translation, "latest_deliveries")
+        ]
+        if all(
+            translation is not push_notification_translation
+            for translation in translations
+        ):
+            translations.append(push_notification_translation)
+        prefetch_related_objects(
+            translations,
+            Prefetch(
+                "deliveries",
+                queryset=PushNotificationDelivery.objects.order_by(
+                    "translation_id", "-created_date"
+                ).distinct("translation_id"),
+                to_attr="latest_deliveries",
+            ),
+        )
+    return next(iter(push_notification_translation.latest_deliveries), None)
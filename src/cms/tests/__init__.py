@@ -3,6 +3,14 @@ We use unit tests to validate that the functionality of the cms works as expecte
 
 For more information, see :doc:`topics/testing/index` and :doc:`topics/testing/overview`.
 """
+from .config import *
+from .events import *
+from .gvz_api import *
+from .media import *
 from .pages import *
+from .push_notifications import *
+from .regions import *
+from .revisions import *
+from .statistics import *
 from .views.admin_view_test import AdminViewTest
 from .views.region_view_test import RegionViewTest
@@ -0,0 +1,4 @@
+"""
+This package contains all unit tests for the configuration.
+"""
+from .configuration import *
@@ -0,0 +1,66 @@
+"""
+This is a collection of unit tests for the cached configuration store
+"""
+from django.test import TestCase
+from cms.models import CacheVersion, Configuration
+from cms.utils.configuration_utils import (
+    CONFIGURATION_CACHE_VERSION_KEY,
+    get_configuration,
+)
+from cms.utils.translation_loader import TranslationLoader, current_translation_loader
+
+
+class ConfigurationTest(TestCase):
+    """
+    Unit tests for :func:`~cms.utils.configuration_utils.get_configuration`
+    """
+
+    def setUp(self):
+        """
+        Create configurations of different types
+        """
+        Configuration.objects.create(key="string", value="value")
+        Configuration.objects.create(key="number", value="42")
+        Configuration.objects.create(key="flag", value="True")
+
+    def test_get_configuration(self):
+        """
+        All configurations are loaded at once and converted to the requested type
+        """
+        token = current_translation_loader.set(TranslationLoader())
+        self.addCleanup(current_translation_loader.reset, token)
+        # One query for the version of the configurations and one for their values
+        with self.assertNumQueries(2):
+            self.assertEqual(get_configuration("string"), "value")
+            self.assertEqual(get_configuration("number", value_type=int), 42)
+            self.assertIs(get_configuration("flag", value_type=bool), True)
+            self.assertEqual(get_configuration("string", 0, value_type=int), 0)
+            self.assertEqual(get_configuration("missing", "default"), "default")
+
+    def test_invalidation(self):
+        """
+        The configurations are reloaded after a configuration was saved or deleted
+        """
+        self.assertEqual(get_configuration("string"), "value")
+        Configuration.objects.filter(key="string").update(value="changed")
+        # Changes which bypass the signals are not noticed until the timeout
+        self.assertEqual(get_configuration("string"), "value")
+        configuration = Configuration.objects.get(key="number")
+        configuration.value = "43"
+        configuration.save()
+        self.assertEqual(get_configuration("string"), "changed")
+        self.assertEqual(get_configuration("number", value_type=int), 43)
+        configuration.delete()
+        self.assertIsNone(get_configuration("number"))
+
+    def test_invalidation_by_other_process(self):
+        """
+        The version is read from the database, so changes of other processes are noticed without a shared cache
+        """
+        self.assertEqual(get_configuration("string"), "value")
+        # Another process changes the configuration and renews the version
+        Configuration.objects.filter(key="string").update(value="changed")
+        CacheVersion.objects.filter(key=CONFIGURATION_CACHE_VERSION_KEY).update(
+            version="other-process"
+        )
+        self.assertEqual(get_configuration("string"), "changed")
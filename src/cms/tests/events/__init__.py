@@ -2,3 +2,4 @@
 This package contains all unit tests for events.
 """
 from .models import *
+from .translation_loader import *
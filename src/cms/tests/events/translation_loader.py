@@ -0,0 +1,59 @@
+"""
+This is a collection of unit tests for the request-scoped translation loader with events.
+"""
+from datetime import date, time
+
+from django.test import TestCase
+from cms.models import Event, EventTranslation, Language, Region
+from cms.templatetags.content_filters import get_translation
+from cms.utils.translation_loader import TranslationLoader, current_translation_loader
+
+
+class EventTranslationLoaderTest(TestCase):
+    """
+    Unit tests for :class:`~cms.utils.translation_loader.TranslationLoader` with a content model whose default ordering
+    differs from the ordering of its translations
+    """
+
+    def setUp(self):
+        """
+        Create events with multiple revisions and install a translation loader
+        """
+        self.region = Region.objects.create(
+            aliases=[], push_notification_channels=[], slug="testregion"
+        )
+        self.language = Language.objects.create(
+            code="de-de", native_name="Deutsch", english_name="German"
+        )
+        self.events = [
+            Event.objects.create(
+                region=self.region,
+                start_date=date(2021, 1, day),
+                end_date=date(2021, 1, day),
+                start_time=time(12),
+                end_time=time(13),
+            )
+            for day in range(3, 0, -1)
+        ]
+        for event in self.events:
+            for version in range(1, 3):
+                EventTranslation.objects.create(
+                    event=event,
+                    language=self.language,
+                    title=f"Event {event.id} v{version}",
+                    version=version,
+                )
+        token = current_translation_loader.set(TranslationLoader())
+        self.addCleanup(current_translation_loader.reset, token)
+
+    def test_batch_loading(self):
+        """
+        The latest translations of all registered events are loaded at once
+        """
+        current_translation_loader.get().register(self.region.events.all())
+        with self.assertNumQueries(2):
+            titles = [
+                get_translation(event, self.language.code).title
+                for event in self.events
+            ]
+        self.assertEqual(titles, [f"Event {event.id} v2" for event in self.events])
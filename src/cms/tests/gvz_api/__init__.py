@@ -0,0 +1,5 @@
+"""
+This package contains all unit tests for the GVZ API.
+"""
+from .gvz_region import *
+from .gvz_local_resolver import *
@@ -0,0 +1,81 @@
+"""
+This is a collection of unit tests for the import of the Gemeindeverzeichnis dataset and the local resolver
+"""
+import json
+import os
+import tempfile
+from io import StringIO
+
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+from cms.constants import administrative_division
+from gvz_api.utils import GvzLocalResolver, GvzRegion, get_gvz_api
+
+#: The content of the dataset file
+DATASET = """key,name,type,longitude,latitude,parent_key
+09,Bayern,Land,,,
+09162,Testkreis,Landkreis,11.0,48.0,09
+091620001,"Ahausen, Gemeinde",Gemeinde,11.1,48.1,09162
+091620002,Behausen,Gemeinde,11.2,48.2,09162
+09163,Testkreis,Kreisfreie Stadt,12.0,49.0,09
+"""
+
+
+class GvzLocalResolverTest(TestCase):
+    """
+    Unit tests for answering GVZ lookups from the local dataset
+    """
+
+    def import_dataset(self, content):
+        """
+        Write the given content to a temporary file and import it
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "gvz.csv")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(content)
+            stdout = StringIO()
+            call_command("import_gvz_dataset", path, stdout=stdout)
+        return int(stdout.getvalue())
+
+    def test_load_region(self):
+        """
+        Regions and their children are loaded with two queries per level of the region tree
+        """
+        self.assertEqual(self.import_dataset(DATASET), 5)
+        api = get_gvz_api()
+        self.assertIsInstance(api, GvzLocalResolver)
+        with self.assertNumQueries(4):
+            region = GvzRegion(region_key="09162", api=api)
+        self.assertEqual(region.name, "Testkreis")
+        self.assertEqual(
+            json.loads(region.aliases),
+            {
+                "Ahausen": {"longitude": 11.1, "latitude": 48.1},
+                "Behausen": {"longitude": 11.2, "latitude": 48.2},
+            },
+        )
+        self.assertEqual(api.get_children("091620001"), [])
+        self.assertIsNone(api.get_details("00000"))
+
+    def test_best_match(self):
+        """
+        Ambiguous names are resolved by the region type
+        """
+        self.import_dataset(DATASET)
+        api = get_gvz_api()
+        self.assertEqual(api.best_match("Behausen")["key"], "091620002")
+        self.assertIsNone(api.best_match("Testkreis"))
+        self.assertEqual(
+            api.best_match("Testkreis", administrative_division.RURAL_DISTRICT)["key"],
+            "09162",
+        )
+
+    def test_invalid_dataset(self):
+        """
+        Invalid files do not replace the existing dataset
+        """
+        self.import_dataset(DATASET)
+        with self.assertRaises(CommandError):
+            self.import_dataset(DATASET + "09164,Ungültig,Landkreis,invalid,,09\n")
+        self.assertEqual(get_gvz_api().get_details("09162")["name"], "Testkreis")
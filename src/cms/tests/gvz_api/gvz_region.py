@@ -0,0 +1,143 @@
+"""
+This is a collection of unit tests for the GVZ API client. The requests are sent to a local stand-in for the GVZ API.
+"""
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+from django.apps import apps
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from gvz_api.utils import GvzApiWrapper, GvzRegion
+
+#: The regions of the GVZ stand-in
+GVZ_REGIONS = {
+    "09162": {"name": "Landkreis Testkreis", "type": "Landkreis", "children": []},
+    "091620001": {"name": "Ahausen, Gemeinde", "type": "Gemeinde", "children": []},
+    "091620002": {"name": "Behausen", "type": "Gemeinde", "children": []},
+}
+GVZ_REGIONS["09162"]["children"] = ["091620001", "091620002"]
+
+
+class GvzStandInHandler(BaseHTTPRequestHandler):
+    """
+    Request handler which answers the details and county search endpoints of the GVZ API
+    """
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        """
+        Record the request and answer it from :data:`GVZ_REGIONS`
+        """
+        self.server.requests.append(self.path)
+        if self.server.unavailable:
+            self.send_response(503)
+            self.end_headers()
+            return
+        endpoint, region_key = self.path.strip("/").split("/")
+        region = GVZ_REGIONS.get(region_key)
+        if region is None:
+            body = []
+        elif endpoint == "details":
+            body = [
+                {
+                    "key": region_key,
+                    "name": region["name"],
+                    "type": region["type"],
+                    "longitude": 11.0,
+                    "latitude": 48.0 + len(region_key),
+                }
+            ]
+        else:
+            body = [{"children": [{"key": key} for key in region["children"]]}]
+        content = json.dumps(body).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        """
+        Do not log requests to stderr
+        """
+
+
+class GvzRegionTest(TestCase):
+    """
+    Unit tests for loading regions and their children from the GVZ API
+    """
+
+    def setUp(self):
+        """
+        Start the GVZ stand-in
+        """
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), GvzStandInHandler)
+        self.server.requests = []
+        self.server.unavailable = False
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        patcher = patch.object(
+            GvzApiWrapper,
+            "api_url",
+            f"http://127.0.0.1:{self.server.server_address[1]}",
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        """
+        Stop the GVZ stand-in
+        """
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_load_region(self):
+        """
+        The children are loaded and stored in the cache, so they are not requested again
+        """
+        region = GvzRegion(region_key="09162")
+        self.assertEqual(region.name, "Landkreis Testkreis")
+        self.assertEqual(
+            json.loads(region.aliases),
+            {
+                "Ahausen": {"longitude": 11.0, "latitude": 57.0},
+                "Behausen": {"longitude": 11.0, "latitude": 57.0},
+            },
+        )
+        self.assertEqual(len(self.server.requests), 6)
+        # One query per level of the region tree
+        with self.assertNumQueries(2):
+            self.assertEqual(GvzRegion(region_key="09162").as_dict(), region.as_dict())
+        self.assertEqual(len(self.server.requests), 6)
+
+    def test_expired_cache(self):
+        """
+        Expired responses are requested again and used if the GVZ API is unavailable
+        """
+        GvzRegion(region_key="09162")
+        self.server.unavailable = True
+        with override_settings(GVZ_API_CACHE_TTL=0):
+            region = GvzRegion(region_key="09162")
+        self.assertEqual(len(self.server.requests), 12)
+        self.assertEqual(len(region.children), 2)
+
+    def test_availability_probe(self):
+        """
+        The availability is checked in the background and cached
+        """
+        cache.clear()
+        config = apps.get_app_config("gvz_api")
+        config.last_status = None
+        # The first access waits for the probe
+        self.assertTrue(config.api_available)
+        self.assertEqual(self.server.requests, ["/search/expect_empty_json"])
+        self.server.unavailable = True
+        cache.clear()
+        # Later accesses return the last known status while the probe is running
+        self.assertTrue(config.api_available)
+        config.probe_thread.join()
+        self.assertFalse(config.api_available)
+        with override_settings(GVZ_API_ENABLED=False):
+            cache.clear()
+            self.assertFalse(config.api_available)
+        self.assertEqual(len(self.server.requests), 2)
@@ -0,0 +1,4 @@
+"""
+This package contains all unit tests for media.
+"""
+from .media_blob import *
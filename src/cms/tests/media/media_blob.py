@@ -0,0 +1,132 @@
+"""
+This is a collection of unit tests for the content-addressed storage of documents
+"""
+import os
+import shutil
+import tempfile
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.files.base import ContentFile
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.test import TransactionTestCase, override_settings
+from django.urls import reverse
+from cms.forms.media import DocumentForm
+from cms.models import Document, MediaBlob, Region
+from cms.utils.duplication_utils import duplicate_media
+
+
+class MediaBlobTest(TransactionTestCase):
+    """
+    Unit tests for the deduplication and reference counting of media blobs. Files are deleted after the transaction
+    is committed, so the tests are not wrapped in a transaction.
+    """
+
+    def setUp(self):
+        """
+        Use a temporary media root and create two regions
+        """
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root)
+        settings_override = override_settings(MEDIA_ROOT=media_root)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        self.source_region = Region.objects.create(
+            aliases=[], push_notification_channels=[], slug="source"
+        )
+        self.target_region = Region.objects.create(
+            aliases=[], push_notification_channels=[], slug="target"
+        )
+
+    def upload(self, name, content, region):
+        """
+        Upload a document with the document form
+        """
+        form = DocumentForm(
+            data={"description": ""},
+            files={"document": SimpleUploadedFile(name, content)},
+        )
+        self.assertTrue(form.is_valid())
+        return form.save(region=region)
+
+    def test_deduplicate_uploads(self):
+        """
+        Identical files share one blob and the blob is only deleted together with its last reference
+        """
+        first = self.upload("flyer.pdf", b"content", self.source_region)
+        second = self.upload("copy.PDF", b"content", self.source_region)
+        other = self.upload("other.pdf", b"other content", self.source_region)
+        self.assertEqual(first.blob, second.blob)
+        self.assertNotEqual(first.blob, other.blob)
+        self.assertEqual(MediaBlob.objects.count(), 2)
+        self.assertEqual(str(second), "copy.PDF")
+        self.assertTrue(first.file.name.endswith(f"{first.blob.sha256}.pdf"))
+        path = first.file.path
+        first.delete()
+        self.assertTrue(os.path.exists(path))
+        self.assertTrue(MediaBlob.objects.filter(id=second.blob_id).exists())
+        second.delete()
+        self.assertFalse(os.path.exists(path))
+        self.assertFalse(MediaBlob.objects.filter(id=second.blob_id).exists())
+
+    def test_duplicate_media(self):
+        """
+        Duplicated documents reference the blobs of the source region and are not duplicated twice
+        """
+        document = self.upload("flyer.pdf", b"content", self.source_region)
+        self.assertEqual(duplicate_media(self.source_region, self.target_region), 1)
+        self.assertEqual(duplicate_media(self.source_region, self.target_region), 0)
+        copy = Document.objects.get(region=self.target_region)
+        self.assertEqual((copy.name, copy.blob), (document.name, document.blob))
+        self.assertEqual(MediaBlob.objects.count(), 1)
+        self.target_region.delete()
+        self.assertEqual(MediaBlob.release_unreferenced(), 0)
+        document.delete()
+        self.assertEqual(MediaBlob.objects.count(), 0)
+
+    def test_delete_other_region(self):
+        """
+        Documents of other regions cannot be deleted
+        """
+        document = self.upload("flyer.pdf", b"content", self.source_region)
+        self.client.force_login(
+            get_user_model().objects.create_superuser("admin", "", "admin")
+        )
+        url_kwargs = {"document_id": document.id}
+        response = self.client.post(
+            reverse("delete_file", kwargs={**url_kwargs, "region_slug": "target"})
+        )
+        self.assertEqual(response.status_code, 404)
+        self.assertTrue(Document.objects.filter(id=document.id).exists())
+        response = self.client.post(
+            reverse("delete_file", kwargs={**url_kwargs, "region_slug": "source"})
+        )
+        self.assertEqual(response.status_code, 302)
+        self.assertFalse(Document.objects.filter(id=document.id).exists())
+
+    def test_convert_documents(self):
+        """
+        Documents which were uploaded before blobs were introduced are stored in blobs and their files are removed
+        """
+        documents = []
+        for name in ("old.pdf", "copy.pdf"):
+            document = Document(description="")
+            document.document.save(name, ContentFile(b"content"), save=False)
+            document.save()
+            documents.append(document)
+        paths = [document.file.path for document in documents]
+        stdout = StringIO()
+        call_command("convert_documents", stdout=stdout)
+        self.assertIn("Converted 2 documents", stdout.getvalue())
+        converted = list(Document.objects.order_by("id"))
+        self.assertEqual(
+            [document.name for document in converted], ["old.pdf", "copy.pdf"]
+        )
+        self.assertEqual(converted[0].blob, converted[1].blob)
+        self.assertEqual(converted[0].document.name, "")
+        with converted[0].file.open("rb") as file:
+            self.assertEqual(file.read(), b"content")
+        self.assertFalse(any(os.path.exists(path) for path in paths))
+        call_command("convert_documents", stdout=stdout)
+        self.assertIn("Converted 0 documents", stdout.getvalue())
@@ -1,4 +1,10 @@
 """
 This package contains all unit tests for pages.
 """
+from .content_queryset import *
 from .models import *
+from .permissions import *
+from .revisions import *
+from .slugs import *
+from .translation_loader import *
+from .xliff import *
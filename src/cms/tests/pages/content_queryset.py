@@ -0,0 +1,114 @@
+"""
+This is a collection of unit tests for the QuerySet methods of content models.
+"""
+from datetime import date, time
+
+from django.test import TestCase
+from cms.constants import status
+from cms.models import Event, EventTranslation, Language, Page, PageTranslation, Region
+
+
+class ContentQuerySetTest(TestCase):
+    """
+    Unit tests for :meth:`~cms.models.content_queryset.ContentQuerySet.with_translation`
+    """
+
+    def setUp(self):
+        """
+        Create pages with a public and a newer draft revision
+        """
+        self.region = Region.objects.create(
+            aliases=[], push_notification_channels=[], slug="testregion"
+        )
+        self.language = Language.objects.create(
+            code="de-de", native_name="Deutsch", english_name="German"
+        )
+        self.pages = [Page.objects.create(region=self.region) for _ in range(3)]
+        for page in self.pages:
+            PageTranslation.objects.create(
+                page=page,
+                language=self.language,
+                title=f"Public {page.id}",
+                status=status.PUBLIC,
+                version=1,
+            )
+            PageTranslation.objects.create(
+                page=page,
+                language=self.language,
+                title=f"Draft {page.id}",
+                status=status.DRAFT,
+                version=2,
+            )
+        self.untranslated_page = Page.objects.create(region=self.region)
+
+    def test_with_translation(self):
+        """
+        The latest and the public translations of all pages are fetched with one query each
+        """
+        with self.assertNumQueries(3):
+            pages = list(
+                self.region.pages.with_translation(self.language.code)
+                .with_translation(self.language.code, public=True)
+                .order_by("id")
+            )
+            titles = [
+                (
+                    page.get_translation(self.language.code),
+                    page.get_public_translation(self.language.code),
+                )
+                for page in pages
+            ]
+            # The language of the translations is selected as well
+            for translation, _ in titles[:-1]:
+                self.assertEqual(translation.language, self.language)
+        self.assertEqual(
+            [
+                tuple(
+                    translation.title if translation else None for translation in pair
+                )
+                for pair in titles
+            ],
+            [(f"Draft {page.id}", f"Public {page.id}") for page in self.pages]
+            + [(None, None)],
+        )
+
+    def test_get_first_translation(self):
+        """
+        Pages without prefetched translations still return their first translation
+        """
+        page = self.pages[0]
+        self.assertEqual(
+            page.get_first_translation([self.language.code]).title, f"Draft {page.id}"
+        )
+        self.assertIsNone(self.untranslated_page.get_first_translation())
+
+    def test_event_with_translation(self):
+        """
+        The translations of events are fetched with one query, although events are ordered by their start date
+        """
+        events = [
+            Event.objects.create(
+                region=self.region,
+                start_date=date(2021, 1, day),
+                end_date=date(2021, 1, day),
+                start_time=time(12),
+                end_time=time(13),
+            )
+            for day in range(2, 0, -1)
+        ]
+        for event in events:
+            for version in range(1, 3):
+                EventTranslation.objects.create(
+                    event=event,
+                    language=self.language,
+                    title=f"Event {event.id} v{version}",
+                    version=version,
+                )
+        with self.assertNumQueries(2):
+            titles = [
+                event.get_translation(self.language.code).title
+                for event in self.region.events.with_translation(self.language.code)
+            ]
+        self.assertEqual(
+            sorted(titles), sorted(f"Event {event.id} v2" for event in events)
+        )
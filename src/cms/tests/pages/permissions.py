@@ -0,0 +1,69 @@
+"""
+This is a collection of unit tests for the page permissions defined in :mod:`cms.rules`.
+"""
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Permission
+from django.test import TestCase
+from cms.models import Page, Region, UserProfile
+
+
+class PagePermissionTest(TestCase):
+    """
+    Unit tests for the request-scoped page permission cache
+    """
+
+    def setUp(self):
+        """
+        Create two regions with pages and a user who belongs to the first region
+        """
+        self.region = Region.objects.create(
+            aliases=[], push_notification_channels=[], slug="region"
+        )
+        self.other_region = Region.objects.create(
+            aliases=[], push_notification_channels=[], slug="other-region"
+        )
+        self.pages = [Page.objects.create(region=self.region) for _ in range(20)]
+        self.other_page = Page.objects.create(region=self.other_region)
+        self.user = get_user_model().objects.create_user("editor")
+        UserProfile.objects.create(user=self.user).regions.add(self.region)
+        self.pages[0].editors.add(self.user)
+        self.pages[1].publishers.add(self.user)
+        self.other_page.editors.add(self.user)
+
+    def get_user(self):
+        """
+        Fetch the user like the authentication middleware does once per request
+        """
+        return get_user_model().objects.get(id=self.user.id)
+
+    def test_explicit_permissions(self):
+        """
+        Checking the permissions of many pages only loads the memberships and page permissions once
+        """
+        user = self.get_user()
+        with self.assertNumQueries(5):
+            editable = [user.has_perm("cms.edit_page", page) for page in self.pages]
+            publishable = [
+                user.has_perm("cms.publish_page", page) for page in self.pages
+            ]
+        self.assertEqual(
+            [page for page, e in zip(self.pages, editable) if e], self.pages[:2]
+        )
+        self.assertEqual(
+            [page for page, p in zip(self.pages, publishable) if p], self.pages[1:2]
+        )
+        self.assertTrue(user.has_perm("cms.edit_page", self.other_page))
+
+    def test_region_permissions(self):
+        """
+        The permission to edit all pages is restricted to the regions of the user
+        """
+        self.user.user_permissions.add(Permission.objects.get(codename="edit_pages"))
+        user = self.get_user()
+        self.assertTrue(
+            all(user.has_perm("cms.edit_page", page) for page in self.pages)
+        )
+        self.assertFalse(user.has_perm("cms.publish_page", self.pages[0]))
+        other_page = Page.objects.create(region=self.other_region)
+        self.assertFalse(user.has_perm("cms.edit_page", other_page))
+        self.assertTrue(user.has_perm("cms.edit_page"))
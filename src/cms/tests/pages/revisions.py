@@ -0,0 +1,146 @@
+"""
+This is a collection of unit tests for the page revisions.
+"""
+from django.test import TestCase
+from cms.constants import status
+from cms.models import Language, Page, PageTranslation, Region
+from cms.utils.revision_utils import (
+    KEYFRAME_INTERVAL,
+    compact_revisions,
+    load_revision_texts,
+)
+from cms.views.pages.page_revision_view import PageRevisionView
+
+
+class PageRevisionTest(TestCase):
+    """
+    Unit tests for :class:`~cms.views.pages.page_revision_view.PageRevisionView`
+    """
+
+    def setUp(self):
+        """
+        Create a page with multiple revisions
+        """
+        region = Region.objects.create(
+            aliases=[], push_notification_channels=[], slug="testregion"
+        )
+        language = Language.objects.create(
+            code="de-de", native_name="Deutsch", english_name="German"
+        )
+        self.page = Page.objects.create(region=region)
+        for version in range(1, 6):
+            PageTranslation.objects.create(
+                page=self.page,
+                language=language,
+                title=f"Version {version}",
+                text=f"<p>Text {version}</p>",
+                status=status.PUBLIC if version == 2 else status.DRAFT,
+                version=version,
+            )
+
+    def test_revision_context(self):
+        """
+        Only the selected revision and its predecessor are loaded with their text
+        """
+        page_translations = self.page.translations.all()
+        revisions = list(page_translations.without_content())
+        with self.assertNumQueries(1):
+            context = PageRevisionView.get_revision_context(
+                page_translations, revisions, 3
+            )
+        self.assertEqual(sorted(context["loaded_versions"]), [2, 3])
+        self.assertEqual(context["selected_revision"].text, "<p>Text 3</p>")
+        self.assertEqual(context["api_revision"].version, 2)
+        for revision in context["page_translations"]:
+            self.assertEqual(
+                "text" in revision.get_deferred_fields(),
+                revision.version not in (2, 3),
+            )
+        self.assertIsNone(
+            PageRevisionView.get_revision_context(page_translations, revisions, 6)
+        )
+        # Archived revisions leave gaps in the versions
+        page_translations.filter(version=2).delete()
+        revisions = list(page_translations.without_content())
+        context = PageRevisionView.get_revision_context(page_translations, revisions, 3)
+        self.assertEqual(sorted(context["loaded_versions"]), [1, 3])
+        self.assertEqual(context["selected_position"], 2)
+
+
+class PageRevisionCompactionTest(TestCase):
+    """
+    Unit tests for :mod:`~cms.utils.revision_utils`
+    """
+
+    def setUp(self):
+        """
+        Create a page with many revisions which only differ in a few paragraphs
+        """
+        region = Region.objects.create(
+            aliases=[], push_notification_channels=[], slug="testregion"
+        )
+        self.language = Language.objects.create(
+            code="de-de", native_name="Deutsch", english_name="German"
+        )
+        self.page = Page.objects.create(region=region)
+        paragraphs = [f"<p>Paragraph {i} with some content.</p>\n" for i in range(50)]
+        self.texts = {}
+        for version in range(1, 31):
+            paragraphs[
+                version % 50
+            ] = f"<p>Paragraph changed in version {version}.</p>\n"
+            self.texts[version] = "".join(paragraphs)
+            PageTranslation.objects.create(
+                page=self.page,
+                language=self.language,
+                title=f"Version {version}",
+                text=self.texts[version],
+                status=status.PUBLIC if version == 12 else status.DRAFT,
+                version=version,
+            )
+
+    def test_compact_revisions(self):
+        """
+        All revisions except the latest and the latest public revision are compacted and can be restored
+        """
+        self.assertEqual(
+            compact_revisions(PageTranslation, self.page.id, self.language.id), 28
+        )
+        revisions = {
+            revision.version: revision for revision in self.page.translations.all()
+        }
+        self.assertEqual(revisions[30].text, self.texts[30])
+        self.assertEqual(revisions[12].text, self.texts[12])
+        for version, revision in revisions.items():
+            if version not in (12, 30):
+                self.assertEqual(revision.text, "")
+                if revision.base_version:
+                    self.assertLess(version - revision.base_version, KEYFRAME_INTERVAL)
+                    self.assertIsNone(revisions[revision.base_version].base_version)
+        full_size = sum(len(text.encode()) for text in self.texts.values())
+        compacted_size = sum(
+            len(revision.text.encode()) + len(revision.compressed_text or b"")
+            for revision in revisions.values()
+        )
+        self.assertLess(compacted_size * 5, full_size)
+        with self.assertNumQueries(1):
+            load_revision_texts(list(revisions.values()))
+        for version, revision in revisions.items():
+            self.assertEqual(revision.text, self.texts[version])
+        # Compacting again does not change anything
+        self.assertEqual(
+            compact_revisions(PageTranslation, self.page.id, self.language.id), 0
+        )
+
+    def test_restore_compacted_revision(self):
+        """
+        Restoring a compacted revision stores its text in full
+        """
+        compact_revisions(PageTranslation, self.page.id, self.language.id)
+        revision = self.page.translations.get(language=self.language, version=5)
+        revision.pk = None
+        revision.version = 31
+        revision.save()
+        restored = self.page.translations.get(language=self.language, version=31)
+        self.assertEqual(restored.text, self.texts[5])
+        self.assertIsNone(restored.compressed_text)
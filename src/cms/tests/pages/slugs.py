@@ -0,0 +1,81 @@
+"""
+This is a collection of unit tests for the allocation of unique page translation slugs.
+"""
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from cms.constants import status
+from cms.forms.pages import PageTranslationForm
+from cms.models import Language, Page, PageTranslation, Region
+
+
+class PageTranslationSlugTest(TestCase):
+    """
+    Unit tests for :func:`~cms.utils.slug_utils.generate_unique_slug` and
+    :func:`~cms.utils.slug_utils.save_with_unique_slug`
+    """
+
+    def setUp(self):
+        """
+        Create a region with multiple pages whose translations use the slug "kontakt"
+        """
+        self.region = Region.objects.create(
+            aliases=[], push_notification_channels=[], slug="testregion"
+        )
+        self.language = Language.objects.create(
+            code="de-de", native_name="Deutsch", english_name="German"
+        )
+        for slug in ["kontakt", "kontakt-2", "kontakt-4", "kontakte", "kontakt-x"]:
+            PageTranslation.objects.create(
+                page=Page.objects.create(region=self.region),
+                language=self.language,
+                slug=slug,
+            )
+
+    def get_form(self, title, instance=None):
+        """
+        Create a page translation form for the given title
+        """
+        return PageTranslationForm(
+            {
+                "title": title,
+                "slug": "",
+                "text": "",
+                "status": status.DRAFT,
+                "submit_draft": "1",
+            },
+            instance=instance,
+            region=self.region,
+            language=self.language,
+        )
+
+    def test_allocate_slug(self):
+        """
+        The next free slug is determined with a single query and other versions of the same page may keep their slug
+        """
+        form = self.get_form("Kontakt")
+        with CaptureQueriesContext(connection) as queries:
+            self.assertTrue(form.is_valid())
+        self.assertEqual(len(queries), 1)
+        self.assertEqual(form.cleaned_data["slug"], "kontakt-3")
+        page_translation = form.save(page=Page.objects.create(region=self.region))
+        self.assertEqual(page_translation.slug, "kontakt-3")
+        form = self.get_form("Kontakt", instance=page_translation)
+        self.assertTrue(form.is_valid())
+        self.assertEqual(form.cleaned_data["slug"], "kontakt-3")
+
+    def test_slug_taken_after_validation(self):
+        """
+        A slug which was taken between the validation and the saving of the form is replaced by the next variant of
+        the desired slug
+        """
+        PageTranslation.objects.filter(slug="kontakt-4").delete()
+        form = self.get_form("Kontakt")
+        self.assertTrue(form.is_valid())
+        PageTranslation.objects.create(
+            page=Page.objects.create(region=self.region),
+            language=self.language,
+            slug="kontakt-3",
+        )
+        page_translation = form.save(page=Page.objects.create(region=self.region))
+        self.assertEqual(page_translation.slug, "kontakt-4")
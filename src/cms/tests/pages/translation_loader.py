@@ -0,0 +1,69 @@
+"""
+This is a collection of unit tests for the request-scoped translation loader.
+"""
+from django.test import TestCase
+from cms.models import Language, Page, PageTranslation, Region
+from cms.templatetags.content_filters import get_translation
+from cms.utils.translation_loader import TranslationLoader, current_translation_loader
+
+
+class TranslationLoaderTest(TestCase):
+    """
+    Unit tests for :class:`~cms.utils.translation_loader.TranslationLoader`
+    """
+
+    def setUp(self):
+        """
+        Create pages with multiple revisions in two languages and install a translation loader
+        """
+        self.region = Region.objects.create(
+            aliases=[], push_notification_channels=[], slug="testregion"
+        )
+        self.german = Language.objects.create(
+            code="de-de", native_name="Deutsch", english_name="German"
+        )
+        self.english = Language.objects.create(
+            code="en-us", native_name="English", english_name="English"
+        )
+        self.pages = [Page.objects.create(region=self.region) for _ in range(5)]
+        for page in self.pages:
+            for version in range(1, 3):
+                PageTranslation.objects.create(
+                    page=page,
+                    language=self.german,
+                    title=f"Seite {page.id} v{version}",
+                    version=version,
+                )
+        PageTranslation.objects.create(
+            page=self.pages[0], language=self.english, title="Page"
+        )
+        token = current_translation_loader.set(TranslationLoader())
+        self.addCleanup(current_translation_loader.reset, token)
+
+    def test_batch_loading(self):
+        """
+        The latest translations of all registered pages are loaded at once
+        """
+        current_translation_loader.get().register(self.region.pages.all())
+        with self.assertNumQueries(2):
+            titles = [
+                get_translation(page, language.code)
+                for page in self.pages
+                for language in (self.german, self.english)
+            ]
+        self.assertEqual(
+            [translation.title if translation else None for translation in titles],
+            [
+                title
+                for page in self.pages
+                for title in (
+                    f"Seite {page.id} v2",
+                    "Page" if page == self.pages[0] else None,
+                )
+            ],
+        )
+        # Objects which were not registered are loaded on demand
+        page = Page.objects.create(region=self.region)
+        with self.assertNumQueries(1):
+            self.assertIsNone(get_translation(page, self.german.code))
+            self.assertIsNone(get_translation(page, self.english.code))
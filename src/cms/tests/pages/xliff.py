@@ -0,0 +1,441 @@
+"""
+This is a collection of unit tests for the XLIFF import and export of page translations.
+"""
+import os
+import shutil
+import uuid
+from io import StringIO
+from unittest.mock import patch
+from zipfile import ZipFile
+
+from lxml import etree
+
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from cms.models import Language, LanguageTreeNode, Page, PageTranslation, Region
+from cms.page_xliff_converter import (
+    PageXliffHelper,
+    TranslationXliffConverter,
+    SEGMENT_UNIT_PREFIX,
+    XLIFFS_DIR,
+)
+
+
+class XliffTestCase(TestCase):
+    """
+    Base class for XLIFF tests which provides a region with two languages and a few pages
+    """
+
+    def setUp(self):
+        """
+        Setup run to create a region with two languages and a few pages
+        """
+        self.region = Region.objects.create(
+            aliases=[], push_notification_channels=[], slug="testregion"
+        )
+        self.german = Language.objects.create(
+            code="de-de", native_name="Deutsch", english_name="German"
+        )
+        self.english = Language.objects.create(
+            code="en-us", native_name="English", english_name="English"
+        )
+        root = LanguageTreeNode.objects.create(language=self.german, region=self.region)
+        LanguageTreeNode.objects.create(
+            language=self.english, region=self.region, parent=root
+        )
+        self.pages = []
+        for i in range(3):
+            page = Page.objects.create(region=self.region)
+            PageTranslation.objects.create(
+                page=page,
+                language=self.german,
+                title=f"Seite {i}",
+                slug=f"seite-{i}",
+                text="<p>Text</p>",
+            )
+            self.pages.append(page)
+        # Existing translation which occupies the slug "contact"
+        PageTranslation.objects.create(
+            page=self.pages[0], language=self.english, title="Contact", slug="contact"
+        )
+        self.upload_dir = os.path.join(XLIFFS_DIR, "upload", str(uuid.uuid4()))
+        os.makedirs(self.upload_dir)
+        cache.clear()
+
+    def tearDown(self):
+        """
+        Remove the temporary XLIFF files
+        """
+        shutil.rmtree(self.upload_dir)
+
+    def write_xliff(self, page, title, translate=lambda source: "<p>Translated</p>"):
+        """
+        Write a translated XLIFF file for the given page to the upload directory
+        """
+        xliff_content = TranslationXliffConverter(
+            self.german, self.english
+        ).translation_to_xliff(
+            page.id,
+            page.get_translation(self.german.code),
+            PageTranslation(title=title),
+            f"{self.english.code}_{page.id}_0",
+        )
+        xliff_path = os.path.join(self.upload_dir, f"page_{page.id}.xliff")
+        PageXliffHelper.save_file(
+            self.translate_xliff(xliff_content, translate), xliff_path
+        )
+        return xliff_path
+
+    @staticmethod
+    def translate_xliff(xliff_content, translate):
+        """
+        Fill in the targets of all exported content segments
+        """
+        converter = TranslationXliffConverter(xliff_code=xliff_content.encode("utf-8"))
+        for unit in converter.elem_file.iterchildren("{*}unit"):
+            if unit.attrib["id"].startswith(SEGMENT_UNIT_PREFIX):
+                source, target = unit.find("{*}segment")
+                target.text = etree.CDATA(translate(source.text))
+        return converter.get_xml().decode("utf-8")
+
+
+class XliffImportTest(XliffTestCase):
+    """
+    Unit tests for the bulk XLIFF import
+    """
+
+    def test_import_allocates_unique_slugs(self):
+        """
+        Importing several files with the same title creates distinct slugs per region and language
+        """
+        xliff_paths = [self.write_xliff(page, "Contact") for page in self.pages]
+        report = PageXliffHelper().import_xliff_files(
+            xliff_paths, self.region, user=None
+        )
+        self.assertTrue(all(result["success"] for result in report))
+        slugs = {page.id: page.get_translation("en-us").slug for page in self.pages}
+        # The first page already used the slug "contact" in a previous revision
+        self.assertEqual(slugs[self.pages[0].id], "contact")
+        self.assertEqual(sorted(slugs.values()), ["contact", "contact-2", "contact-3"])
+        self.assertEqual(self.pages[0].get_translation("en-us").version, 1)
+
+    def test_import_reports_invalid_files(self):
+        """
+        Invalid files are reported without preventing the import of valid files
+        """
+        invalid_path = os.path.join(self.upload_dir, "invalid.xliff")
+        with open(invalid_path, "w", encoding="utf-8") as f:
+            f.write("<no-xliff>")
+        valid_path = self.write_xliff(self.pages[1], "About")
+        report = PageXliffHelper().import_xliff_files(
+            [invalid_path, valid_path], self.region, user=None
+        )
+        self.assertEqual(
+            [result["success"] for result in report],
+            [False, True],
+        )
+        self.assertEqual(self.pages[1].get_translation("en-us").title, "About")
+
+    def test_import_uses_translation_memory(self):
+        """
+        Segments which were already translated are exported with the translation from the translation memory
+        """
+        translate = lambda source: source.replace("Text", "Translated text").replace(
+            "Neu", "New"
+        )
+        page = self.pages[1]
+        PageXliffHelper().import_xliff_files(
+            [self.write_xliff(page, "About", translate)], self.region, user=None
+        )
+        PageTranslation.objects.create(
+            page=page,
+            language=self.german,
+            title="Seite 1",
+            slug="seite-1",
+            text="<p>Text</p>\n<p>Neu</p>",
+            version=1,
+        )
+        export_path = PageXliffHelper(
+            src_lang=self.german, tgt_lang=self.english
+        ).export_page_translation_xliff(page)
+        with open(export_path, encoding="utf-8") as f:
+            xliff_content = f.read()
+        shutil.rmtree(os.path.dirname(export_path))
+        self.assertIn("<p>Translated text</p>", xliff_content)
+        self.assertIn("<p>Neu</p>", xliff_content)
+        xliff_path = os.path.join(self.upload_dir, "page.xliff")
+        PageXliffHelper.save_file(
+            self.translate_xliff(xliff_content, translate), xliff_path
+        )
+        PageXliffHelper().import_xliff_files([xliff_path], self.region, user=None)
+        self.assertEqual(
+            page.get_translation("en-us").text,
+            "<p>Translated text</p>\n<p>New</p>",
+        )
+
+    def test_export_prefers_manual_edits(self):
+        """
+        Segments of the target translation which were edited after the last import are exported instead of the
+        translation memory, and existing translations are exported without translation memory entries
+        """
+        page = self.pages[1]
+        PageXliffHelper().import_xliff_files(
+            [self.write_xliff(page, "About")], self.region, user=None
+        )
+        helper = PageXliffHelper(src_lang=self.german, tgt_lang=self.english)
+        PageTranslation.objects.create(
+            page=page,
+            language=self.english,
+            title="About",
+            slug="about",
+            text="<p>Edited</p>",
+            version=2,
+        )
+        PageTranslation.objects.create(
+            page=self.pages[2],
+            language=self.english,
+            title="Other",
+            slug="other",
+            text="<p>Manually translated</p>",
+        )
+        for exported_page, target_text in (
+            (page, "<p>Edited</p>"),
+            (self.pages[2], "<p>Manually translated</p>"),
+        ):
+            export_path = helper.export_page_translation_xliff(exported_page)
+            with open(export_path, encoding="utf-8") as f:
+                xliff_content = f.read()
+            shutil.rmtree(os.path.dirname(export_path))
+            self.assertIn(f"<target><![CDATA[{target_text}]]></target>", xliff_content)
+
+    def test_export_only_changed_segments(self):
+        """
+        Segments which are contained in the translation memory are excluded from translation, so an unchanged page
+        has no translatable units and a changed page only contains the changed segments
+        """
+        page = self.pages[1]
+        source = page.get_translation(self.german.code)
+        source.text = "<p>Text</p>\n<p>Zweiter Absatz</p>"
+        source.save()
+        PageXliffHelper().import_xliff_files(
+            [self.write_xliff(page, "About", lambda source: f"EN {source}")],
+            self.region,
+            user=None,
+        )
+        helper = PageXliffHelper(src_lang=self.german, tgt_lang=self.english)
+
+        def get_translatable_units():
+            export_path = helper.export_page_translation_xliff(page)
+            with open(export_path, "rb") as f:
+                converter = TranslationXliffConverter(xliff_code=f.read())
+            shutil.rmtree(os.path.dirname(export_path))
+            return [
+                unit.find("{*}segment/{*}source").text
+                for unit in converter.elem_file.iterchildren("{*}unit")
+                if unit.attrib.get("translate") != "no"
+            ]
+
+        self.assertEqual(get_translatable_units(), [])
+        PageTranslation.objects.create(
+            page=page,
+            language=self.german,
+            title=source.title,
+            slug=source.slug,
+            text="<p>Text</p>\n<p>Neuer Absatz</p>",
+            version=source.version + 1,
+        )
+        self.assertEqual(get_translatable_units(), ["<p>Neuer Absatz</p>"])
+
+    def test_import_reports_untranslated_segments(self):
+        """
+        Files with segments which are neither translated nor contained in the translation memory are rejected
+        """
+        xliff_path = self.write_xliff(self.pages[1], "About", lambda source: "")
+        report = PageXliffHelper().import_xliff_files(
+            [xliff_path], self.region, user=None
+        )
+        self.assertFalse(report[0]["success"])
+        self.assertIsNone(self.pages[1].get_translation("en-us"))
+
+    def test_import_other_region(self):
+        """
+        Pages of other regions and languages outside of the language tree of the region are not imported
+        """
+        other_region = Region.objects.create(
+            aliases=[], push_notification_channels=[], slug="otherregion"
+        )
+        LanguageTreeNode.objects.create(language=self.german, region=other_region)
+        xliff_path = self.write_xliff(self.pages[1], "About")
+        report = PageXliffHelper().import_xliff_files(
+            [xliff_path], other_region, user=None
+        )
+        self.assertEqual(report[0]["error"], "The page does not exist.")
+        self.assertEqual(
+            PageXliffHelper().generate_xliff_import_diff([xliff_path], other_region),
+            [],
+        )
+        self.region.language_tree_nodes.get(language=self.english).delete()
+        report = PageXliffHelper().import_xliff_files(
+            [xliff_path], self.region, user=None
+        )
+        self.assertEqual(
+            report[0]["error"], "The target language is not available in this region."
+        )
+        self.assertIsNone(self.pages[1].get_translation("en-us"))
+
+
+class XliffUploadTest(XliffTestCase):
+    """
+    Unit tests for the extraction and diff generation of uploaded XLIFF files
+    """
+
+    def write_zip(self, xliff_paths):
+        """
+        Write a zip archive containing the given XLIFF files to the upload directory
+        """
+        zip_path = os.path.join(self.upload_dir, "upload.zip")
+        with ZipFile(zip_path, "w") as zip_file:
+            for xliff_path in xliff_paths:
+                zip_file.write(
+                    xliff_path, arcname=f"nested/{os.path.basename(xliff_path)}"
+                )
+                os.remove(xliff_path)
+        return zip_path
+
+    def test_extract_zip_file(self):
+        """
+        XLIFF files are extracted flat into the upload directory
+        """
+        zip_path = self.write_zip(
+            [self.write_xliff(page, "Title") for page in self.pages]
+        )
+        xliff_paths = PageXliffHelper.extract_zip_file(zip_path)
+        self.assertEqual(len(xliff_paths), 3)
+        for xliff_path in xliff_paths:
+            self.assertEqual(os.path.dirname(xliff_path), self.upload_dir)
+            self.assertTrue(os.path.isfile(xliff_path))
+
+    def test_extract_zip_file_duplicate_names(self):
+        """
+        Files with the same name in different directories do not overwrite each other
+        """
+        zip_path = os.path.join(self.upload_dir, "upload.zip")
+        with ZipFile(zip_path, "w") as zip_file:
+            for index, page in enumerate(self.pages[:2]):
+                xliff_path = self.write_xliff(page, "Title")
+                zip_file.write(xliff_path, arcname=f"dir{index}/page.xliff")
+                os.remove(xliff_path)
+        xliff_paths = PageXliffHelper.extract_zip_file(zip_path)
+        self.assertEqual(
+            [os.path.basename(xliff_path) for xliff_path in xliff_paths],
+            ["page.xliff", "page_2.xliff"],
+        )
+
+    @override_settings(XLIFF_UPLOAD_MAX_ENTRIES=2)
+    def test_extract_zip_file_max_entries(self):
+        """
+        Archives with too many entries are rejected
+        """
+        zip_path = self.write_zip(
+            [self.write_xliff(page, "Title") for page in self.pages]
+        )
+        with self.assertRaises(ValidationError):
+            PageXliffHelper.extract_zip_file(zip_path)
+
+    @override_settings(XLIFF_UPLOAD_MAX_SIZE=100)
+    def test_extract_zip_file_max_size(self):
+        """
+        Archives which are too large when uncompressed are rejected
+        """
+        zip_path = self.write_zip([self.write_xliff(self.pages[0], "Title")])
+        with self.assertRaises(ValidationError):
+            PageXliffHelper.extract_zip_file(zip_path)
+
+    def test_generate_xliff_import_diff(self):
+        """
+        The diff contains the changed title for each file
+        """
+        xliff_paths = [self.write_xliff(page, "New title") for page in self.pages]
+        diffs = PageXliffHelper().generate_xliff_import_diff(xliff_paths, self.region)
+        self.assertEqual(len(diffs), 3)
+        for diff in diffs:
+            self.assertIn("+New title", diff["title_diff"])
+            self.assertFalse(diff["content_diff"] == "")
+        # The diff of the first page is computed against its existing translation
+        self.assertIn("-Contact", diffs[0]["title_diff"])
+
+    @override_settings(XLIFF_WORKER_PROCESSES=2)
+    def test_generate_xliff_import_diff_parallel(self):
+        """
+        Diffs computed by the worker pool are identical to serially computed diffs
+        """
+        xliff_paths = [self.write_xliff(page, "New title") for page in self.pages]
+        serial_diffs = PageXliffHelper().generate_xliff_import_diff(
+            xliff_paths, self.region
+        )
+        cache.clear()
+        with patch("cms.page_xliff_converter.XLIFF_PARALLEL_THRESHOLD", 1):
+            parallel_diffs = PageXliffHelper().generate_xliff_import_diff(
+                xliff_paths, self.region
+            )
+        self.assertEqual(serial_diffs, parallel_diffs)
+
+
+class XliffExportTest(XliffTestCase):
+    """
+    Unit tests for the multilingual XLIFF export
+    """
+
+    def setUp(self):
+        """
+        Add a third language whose source language is English
+        """
+        super().setUp()
+        self.french = Language.objects.create(
+            code="fr-fr", native_name="Français", english_name="French"
+        )
+        LanguageTreeNode.objects.create(
+            language=self.french,
+            region=self.region,
+            parent=self.region.language_tree_nodes.get(language=self.english),
+        )
+
+    def test_multilingual_export(self):
+        """
+        The archive contains one folder per target language with the XLIFFs of all translatable pages
+        """
+        zip_path = os.path.join(self.upload_dir, "export.zip")
+        # Version of the language tree cache, language tree, translations and translation memory of each language pair
+        with self.assertNumQueries(5):
+            PageXliffHelper().pages_to_zipped_multilingual_xliffs(
+                self.region, self.pages, zip_path=zip_path
+            )
+        with ZipFile(zip_path) as zip_file:
+            names = zip_file.namelist()
+        # Only the first page has an English translation which can be translated to French
+        self.assertEqual(len([name for name in names if name.startswith("en-us/")]), 3)
+        self.assertEqual(len([name for name in names if name.startswith("fr-fr/")]), 1)
+        self.assertIn(
+            f"fr-fr/testregion_en-us__fr-fr_{self.pages[0].id}_0__contact.xliff", names
+        )
+
+    def test_export_command(self):
+        """
+        The management command exports the selected target languages
+        """
+        zip_path = os.path.join(self.upload_dir, "export.zip")
+        stdout = StringIO()
+        call_command(
+            "export_xliffs",
+            "testregion",
+            languages=["en-us"],
+            output=zip_path,
+            stdout=stdout,
+        )
+        self.assertEqual(stdout.getvalue().strip(), zip_path)
+        with ZipFile(zip_path) as zip_file:
+            self.assertTrue(
+                all(name.startswith("en-us/") for name in zip_file.namelist())
+            )
@@ -0,0 +1,6 @@
+"""
+This package contains all unit tests for push notifications.
+"""
+from .push_notification_sender import *
+from .push_notification_dispatcher import *
+from .push_notification_filters import *
@@ -0,0 +1,171 @@
+"""
+This is a collection of unit tests for the dispatch queue of push notifications
+"""
+from datetime import timedelta
+
+from django.contrib.auth.models import Permission, User
+from django.core.management import call_command
+from django.utils import timezone
+from cms.constants import push_notifications as pnt_const
+from cms.forms.push_notifications import PushNotificationForm
+from cms.models import PushNotificationDelivery, PushNotificationTranslation
+from cms.views.push_notifications.push_notification_dispatcher import (
+    dispatch_pending_deliveries,
+    enqueue_due_push_notifications,
+    enqueue_push_notification,
+    get_next_scheduled_date,
+)
+
+from .push_notification_sender import FcmStandInTestCase
+
+
+class PushNotificationDispatcherTest(FcmStandInTestCase):
+    """
+    Unit tests for queueing and dispatching push notifications
+    """
+
+    def get_status(self):
+        """
+        Get the status and number of attempts of the latest delivery per language
+        """
+        return {
+            delivery.translation.language.code: (delivery.status, delivery.attempts)
+            for delivery in PushNotificationDelivery.objects.select_related(
+                "translation__language"
+            ).order_by("created_date")
+        }
+
+    def test_enqueue_and_dispatch(self):
+        """
+        Queued translations are sent by the dispatcher and the push notification is marked as sent
+        """
+        self.assertEqual(len(enqueue_push_notification(self.push_notification)), 3)
+        # A push notification cannot be queued twice
+        self.assertEqual(enqueue_push_notification(self.push_notification), [])
+        self.assertEqual(self.server.requests, [])
+        call_command("dispatch_push_notifications", once=True)
+        self.assertEqual(len(self.server.requests), 3)
+        self.assertEqual(
+            self.get_status(),
+            {
+                "de-de": (pnt_const.SENT, 1),
+                "en-us": (pnt_const.SENT, 1),
+                "ar-sa": (pnt_const.SENT, 1),
+            },
+        )
+        self.push_notification.refresh_from_db()
+        self.assertIsNotNone(self.push_notification.sent_date)
+
+    def test_dispatch_failed_delivery(self):
+        """
+        Failed deliveries stay in the queue until the maximum number of attempts is reached
+        """
+        self.server.responses = {"en-us": [500] * 12}
+        enqueue_push_notification(self.push_notification)
+        self.assertEqual(dispatch_pending_deliveries(), 3)
+        self.assertEqual(self.get_status()["en-us"], (pnt_const.PENDING, 1))
+        self.push_notification.refresh_from_db()
+        sent_date = self.push_notification.sent_date
+        self.assertIsNotNone(sent_date)
+        for _ in range(2):
+            # Failed deliveries are retried after a delay
+            self.assertEqual(dispatch_pending_deliveries(), 0)
+            PushNotificationDelivery.objects.update(next_attempt_at=timezone.now())
+            self.assertEqual(dispatch_pending_deliveries(), 1)
+        PushNotificationDelivery.objects.update(next_attempt_at=timezone.now())
+        self.assertEqual(dispatch_pending_deliveries(), 0)
+        delivery = PushNotificationDelivery.objects.get(
+            translation__language__code="en-us"
+        )
+        self.assertEqual((delivery.status, delivery.attempts), (pnt_const.FAILED, 3))
+        self.assertIn("500", delivery.last_error)
+        # Failed retries do not change the sent date
+        self.push_notification.refresh_from_db()
+        self.assertEqual(self.push_notification.sent_date, sent_date)
+
+    def test_dispatch_expired_lease(self):
+        """
+        Deliveries which were claimed by a crashed dispatcher are sent again when their lease has expired
+        """
+        enqueue_push_notification(self.push_notification)
+        PushNotificationDelivery.objects.update(
+            status=pnt_const.SENDING,
+            leased_until=timezone.now() + timedelta(minutes=1),
+        )
+        self.assertEqual(dispatch_pending_deliveries(), 0)
+        PushNotificationDelivery.objects.update(
+            leased_until=timezone.now() - timedelta(minutes=1)
+        )
+        self.assertEqual(dispatch_pending_deliveries(), 3)
+        self.assertEqual(
+            {status for status, _ in self.get_status().values()}, {pnt_const.SENT}
+        )
+
+    def test_enqueue_due_push_notifications(self):
+        """
+        Scheduled push notifications are queued exactly once when they are due
+        """
+        scheduled_for = timezone.now() + timedelta(hours=1)
+        self.push_notification.scheduled_for = scheduled_for
+        self.push_notification.save()
+        self.assertEqual(get_next_scheduled_date(), scheduled_for)
+        self.assertEqual(enqueue_due_push_notifications(), 0)
+
+        self.push_notification.scheduled_for = timezone.now() - timedelta(minutes=1)
+        self.push_notification.save()
+        call_command("schedule_push_notifications", once=True)
+        self.assertEqual(PushNotificationDelivery.objects.count(), 3)
+        self.push_notification.refresh_from_db()
+        self.assertIsNone(self.push_notification.scheduled_for)
+        self.assertIsNone(get_next_scheduled_date())
+        self.assertEqual(enqueue_due_push_notifications(), 0)
+
+        dispatch_pending_deliveries()
+        self.push_notification.refresh_from_db()
+        self.assertIsNotNone(self.push_notification.sent_date)
+
+    def test_enqueue_due_invalid_push_notifications(self):
+        """
+        Scheduled push notifications without the required texts are not queued
+        """
+        self.push_notification.scheduled_for = timezone.now() - timedelta(minutes=1)
+        self.push_notification.save()
+        PushNotificationTranslation.objects.filter(language__code="de-de").update(
+            title=""
+        )
+        self.assertEqual(enqueue_due_push_notifications(), 0)
+        PushNotificationTranslation.objects.filter(language__code="de-de").delete()
+        self.push_notification.scheduled_for = timezone.now() - timedelta(minutes=1)
+        self.push_notification.save()
+        self.assertEqual(enqueue_due_push_notifications(), 0)
+        self.assertFalse(PushNotificationDelivery.objects.exists())
+        self.push_notification.refresh_from_db()
+        self.assertIsNone(self.push_notification.scheduled_for)
+
+    def test_schedule_permission(self):
+        """
+        Only users who can send push notifications can schedule them
+        """
+        user = User.objects.create_user("editor")
+        data = {
+            "channel": self.push_notification.channel_id,
+            "mode": self.push_notification.mode,
+            "scheduled_for": (timezone.now() + timedelta(hours=1)).strftime(
+                "%Y-%m-%dT%H:%M"
+            ),
+        }
+        form = PushNotificationForm(data, instance=self.push_notification, user=user)
+        self.assertTrue(form.is_valid())
+        form.save()
+        self.push_notification.refresh_from_db()
+        self.assertIsNone(self.push_notification.scheduled_for)
+
+        user.user_permissions.add(
+            Permission.objects.get(codename="send_push_notifications")
+        )
+        user = User.objects.get(id=user.id)
+        form = PushNotificationForm(data, instance=self.push_notification, user=user)
+        self.assertTrue(form.is_valid())
+        form.save()
+        self.push_notification.refresh_from_db()
+        self.assertIsNotNone(self.push_notification.scheduled_for)
@@ -0,0 +1,86 @@
+"""
+This is a collection of unit tests for the template filters of push notifications
+"""
+from datetime import timedelta
+
+from django.test import TestCase
+from django.utils import timezone
+from cms.constants import push_notifications as pnt_const
+from cms.models import (
+    Language,
+    PushNotification,
+    PushNotificationChannel,
+    PushNotificationDelivery,
+    PushNotificationTranslation,
+    Region,
+)
+from cms.templatetags.push_notification_filters import latest_delivery, translation
+from cms.utils.translation_loader import TranslationLoader, current_translation_loader
+
+
+class LatestDeliveryFilterTest(TestCase):
+    """
+    Unit tests for :func:`~cms.templatetags.push_notification_filters.latest_delivery`
+    """
+
+    def setUp(self):
+        """
+        Create push notifications in two languages with multiple deliveries and install a translation loader
+        """
+        self.region = Region.objects.create(
+            aliases=[], push_notification_channels=[], slug="testregion"
+        )
+        self.languages = [
+            Language.objects.create(
+                code="de-de", native_name="Deutsch", english_name="German"
+            ),
+            Language.objects.create(
+                code="en-us", native_name="English", english_name="English"
+            ),
+        ]
+        channel = PushNotificationChannel.objects.create(name="news")
+        now = timezone.now()
+        for _ in range(3):
+            push_notification = PushNotification.objects.create(
+                region=self.region, channel=channel, mode="ONLY_AVAILABLE"
+            )
+            for language in self.languages:
+                pnt = PushNotificationTranslation.objects.create(
+                    push_notification=push_notification,
+                    language=language,
+                    title=f"Nachricht {push_notification.id}",
+                )
+                PushNotificationDelivery.objects.create(
+                    translation=pnt,
+                    status=pnt_const.FAILED,
+                    created_date=now - timedelta(hours=1),
+                )
+                PushNotificationDelivery.objects.create(
+                    translation=pnt, status=pnt_const.SENT, created_date=now
+                )
+        token = current_translation_loader.set(TranslationLoader())
+        self.addCleanup(current_translation_loader.reset, token)
+
+    def test_batch_loading(self):
+        """
+        The latest deliveries of all rows of the list are loaded at once
+        """
+        push_notifications = self.region.push_notifications.all()
+        current_translation_loader.get().register(push_notifications)
+        rows = list(push_notifications)
+        # One query for the ids, one for the translations and one for the deliveries
+        with self.assertNumQueries(3):
+            statuses = [
+                latest_delivery(translation(push_notification, language)).status
+                for push_notification in rows
+                for language in self.languages
+            ]
+        self.assertEqual(statuses, [pnt_const.SENT] * 6)
+
+    def test_without_loader(self):
+        """
+        The latest delivery of a single translation is loaded on demand
+        """
+        pnt = PushNotificationTranslation.objects.first()
+        self.assertEqual(latest_delivery(pnt).status, pnt_const.SENT)
+        self.assertIsNone(latest_delivery(None))
@@ -0,0 +1,145 @@
+"""
+This is a collection of unit tests for the delivery of push notifications. The requests are sent to a local stand-in
+for the FCM HTTP API.
+"""
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+from django.test import TestCase
+from cms.constants import push_notifications as pnt_const
+from cms.models import (
+    Configuration,
+    Language,
+    LanguageTreeNode,
+    PushNotification,
+    PushNotificationChannel,
+    PushNotificationTranslation,
+    Region,
+)
+from cms.views.push_notifications.push_notification_sender import (
+    PushNotificationSender,
+)
+
+
+class FcmStandInHandler(BaseHTTPRequestHandler):
+    """
+    Request handler which answers with the status codes configured in ``server.responses`` per language
+    """
+
+    def do_POST(self):  # pylint: disable=invalid-name
+        """
+        Record the message and answer with the next configured status code of its language
+        """
+        payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        language_code = payload["data"]["lanCode"]
+        with self.server.lock:
+            self.server.requests.append(payload)
+            responses = self.server.responses.get(language_code, [])
+            status_code = responses.pop(0) if responses else 200
+        body = json.dumps({"message_id": len(self.server.requests)}).encode()
+        self.send_response(status_code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        """
+        Do not log requests to stderr
+        """
+
+
+class FcmStandInTestCase(TestCase):
+    """
+    Base class for push notification tests which provides a local FCM stand-in and a push notification in three
+    languages
+    """
+
+    def setUp(self):
+        """
+        Start the FCM stand-in and create a push notification in three languages
+        """
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), FcmStandInHandler)
+        self.server.lock = threading.Lock()
+        self.server.requests = []
+        self.server.responses = {}
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        fcm_url = f"http://127.0.0.1:{self.server.server_address[1]}/fcm/send"
+        for attribute, value in [("fcm_url", fcm_url), ("backoff_factor", 0)]:
+            patcher = patch.object(PushNotificationSender, attribute, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        Configuration.objects.create(key="fcm_auth_key", value="secret")
+        region = Region.objects.create(
+            aliases=[], push_notification_channels=[], slug="testregion"
+        )
+        self.push_notification = PushNotification.objects.create(
+            region=region,
+            channel=PushNotificationChannel.objects.create(name="news"),
+            mode=pnt_const.ONLY_AVAILABLE,
+        )
+        parent = None
+        for code in ["de-de", "en-us", "ar-sa"]:
+            language = Language.objects.create(
+                code=code, native_name=code, english_name=code
+            )
+            parent = LanguageTreeNode.objects.create(
+                language=language, region=region, parent=parent
+            )
+            PushNotificationTranslation.objects.create(
+                push_notification=self.push_notification,
+                language=language,
+                title=f"Title {code}",
+                text="Text",
+            )
+
+    def tearDown(self):
+        """
+        Stop the FCM stand-in
+        """
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class PushNotificationSenderTest(FcmStandInTestCase):
+    """
+    Unit tests for the concurrent delivery of push notification translations
+    """
+
+    def test_send_all(self):
+        """
+        All translations are sent exactly once
+        """
+        sender = PushNotificationSender(self.push_notification)
+        self.assertTrue(sender.is_valid())
+        self.assertTrue(sender.send_all())
+        self.assertEqual(
+            sorted(payload["data"]["lanCode"] for payload in self.server.requests),
+            ["ar-sa", "de-de", "en-us"],
+        )
+        self.assertEqual(sender.results, {"de-de": True, "en-us": True, "ar-sa": True})
+
+    def test_send_all_retries(self):
+        """
+        Rate limits and server errors are retried
+        """
+        self.server.responses = {"en-us": [429, 503]}
+        sender = PushNotificationSender(self.push_notification)
+        self.assertTrue(sender.send_all())
+        self.assertEqual(len(self.server.requests), 5)
+
+    def test_send_all_reports_failed_languages(self):
+        """
+        The outcome is reported per language if the retries are exhausted or the request is invalid
+        """
+        self.server.responses = {"en-us": [500] * 4, "ar-sa": [400]}
+        sender = PushNotificationSender(self.push_notification)
+        self.assertFalse(sender.send_all())
+        self.assertEqual(
+            sender.results, {"de-de": True, "en-us": False, "ar-sa": False}
+        )
+        # The invalid request is not retried
+        self.assertEqual(len(self.server.requests), 6)
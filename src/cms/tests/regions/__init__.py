@@ -0,0 +1,6 @@
+"""
+This package contains all unit tests for regions.
+"""
+from .region_duplication import *
+from .region_cache import *
+from .language_tree import *
@@ -0,0 +1,85 @@
+"""
+This is a collection of unit tests for the cached language trees of regions
+"""
+from django.test import TestCase
+from cms.models import CacheVersion, Language, LanguageTreeNode, Region
+from cms.utils.language_tree_utils import LANGUAGE_TREE_CACHE_VERSION_KEY
+from cms.utils.translation_loader import TranslationLoader, current_translation_loader
+
+
+class LanguageTreeTest(TestCase):
+    """
+    Unit tests for :class:`~cms.utils.language_tree_utils.LanguageTree`
+    """
+
+    def setUp(self):
+        """
+        Create a region with the language tree German -> English -> Arabic
+        """
+        self.region = Region.objects.create(
+            aliases=[], push_notification_channels=[], slug="testregion"
+        )
+        self.languages = [
+            Language.objects.create(code=code, native_name=code, english_name=code)
+            for code in ("de", "en", "ar")
+        ]
+        parent = None
+        for language in self.languages:
+            parent = LanguageTreeNode.objects.create(
+                region=self.region, language=language, parent=parent
+            )
+
+    def get_region(self):
+        """
+        Fetch the region like the region middleware does once per request and install a new request memo
+        """
+        token = current_translation_loader.set(TranslationLoader())
+        self.addCleanup(current_translation_loader.reset, token)
+        return Region.objects.get(id=self.region.id)
+
+    def test_cached_language_tree(self):
+        """
+        The language tree is only queried once and all lookups are answered from memory
+        """
+        region = self.get_region()
+        # One query for the version of the cache and one for the tree
+        with self.assertNumQueries(2):
+            self.assertEqual(region.languages, self.languages)
+            self.assertEqual(region.default_language, self.languages[0])
+            self.assertEqual(region.get_language_or_404("en"), self.languages[1])
+            self.assertEqual(
+                region.language_tree.get_parent_language("ar"), self.languages[1]
+            )
+            self.assertEqual(region.language_tree.get_depth("ar"), 2)
+            self.assertIsNone(region.language_tree.get_parent_language("de"))
+            self.assertNotIn("fr", region.language_tree)
+        region = self.get_region()
+        # Subsequent requests only check the version
+        with self.assertNumQueries(1):
+            self.assertEqual(region.default_language, self.languages[0])
+
+    def test_invalidation(self):
+        """
+        The cached language trees are renewed when a language tree node changes
+        """
+        self.assertTrue(self.get_region().language_tree.is_active("ar"))
+        LanguageTreeNode.objects.filter(language__code="ar").get().delete()
+        self.assertEqual(self.get_region().languages, self.languages[:2])
+        node = LanguageTreeNode.objects.get(language__code="en")
+        node.active = False
+        node.save()
+        self.assertEqual(
+            self.get_region().language_tree.active_languages, (self.languages[0],)
+        )
+
+    def test_invalidation_by_other_process(self):
+        """
+        The version is read from the database, so changes of other processes are noticed without a shared cache
+        """
+        self.assertEqual(self.get_region().languages, self.languages)
+        # Another process changes the tree and renews the version
+        LanguageTreeNode.objects.filter(language__code="ar").update(active=False)
+        CacheVersion.objects.filter(key=LANGUAGE_TREE_CACHE_VERSION_KEY).update(
+            version="other-process"
+        )
+        self.assertFalse(self.get_region().language_tree.is_active("ar"))
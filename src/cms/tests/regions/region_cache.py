@@ -0,0 +1,74 @@
+"""
+This is a collection of unit tests for the cached regions of users
+"""
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AnonymousUser
+from django.test import TestCase
+from cms.models import Region, UserProfile
+from cms.utils.region_utils import get_quick_access_regions, get_user_region_ids
+
+
+class RegionCacheTest(TestCase):
+    """
+    Unit tests for the cache of the region memberships and the quick access regions
+    """
+
+    def setUp(self):
+        """
+        Create multiple regions and a user who belongs to two of them
+        """
+        self.regions = [
+            Region.objects.create(
+                aliases=[], push_notification_channels=[], slug=f"region-{i}"
+            )
+            for i in range(3)
+        ]
+        self.user = get_user_model().objects.create_user("member")
+        self.profile = UserProfile.objects.create(user=self.user)
+        self.profile.regions.add(*self.regions[:2])
+
+    def get_user(self):
+        """
+        Fetch the user like the authentication middleware does once per request
+        """
+        return get_user_model().objects.get(id=self.user.id)
+
+    def test_cached_regions(self):
+        """
+        The region memberships are queried once per request, the quick access regions only on the first request and
+        the current region is excluded from quick access
+        """
+        user = self.get_user()
+        self.assertEqual(
+            get_user_region_ids(user), {region.id for region in self.regions[:2]}
+        )
+        self.assertEqual(
+            get_quick_access_regions(user, self.regions[1]), [self.regions[0]]
+        )
+        with self.assertNumQueries(0):
+            get_user_region_ids(user)
+        user = self.get_user()
+        with self.assertNumQueries(0):
+            get_quick_access_regions(user)
+        with self.assertNumQueries(1):
+            get_user_region_ids(user)
+        self.assertEqual(len(get_quick_access_regions(AnonymousUser())), 3)
+
+    def test_invalidation(self):
+        """
+        The cache is invalidated when the region memberships change
+        """
+        get_user_region_ids(self.get_user())
+        # Revoked memberships take effect on the next request, even if the cache is not invalidated
+        with patch("cms.utils.region_utils.invalidate_region_cache"):
+            self.profile.regions.remove(self.regions[0])
+        self.assertEqual(get_user_region_ids(self.get_user()), {self.regions[1].id})
+        self.regions[2].name = "Updated region"
+        self.regions[2].save()
+        self.profile.regions.add(self.regions[2])
+        self.assertEqual(
+            get_quick_access_regions(self.get_user()),
+            [self.regions[2], self.regions[1]],
+        )
@@ -0,0 +1,165 @@
+"""
+This is a collection of unit tests for the duplication of regions
+"""
+import threading
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import connection, transaction
+from django.test import TestCase, TransactionTestCase
+from cms.constants import duplication_status
+from cms.models import (
+    Language,
+    LanguageTreeNode,
+    Page,
+    PageTranslation,
+    Region,
+    RegionDuplication,
+)
+from cms.utils.duplication_utils import duplicate_language_tree, duplicate_trees
+
+
+class RegionDuplicationTest(TestCase):
+    """
+    Unit tests for the bulk duplication of language trees, pages and page translations
+    """
+
+    def setUp(self):
+        """
+        Create a source region with two languages, a page tree and multiple revisions of the page translations
+        """
+        self.source_region = Region.objects.create(
+            aliases=[], push_notification_channels=[], slug="source"
+        )
+        self.target_region = Region.objects.create(
+            aliases=[], push_notification_channels=[], slug="target"
+        )
+        self.german = Language.objects.create(
+            code="de-de", native_name="Deutsch", english_name="German"
+        )
+        self.english = Language.objects.create(
+            code="en-us", native_name="English", english_name="English"
+        )
+        root = LanguageTreeNode.objects.create(
+            language=self.german, region=self.source_region
+        )
+        LanguageTreeNode.objects.create(
+            language=self.english, region=self.source_region, parent=root
+        )
+        first_root = Page.objects.create(region=self.source_region)
+        child = Page.objects.create(region=self.source_region, parent=first_root)
+        Page.objects.create(region=self.source_region, parent=child)
+        Page.objects.create(region=self.source_region)
+        for page in self.source_region.pages.all():
+            for version in range(2):
+                PageTranslation.objects.create(
+                    page=page,
+                    language=self.german,
+                    title=f"Seite {page.id}",
+                    slug=f"seite-{page.id}",
+                    version=version,
+                )
+            PageTranslation.objects.create(
+                page=page,
+                language=self.english,
+                title=f"Page {page.id}",
+                slug=f"page-{page.id}",
+            )
+
+    def duplicate(self, only_latest_revisions=False):
+        """
+        Duplicate the source region to the target region with the management command
+        """
+        duplicate_language_tree(self.source_region, self.target_region)
+        duplication = RegionDuplication.objects.create(
+            source_region=self.source_region,
+            target_region=self.target_region,
+            only_latest_revisions=only_latest_revisions,
+        )
+        call_command("duplicate_regions", once=True, batch_size=5, stdout=StringIO())
+        duplication.refresh_from_db()
+        return duplication
+
+    def test_duplicate_region(self):
+        """
+        The trees are duplicated with valid MPTT fields and all revisions are copied
+        """
+        duplication = self.duplicate()
+        self.assertEqual(duplication.status, duplication_status.DONE)
+        self.assertEqual((duplication.progress, duplication.total), (12, 12))
+        target_root = self.target_region.language_tree_nodes.get(level=0)
+        self.assertEqual(target_root.language, self.german)
+        self.assertEqual(
+            [node.language for node in target_root.get_descendants()], [self.english]
+        )
+        first_root, second_root = self.target_region.pages.filter(level=0).order_by(
+            "tree_id"
+        )
+        self.assertEqual(first_root.get_descendant_count(), 2)
+        self.assertEqual(
+            [page.region for page in first_root.get_descendants()],
+            [self.target_region] * 2,
+        )
+        self.assertTrue(second_root.is_leaf_node())
+        self.assertEqual(
+            PageTranslation.objects.filter(page__region=self.target_region).count(), 12
+        )
+        self.assertEqual(
+            PageTranslation.objects.filter(page__region=self.source_region).count(), 12
+        )
+        # New pages are still inserted correctly into the duplicated trees
+        new_page = Page.objects.create(region=self.target_region, parent=second_root)
+        self.assertEqual(new_page.tree_id, second_root.tree_id)
+
+    def test_duplicate_latest_revisions(self):
+        """
+        Only the latest revision per page and language is copied if requested
+        """
+        duplication = self.duplicate(only_latest_revisions=True)
+        self.assertEqual((duplication.progress, duplication.total), (8, 8))
+        self.assertEqual(
+            set(
+                PageTranslation.objects.filter(
+                    page__region=self.target_region, language=self.german
+                ).values_list("version", flat=True)
+            ),
+            {1},
+        )
+
+
+class TreeIdLockTest(TransactionTestCase):
+    """
+    Unit tests for the serialization of the tree id allocation. The lock is held by another connection, so the tests
+    are not wrapped in a transaction.
+    """
+
+    def test_root_waits_for_duplication(self):
+        """
+        A new root page does not get a tree id until a concurrent duplication of page trees is committed
+        """
+        source_region = Region.objects.create(
+            aliases=[], push_notification_channels=[], slug="source"
+        )
+        target_region = Region.objects.create(
+            aliases=[], push_notification_channels=[], slug="target"
+        )
+        source_root = Page.objects.create(region=source_region)
+        created = []
+
+        def create_root():
+            created.append(Page.objects.create(region=source_region))
+            connection.close()
+
+        with transaction.atomic():
+            copies = duplicate_trees([source_root], region=target_region)
+            thread = threading.Thread(target=create_root)
+            thread.start()
+            thread.join(0.5)
+            self.assertTrue(thread.is_alive())
+            self.assertEqual(created, [])
+        thread.join()
+        self.assertEqual(
+            sorted(Page.objects.values_list("tree_id", flat=True)),
+            [source_root.tree_id, copies[source_root.id].tree_id, created[0].tree_id],
+        )
+        self.assertEqual(len({page.tree_id for page in Page.objects.all()}), 3)
@@ -0,0 +1,151 @@
+"""
+This is a collection of unit tests for :mod:`~cms.utils.retention_utils`.
+"""
+import threading
+from datetime import timedelta
+
+from django.db import connection, transaction
+from django.test import TestCase, TransactionTestCase
+from django.utils import timezone
+
+from cms.constants import status
+from cms.models import ArchivedRevision, Language, Page, PageTranslation, Region
+from cms.utils.retention_utils import archive_revisions, select_archived_revisions
+from cms.utils.revision_utils import (
+    compact_revisions,
+    load_revision_texts,
+    lock_revisions,
+)
+
+
+class RevisionRetentionTest(TestCase):
+    """
+    Unit tests for the revision retention policy
+    """
+
+    def setUp(self):
+        """
+        Create a page with many revisions
+        """
+        region = Region.objects.create(
+            aliases=[], push_notification_channels=[], slug="testregion"
+        )
+        self.language = Language.objects.create(
+            code="de-de", native_name="Deutsch", english_name="German"
+        )
+        self.page = Page.objects.create(region=region)
+        paragraphs = [f"<p>Paragraph {i}</p>\n" for i in range(20)]
+        self.texts = {}
+        for version in range(1, 31):
+            paragraphs[version % 20] = f"<p>Version {version}</p>\n"
+            self.texts[version] = "".join(paragraphs)
+            PageTranslation.objects.create(
+                page=self.page,
+                language=self.language,
+                title=f"Version {version}",
+                text=self.texts[version],
+                status=status.PUBLIC if version in (3, 7) else status.DRAFT,
+                minor_edit=version == 7,
+                version=version,
+            )
+
+    def test_select_archived_revisions(self):
+        """
+        The latest revision and the latest public revision are never archived
+        """
+        now = timezone.now()
+        revisions = [
+            {
+                "id": version,
+                "status": status.PUBLIC if version == 2 else status.DRAFT,
+                "minor_edit": True,
+                "last_updated": now - timedelta(days=10 - version),
+            }
+            for version in range(10, 0, -1)
+        ]
+        self.assertEqual(
+            select_archived_revisions(revisions, keep_count=0), [9, 8, 7, 6, 5, 4, 3, 1]
+        )
+        self.assertEqual(
+            select_archived_revisions(revisions, keep_count=3), [7, 6, 5, 4, 3, 1]
+        )
+        self.assertEqual(
+            select_archived_revisions(revisions, cutoff=now - timedelta(days=4)),
+            [5, 4, 3, 1],
+        )
+        self.assertEqual(
+            select_archived_revisions(
+                revisions, keep_count=3, cutoff=now - timedelta(days=6)
+            ),
+            [3, 1],
+        )
+        self.assertEqual(select_archived_revisions(revisions), [])
+
+    def test_archive_revisions(self):
+        """
+        Old revisions are moved to the archive and compacted revisions stay readable
+        """
+        compact_revisions(PageTranslation, self.page.id, self.language.id)
+        self.assertEqual(sum(archive_revisions(Page, keep_count=10, dry_run=True)), 18)
+        self.assertEqual(self.page.translations.count(), 30)
+        self.assertEqual(sum(archive_revisions(Page, keep_count=10)), 18)
+        # The latest 10 revisions, the latest public revision (7) and the public major revision (3) are kept
+        self.assertEqual(
+            sorted(self.page.translations.values_list("version", flat=True)),
+            [3, 7] + list(range(21, 31)),
+        )
+        self.assertEqual(self.page.get_translation("de-de").version, 30)
+        self.assertEqual(self.page.get_public_translation("de-de").version, 7)
+        archived = ArchivedRevision.objects.get(object_id=self.page.id, version=12)
+        self.assertEqual(archived.revision.text, self.texts[12])
+        self.assertEqual(archived.revision.version, 12)
+        revisions = list(self.page.translations.all())
+        load_revision_texts(revisions)
+        for revision in revisions:
+            self.assertEqual(revision.text, self.texts[revision.version])
+        self.assertEqual(sum(archive_revisions(Page, keep_count=10)), 0)
+
+
+class RevisionLockTest(TransactionTestCase):
+    """
+    Unit tests for the serialization of compacting and archiving revisions. The lock is held by another connection,
+    so the tests are not wrapped in a transaction.
+    """
+
+    def test_compact_waits_for_lock(self):
+        """
+        Revisions are not compacted while they are locked by another transaction
+        """
+        region = Region.objects.create(
+            aliases=[], push_notification_channels=[], slug="testregion"
+        )
+        language = Language.objects.create(
+            code="de-de", native_name="Deutsch", english_name="German"
+        )
+        page = Page.objects.create(region=region)
+        # Bulk creation skips the compaction after saving
+        PageTranslation.objects.bulk_create(
+            PageTranslation(
+                page=page,
+                language=language,
+                title=f"Version {version}",
+                text=f"<p>Version {version}</p>",
+                version=version,
+            )
+            for version in range(1, 4)
+        )
+        compacted = []
+
+        def compact():
+            compacted.append(compact_revisions(PageTranslation, page.id, language.id))
+            connection.close()
+
+        with transaction.atomic():
+            lock_revisions(PageTranslation, page.id, language.id)
+            thread = threading.Thread(target=compact)
+            thread.start()
+            thread.join(0.5)
+            self.assertTrue(thread.is_alive())
+            self.assertEqual(compacted, [])
+        thread.join()
+        self.assertEqual(compacted, [2])
@@ -0,0 +1,5 @@
+"""
+This package contains all unit tests for statistics.
+"""
+from .matomo_api_manager import *
+from .statistics_importer import *
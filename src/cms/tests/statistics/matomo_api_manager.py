@@ -0,0 +1,134 @@
+"""
+This is a collection of unit tests for the Matomo API manager. The requests are sent to a local stand-in for the Matomo
+reporting API.
+"""
+import json
+import threading
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+from urllib.parse import parse_qs
+
+from django.core.cache import cache
+from django.test import SimpleTestCase
+from cms.views.statistics.matomo_api_manager import MatomoApiManager, MatomoException
+
+
+class MatomoStandInHandler(BaseHTTPRequestHandler):
+    """
+    Request handler which answers bulk requests with one visitor per day and language
+    """
+
+    def do_POST(self):  # pylint: disable=invalid-name
+        """
+        Record the request and answer each contained API request
+        """
+        data = parse_qs(self.rfile.read(int(self.headers["Content-Length"])).decode())
+        self.server.requests.append(data)
+        if data["token_auth"] != ["secret"]:
+            body = {"result": "error", "message": "Invalid token"}
+        else:
+            body = []
+            index = 0
+            while f"urls[{index}]" in data:
+                params = parse_qs(data[f"urls[{index}]"][0])
+                start, end = params["date"][0].split(",")
+                day = date.fromisoformat(start)
+                result = {}
+                while day <= date.fromisoformat(end):
+                    result[str(day)] = {"nb_uniq_visitors": index + 1}
+                    day += timedelta(days=1)
+                body.append(result)
+                index += 1
+        content = json.dumps(body).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        """
+        Do not log requests to stderr
+        """
+
+
+class MatomoApiManagerTest(SimpleTestCase):
+    """
+    Unit tests for fetching and caching visitor statistics
+    """
+
+    def setUp(self):
+        """
+        Start the Matomo stand-in
+        """
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), MatomoStandInHandler)
+        self.server.requests = []
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        patcher = patch.object(MatomoApiManager, "protocol", "http://")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.api_man = MatomoApiManager(
+            f"127.0.0.1:{self.server.server_address[1]}/", "secret", True
+        )
+        cache.clear()
+
+    def tearDown(self):
+        """
+        Stop the Matomo stand-in
+        """
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_get_visitors_per_language(self):
+        """
+        All languages are fetched with a single request
+        """
+        visitors = self.api_man.get_visitors_per_language(
+            "2020-01-01,2020-01-03", "2", "day", ["de", "en", "ar"]
+        )
+        self.assertEqual(len(self.server.requests), 1)
+        self.assertEqual(
+            visitors["en"], [["01-01-2020", 2], ["02-01-2020", 2], ["03-01-2020", 2]]
+        )
+        self.assertEqual(
+            parse_qs(self.server.requests[0]["urls[2]"][0])["segment"],
+            ["pageUrl%3D@%252Far%252Fwp-json%252F"],
+        )
+
+    def test_cache(self):
+        """
+        Closed timeranges are cached and only missing languages are fetched
+        """
+        self.api_man.get_visitors_per_timerange(
+            "2020-01-01,2020-01-03", "2", "day", "de"
+        )
+        visitors = self.api_man.get_visitors_per_language(
+            "2020-01-01,2020-01-03", "2", "day", ["de", "en"]
+        )
+        self.assertEqual(len(self.server.requests), 2)
+        self.assertNotIn("urls[1]", self.server.requests[1])
+        self.assertEqual(visitors["de"][0], ["01-01-2020", 1])
+        with patch(
+            "cms.views.statistics.matomo_api_manager.cache.set_many"
+        ) as set_many:
+            self.api_man.get_visitors_per_language(
+                f"2020-01-01,{date.today()}", "2", "day", ["de"]
+            )
+        self.assertEqual(
+            set_many.call_args[0][1], MatomoApiManager.current_cache_timeout
+        )
+
+    def test_error(self):
+        """
+        Errors of the API are raised as exceptions and not cached
+        """
+        api_man = MatomoApiManager(self.api_man.matomo_url, "invalid", True)
+        with self.assertRaises(MatomoException):
+            api_man.get_visitors_per_language(
+                "2020-01-01,2020-01-03", "2", "day", ["de"]
+            )
+        self.api_man.get_visitors_per_language(
+            "2020-01-01,2020-01-03", "2", "day", ["de"]
+        )
+        self.assertEqual(len(self.server.requests), 2)
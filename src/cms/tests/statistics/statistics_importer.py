@@ -0,0 +1,140 @@
+"""
+This is a collection of unit tests for the import of visitor statistics into the local database
+"""
+import threading
+from datetime import date
+from http.server import ThreadingHTTPServer
+from io import StringIO
+from unittest.mock import patch
+from urllib.parse import parse_qs
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+from cms.models import Language, LanguageTreeNode, Region, VisitorCount
+from cms.views.statistics.analytics_view import AnalyticsView
+from cms.views.statistics.matomo_api_manager import MatomoApiManager
+from cms.views.statistics.statistics_importer import import_visitor_counts
+
+from .matomo_api_manager import MatomoStandInHandler
+
+
+class StatisticsImporterTest(TestCase):
+    """
+    Unit tests for the incremental import of visitor counts
+    """
+
+    def setUp(self):
+        """
+        Start the Matomo stand-in and create a region with two languages
+        """
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), MatomoStandInHandler)
+        self.server.requests = []
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        patcher = patch.object(MatomoApiManager, "protocol", "http://")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.region = Region.objects.create(
+            aliases=[],
+            push_notification_channels=[],
+            slug="testregion",
+            statistics_enabled=True,
+            matomo_url=f"127.0.0.1:{self.server.server_address[1]}",
+            matomo_id=2,
+            matomo_token="secret",
+        )
+        self.german = Language.objects.create(
+            code="de-de", native_name="Deutsch", english_name="German"
+        )
+        self.english = Language.objects.create(
+            code="en-us", native_name="English", english_name="English"
+        )
+        root = LanguageTreeNode.objects.create(language=self.german, region=self.region)
+        LanguageTreeNode.objects.create(
+            language=self.english, region=self.region, parent=root
+        )
+
+    def tearDown(self):
+        """
+        Stop the Matomo stand-in
+        """
+        self.server.shutdown()
+        self.server.server_close()
+
+    def get_requested_dates(self):
+        """
+        Return the timeranges of all requests to the stand-in
+        """
+        return [
+            parse_qs(request["urls[0]"][0])["date"][0]
+            for request in self.server.requests
+        ]
+
+    def test_incremental_import(self):
+        """
+        Only days after the high-water mark are fetched, in chunks and with one request for all languages
+        """
+        stdout = StringIO()
+        call_command(
+            "import_statistics",
+            end_date=date(2020, 1, 10),
+            days=10,
+            chunk_days=7,
+            stdout=stdout,
+        )
+        self.assertEqual(stdout.getvalue().strip(), "testregion: 20")
+        self.assertEqual(
+            self.get_requested_dates(),
+            ["2020-01-01,2020-01-07", "2020-01-08,2020-01-10"],
+        )
+        self.assertEqual(
+            import_visitor_counts(self.region, end_date=date(2020, 1, 12), max_days=10),
+            4,
+        )
+        self.assertEqual(self.get_requested_dates()[-1], "2020-01-11,2020-01-12")
+        self.assertEqual(
+            VisitorCount.objects.get(
+                region=self.region, language=self.english, date=date(2020, 1, 12)
+            ).visitors,
+            2,
+        )
+
+    def test_get_visitors(self):
+        """
+        The dashboard aggregates the stored counts per month and fills in missing days
+        """
+        import_visitor_counts(self.region, end_date=date(2020, 2, 2), max_days=5)
+        dates, visitors = AnalyticsView.get_visitors(
+            self.region,
+            [self.german, self.english],
+            date(2020, 1, 1),
+            date(2020, 2, 28),
+            "month",
+        )
+        self.assertEqual(dates, ["01-2020", "02-2020"])
+        self.assertEqual(visitors[self.english.id], [6, 4])
+        dates, visitors = AnalyticsView.get_visitors(
+            self.region, [self.german], date(2020, 2, 1), date(2020, 2, 4), "day"
+        )
+        self.assertEqual(dates[0], "01-02-2020")
+        self.assertEqual(visitors[self.german.id], [1, 1, 0, 0])
+
+    def test_export_csv(self):
+        """
+        The CSV export streams one row per day with the visitors of all languages
+        """
+        import_visitor_counts(self.region, end_date=date(2020, 1, 2), max_days=2)
+        self.client.force_login(
+            get_user_model().objects.create_superuser("admin", "", "admin")
+        )
+        response = self.client.get(
+            reverse("statistics_csv", kwargs={"region_slug": "testregion"}),
+            {"start_date": "2019-12-31", "end_date": "2020-01-02"},
+        )
+        self.assertTrue(response.streaming)
+        rows = b"".join(response.streaming_content).decode().splitlines()
+        self.assertEqual(len(rows[0].split(",")), 3)
+        self.assertEqual(
+            rows[1:], ["2019-12-31,0,0", "2020-01-01,1,2", "2020-01-02,1,2"]
+        )
@@ -15,7 +15,10 @@ region_views = [
     "offers",
     "region_users",
     "settings",
+    "statistics",
+    "statistics_csv",
     "translation_coverage",
+    "translation_coverage_csv",
 ]
 
 region_language_views = [
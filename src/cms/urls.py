@@ -314,8 +314,20 @@ urlpatterns = [
                 url(r"^$", dashboard.DashboardView.as_view(), name="dashboard"),
                 url(
                     r"^translation_coverage/",
-                    analytics.TranslationCoverageView.as_view(),
-                    name="translation_coverage",
+                    include(
+                        [
+                            url(
+                                r"^$",
+                                analytics.TranslationCoverageView.as_view(),
+                                name="translation_coverage",
+                            ),
+                            url(
+                                r"^csv$",
+                                analytics.export_translation_coverage_csv,
+                                name="translation_coverage_csv",
+                            ),
+                        ]
+                    ),
                 ),
                 url(
                     r"^pages/",
@@ -654,9 +666,21 @@ urlpatterns = [
                     ),
                 ),
                 url(
-                    r"^statistics/$",
-                    statistics.AnalyticsView.as_view(),
-                    name="statistics",
+                    r"^statistics/",
+                    include(
+                        [
+                            url(
+                                r"^$",
+                                statistics.AnalyticsView.as_view(),
+                                name="statistics",
+                            ),
+                            url(
+                                r"^csv$",
+                                statistics.export_statistics_csv,
+                                name="statistics_csv",
+                            ),
+                        ]
+                    ),
                 ),
                 url(r"^settings/$", settings.SettingsView.as_view(), name="settings"),
                 url(
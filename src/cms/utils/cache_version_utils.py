@@ -0,0 +1,63 @@
+"""
+This module contains the versions of process-local caches.
+
+Cached values are stored under keys which contain the current version of their cache, so renewing the version
+invalidates all cached values at once. The versions are stored in the database (see
+:class:`~cms.models.config.cache_version.CacheVersion`) instead of the cache, because the default cache backend is
+process-local and other processes would not notice a renewed version. All versions are loaded with a single query once
+per request (see :meth:`~cms.utils.translation_loader.TranslationLoader.memoize`). Since the versions are renewed in
+the transaction which changes the cached data, other processes notice the change as soon as it is committed.
+"""
+import uuid
+
+from .translation_loader import get_translation_loader
+
+#: The key of the loaded versions in the memo of the current request
+CACHE_VERSIONS_MEMO_KEY = "cache-versions"
+
+
+def load_cache_versions():
+    """
+    Load the versions of all caches
+
+    :return: The versions with the cache keys as keys
+    :rtype: dict
+    """
+    # pylint: disable=import-outside-toplevel
+    from ..models import CacheVersion
+
+    return dict(CacheVersion.objects.values_list("key", "version"))
+
+
+def get_cache_version(key):
+    """
+    Get the current version of a cache
+
+    :param key: The key of the cache
+    :type key: str
+
+    :return: The version (an empty string if the cache was never invalidated)
+    :rtype: str
+    """
+    return (
+        get_translation_loader()
+        .memoize(CACHE_VERSIONS_MEMO_KEY, load_cache_versions)
+        .get(key, "")
+    )
+
+
+def renew_cache_version(key):
+    """
+    Invalidate a cache in all processes by renewing its version. The versions are random, so a version which was
+    rolled back is never reused.
+
+    :param key: The key of the cache
+    :type key: str
+    """
+    # pylint: disable=import-outside-toplevel
+    from ..models import CacheVersion
+
+    CacheVersion.objects.update_or_create(
+        key=key, defaults={"version": uuid.uuid4().hex}
+    )
+    get_translation_loader().memo.pop(CACHE_VERSIONS_MEMO_KEY, None)
@@ -0,0 +1,117 @@
+"""
+This module contains a cached accessor for the :class:`~cms.models.config.configuration.Configuration` key/value store.
+
+All configuration rows are loaded with a single query into a process-local dictionary, so reading a configuration is a
+dictionary access. Whenever a configuration is saved or deleted, the version of the configurations in the database is
+renewed (see :func:`invalidate_configuration_cache` and :mod:`~cms.utils.cache_version_utils`) and each process reloads
+its configurations on its next request. Changes which bypass the model signals (e.g. :meth:`~django.db.models.query.QuerySet.update`)
+are noticed after at most :setting:`CONFIGURATION_CACHE_TTL` seconds.
+"""
+import logging
+import threading
+import time
+
+from django.conf import settings
+
+from .cache_version_utils import get_cache_version, renew_cache_version
+
+logger = logging.getLogger(__name__)
+
+#: The key of the current version of the configurations
+CONFIGURATION_CACHE_VERSION_KEY = "configuration-cache-version"
+#: The strings which are interpreted as ``True`` by :func:`get_configuration`
+TRUE_VALUES = ("1", "true", "yes", "on")
+
+
+class ConfigurationStore:
+    """
+    Process-local snapshot of all configurations
+    """
+
+    def __init__(self):
+        """
+        Initialize an empty store which is loaded on the first access
+        """
+        self.lock = threading.Lock()
+        #: The configuration values with the keys as keys
+        self.values = {}
+        #: The version of the loaded configurations
+        self.version = None
+        #: The time when the configurations were loaded
+        self.loaded_at = None
+
+    def get_values(self):
+        """
+        Get all configurations and reload them if they are outdated
+
+        :return: The configuration values with the keys as keys
+        :rtype: dict
+        """
+        version = get_configuration_cache_version()
+        if (
+            version != self.version
+            or time.monotonic() - self.loaded_at > settings.CONFIGURATION_CACHE_TTL
+        ):
+            with self.lock:
+                # pylint: disable=import-outside-toplevel
+                from ..models import Configuration
+
+                self.values = dict(Configuration.objects.values_list("key", "value"))
+                self.version = version
+                self.loaded_at = time.monotonic()
+                logger.debug("Loaded %d configurations", len(self.values))
+        return self.values
+
+
+#: The configurations of the current process
+configuration_store = ConfigurationStore()
+
+
+def get_configuration_cache_version():
+    """
+    Get the current version of the configurations
+
+    :return: The version
+    :rtype: str
+    """
+    return get_cache_version(CONFIGURATION_CACHE_VERSION_KEY)
+
+
+def invalidate_configuration_cache():
+    """
+    Invalidate the loaded configurations of all processes by renewing the version
+    """
+    renew_cache_version(CONFIGURATION_CACHE_VERSION_KEY)
+
+
+def get_configuration(key, default=None, value_type=str):
+    """
+    Get the value of a configuration
+
+    :param key: The key of the configuration
+    :type key: str
+
+    :param default: The value which is returned if the configuration does not exist or cannot be converted
+    :type default: object
+
+    :param value_type: The type of the value (:class:`bool` accepts the strings in :data:`TRUE_VALUES` as ``True``)
+    :type value_type: type
+
+    :return: The value of the configuration
+    :rtype: object
+    """
+    value = configuration_store.get_values().get(key)
+    if value is None:
+        return default
+    if value_type is bool:
+        return value.strip().lower() in TRUE_VALUES
+    try:
+        return value_type(value)
+    except (TypeError, ValueError):
+        logger.warning(
+            "The configuration %r is not a valid %s: %r",
+            key,
+            value_type.__name__,
+            value,
+        )
+        return default
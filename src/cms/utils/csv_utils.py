@@ -0,0 +1,53 @@
+"""
+This module contains helpers for exporting data as CSV documents.
+"""
+import csv
+
+from django.http import StreamingHttpResponse
+
+
+class Echo:
+    """
+    Pseudo-buffer which returns the written value instead of storing it, so :func:`csv.writer` can be used to format
+    single rows (see `Streaming large CSV files <https://docs.djangoproject.com/en/2.2/howto/outputting-csv/>`_).
+    """
+
+    @staticmethod
+    def write(value):
+        """
+        Return the given value instead of writing it
+
+        :param value: The formatted CSV row
+        :type value: str
+
+        :return: The unchanged value
+        :rtype: str
+        """
+        return value
+
+
+def stream_csv(rows, filename):
+    """
+    This function returns a response which streams the given rows as CSV document. The rows are consumed lazily while
+    the response is sent, so the whole document is never held in memory.
+
+    Example usages:
+
+    * :func:`cms.views.statistics.statistics_actions.export_statistics_csv`
+    * :func:`cms.views.analytics.translation_coverage_actions.export_translation_coverage_csv`
+
+    :param rows: The rows of the document (including the header row)
+    :type rows: ~collections.abc.Iterable [ list ]
+
+    :param filename: The filename of the downloaded document
+    :type filename: str
+
+    :return: The streaming CSV response
+    :rtype: ~django.http.StreamingHttpResponse
+    """
+    writer = csv.writer(Echo())
+    response = StreamingHttpResponse(
+        (writer.writerow(row) for row in rows), content_type="text/csv; charset=utf-8"
+    )
+    response["Content-Disposition"] = f'attachment; filename="{filename}"'
+    return response
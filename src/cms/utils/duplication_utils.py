@@ -0,0 +1,273 @@
+"""
+This module contains helpers to duplicate the content of one region to another. The content is read and inserted in
+bulk: the MPTT trees keep their ``lft``, ``rght`` and ``level`` values and only get new tree ids, so no tree updates
+are necessary. Media files are not copied at all, the duplicated documents reference the same content-addressed
+blobs.
+"""
+import logging
+from itertools import islice
+
+from django.db import transaction
+from django.db.models import F, Max
+
+from ..constants import duplication_status
+from ..models import Document, LanguageTreeNode, PageTranslation, RegionDuplication
+
+logger = logging.getLogger(__name__)
+
+
+def duplicate_trees(nodes, **fields):
+    """
+    Duplicate complete MPTT trees with one bulk insert per tree level. The copies get new tree ids which are appended
+    after the highest existing tree id. The tree ids are locked until the surrounding transaction is committed, so
+    concurrent duplications and new root nodes cannot get the same tree ids.
+
+    :param nodes: All nodes of the trees which should be duplicated
+    :type nodes: list [ ~mptt.models.MPTTModel ]
+
+    :param fields: Field values which are set on all copies (e.g. the target region)
+    :type fields: dict
+
+    :return: A dict mapping the ids of the source nodes to their copies
+    :rtype: dict
+    """
+    if not nodes:
+        return {}
+    model = type(nodes[0])
+    with transaction.atomic():
+        # The tree ids stay locked until the copies are committed (see LockingTreeManager)
+        model.objects.lock_tree_ids()
+        next_tree_id = (
+            model.objects.aggregate(Max("tree_id"))["tree_id__max"] or 0
+        ) + 1
+        tree_ids = {
+            tree_id: next_tree_id + index
+            for index, tree_id in enumerate(sorted({node.tree_id for node in nodes}))
+        }
+        copies = {}
+        for level in sorted({node.level for node in nodes}):
+            level_copies = []
+            for node in nodes:
+                if node.level != level:
+                    continue
+                copy = model(
+                    **{
+                        field.attname: getattr(node, field.attname)
+                        for field in model._meta.concrete_fields
+                        if not field.primary_key
+                    },
+                )
+                copy.tree_id = tree_ids[node.tree_id]
+                if node.parent_id:
+                    copy.parent_id = copies[node.parent_id].id
+                for name, value in fields.items():
+                    setattr(copy, name, value)
+                copies[node.id] = copy
+                level_copies.append(copy)
+            model.objects.bulk_create(level_copies)
+        return copies
+
+
+def duplicate_language_tree(source_region, target_region):
+    """
+    Function to duplicate the language tree of one region to another.
+
+    :param source_region: The region from which the language tree should be duplicated
+    :type source_region: ~cms.models.regions.region.Region
+
+    :param target_region: The region to which the language tree should be added
+    :type target_region: ~cms.models.regions.region.Region
+    """
+    duplicate_trees(
+        list(LanguageTreeNode.objects.filter(region=source_region)),
+        region=target_region,
+    )
+
+
+def duplicate_pages(source_region, target_region):
+    """
+    Function to duplicate the page tree of one region to another. If the target region already contains the
+    duplicated pages (e.g. because a previous duplication failed afterwards), the existing copies are returned.
+
+    :param source_region: The region from which the pages should be duplicated
+    :type source_region: ~cms.models.regions.region.Region
+
+    :param target_region: The region to which the pages should be added
+    :type target_region: ~cms.models.regions.region.Region
+
+    :raises ValueError: If the target region contains pages which are not copies of the source region's pages
+
+    :return: A dict mapping the ids of the source pages to their copies
+    :rtype: dict
+    """
+    source_pages = list(source_region.pages.order_by("tree_id", "lft"))
+    target_pages = list(target_region.pages.order_by("tree_id", "lft"))
+    if not target_pages:
+        return duplicate_trees(source_pages, region=target_region)
+    if [(page.level, page.lft, page.rght) for page in source_pages] != [
+        (page.level, page.lft, page.rght) for page in target_pages
+    ]:
+        raise ValueError("The target region already contains other pages")
+    return {
+        source_page.id: target_page
+        for source_page, target_page in zip(source_pages, target_pages)
+    }
+
+
+def duplicate_page_translations(
+    source_region, page_copies, only_latest_revisions=False, batch_size=1000
+):
+    """
+    Function to duplicate the page translations of one region to the copies of its pages. The translations are
+    inserted in batches, each batch is reported as soon as it is inserted.
+
+    :param source_region: The region from which the page translations should be duplicated
+    :type source_region: ~cms.models.regions.region.Region
+
+    :param page_copies: A dict mapping the ids of the source pages to their copies
+    :type page_copies: dict
+
+    :param only_latest_revisions: Whether only the latest revision per page and language should be duplicated
+    :type only_latest_revisions: bool
+
+    :param batch_size: The number of translations which are inserted at once
+    :type batch_size: int
+
+    :return: An iterator over the number of translations of each inserted batch
+    :rtype: ~collections.abc.Iterator [ int ]
+    """
+    page_translations = PageTranslation.objects.filter(page__region=source_region)
+    if only_latest_revisions:
+        page_translations = page_translations.order_by(
+            "page_id", "language_id", "-version"
+        ).distinct("page_id", "language_id")
+    page_translations = page_translations.iterator(chunk_size=batch_size)
+    while True:
+        batch = list(islice(page_translations, batch_size))
+        if not batch:
+            return
+        for page_translation in batch:
+            page_translation.pk = None
+            page_translation.page = page_copies[page_translation.page_id]
+        PageTranslation.objects.bulk_create(batch)
+        yield len(batch)
+
+
+def duplicate_media(source_region, target_region):
+    """
+    Function to duplicate all media of one region to another. The content of the files is not copied, the duplicated
+    documents reference the same blobs as the source documents. Documents which already exist in the target region
+    (e.g. because a previous duplication failed afterwards) are skipped.
+
+    :param source_region: The region from which the media should be duplicated
+    :type source_region: ~cms.models.regions.region.Region
+
+    :param target_region: The region to which the media should be added
+    :type target_region: ~cms.models.regions.region.Region
+
+    :return: The number of duplicated documents
+    :rtype: int
+    """
+    existing_documents = set(
+        Document.objects.filter(region=target_region).values_list("blob_id", "name")
+    )
+    documents = [
+        document
+        for document in Document.objects.filter(region=source_region)
+        if (document.blob_id, document.name) not in existing_documents
+    ]
+    for document in documents:
+        document.pk = None
+        document.region = target_region
+    return len(Document.objects.bulk_create(documents))
+
+
+def run_region_duplication(duplication, batch_size=1000):
+    """
+    Duplicate the pages, page translations and media of a region. The page tree is duplicated in a single transaction
+    and the page translations are committed batch-wise, so the progress is visible to other processes. Failed
+    duplications can be run again, because existing page copies are reused and the page translations are replaced.
+
+    :param duplication: The duplication which should be run
+    :type duplication: ~cms.models.regions.region_duplication.RegionDuplication
+
+    :param batch_size: The number of page translations which are inserted at once
+    :type batch_size: int
+
+    :return: Whether the duplication succeeded
+    :rtype: bool
+    """
+    source_region = duplication.source_region
+    target_region = duplication.target_region
+    logger.info(
+        "Duplicate content of region %s to region %s",
+        source_region.slug,
+        target_region.slug,
+    )
+    page_translations = PageTranslation.objects.filter(page__region=source_region)
+    if duplication.only_latest_revisions:
+        page_translations = page_translations.order_by(
+            "page_id", "language_id"
+        ).distinct("page_id", "language_id")
+    RegionDuplication.objects.filter(id=duplication.id).update(
+        status=duplication_status.RUNNING,
+        progress=0,
+        total=page_translations.count(),
+        error="",
+    )
+    try:
+        with transaction.atomic():
+            page_copies = duplicate_pages(source_region, target_region)
+            PageTranslation.objects.filter(page__region=target_region).delete()
+        for inserted in duplicate_page_translations(
+            source_region,
+            page_copies,
+            duplication.only_latest_revisions,
+            batch_size,
+        ):
+            RegionDuplication.objects.filter(id=duplication.id).update(
+                progress=F("progress") + inserted
+            )
+        duplicate_media(source_region, target_region)
+    # pylint: disable=broad-except
+    except Exception as e:
+        logger.exception(
+            "Duplication of region %s to region %s failed",
+            source_region.slug,
+            target_region.slug,
+        )
+        RegionDuplication.objects.filter(id=duplication.id).update(
+            status=duplication_status.FAILED, error=str(e)[:1000]
+        )
+        return False
+    RegionDuplication.objects.filter(id=duplication.id).update(
+        status=duplication_status.DONE
+    )
+    return True
+
+
+def run_pending_region_duplication(batch_size=1000):
+    """
+    Claim the oldest pending duplication and run it. Multiple workers can run in parallel, because claimed
+    duplications are locked and skipped by the other workers.
+
+    :param batch_size: The number of page translations which are inserted at once
+    :type batch_size: int
+
+    :return: The duplication which was run (:obj:`None` if there was no pending duplication)
+    :rtype: ~cms.models.regions.region_duplication.RegionDuplication
+    """
+    with transaction.atomic():
+        duplication = (
+            RegionDuplication.objects.select_for_update(skip_locked=True, of=("self",))
+            .filter(status=duplication_status.PENDING)
+            .select_related("source_region", "target_region")
+            .order_by("created_date")
+            .first()
+        )
+        if duplication is None:
+            return None
+        duplication.status = duplication_status.RUNNING
+        duplication.save(update_fields=["status", "last_updated"])
+    run_region_duplication(duplication, batch_size)
+    return duplication
@@ -5,7 +5,7 @@ This module contains helpers for file handling.
 from ..forms.media import DocumentForm
 
 
-def save_file(request):
+def save_file(request, region=None):
     """
     This function accepts uploaded files, checks if they are valid in respect to the
     :class:`~cms.forms.media.document_form.DocumentForm` and stores them to disk if so.
@@ -15,6 +15,9 @@ def save_file(request):
     :param request: The current request submitting the file(s)
     :type request: ~django.http.HttpRequest
 
+    :param region: The region of the uploaded document
+    :type region: ~cms.models.regions.region.Region
+
     :return: A dictionary containing the :class:`~cms.forms.media.document_form.DocumentForm` object and the boolean return status
     :rtype: dict
     """
@@ -23,7 +26,7 @@ def save_file(request):
     if request.method == "POST":
         form = DocumentForm(request.POST, request.FILES)
         if form.is_valid():
-            form.save()
+            form.save(region=region)
             status = 1
     else:
         form = DocumentForm()
@@ -0,0 +1,193 @@
+"""
+This module contains the cached language trees of regions.
+
+The languages of a region, its default language and the source language of a translation are needed in almost every
+view of the backend and the API. Instead of querying the :class:`~cms.models.languages.language_tree_node.LanguageTreeNode`
+objects over and over again, the language tree of a region is loaded with a single query into an immutable
+:class:`LanguageTree` which answers all lookups from memory. The trees are cached for
+:setting:`LANGUAGE_TREE_CACHE_TTL` seconds and all cache keys contain a version which is renewed whenever a language or a
+language tree node changes (see :func:`invalidate_language_tree_cache`). The version is stored in the database (see
+:mod:`~cms.utils.cache_version_utils`), so all processes notice the change on their next request.
+"""
+from django.conf import settings
+from django.core.cache import cache
+
+from .cache_version_utils import get_cache_version, renew_cache_version
+
+#: The key of the current version of the language tree cache
+LANGUAGE_TREE_CACHE_VERSION_KEY = "language-tree-cache-version"
+
+
+class LanguageTree:
+    """
+    Immutable snapshot of the language tree of a region
+    """
+
+    __slots__ = ("_languages", "_by_code", "_parent_codes", "_active", "_depths")
+
+    def __init__(self, nodes):
+        """
+        Build the tree from its nodes
+
+        :param nodes: The language tree nodes (with their languages) in tree order
+        :type nodes: ~collections.abc.Iterable [ ~cms.models.languages.language_tree_node.LanguageTreeNode ]
+        """
+        nodes = list(nodes)
+        codes_by_node_id = {node.id: node.language.code for node in nodes}
+        self._languages = tuple(node.language for node in nodes)
+        self._by_code = {node.language.code: node.language for node in nodes}
+        self._parent_codes = {
+            node.language.code: codes_by_node_id.get(node.parent_id) for node in nodes
+        }
+        self._active = {node.language.code: node.active for node in nodes}
+        self._depths = {node.language.code: node.level for node in nodes}
+
+    @property
+    def languages(self):
+        """
+        All languages of the region in tree order
+
+        :return: The languages
+        :rtype: tuple [ ~cms.models.languages.language.Language ]
+        """
+        return self._languages
+
+    @property
+    def active_languages(self):
+        """
+        All languages of the region whose tree nodes are active in tree order
+
+        :return: The active languages
+        :rtype: tuple [ ~cms.models.languages.language.Language ]
+        """
+        return tuple(
+            language for language in self._languages if self._active[language.code]
+        )
+
+    @property
+    def default_language(self):
+        """
+        The language of the root node
+
+        :return: The default language (or ``None`` if the tree is empty)
+        :rtype: ~cms.models.languages.language.Language
+        """
+        return self._languages[0] if self._languages else None
+
+    def get_language(self, language_code):
+        """
+        Get a language of the region
+
+        :param language_code: The code of the requested language
+        :type language_code: str
+
+        :return: The language (or ``None`` if the language is not part of the tree)
+        :rtype: ~cms.models.languages.language.Language
+        """
+        return self._by_code.get(language_code)
+
+    def get_parent_language(self, language_code):
+        """
+        Get the language of the parent node, i.e. the source language of translations into the requested language
+
+        :param language_code: The code of the requested language
+        :type language_code: str
+
+        :return: The parent language (or ``None`` for the default language and languages which are not part of the tree)
+        :rtype: ~cms.models.languages.language.Language
+        """
+        return self._by_code.get(self._parent_codes.get(language_code))
+
+    def get_depth(self, language_code):
+        """
+        Get the depth of a language in the tree. The default language has the depth ``0``.
+
+        :param language_code: The code of the requested language
+        :type language_code: str
+
+        :return: The depth (or ``None`` if the language is not part of the tree)
+        :rtype: int
+        """
+        return self._depths.get(language_code)
+
+    def is_active(self, language_code):
+        """
+        Check whether the tree node of a language is active
+
+        :param language_code: The code of the requested language
+        :type language_code: str
+
+        :return: Whether the language is part of the tree and active
+        :rtype: bool
+        """
+        return self._active.get(language_code, False)
+
+    def __contains__(self, language_code):
+        """
+        Check whether a language is part of the tree
+
+        :param language_code: The code of the requested language
+        :type language_code: str
+
+        :return: Whether the language is part of the tree
+        :rtype: bool
+        """
+        return language_code in self._by_code
+
+
+def get_language_tree_cache_version():
+    """
+    Get the current version of the language tree cache
+
+    :return: The version
+    :rtype: str
+    """
+    return get_cache_version(LANGUAGE_TREE_CACHE_VERSION_KEY)
+
+
+def invalidate_language_tree_cache():
+    """
+    Invalidate the cached language trees of all regions by renewing the version of the language tree cache
+    """
+    renew_cache_version(LANGUAGE_TREE_CACHE_VERSION_KEY)
+
+
+def get_language_tree(region):
+    """
+    Get the language tree of a region. The result is cached on the region object for the current request and in the
+    cache for subsequent requests.
+
+    :param region: The region
+    :type region: ~cms.models.regions.region.Region
+
+    :return: The language tree of the region
+    :rtype: ~cms.utils.language_tree_utils.LanguageTree
+    """
+    if region.id is None:
+        return LanguageTree(())
+    if not hasattr(region, "_language_tree"):
+        cache_key = f"language-tree-{region.id}-{get_language_tree_cache_version()}"
+        language_tree = cache.get(cache_key)
+        if language_tree is None:
+            language_tree = LanguageTree(
+                region.language_tree_nodes.select_related("language").order_by(
+                    "tree_id", "lft"
+                )
+            )
+            cache.set(cache_key, language_tree, settings.LANGUAGE_TREE_CACHE_TTL)
+        # pylint: disable=protected-access
+        region._language_tree = language_tree
+    # pylint: disable=protected-access
+    return region._language_tree
+
+
+def clear_language_tree(region):
+    """
+    Clear the language tree which is cached on a region object, e.g. after the tree was changed in the current request
+
+    :param region: The region
+    :type region: ~cms.models.regions.region.Region
+    """
+    if hasattr(region, "_language_tree"):
+        # pylint: disable=protected-access
+        del region._language_tree
@@ -0,0 +1,100 @@
+"""
+This module contains helpers for the object permissions defined in :mod:`cms.rules`.
+
+The region memberships and page permissions of a user are loaded once and cached on the user object, just like
+Django's :class:`~django.contrib.auth.backends.ModelBackend` caches the model permissions. Since ``request.user`` is
+loaded once per request, the cache is request-scoped and checking the permissions of many pages (e.g. in the page
+tree) does not cause additional queries.
+"""
+from django.utils.functional import cached_property
+
+from .region_utils import get_user_region_ids
+
+
+class PagePermissionCache:
+    """
+    The cached region memberships and page permissions of a user. Each set is loaded with a single query on its first
+    access.
+    """
+
+    def __init__(self, user):
+        """
+        Initialize the cache
+
+        :param user: The user whose permissions are cached
+        :type user: ~django.contrib.auth.models.User
+        """
+        self.user = user
+
+    @cached_property
+    def region_ids(self):
+        """
+        The ids of the regions the user belongs to
+
+        :return: The region ids
+        :rtype: frozenset [ int ]
+        """
+        return get_user_region_ids(self.user)
+
+    @cached_property
+    def editable_page_ids(self):
+        """
+        The ids of the pages the user was explicitly added to as editor
+
+        :return: The page ids
+        :rtype: set [ int ]
+        """
+        return set(self.user.editable_pages.values_list("id", flat=True))
+
+    @cached_property
+    def publishable_page_ids(self):
+        """
+        The ids of the pages the user was explicitly added to as publisher
+
+        :return: The page ids
+        :rtype: set [ int ]
+        """
+        return set(self.user.publishable_pages.values_list("id", flat=True))
+
+    def is_region_member(self, region_id):
+        """
+        Check whether the user belongs to a region. Superusers and staff members belong to all regions.
+
+        :param region_id: The id of the region
+        :type region_id: int
+
+        :return: Whether the user belongs to the region
+        :rtype: bool
+        """
+        return (
+            self.user.is_superuser or self.user.is_staff or region_id in self.region_ids
+        )
+
+
+def get_page_permission_cache(user):
+    """
+    Get the permission cache of a user and create it on the first call
+
+    :param user: The user whose permissions should be checked
+    :type user: ~django.contrib.auth.models.User
+
+    :return: The permission cache of the user
+    :rtype: ~cms.utils.permission_utils.PagePermissionCache
+    """
+    if not hasattr(user, "_page_permission_cache"):
+        # pylint: disable=protected-access
+        user._page_permission_cache = PagePermissionCache(user)
+    # pylint: disable=protected-access
+    return user._page_permission_cache
+
+
+def clear_page_permission_cache(user):
+    """
+    Clear the permission cache of a user, e.g. after the user's page permissions were changed
+
+    :param user: The user whose permissions were changed
+    :type user: ~django.contrib.auth.models.User
+    """
+    if hasattr(user, "_page_permission_cache"):
+        # pylint: disable=protected-access
+        del user._page_permission_cache
@@ -0,0 +1,86 @@
+"""
+This module contains helpers for the regions of users.
+
+The ids of the regions a user belongs to and the quick access regions are needed on every request of the backend.
+The region memberships are used for permission checks, so they are only cached for the current request. The quick
+access regions are only used for navigation and are cached for :setting:`USER_REGIONS_CACHE_TTL` seconds. Their cache
+keys contain a version which is renewed whenever a region or a region membership changes (see
+:func:`invalidate_region_cache`), so outdated entries are never read again.
+"""
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+
+from ..models import Region
+
+#: The cache key of the current version of the region cache
+REGION_CACHE_VERSION_KEY = "region-cache-version"
+#: The maximum number of quick access regions
+QUICK_ACCESS_REGIONS = 10
+
+
+def get_region_cache_version():
+    """
+    Get the current version of the region cache
+
+    :return: The version
+    :rtype: str
+    """
+    return cache.get_or_set(REGION_CACHE_VERSION_KEY, uuid.uuid4().hex, None)
+
+
+def invalidate_region_cache():
+    """
+    Invalidate the cached regions of all users by renewing the version of the region cache
+    """
+    cache.set(REGION_CACHE_VERSION_KEY, uuid.uuid4().hex, None)
+
+
+def get_user_region_ids(user):
+    """
+    Get the ids of the regions a user belongs to. The result is cached on the user object for the current request
+    only, so revoked memberships take effect immediately in all processes.
+
+    :param user: The user
+    :type user: ~django.contrib.auth.models.User
+
+    :return: The ids of the user's regions
+    :rtype: frozenset [ int ]
+    """
+    if not hasattr(user, "_region_ids"):
+        # pylint: disable=protected-access
+        user._region_ids = frozenset(
+            Region.objects.filter(users__user=user).values_list("id", flat=True)
+        )
+    # pylint: disable=protected-access
+    return user._region_ids
+
+
+def get_quick_access_regions(user, current_region=None):
+    """
+    Get the regions which are available via quick access. Usually, these are the regions of the user, but if there are
+    none, all regions are listed. The most recently updated regions come first.
+
+    :param user: The user
+    :type user: ~django.contrib.auth.models.User
+
+    :param current_region: The current region which should not be contained in the quick access regions
+    :type current_region: ~cms.models.regions.region.Region
+
+    :return: At most :data:`QUICK_ACCESS_REGIONS` regions
+    :rtype: list [ ~cms.models.regions.region.Region ]
+    """
+    cache_key = f"quick-access-regions-{user.id}-{get_region_cache_version()}"
+    regions = cache.get(cache_key)
+    if regions is None:
+        region_ids = get_user_region_ids(user) if user.is_authenticated else None
+        regions = Region.objects.order_by("-last_updated")
+        if region_ids:
+            regions = regions.filter(id__in=region_ids)
+        # Fetch one additional region in case the current region has to be excluded
+        regions = list(regions[: QUICK_ACCESS_REGIONS + 1])
+        cache.set(cache_key, regions, settings.USER_REGIONS_CACHE_TTL)
+    return [region for region in regions if region != current_region][
+        :QUICK_ACCESS_REGIONS
+    ]
@@ -0,0 +1,218 @@
+"""
+This module contains the retention policy of old revisions.
+
+Every change of a page, event or POI translation creates a new revision, so the translation tables grow without bound.
+The management command ``archive_revisions`` moves old revisions into the
+:class:`~cms.models.revisions.archived_revision.ArchivedRevision` table. The policy is configured with
+:setting:`REVISION_RETENTION_COUNT`, :setting:`REVISION_RETENTION_DAYS` and :setting:`REVISION_RETENTION_KEEP_PUBLIC`.
+The latest revision and the latest public revision of each translation are never archived.
+"""
+import logging
+from datetime import timedelta
+from itertools import groupby, islice
+from operator import itemgetter
+
+from django.db import transaction
+from django.db.models import Count, Min
+from django.utils import timezone
+
+from ..constants import status
+from ..models import ArchivedRevision, Event, Page, POI
+from ..models.pages.abstract_base_page_translation import AbstractBasePageTranslation
+from .revision_utils import (
+    compact_revisions,
+    expand_dependent_revisions,
+    load_revision_texts,
+    lock_revisions,
+)
+
+logger = logging.getLogger(__name__)
+
+#: The content models whose revisions are archived
+CONTENT_MODELS = (Page, Event, POI)
+
+
+def select_archived_revisions(
+    revisions, keep_count=None, cutoff=None, keep_public=True
+):
+    """
+    Select the revisions of one translation which are archived by the retention policy
+
+    :param revisions: The ``id``, ``status``, ``minor_edit`` and ``last_updated`` of all revisions of the translation,
+                      ordered by descending version
+    :type revisions: list [ dict ]
+
+    :param keep_count: The number of latest revisions which are kept (``None`` to only archive by age)
+    :type keep_count: int
+
+    :param cutoff: Revisions which were updated after this date are kept (``None`` to only archive by count)
+    :type cutoff: ~datetime.datetime
+
+    :param keep_public: Whether public revisions which are no minor edits are kept
+    :type keep_public: bool
+
+    :return: The ids of the archived revisions
+    :rtype: list [ int ]
+    """
+    if keep_count is None and cutoff is None:
+        return []
+    archived_ids = []
+    public_seen = False
+    for index, revision in enumerate(revisions):
+        is_public = revision["status"] == status.PUBLIC
+        is_latest_public = is_public and not public_seen
+        public_seen = public_seen or is_public
+        # The latest revision and the latest public revision are always kept
+        if index == 0 or is_latest_public:
+            continue
+        if keep_public and is_public and not revision["minor_edit"]:
+            continue
+        if keep_count is not None and index < keep_count:
+            continue
+        if cutoff is not None and revision["last_updated"] >= cutoff:
+            continue
+        archived_ids.append(revision["id"])
+    return archived_ids
+
+
+def archive_revisions(
+    content_model,
+    keep_count=None,
+    max_age_days=None,
+    keep_public=True,
+    batch_size=100,
+    dry_run=False,
+):
+    """
+    Move the revisions of a content model which are not covered by the retention policy into the archive. Each batch
+    of translations is archived in its own transaction.
+
+    :param content_model: The content model (:class:`~cms.models.pages.page.Page`,
+                          :class:`~cms.models.events.event.Event` or :class:`~cms.models.pois.poi.POI`)
+    :type content_model: type
+
+    :param keep_count: The number of latest revisions which are kept (``None`` to only archive by age)
+    :type keep_count: int
+
+    :param max_age_days: The number of days for which revisions are kept (``None`` to only archive by count)
+    :type max_age_days: int
+
+    :param keep_public: Whether public revisions which are no minor edits are kept
+    :type keep_public: bool
+
+    :param batch_size: The number of translations which are processed at once
+    :type batch_size: int
+
+    :param dry_run: Whether the revisions are only counted instead of archived
+    :type dry_run: bool
+
+    :return: An iterator over the number of archived revisions of each batch
+    :rtype: ~collections.abc.Iterator [ int ]
+    """
+    if keep_count is None and max_age_days is None:
+        return
+    cutoff = (
+        timezone.now() - timedelta(days=max_age_days)
+        if max_age_days is not None
+        else None
+    )
+    related_field = content_model.translations.field
+    model = related_field.model
+    foreign_key = related_field.attname
+    # Only translations with more revisions than the kept ones (or with revisions older than the cutoff) are candidates
+    translations = (
+        model.objects.order_by(foreign_key, "language_id")
+        .values_list(foreign_key, "language_id")
+        .annotate(count=Count("id"), oldest=Min("last_updated"))
+        .filter(count__gt=max(keep_count or 1, 1))
+    )
+    if cutoff is not None:
+        translations = translations.filter(oldest__lt=cutoff)
+    translations = iter(list(translations))
+    while True:
+        batch = {
+            (object_id, language_id)
+            for object_id, language_id, _, _ in islice(translations, batch_size)
+        }
+        if not batch:
+            return
+        revisions = (
+            model.objects.filter(
+                **{f"{foreign_key}__in": {object_id for object_id, _ in batch}}
+            )
+            .order_by(foreign_key, "language_id", "-version")
+            .values(
+                "id",
+                foreign_key,
+                "language_id",
+                "status",
+                "minor_edit",
+                "last_updated",
+            )
+        )
+        archived_ids = {}
+        for key, group in groupby(
+            revisions, key=itemgetter(foreign_key, "language_id")
+        ):
+            if key in batch:
+                archived_ids[key] = select_archived_revisions(
+                    list(group), keep_count, cutoff, keep_public
+                )
+        archived_count = sum(len(ids) for ids in archived_ids.values())
+        if archived_count and not dry_run:
+            with transaction.atomic():
+                archive_translation_revisions(model, foreign_key, archived_ids)
+        logger.debug(
+            "%s %d revisions of %d %s",
+            "Found" if dry_run else "Archived",
+            archived_count,
+            len(batch),
+            model._meta.verbose_name_plural,
+        )
+        yield archived_count
+
+
+def archive_translation_revisions(model, foreign_key, archived_ids):
+    """
+    Move revisions into the archive. This has to be called inside of a transaction, since the revisions of page
+    translations are locked with :func:`~cms.utils.revision_utils.lock_revisions` until they are archived.
+
+    :param model: The model of the translations
+    :type model: type
+
+    :param foreign_key: The attribute name of the foreign key to the content object (e.g. ``page_id``)
+    :type foreign_key: str
+
+    :param archived_ids: The ids of the archived revisions per content object id and language id
+    :type archived_ids: dict
+    """
+    revision_ids = [
+        revision_id for group_ids in archived_ids.values() for revision_id in group_ids
+    ]
+    is_page_translation = issubclass(model, AbstractBasePageTranslation)
+    if is_page_translation:
+        # Lock the translations in a fixed order to avoid deadlocks between concurrent archive runs
+        for page_id, language_id in sorted(archived_ids):
+            if archived_ids[(page_id, language_id)]:
+                lock_revisions(model, page_id, language_id)
+    revisions = list(model.objects.filter(id__in=revision_ids))
+    if is_page_translation:
+        # The archive contains the full text of compacted revisions
+        load_revision_texts(revisions)
+        # Revisions which are stored as deltas to archived keyframes have to be stored in full again
+        keyframe_versions = {}
+        for revision in revisions:
+            keyframe_versions.setdefault(
+                (revision.page_id, revision.language_id), []
+            ).append(revision.version)
+        for (page_id, language_id), versions in keyframe_versions.items():
+            expand_dependent_revisions(model, page_id, language_id, versions)
+    ArchivedRevision.objects.bulk_create(
+        ArchivedRevision.from_revision(revision, getattr(revision, foreign_key))
+        for revision in revisions
+    )
+    model.objects.filter(id__in=revision_ids).delete()
+    if is_page_translation:
+        for (page_id, language_id), group_ids in archived_ids.items():
+            if group_ids:
+                compact_revisions(model, page_id, language_id)
@@ -0,0 +1,258 @@
+"""
+This module contains the compact storage of old page revisions.
+
+The latest revision and the latest public revision of a page translation are stored in full, since they are read by the
+backend, the API and the XLIFF export. All other revisions are compacted: their text is compressed with :mod:`zlib`
+and stored in ``compressed_text``. Most revisions are stored as line-based delta to a keyframe, which is an older
+revision whose text is compressed on its own. A keyframe is stored at least every :data:`KEYFRAME_INTERVAL` versions,
+so every revision can be reconstructed from at most two rows.
+
+New revisions are compacted after they are committed (see
+:meth:`~cms.models.pages.abstract_base_page_translation.AbstractBasePageTranslation.save`), the existing history can be
+compacted with the management command ``compact_revisions``. Compacting and archiving revisions of the same page
+translation is serialized with :func:`lock_revisions`, so no delta ever refers to a keyframe which was archived
+concurrently.
+"""
+import difflib
+import json
+import logging
+import zlib
+
+from django.db import connection, transaction
+from django.db.models import Q
+
+from ..constants import status
+from .slug_utils import get_lock_key
+
+logger = logging.getLogger(__name__)
+
+#: The maximum distance between a revision and the keyframe it is based on
+KEYFRAME_INTERVAL = 10
+
+
+def encode_text(text, base_text=None):
+    """
+    Compress a text, optionally as delta to a base text
+
+    :param text: The text
+    :type text: str
+
+    :param base_text: The text of the keyframe (if ``None``, the text is compressed on its own)
+    :type base_text: str
+
+    :return: The compressed text
+    :rtype: bytes
+    """
+    if base_text is None:
+        payload = text
+    else:
+        base_lines = base_text.splitlines(keepends=True)
+        lines = text.splitlines(keepends=True)
+        # Ranges of lines are copied from the base text, strings are inserted
+        payload = []
+        for tag, i1, i2, j1, j2 in difflib.SequenceMatcher(
+            None, base_lines, lines, autojunk=False
+        ).get_opcodes():
+            if tag == "equal":
+                payload.append([i1, i2])
+            elif j1 < j2:
+                payload.append("".join(lines[j1:j2]))
+    return zlib.compress(json.dumps(payload).encode("utf-8"), 9)
+
+
+def decode_text(data, base_text=None):
+    """
+    Decompress a text which was compressed with :func:`encode_text`
+
+    :param data: The compressed text
+    :type data: bytes
+
+    :param base_text: The text of the keyframe (required if the text is a delta)
+    :type base_text: str
+
+    :return: The text
+    :rtype: str
+    """
+    payload = json.loads(zlib.decompress(bytes(data)).decode("utf-8"))
+    if isinstance(payload, str):
+        return payload
+    base_lines = base_text.splitlines(keepends=True)
+    return "".join(
+        operation
+        if isinstance(operation, str)
+        else "".join(base_lines[slice(*operation)])
+        for operation in payload
+    )
+
+
+def load_revision_texts(revisions):
+    """
+    Restore the texts of compacted revisions in memory. The required keyframes are fetched with a single query.
+
+    :param revisions: The revisions
+    :type revisions: list [ ~cms.models.pages.abstract_base_page_translation.AbstractBasePageTranslation ]
+    """
+    compacted = [
+        revision for revision in revisions if revision.compressed_text is not None
+    ]
+    if not compacted:
+        return
+    model = type(compacted[0])
+    keyframe_query = Q(pk__in=[])
+    for revision in compacted:
+        if revision.base_version is not None:
+            keyframe_query |= Q(
+                page_id=revision.page_id,
+                language_id=revision.language_id,
+                version=revision.base_version,
+            )
+    keyframes = {
+        (keyframe.page_id, keyframe.language_id, keyframe.version): keyframe
+        for keyframe in model.objects.filter(keyframe_query).only(
+            "page_id", "language_id", "version", "compressed_text"
+        )
+    }
+    for revision in compacted:
+        base_text = None
+        if revision.base_version is not None:
+            keyframe = keyframes[
+                (revision.page_id, revision.language_id, revision.base_version)
+            ]
+            base_text = decode_text(keyframe.compressed_text)
+        revision.text = decode_text(revision.compressed_text, base_text)
+        revision.compressed_text = None
+        revision.base_version = None
+
+
+def lock_revisions(model, page_id, language_id):
+    """
+    Acquire a transaction-level advisory lock on the stored revisions of a page translation. It is released when the
+    current transaction ends, so this has to be called inside of a transaction.
+
+    :param model: The model of the translation (a subclass of
+                  :class:`~cms.models.pages.abstract_base_page_translation.AbstractBasePageTranslation`)
+    :type model: type
+
+    :param page_id: The id of the page
+    :type page_id: int
+
+    :param language_id: The id of the language
+    :type language_id: int
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT pg_advisory_xact_lock(%s)",
+            [get_lock_key(model._meta.db_table, "revisions", page_id, language_id)],
+        )
+
+
+def compact_revisions(model, page_id, language_id):
+    """
+    Compact all revisions of a page translation except the latest revision and the latest public revision. The
+    revisions are locked with :func:`lock_revisions` while they are compacted.
+
+    :param model: The model of the translation (a subclass of
+                  :class:`~cms.models.pages.abstract_base_page_translation.AbstractBasePageTranslation`)
+    :type model: type
+
+    :param page_id: The id of the page
+    :type page_id: int
+
+    :param language_id: The id of the language
+    :type language_id: int
+
+    :return: The number of compacted revisions
+    :rtype: int
+    """
+    with transaction.atomic():
+        lock_revisions(model, page_id, language_id)
+        revisions = model.objects.filter(page_id=page_id, language_id=language_id)
+        latest_ids = {
+            revision.id
+            for revision in (
+                revisions.only("id").first(),
+                revisions.filter(status=status.PUBLIC).only("id").first(),
+            )
+            if revision
+        }
+        # Only the uncompacted revisions and the keyframes are needed, the deltas are never changed again
+        revisions = (
+            revisions.filter(base_version__isnull=True)
+            .only("id", "version", "text", "compressed_text", "base_version")
+            .order_by("version")
+        )
+        keyframe_version = keyframe_data = keyframe_text = None
+        compacted = []
+        for revision in revisions:
+            if revision.compressed_text is not None:
+                keyframe_version, keyframe_data, keyframe_text = (
+                    revision.version,
+                    revision.compressed_text,
+                    None,
+                )
+                continue
+            if revision.id in latest_ids:
+                continue
+            revision.compressed_text = encode_text(revision.text)
+            if (
+                keyframe_version is not None
+                and revision.version - keyframe_version < KEYFRAME_INTERVAL
+            ):
+                if keyframe_text is None:
+                    keyframe_text = decode_text(keyframe_data)
+                delta = encode_text(revision.text, keyframe_text)
+                if len(delta) < len(revision.compressed_text):
+                    revision.compressed_text = delta
+                    revision.base_version = keyframe_version
+            if revision.base_version is None:
+                keyframe_version, keyframe_data, keyframe_text = (
+                    revision.version,
+                    revision.compressed_text,
+                    revision.text,
+                )
+            revision.text = ""
+            compacted.append(revision)
+        model.objects.bulk_update(
+            compacted, ["text", "compressed_text", "base_version"]
+        )
+    if compacted:
+        logger.debug(
+            "Compacted %d revisions of page %d in language %d",
+            len(compacted),
+            page_id,
+            language_id,
+        )
+    return len(compacted)
+
+
+def expand_dependent_revisions(model, page_id, language_id, keyframe_versions):
+    """
+    Store the revisions which are based on the given keyframes in full again, e.g. before the keyframes are deleted.
+    Afterwards, :func:`compact_revisions` compacts them against the remaining keyframes.
+
+    :param model: The model of the translation (a subclass of
+                  :class:`~cms.models.pages.abstract_base_page_translation.AbstractBasePageTranslation`)
+    :type model: type
+
+    :param page_id: The id of the page
+    :type page_id: int
+
+    :param language_id: The id of the language
+    :type language_id: int
+
+    :param keyframe_versions: The versions of the keyframes
+    :type keyframe_versions: list [ int ]
+
+    :return: The number of expanded revisions
+    :rtype: int
+    """
+    if not keyframe_versions:
+        return 0
+    dependents = list(
+        model.objects.filter(
+            page_id=page_id, language_id=language_id, base_version__in=keyframe_versions
+        ).only("id", "page_id", "language_id", "compressed_text", "base_version")
+    )
+    load_revision_texts(dependents)
+    model.objects.bulk_update(dependents, ["text", "compressed_text", "base_version"])
+    return len(dependents)
@@ -2,9 +2,12 @@
 This module contains helpers regarding unique string identifiers without special characters ("slugs").
 """
 
+import hashlib
 import logging
+import re
 
 from django.core.exceptions import ValidationError
+from django.db import IntegrityError, connection, transaction
 from django.utils.text import slugify
 from django.utils.translation import ugettext_lazy as _
 
@@ -12,12 +15,17 @@ from django.utils.translation import ugettext_lazy as _
 logger = logging.getLogger(__name__)
 
 
+#: The foreign models of content translations whose slugs are unique per region and language
+CONTENT_TYPES = ["page", "event", "poi"]
+
+
 def generate_unique_slug(form_object, foreign_model):
     """
     This function can be used in :mod:`~cms.forms` to clean slug fields. It will make sure the slug field contains a
     unique identifier per region and language. It can also be used for region slugs (``foreign_model`` is ``None`` in
     this case). If the slug field is empty, it creates a fallback value from either the ``title`` or the ``name`` field.
-    In case the slug exists already, it appends a counter which is increased until the slug is unique.
+    In case the slug exists already, it appends the lowest counter which makes the slug unique (see
+    :func:`~cms.utils.slug_utils.get_unique_slug`).
 
     Example usages:
 
@@ -39,7 +47,7 @@ def generate_unique_slug(form_object, foreign_model):
 
     logger.info("generate_unique_slug()")
     logger.info('foreign_model: "%s"', foreign_model)
-    if foreign_model in ["page", "event", "poi"]:
+    if foreign_model in CONTENT_TYPES:
         logger.info('region: "%s"', form_object.region)
         logger.info('language: "%s"', form_object.language)
 
@@ -48,7 +56,7 @@ def generate_unique_slug(form_object, foreign_model):
     # if slug is empty, generate from title/name
     if not slug:
         # determine fallback field of the model
-        if foreign_model in ["page", "event", "poi"]:
+        if foreign_model in CONTENT_TYPES:
             fallback = "title"
         else:
             fallback = "name"
@@ -64,39 +72,187 @@ def generate_unique_slug(form_object, foreign_model):
         if not slug:
             slug = foreign_model
 
-    unique_slug = slug
-    i = 1
-    pre_filtered_objects = form_object.Meta.model.objects
+    # The desired slug is kept, so it can be allocated again if the unique slug is taken before saving
+    form_object.base_slug = slug
+    unique_slug = get_unique_slug(
+        slug, get_other_objects(form_object, foreign_model, form_object.instance)
+    )
+
+    logger.info("unique slug: %s", unique_slug)
+    return unique_slug
+
 
-    # if the foreign model is a content type (e.g. page, event or poi), make sure slug is unique per region and language
-    if foreign_model in ["page", "event", "poi"]:
-        pre_filtered_objects = pre_filtered_objects.filter(
+def get_other_objects(form_object, foreign_model, instance):
+    """
+    This function returns all objects whose slugs must not be used by ``instance``. For content translations, these
+    are the translations of other content objects in the same region and language, otherwise all other objects of the
+    model.
+
+    :param form_object: The form which contains the slug field
+    :type form_object: ~django.forms.Form
+
+    :param foreign_model: The model of the foreign related object (see :func:`generate_unique_slug`)
+    :type foreign_model: str
+
+    :param instance: The object which should get a unique slug
+    :type instance: ~django.db.models.Model
+
+    :return: The objects whose slugs are taken
+    :rtype: ~django.db.models.query.QuerySet
+    """
+    other_objects = form_object.Meta.model.objects.all()
+    if foreign_model in CONTENT_TYPES:
+        # make sure slug is unique per region and language
+        other_objects = other_objects.filter(
             **{
                 foreign_model + "__region": form_object.region,
                 "language": form_object.language,
             }
         )
+        if getattr(instance, foreign_model + "_id"):
+            # other objects which are just other versions of this object are allowed to have the same slug
+            other_objects = other_objects.exclude(
+                **{foreign_model: instance.foreign_object}
+            )
+    elif instance.id:
+        # the current object is also allowed to have the same slug
+        other_objects = other_objects.exclude(id=instance.id)
+    return other_objects
+
+
+def get_unique_slug(slug, other_objects):
+    """
+    This function fetches all slugs of ``other_objects`` which could conflict with ``slug`` (``slug`` itself and its
+    numbered variants) with a single query and picks the first free variant.
+
+    :param slug: The desired slug
+    :type slug: str
+
+    :param other_objects: The objects whose slugs are taken
+    :type other_objects: ~django.db.models.query.QuerySet
+
+    :return: A slug which is not used by any of ``other_objects``
+    :rtype: str
+    """
+    taken_slugs = set(
+        other_objects.filter(
+            slug__startswith=slug, slug__regex=get_slug_candidates_regex([slug])
+        ).values_list("slug", flat=True)
+    )
+    return get_next_free_slug(slug, taken_slugs)
+
+
+def save_with_unique_slug(form_object, foreign_model, instance, max_attempts=3):
+    """
+    This function saves an object whose slug was cleaned by :func:`generate_unique_slug` and makes sure the slug is
+    still unique at the time of saving, even if other objects are saved concurrently:
 
-    # generate new slug while it is not unique
-    while True:
-        # get other objects with same slug
-        other_objects = pre_filtered_objects.filter(slug=unique_slug)
-        if form_object.instance.id:
-            if foreign_model in ["page", "event", "poi"]:
-                # other objects which are just other versions of this object are allowed to have the same slug
-                other_objects = other_objects.exclude(
-                    **{
-                        foreign_model: form_object.instance.foreign_object,
-                        "language": form_object.language,
-                    }
+    * Content translations may share their slug with their other versions, so the database cannot enforce unique
+      slugs. Instead, concurrent saves in the same region and language are serialized with a transaction-level
+      advisory lock and the slug is checked again while holding the lock.
+    * The slugs of all other models are unique in the database, so the object is saved and if the slug was taken in
+      the meantime, a new slug is allocated and saving is retried.
+
+    New slugs are allocated from the desired slug before the counter was appended (e.g. ``kontakt-4`` instead of
+    ``kontakt-3-2``).
+
+    :param form_object: The form which contains the slug field
+    :type form_object: ~django.forms.Form
+
+    :param foreign_model: The model of the foreign related object (see :func:`generate_unique_slug`)
+    :type foreign_model: str
+
+    :param instance: The object which should be saved
+    :type instance: ~django.db.models.Model
+
+    :param max_attempts: The maximum number of attempts to save an object with a unique database constraint
+    :type max_attempts: int
+
+    :raises ~django.db.IntegrityError: If saving failed for another reason than a taken slug or the slug could not be
+                                       allocated within ``max_attempts`` attempts
+    """
+    base_slug = getattr(form_object, "base_slug", instance.slug)
+    if foreign_model in CONTENT_TYPES:
+        with transaction.atomic():
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "SELECT pg_advisory_xact_lock(%s)",
+                    [
+                        get_lock_key(
+                            form_object.Meta.model._meta.db_table,
+                            form_object.region.id,
+                            form_object.language.id,
+                        )
+                    ],
                 )
-            else:
-                # the current object is also allowed to have the same slug
-                other_objects = other_objects.exclude(id=form_object.instance.id)
-        if not other_objects.exists():
-            break
+            instance.slug = get_unique_slug(
+                base_slug, get_other_objects(form_object, foreign_model, instance)
+            )
+            instance.save()
+        return
+    for attempt in range(1, max_attempts + 1):
+        try:
+            with transaction.atomic():
+                instance.save()
+            return
+        except IntegrityError:
+            other_objects = get_other_objects(form_object, foreign_model, instance)
+            if (
+                attempt == max_attempts
+                or not other_objects.filter(slug=instance.slug).exists()
+            ):
+                raise
+            logger.info("Slug %s was taken concurrently, retrying", instance.slug)
+            instance.slug = get_unique_slug(base_slug, other_objects)
+
+
+def get_lock_key(*scope):
+    """
+    This function converts a scope into a key for PostgreSQL advisory locks (a signed 64-bit integer)
+
+    :param scope: The values which identify the locked scope
+    :type scope: list
+
+    :return: The lock key
+    :rtype: int
+    """
+    digest = hashlib.sha256(":".join(map(str, scope)).encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big", signed=True)
+
+
+def get_slug_candidates_regex(slugs):
+    """
+    This function returns a regular expression which matches all given slugs and their numbered variants (e.g.
+    ``slug``, ``slug-2``, ``slug-3``...). It can be passed to a ``slug__regex`` lookup to fetch all potentially
+    conflicting slugs with a single query.
+
+    :param slugs: The base slugs which should be matched
+    :type slugs: ~collections.abc.Iterable [ str ]
+
+    :return: A regular expression matching the slugs and their numbered variants
+    :rtype: str
+    """
+    alternatives = "|".join(re.escape(slug) for slug in sorted(set(slugs)))
+    return f"^({alternatives})(-[0-9]+)?$"
+
+
+def get_next_free_slug(slug, taken_slugs):
+    """
+    This function picks the first variant of ``slug`` which is not contained in ``taken_slugs`` without issuing any
+    database queries. The counter starts at ``2``, so the second object with the slug ``slug`` gets ``slug-2``.
+
+    :param slug: The desired slug
+    :type slug: str
+
+    :param taken_slugs: The slugs which are already in use
+    :type taken_slugs: ~collections.abc.Container [ str ]
+
+    :return: A slug which is not contained in ``taken_slugs``
+    :rtype: str
+    """
+    unique_slug = slug
+    i = 1
+    while unique_slug in taken_slugs:
         i += 1
         unique_slug = f"{slug}-{i}"
-
-    logger.info("unique slug: %s", unique_slug)
     return unique_slug
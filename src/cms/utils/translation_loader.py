@@ -0,0 +1,172 @@
+"""
+This module contains a request-scoped loader for the translations of content objects.
+
+List templates call tags like :func:`~cms.templatetags.content_filters.get_translation` for every object and language,
+which would cause one query per call. Instead, views register the objects they render and the first tag call loads the
+latest translations of all registered objects in all languages with a single query (plus one query for the ids of each
+registered queryset). Subsequent calls are answered from memory. The content fields of the translations (e.g. the
+text of pages) are deferred, since list templates only show titles and the status.
+
+The loader of the current request is installed by :class:`~cms.middleware.TranslationLoaderMiddleware`. Outside of
+requests (e.g. in management commands), :func:`get_translation_loader` returns a new loader for each call, so the
+translations are just loaded on demand.
+"""
+from contextvars import ContextVar
+
+#: The translation loader of the current request
+current_translation_loader = ContextVar("current_translation_loader", default=None)
+
+
+class TranslationLoader:
+    """
+    Batch loader for the latest translations of content objects (e.g. :class:`~cms.models.pages.page.Page`,
+    :class:`~cms.models.events.event.Event`, :class:`~cms.models.pois.poi.POI` or
+    :class:`~cms.models.push_notifications.push_notification.PushNotification`)
+    """
+
+    def __init__(self):
+        """
+        Initialize an empty loader
+        """
+        #: The registered querysets and object ids per model which are loaded on the next call
+        self.pending = {}
+        #: The latest translation per model, object id and language code
+        self.translations = {}
+        #: Values which are computed once per request (see :meth:`memoize`)
+        self.memo = {}
+
+    def register(self, objects):
+        """
+        Register objects whose translations will be needed. Querysets are not evaluated until the first translation is
+        requested.
+
+        :param objects: The content objects
+        :type objects: ~django.db.models.query.QuerySet or list
+        """
+        if hasattr(objects, "values_list"):
+            self.pending.setdefault(objects.model, []).append(objects)
+            return
+        for instance in objects:
+            self.pending.setdefault(type(instance), []).append(instance.pk)
+
+    def get_translations(self, instance):
+        """
+        Get the latest translations of a content object in all languages
+
+        :param instance: The content object
+        :type instance: ~django.db.models.Model
+
+        :return: The latest translation per language code
+        :rtype: dict
+        """
+        model = type(instance)
+        loaded = self.translations.setdefault(model, {})
+        if instance.pk not in loaded:
+            self.pending.setdefault(model, []).append(instance.pk)
+            self.load(model)
+        return loaded.get(instance.pk, {})
+
+    def get_translation(self, instance, language_code):
+        """
+        Get the latest translation of a content object in the requested language
+
+        :param instance: The content object
+        :type instance: ~django.db.models.Model
+
+        :param language_code: The code of the requested language
+        :type language_code: str
+
+        :return: The translation (or ``None`` if the object is not translated into the requested language)
+        :rtype: ~django.db.models.Model
+        """
+        return self.get_translations(instance).get(language_code)
+
+    def load(self, model):
+        """
+        Load the latest translations of all pending objects of a model (one query for the ids of registered querysets
+        and one query for the translations)
+
+        :param model: The model of the content objects
+        :type model: type
+        """
+        ids = set()
+        for item in self.pending.pop(model, []):
+            if hasattr(item, "values_list"):
+                ids.update(item.values_list("pk", flat=True))
+            else:
+                ids.add(item)
+        related_field = model.translations.field
+        translation_model = related_field.model
+        # The column is used instead of the relation, since ordering by a relation expands to the ordering of the
+        # related model, which would not match the DISTINCT ON expression
+        foreign_key = related_field.attname
+        ordering = [
+            field
+            for field in translation_model._meta.ordering
+            if field.lstrip("-") not in (related_field.name, foreign_key)
+        ] or ["pk"]
+        translations = (
+            translation_model.objects.filter(**{f"{foreign_key}__in": ids})
+            # List views only show titles and status, so the large text columns are not loaded
+            .defer(*getattr(translation_model, "content_fields", ()))
+            .select_related("language")
+            .order_by(foreign_key, "language_id", *ordering)
+            .distinct(foreign_key, "language_id")
+        )
+        loaded = self.translations.setdefault(model, {})
+        for object_id in ids:
+            loaded.setdefault(object_id, {})
+        for translation in translations:
+            loaded.setdefault(getattr(translation, foreign_key), {})[
+                translation.language.code
+            ] = translation
+
+    def memoize(self, key, function):
+        """
+        Compute a value once per request
+
+        :param key: The key of the value
+        :type key: ~collections.abc.Hashable
+
+        :param function: The function which computes the value
+        :type function: ~collections.abc.Callable
+
+        :return: The value
+        :rtype: object
+        """
+        if key not in self.memo:
+            self.memo[key] = function()
+        return self.memo[key]
+
+
+def get_translation_loader():
+    """
+    Get the translation loader of the current request
+
+    :return: The translation loader of the current request or a new loader if there is no current request
+    :rtype: ~cms.utils.translation_loader.TranslationLoader
+    """
+    return current_translation_loader.get() or TranslationLoader()
+
+
+def get_first_translation(instance, priority_language_codes):
+    """
+    Get the first available translation of a content object from the translation loader of the current request. This
+    is the batched counterpart of :meth:`~cms.models.pages.abstract_base_page.AbstractBasePage.get_first_translation`
+    which is used for labels in page pickers.
+
+    :param instance: The content object
+    :type instance: ~django.db.models.Model
+
+    :param priority_language_codes: The codes of the preferred languages (a lower list index means a higher priority)
+    :type priority_language_codes: list [ str ]
+
+    :return: The first translation which matches one of the languages, any translation if none matches or ``None`` if
+             the object has no translations
+    :rtype: ~django.db.models.Model
+    """
+    translations = get_translation_loader().get_translations(instance)
+    for language_code in priority_language_codes + ["en-us", "de-de"]:
+        if language_code in translations:
+            return translations[language_code]
+    return next(iter(translations.values()), None)
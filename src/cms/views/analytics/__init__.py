@@ -2,3 +2,4 @@
 Python standard Init-File
 """
 from .translation_coverage_view import TranslationCoverageView
+from .translation_coverage_actions import export_translation_coverage_csv
@@ -0,0 +1,48 @@
+"""
+This module contains view actions for the translation coverage report
+"""
+from django.contrib.auth.decorators import login_required
+from django.utils.translation import ugettext as _
+
+from .translation_coverage_view import TranslationCoverageView
+from ...decorators import region_permission_required
+from ...models import Region
+from ...utils.csv_utils import stream_csv
+
+
+@login_required
+@region_permission_required
+def export_translation_coverage_csv(request, region_slug):
+    """
+    Download the translation coverage of all languages of a region as CSV document
+
+    :param request: The current request
+    :type request: ~django.http.HttpRequest
+
+    :param region_slug: The slug of the current region
+    :type region_slug: str
+
+    :return: A streaming CSV response
+    :rtype: ~django.http.StreamingHttpResponse
+    """
+    region = Region.get_current_region(request)
+    header = [
+        _("Language"),
+        _("Translations up-to-date"),
+        _("Currently in translation"),
+        _("Translations outdated"),
+        _("Translations missing"),
+    ]
+
+    def rows():
+        yield header
+        for coverage in TranslationCoverageView.iter_coverage(region):
+            yield [
+                coverage["translated_name"],
+                coverage["num_page_translations_up_to_date"],
+                coverage["num_page_translations_currently_in_translation"],
+                coverage["num_page_translations_outdated"],
+                coverage["num_page_translations_missing"],
+            ]
+
+    return stream_csv(rows(), f"translation_coverage_{region_slug}.csv")
@@ -18,11 +18,19 @@ class TranslationCoverageView(TemplateView):
     template_name = "analytics/translation_coverage.html"
     base_context = {"current_menu_item": "translation_coverage"}
 
-    def get(self, request, *args, **kwargs):
+    @staticmethod
+    def iter_coverage(region):
+        """
+        Iterate over the translation coverage of all languages of a region. The coverage of each language is only
+        computed when it is requested.
 
-        region = Region.get_current_region(request)
+        :param region: The region
+        :type region: ~cms.models.regions.region.Region
+
+        :return: An iterator over the coverage of each language
+        :rtype: ~collections.abc.Iterator [ dict ]
+        """
         num_pages = region.pages.count()
-        languages = []
 
         for language in region.languages:
             # page_translations = PageTranslation.get_translations(region, language)
@@ -31,23 +39,26 @@ class TranslationCoverageView(TemplateView):
                 .filter(page__region=region, language=language)
                 .distinct("page")
             )
-            languages.append(
-                {
-                    "translated_name": language.translated_name,
-                    "num_page_translations_up_to_date": len(
-                        [t for t in page_translations if t.is_up_to_date]
-                    ),
-                    "num_page_translations_currently_in_translation": len(
-                        [t for t in page_translations if t.currently_in_translation]
-                    ),
-                    "num_page_translations_outdated": len(
-                        [t for t in page_translations if t.is_outdated]
-                    ),
-                    "num_page_translations_missing": num_pages
-                    - page_translations.count(),
-                }
-            )
+            yield {
+                "translated_name": language.translated_name,
+                "num_page_translations_up_to_date": len(
+                    [t for t in page_translations if t.is_up_to_date]
+                ),
+                "num_page_translations_currently_in_translation": len(
+                    [t for t in page_translations if t.currently_in_translation]
+                ),
+                "num_page_translations_outdated": len(
+                    [t for t in page_translations if t.is_outdated]
+                ),
+                "num_page_translations_missing": num_pages - page_translations.count(),
+            }
+
+    def get(self, request, *args, **kwargs):
+
+        region = Region.get_current_region(request)
 
         return render(
-            request, self.template_name, {**self.base_context, "languages": languages}
+            request,
+            self.template_name,
+            {**self.base_context, "languages": list(self.iter_coverage(region))},
         )
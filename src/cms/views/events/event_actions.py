@@ -11,6 +11,7 @@ from django.utils.translation import ugettext as _
 from ...constants import status
 from ...decorators import region_permission_required, staff_required
 from ...models import Region, POITranslation
+from ...utils.translation_loader import get_translation_loader
 
 logger = logging.getLogger(__name__)
 
@@ -101,15 +102,13 @@ def search_poi_ajax(request):
         .values("id")
     )
     # All POIs which are not archived and have a latest public revision which contains the query
-    poi_query_result = (
-        region.pois.prefetch_related("translations")
-        .filter(
-            archived=False,
-            translations__in=Subquery(latest_public_poi_revisions),
-            translations__title__icontains=poi_query,
-        )
-        .distinct()
-    )
+    poi_query_result = region.pois.filter(
+        archived=False,
+        translations__in=Subquery(latest_public_poi_revisions),
+        translations__title__icontains=poi_query,
+    ).distinct()
+    # Load the translations of all found pois at once
+    get_translation_loader().register(poi_query_result)
 
     return render(
         request,
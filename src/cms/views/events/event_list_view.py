@@ -10,8 +10,9 @@ from django.views.generic import TemplateView
 
 from ...constants import all_day, recurrence
 from ...decorators import region_permission_required
-from ...models import Region
+from ...models import POI, Region
 from ...forms.events import EventFilterForm
+from ...utils.translation_loader import get_translation_loader
 
 
 @method_decorator(login_required, name="dispatch")
@@ -37,7 +38,7 @@ class EventListView(LoginRequiredMixin, PermissionRequiredMixin, TemplateView):
         # current language
         language_code = kwargs.get("language_code")
         if language_code:
-            language = region.languages.get(code=language_code)
+            language = region.get_language_or_404(language_code)
         elif region.default_language is not None:
             return redirect(
                 "events",
@@ -129,6 +130,12 @@ class EventListView(LoginRequiredMixin, PermissionRequiredMixin, TemplateView):
             event_filter_form.changed_data.clear()
             poi = None
 
+        events = events.select_related("location")
+        # Load the translations of all events and their locations at once
+        translation_loader = get_translation_loader()
+        translation_loader.register(events)
+        translation_loader.register(POI.objects.filter(events__in=events))
+
         return render(
             request,
             self.template_name,
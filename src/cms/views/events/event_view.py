@@ -4,7 +4,7 @@ from django.contrib import messages
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth.mixins import PermissionRequiredMixin
 from django.core.exceptions import PermissionDenied
-from django.shortcuts import render, redirect, get_object_or_404
+from django.shortcuts import render, redirect
 from django.utils.decorators import method_decorator
 from django.utils.translation import ugettext as _
 from django.views.generic import TemplateView
@@ -12,7 +12,7 @@ from django.views.generic import TemplateView
 from ...constants import status
 from ...decorators import region_permission_required
 from ...forms.events import EventForm, EventTranslationForm, RecurrenceRuleForm
-from ...models import Region, Language, Event, EventTranslation, RecurrenceRule, POI
+from ...models import Region, Event, EventTranslation, RecurrenceRule, POI
 
 logger = logging.getLogger(__name__)
 
@@ -28,7 +28,7 @@ class EventView(PermissionRequiredMixin, TemplateView):
     # pylint: disable=too-many-locals
     def get(self, request, *args, **kwargs):
         region = Region.get_current_region(request)
-        language = get_object_or_404(region.languages, code=kwargs.get("language_code"))
+        language = region.get_language_or_404(kwargs.get("language_code"))
 
         # get event and event translation objects if they exist, otherwise objects are None
         event_instance = region.events.filter(id=kwargs.get("event_id")).first()
@@ -79,7 +79,7 @@ class EventView(PermissionRequiredMixin, TemplateView):
     # pylint: disable=too-many-locals,too-many-branches
     def post(self, request, **kwargs):
         region = Region.get_current_region(request)
-        language = Language.objects.get(code=kwargs.get("language_code"))
+        language = region.get_language_or_404(kwargs.get("language_code"))
         poi = POI.objects.filter(id=request.POST.get("poi_id")).first()
 
         event_instance = Event.objects.filter(id=kwargs.get("event_id")).first()
@@ -1,5 +1,6 @@
 from django.contrib.auth.decorators import login_required
-from django.shortcuts import redirect
+from django.db.models import Q
+from django.shortcuts import get_object_or_404, redirect
 
 from ...decorators import region_permission_required
 from ...models import Document, Region
@@ -12,7 +13,9 @@ def delete_file(request, document_id, region_slug):
     region = Region.get_current_region(request)
 
     if request.method == "POST":
-        document = Document.objects.get(id=document_id)
+        document = get_object_or_404(
+            Document, Q(region=region) | Q(region=None), id=document_id
+        )
         document.delete()
 
     return redirect("media", **{"region_slug": region.slug})
@@ -1,5 +1,6 @@
 from django.contrib.auth.decorators import login_required
-from django.shortcuts import render, redirect
+from django.db.models import Q
+from django.shortcuts import get_object_or_404, render, redirect
 from django.utils.decorators import method_decorator
 from django.views.generic import TemplateView
 
@@ -20,7 +21,9 @@ class MediaEditView(TemplateView):
         document_id = kwargs.get("document_id")
         form = DocumentForm()
         if document_id != "0":
-            document = Document.objects.get(id=document_id)
+            document = get_object_or_404(
+                Document, Q(region=region) | Q(region=None), id=document_id
+            )
             form = DocumentForm(instance=document)
 
         return render(
@@ -38,7 +41,7 @@ class MediaEditView(TemplateView):
         # current region
         region = Region.get_current_region(request)
 
-        result = save_file(request)
+        result = save_file(request, region)
 
         if result.get("status") == 1:
             return redirect("media", **{"region_slug": region.slug})
@@ -1,10 +1,11 @@
 from django.contrib.auth.decorators import login_required
+from django.db.models import Q
 from django.shortcuts import render
 from django.utils.decorators import method_decorator
 from django.views.generic import TemplateView
 
 from ...decorators import region_permission_required
-from ...models import Document
+from ...models import Document, Region
 
 
 @method_decorator(login_required, name="dispatch")
@@ -14,7 +15,10 @@ class MediaListView(TemplateView):
     base_context = {"current_menu_item": "media"}
 
     def get(self, request, *args, **kwargs):
-        documents = Document.objects.all()
+        region = Region.get_current_region(request)
+        documents = Document.objects.filter(
+            Q(region=region) | Q(region=None)
+        ).select_related("blob")
 
         return render(
             request, self.template_name, {**self.base_context, "documents": documents}
@@ -6,7 +6,10 @@ Returns:
 import json
 import logging
 import os
+import shutil
 import uuid
+from zipfile import BadZipFile
+
 import pyperclip
 
 from mptt.exceptions import InvalidMove
@@ -14,10 +17,10 @@ from mptt.exceptions import InvalidMove
 from django.contrib import messages
 from django.contrib.auth import get_user_model
 from django.contrib.auth.decorators import login_required, permission_required
-from django.core.exceptions import PermissionDenied
-from django.http import JsonResponse
+from django.core.exceptions import PermissionDenied, ValidationError
+from django.http import Http404, JsonResponse
 from django.shortcuts import render, redirect, get_object_or_404, get_list_or_404
-from django.utils.translation import ugettext as _
+from django.utils.translation import ugettext as _, get_language
 from django.views.static import serve
 from django.http import HttpResponseNotFound
 
@@ -26,6 +29,8 @@ from ...decorators import region_permission_required, staff_required
 from ...forms.pages import PageForm
 from ...models import Page, Language, Region, PageTranslation
 from ...page_xliff_converter import PageXliffHelper, XLIFFS_DIR
+from ...utils.permission_utils import clear_page_permission_cache
+from ...utils.translation_loader import get_first_translation, get_translation_loader
 
 logger = logging.getLogger(__name__)
 
@@ -164,6 +169,8 @@ def expand_short_url(request, short_url_id):
 def download_xliff(request, region_slug, language_code):
     """
     Create zip file that contains XLIFF files for target language.
+    If ``target_lang`` is ``all`` or a comma-separated list of language codes, the archive contains one folder for each
+    of these target languages.
     """
     page_ids = []
     for page_id in request.GET.get("pages").split(","):
@@ -172,16 +179,28 @@ def download_xliff(request, region_slug, language_code):
     if page_ids:
         region = Region.get_current_region(request)
         pages = get_list_or_404(region.pages, id__in=page_ids)
-        target_language = get_object_or_404(
-            region.language_tree_nodes, language__code=request.GET.get("target_lang")
-        ).language
-        source_language = get_object_or_404(
-            region.language_tree_nodes, language=target_language
-        ).parent.language
-        page_xliff_helper = PageXliffHelper(
-            src_lang=source_language, tgt_lang=target_language
-        )
-        zip_path = page_xliff_helper.pages_to_zipped_xliffs(region, pages)
+        target_lang = request.GET.get("target_lang", "")
+        page_xliff_helper = PageXliffHelper()
+        if target_lang == "all":
+            zip_path = page_xliff_helper.pages_to_zipped_multilingual_xliffs(
+                region, pages
+            )
+        elif "," in target_lang:
+            target_languages = get_list_or_404(
+                Language, code__in=target_lang.split(",")
+            )
+            zip_path = page_xliff_helper.pages_to_zipped_multilingual_xliffs(
+                region, pages, target_languages
+            )
+        else:
+            target_language = region.get_language_or_404(target_lang)
+            source_language = region.language_tree.get_parent_language(target_lang)
+            if not source_language:
+                raise Http404
+            page_xliff_helper = PageXliffHelper(
+                src_lang=source_language, tgt_lang=target_language
+            )
+            zip_path = page_xliff_helper.pages_to_zipped_xliffs(region, pages)
         if zip_path is not None and zip_path.startswith(XLIFFS_DIR):
             response = serve(
                 request, zip_path.split(XLIFFS_DIR)[1], document_root=XLIFFS_DIR
@@ -212,22 +231,40 @@ def upload_xliff(request, region_slug, language_code):
             for chunk in upload_file.chunks():
                 file_write.write(chunk)
         if upload_file.name.endswith(".zip"):
-            xliff_paths = xliff_helper.extract_zip_file(
-                os.path.join(upload_dir, upload_file.name)
-            )
+            try:
+                xliff_paths = xliff_helper.extract_zip_file(
+                    os.path.join(upload_dir, upload_file.name)
+                )
+            except (BadZipFile, ValidationError) as e:
+                logger.warning("Could not extract XLIFF archive: %s", e)
+                shutil.rmtree(upload_dir)
+                messages.error(
+                    request,
+                    e.message
+                    if isinstance(e, ValidationError)
+                    else _("The uploaded file is not a valid zip archive."),
+                )
+                return redirect(
+                    "pages",
+                    **{
+                        "region_slug": region_slug,
+                        "language_code": language_code,
+                    },
+                )
         elif upload_file.name.endswith((".xliff", ".xlf")):
             xliff_paths = [os.path.join(upload_dir, upload_file.name)]
         else:  # no supported file name ending
             xliff_paths = []
+        region = Region.get_current_region(request)
         return render(
             request,
             "pages/page_xliff_confirm.html",
             {
                 "upload_dir": os.path.basename(upload_dir),
                 "translation_diffs": xliff_helper.generate_xliff_import_diff(
-                    xliff_paths
+                    xliff_paths, region
                 ),
-                "language": Language.objects.get(code=language_code),
+                "language": region.get_language_or_404(language_code),
             },
         )
     return redirect(
@@ -252,7 +289,23 @@ def confirm_xliff_import(request, region_slug, language_code):
             and f.endswith((".xliff", ".xlf"))
         ]
         xliff_helper = PageXliffHelper()
-        xliff_helper.import_xliff_files(xliff_paths, user=request.user)
+        for result in xliff_helper.import_xliff_files(
+            xliff_paths, Region.get_current_region(request), request.user
+        ):
+            if result["success"]:
+                messages.success(
+                    request,
+                    _('XLIFF file "{file}" was imported successfully.').format(
+                        file=result["xliff_name"]
+                    ),
+                )
+            else:
+                messages.error(
+                    request,
+                    _('XLIFF file "{file}" could not be imported: {error}').format(
+                        file=result["xliff_name"], error=result["error"]
+                    ),
+                )
     return redirect(
         "pages",
         **{
@@ -359,6 +412,7 @@ def grant_page_permission_ajax(request):
             else:
                 # else grant the permission by adding the user to the editors of the page
                 page.editors.add(user)
+                clear_page_permission_cache(user)
                 page.save()
                 message = _("Success: The user {user} can now edit this page.").format(
                     user=user.username
@@ -374,6 +428,7 @@ def grant_page_permission_ajax(request):
             else:
                 # else grant the permission by adding the user to the publishers of the page
                 page.publishers.add(user)
+                clear_page_permission_cache(user)
                 page.save()
                 message = _(
                     "Success: The user {user} can now publish this page."
@@ -452,6 +507,7 @@ def revoke_page_permission_ajax(request):
             if user in page.editors.all():
                 # revoke the permission by removing the user to the editors of the page
                 page.editors.remove(user)
+                clear_page_permission_cache(user)
                 page.save()
             # check, if the user has this permission anyway
             if user.has_perm("cms.edit_page", page):
@@ -469,6 +525,7 @@ def revoke_page_permission_ajax(request):
             if user in page.publishers.all():
                 # revoke the permission by removing the user to the publishers of the page
                 page.publishers.remove(user)
+                clear_page_permission_cache(user)
                 page.save()
             # check, if the user already has this permission
             if user.has_perm("cms.publish_page", page):
@@ -579,19 +636,18 @@ def get_pages_list_ajax(request):
         page.save()
         return JsonResponse({"nolist": True})
     region = get_object_or_404(Region, id=decoded_json["region"])
+    # Load all pages and their titles at once and build the paths from the parent relations
+    pages = {page.id: page for page in region.pages.all()}
+    get_translation_loader().register(pages.values())
+    language_codes = [get_language(), region.default_language.code]
     result = []
-    for page in region.pages.all():
-        result.append(
-            {
-                "id": page.id,
-                "name": " -> ".join(
-                    [
-                        page_iter.best_language_title()
-                        for page_iter in page.get_ancestors(include_self=True)
-                    ]
-                ),
-            }
-        )
+    for page in pages.values():
+        path = []
+        page_iter = page
+        while page_iter:
+            path.insert(0, get_first_translation(page_iter, language_codes).title)
+            page_iter = pages.get(page_iter.parent_id)
+        result.append({"id": page.id, "name": " -> ".join(path)})
     result = sorted(result, key=lambda k: k["name"])
     return JsonResponse(result, safe=False)
 
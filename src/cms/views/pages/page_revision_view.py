@@ -9,7 +9,8 @@ from django.views.generic import TemplateView
 
 from ...constants import status
 from ...decorators import region_permission_required
-from ...models import Region, Language
+from ...models import Region
+from ...utils.revision_utils import load_revision_texts
 
 
 @method_decorator(login_required, name="dispatch")
@@ -30,13 +31,12 @@ class PageRevisionView(PermissionRequiredMixin, TemplateView):
         region = Region.get_current_region(request)
         page = get_object_or_404(region.pages, id=kwargs.get("page_id"))
 
-        language = get_object_or_404(
-            region.language_tree_nodes, language__code=kwargs.get("language_code")
-        ).language
+        language = region.get_language_or_404(kwargs.get("language_code"))
 
         page_translations = page.translations.filter(language=language)
+        revisions = list(page_translations.without_content().select_related("creator"))
 
-        if not page_translations.exists():
+        if not revisions:
             return redirect(
                 "edit_page",
                 **{
@@ -52,11 +52,12 @@ class PageRevisionView(PermissionRequiredMixin, TemplateView):
                 _("You don't have the permission to restore revisions of this page."),
             )
 
-        selected_revision = page_translations.filter(
-            version=kwargs.get("selected_revision", page_translations.count())
+        selected_version = int(kwargs.get("selected_revision", revisions[0].version))
+        context = self.get_revision_context(
+            page_translations, revisions, selected_version
         )
 
-        if not selected_revision.exists():
+        if not context:
             messages.error(request, _("This revision does not exist."))
             return redirect(
                 "page_revisions",
@@ -78,10 +79,8 @@ class PageRevisionView(PermissionRequiredMixin, TemplateView):
             self.template_name,
             {
                 **self.base_context,
+                **context,
                 "page": page,
-                "page_translations": page_translations,
-                "api_revision": page_translations.filter(status=status.PUBLIC).first(),
-                "selected_revision": selected_revision.first(),
                 "language": language,
             },
         )
@@ -95,7 +94,7 @@ class PageRevisionView(PermissionRequiredMixin, TemplateView):
         if not request.user.has_perm("cms.edit_page", page):
             raise PermissionDenied
 
-        language = Language.objects.get(code=kwargs.get("language_code"))
+        language = region.get_language_or_404(kwargs.get("language_code"))
 
         revision = page.translations.filter(
             language=language, version=request.POST.get("revision")
@@ -112,6 +111,7 @@ class PageRevisionView(PermissionRequiredMixin, TemplateView):
                 }
             )
 
+        load_revision_texts([revision])
         current_revision = page.get_translation(language.code)
 
         if (
@@ -151,16 +151,73 @@ class PageRevisionView(PermissionRequiredMixin, TemplateView):
         messages.success(request, _("The revision was successfully restored"))
 
         page_translations = page.translations.filter(language=language)
+        revisions = list(page_translations.without_content().select_related("creator"))
 
         return render(
             request,
             self.template_name,
             {
                 **self.base_context,
+                **self.get_revision_context(
+                    page_translations, revisions, revision.version
+                ),
                 "page": page,
-                "page_translations": page_translations,
-                "api_revision": page_translations.filter(status=status.PUBLIC).first(),
-                "selected_revision": revision,
                 "language": language,
             },
         )
+
+    @staticmethod
+    def get_revision_context(page_translations, revisions, selected_version):
+        """
+        Get the revisions for the template. Only the selected revision and its predecessor (which is needed for the
+        diff) are loaded with their text (and restored if they are compacted), all other revisions are shown without
+        their content. Since old revisions may have been archived, the predecessor is not necessarily the previous
+        version and the slider of the template uses the position of the revisions instead of their versions.
+
+        :param page_translations: All revisions of the page translation
+        :type page_translations: ~django.db.models.query.QuerySet [ ~cms.models.pages.page_translation.PageTranslation ]
+
+        :param revisions: All revisions without their content (ordered by descending version)
+        :type revisions: list [ ~cms.models.pages.page_translation.PageTranslation ]
+
+        :param selected_version: The version of the selected revision
+        :type selected_version: int
+
+        :return: The template context (or ``None`` if the selected revision does not exist)
+        :rtype: dict
+        """
+        previous_version = next(
+            (
+                revision.version
+                for revision in revisions
+                if revision.version < selected_version
+            ),
+            None,
+        )
+        loaded_revisions = {
+            revision.version: revision
+            for revision in page_translations.filter(
+                version__in=[selected_version, previous_version]
+            ).select_related("creator")
+        }
+        if selected_version not in loaded_revisions:
+            return None
+        load_revision_texts(list(loaded_revisions.values()))
+        revisions = [
+            loaded_revisions.get(revision.version, revision) for revision in revisions
+        ]
+        return {
+            "page_translations": revisions,
+            "api_revision": next(
+                (
+                    revision
+                    for revision in revisions
+                    if revision.status == status.PUBLIC
+                ),
+                None,
+            ),
+            "selected_revision": loaded_revisions[selected_version],
+            "selected_position": len(revisions)
+            - [revision.version for revision in revisions].index(selected_version),
+            "loaded_versions": list(loaded_revisions),
+        }
@@ -13,7 +13,7 @@ from django.views.generic import TemplateView
 from ...constants import status
 from ...decorators import region_permission_required
 from ...forms.pages import PageTranslationForm
-from ...models import Region, Language
+from ...models import Region
 
 
 @method_decorator(login_required, name="dispatch")
@@ -30,14 +30,10 @@ class PageSideBySideView(PermissionRequiredMixin, TemplateView):
         region = Region.get_current_region(request)
         page = region.pages.get(id=kwargs.get("page_id"))
 
-        target_language = Language.objects.get(code=kwargs.get("language_code"))
-        source_language_node = region.language_tree_nodes.get(
-            language=target_language
-        ).parent
+        target_language = region.get_language_or_404(kwargs.get("language_code"))
+        source_language = region.language_tree.get_parent_language(target_language.code)
 
-        if source_language_node:
-            source_language = source_language_node.language
-        else:
+        if not source_language:
             messages.error(
                 request,
                 _(
@@ -100,15 +96,11 @@ class PageSideBySideView(PermissionRequiredMixin, TemplateView):
             )
             raise PermissionDenied
 
-        target_language = Language.objects.get(code=kwargs.get("language_code"))
-        source_language_node = region.language_tree_nodes.get(
-            language=target_language
-        ).parent
+        target_language = region.get_language_or_404(kwargs.get("language_code"))
+        source_language = region.language_tree.get_parent_language(target_language.code)
 
-        if source_language_node:
-            source_page_translation = page.get_translation(
-                source_language_node.language.code
-            )
+        if source_language:
+            source_page_translation = page.get_translation(source_language.code)
         else:
             messages.error(
                 request,
@@ -132,7 +124,7 @@ class PageSideBySideView(PermissionRequiredMixin, TemplateView):
                 request,
                 _(
                     "You cannot use the side-by-side-view if the source translation (in this case {source_language}) does not exist."
-                ).format(source_language=source_language_node.language.translated_name),
+                ).format(source_language=source_language.translated_name),
             )
             return redirect(
                 "edit_page",
@@ -7,7 +7,8 @@ from django.utils.translation import ugettext as _
 from django.views.generic import TemplateView
 
 from ...decorators import region_permission_required
-from ...models import Region, Language
+from ...models import Region
+from ...utils.translation_loader import get_translation_loader
 
 
 @method_decorator(login_required, name="dispatch")
@@ -32,7 +33,7 @@ class PageTreeView(PermissionRequiredMixin, TemplateView):
         # current language
         language_code = kwargs.get("language_code")
         if language_code:
-            language = Language.objects.get(code=language_code)
+            language = region.get_language_or_404(language_code)
         elif region.default_language:
             return redirect(
                 "pages",
@@ -58,12 +59,16 @@ class PageTreeView(PermissionRequiredMixin, TemplateView):
                 request, _("You don't have the permission to edit or create pages.")
             )
 
+        pages = region.pages.filter(archived=self.archived)
+        # Load the translations of all pages at once
+        get_translation_loader().register(pages)
+
         return render(
             request,
             self.template_name,
             {
                 "current_menu_item": "pages",
-                "pages": region.pages.filter(archived=self.archived),
+                "pages": pages,
                 "archived_count": region.pages.filter(archived=True).count(),
                 "language": language,
                 "languages": region.languages,
@@ -9,7 +9,7 @@ from django.contrib import messages
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth.mixins import PermissionRequiredMixin
 from django.core.exceptions import PermissionDenied
-from django.shortcuts import render, redirect, get_object_or_404
+from django.shortcuts import render, redirect
 from django.urls import reverse
 from django.utils.decorators import method_decorator
 from django.utils.translation import ugettext as _
@@ -35,7 +35,7 @@ class PageView(PermissionRequiredMixin, TemplateView):
     def get(self, request, *args, **kwargs):
 
         region = Region.get_current_region(request)
-        language = get_object_or_404(region.languages, code=kwargs.get("language_code"))
+        language = region.get_language_or_404(kwargs.get("language_code"))
 
         # get page and translation objects if they exist
         page = region.pages.filter(id=kwargs.get("page_id")).first()
@@ -123,7 +123,7 @@ class PageView(PermissionRequiredMixin, TemplateView):
     def post(self, request, *args, **kwargs):
 
         region = Region.get_current_region(request)
-        language = get_object_or_404(region.languages, code=kwargs.get("language_code"))
+        language = region.get_language_or_404(kwargs.get("language_code"))
 
         page_instance = region.pages.filter(id=kwargs.get("page_id")).first()
         page_translation_instance = PageTranslation.objects.filter(
@@ -255,21 +255,24 @@ class PageView(PermissionRequiredMixin, TemplateView):
         :rtype: list
         """
         side_by_side_language_options = []
-        for language_node in region.language_tree_nodes.all():
-            if language_node.parent:
-                source_translation = PageTranslation.objects.filter(
-                    page=page,
-                    language=language_node.parent.language,
-                )
+        language_tree = region.language_tree
+        translated_language_ids = (
+            set(page.translations.values_list("language_id", flat=True))
+            if page
+            else set()
+        )
+        for target_language in language_tree.languages:
+            source_language = language_tree.get_parent_language(target_language.code)
+            if source_language:
                 side_by_side_language_options.append(
                     {
-                        "value": language_node.language.code,
+                        "value": target_language.code,
                         "label": _("{source_language} to {target_language}").format(
-                            source_language=language_node.parent.language.translated_name,
-                            target_language=language_node.language.translated_name,
+                            source_language=source_language.translated_name,
+                            target_language=target_language.translated_name,
                         ),
-                        "selected": language_node.language == language,
-                        "disabled": not source_translation.exists(),
+                        "selected": target_language == language,
+                        "disabled": source_language.id not in translated_language_ids,
                     }
                 )
         return side_by_side_language_options
@@ -7,7 +7,8 @@ from django.utils.translation import ugettext as _
 from django.views.generic import TemplateView
 
 from ...decorators import region_permission_required
-from ...models import Region, Language
+from ...models import Region
+from ...utils.translation_loader import get_translation_loader
 
 
 @method_decorator(login_required, name="dispatch")
@@ -32,7 +33,7 @@ class POIListView(PermissionRequiredMixin, TemplateView):
         # current language
         language_code = kwargs.get("language_code")
         if language_code:
-            language = Language.objects.get(code=language_code)
+            language = region.get_language_or_404(language_code)
         elif region.default_language:
             return redirect(
                 "pois",
@@ -64,12 +65,16 @@ class POIListView(PermissionRequiredMixin, TemplateView):
                 % {"language": region.default_language.translated_name},
             )
 
+        pois = region.pois.filter(archived=self.archived)
+        # Load the translations of all pois at once
+        get_translation_loader().register(pois)
+
         return render(
             request,
             self.template_name,
             {
                 "current_menu_item": "pois",
-                "pois": region.pois.filter(archived=self.archived),
+                "pois": pois,
                 "archived_count": region.pois.filter(archived=True).count(),
                 "language": language,
                 "languages": region.languages,
@@ -14,7 +14,7 @@ from django.views.generic import TemplateView
 from ...constants import status
 from ...decorators import region_permission_required
 from ...forms.pois import POIForm, POITranslationForm
-from ...models import POI, POITranslation, Region, Language
+from ...models import POI, POITranslation, Region
 
 logger = logging.getLogger(__name__)
 
@@ -31,7 +31,7 @@ class POIView(PermissionRequiredMixin, TemplateView):
     def get(self, request, *args, **kwargs):
 
         region = Region.get_current_region(request)
-        language = Language.objects.get(code=kwargs.get("language_code"))
+        language = region.get_language_or_404(kwargs.get("language_code"))
 
         # get poi and translation objects if they exist
         poi = POI.objects.filter(id=kwargs.get("poi_id")).first()
@@ -65,7 +65,7 @@ class POIView(PermissionRequiredMixin, TemplateView):
     def post(self, request, *args, **kwargs):
 
         region = Region.get_current_region(request)
-        language = Language.objects.get(code=kwargs.get("language_code"))
+        language = region.get_language_or_404(kwargs.get("language_code"))
 
         poi_instance = POI.objects.filter(id=kwargs.get("poi_id")).first()
         poi_translation_instance = POITranslation.objects.filter(
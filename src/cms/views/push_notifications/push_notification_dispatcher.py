@@ -0,0 +1,264 @@
+"""
+Module for the database-backed dispatch queue of push notifications.
+The :class:`~cms.models.push_notifications.push_notification_delivery.PushNotificationDelivery` objects with status
+``PENDING`` form the queue, which is processed by the ``dispatch_push_notifications`` management command. Multiple
+dispatchers can run in parallel, because each of them claims its deliveries with a lease before sending them.
+
+Scheduled push notifications are handed to the queue by the ``schedule_push_notifications`` management command.
+"""
+import logging
+from collections import defaultdict
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from .push_notification_sender import PushNotificationSender
+from ...constants import push_notifications as pnt_const
+from ...models import (
+    PushNotification,
+    PushNotificationDelivery,
+    PushNotificationTranslation,
+)
+
+logger = logging.getLogger(__name__)
+
+#: How often the delivery of a translation is attempted before it is marked as failed
+MAX_DELIVERY_ATTEMPTS = 3
+#: The delay before the first retry of a failed delivery (doubled for each further attempt)
+RETRY_DELAY = timedelta(minutes=1)
+#: How long claimed deliveries are reserved for a dispatcher before other dispatchers may claim them again
+DELIVERY_LEASE_TIME = timedelta(minutes=10)
+
+
+def is_queued(push_notification):
+    """
+    Check whether the push notification has pending deliveries
+
+    :param push_notification: the push notification
+    :type push_notification: ~cms.models.push_notifications.push_notification.PushNotification
+
+    :return: Whether the push notification is queued for sending
+    :rtype: bool
+    """
+    return PushNotificationDelivery.objects.filter(
+        translation__push_notification=push_notification,
+        status__in=[pnt_const.PENDING, pnt_const.SENDING],
+    ).exists()
+
+
+def enqueue_push_notification(push_notification):
+    """
+    Queue all translations of a push notification which would be sent by
+    :class:`~cms.views.push_notifications.push_notification_sender.PushNotificationSender`
+
+    :param push_notification: the push notification that should be sent
+    :type push_notification: ~cms.models.push_notifications.push_notification.PushNotification
+
+    :return: The created deliveries (empty if the push notification is already queued)
+    :rtype: list [ ~cms.models.push_notifications.push_notification_delivery.PushNotificationDelivery ]
+    """
+    with transaction.atomic():
+        # Lock the push notification to prevent that it is queued twice by concurrent requests
+        PushNotification.objects.select_for_update().get(id=push_notification.id)
+        if is_queued(push_notification):
+            return []
+        push_sender = PushNotificationSender(push_notification)
+        deliveries = PushNotificationDelivery.objects.bulk_create(
+            [
+                PushNotificationDelivery(translation=pnt)
+                for pnt in push_sender.prepared_pnts
+            ]
+        )
+    logger.info(
+        "Queued %d translations of push notification %d",
+        len(deliveries),
+        push_notification.id,
+    )
+    return deliveries
+
+
+def claim_pending_deliveries(batch_size=50):
+    """
+    Claim a batch of due deliveries for the current dispatcher. The deliveries are selected with ``SELECT ... FOR
+    UPDATE SKIP LOCKED`` and marked as ``SENDING`` with a lease in a short transaction, so concurrent dispatchers never
+    claim the same delivery. Deliveries whose lease has expired (e.g. because their dispatcher crashed) are claimed
+    again.
+
+    :param batch_size: the maximum number of deliveries which are claimed
+    :type batch_size: int
+
+    :return: The claimed deliveries
+    :rtype: list [ ~cms.models.push_notifications.push_notification_delivery.PushNotificationDelivery ]
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        deliveries = list(
+            PushNotificationDelivery.objects.select_for_update(
+                skip_locked=True, of=("self",)
+            )
+            .filter(
+                Q(status=pnt_const.PENDING, next_attempt_at__lte=now)
+                | Q(status=pnt_const.SENDING, leased_until__lt=now)
+            )
+            .select_related("translation")
+            .order_by("next_attempt_at")[:batch_size]
+        )
+        for delivery in deliveries:
+            delivery.status = pnt_const.SENDING
+            delivery.leased_until = now + DELIVERY_LEASE_TIME
+        PushNotificationDelivery.objects.bulk_update(
+            deliveries, ["status", "leased_until"]
+        )
+    return deliveries
+
+
+def dispatch_pending_deliveries(batch_size=50):
+    """
+    Send a batch of due deliveries. The deliveries are claimed in a short transaction (see
+    :func:`claim_pending_deliveries`), sent without holding any database locks and their results are saved in a
+    second transaction.
+
+    :param batch_size: the maximum number of deliveries which are sent
+    :type batch_size: int
+
+    :return: The number of processed deliveries
+    :rtype: int
+    """
+    deliveries = claim_pending_deliveries(batch_size)
+    if not deliveries:
+        return 0
+    deliveries_by_push_notification = defaultdict(list)
+    for delivery in deliveries:
+        deliveries_by_push_notification[
+            delivery.translation.push_notification_id
+        ].append(delivery)
+    sent_push_notification_ids = []
+    for push_notification in PushNotification.objects.filter(
+        id__in=deliveries_by_push_notification
+    ).select_related("region", "channel"):
+        if deliver(
+            push_notification, deliveries_by_push_notification[push_notification.id]
+        ):
+            sent_push_notification_ids.append(push_notification.id)
+    with transaction.atomic():
+        PushNotificationDelivery.objects.bulk_update(
+            deliveries,
+            [
+                "status",
+                "attempts",
+                "last_error",
+                "next_attempt_at",
+                "leased_until",
+                "last_updated",
+            ],
+        )
+        # The status of the individual translations is tracked by their deliveries
+        PushNotification.objects.filter(id__in=sent_push_notification_ids).update(
+            sent_date=timezone.now()
+        )
+    return len(deliveries)
+
+
+def deliver(push_notification, deliveries):
+    """
+    Send the given deliveries of a push notification and update their status (without saving them). Failed deliveries
+    are retried with exponential backoff until :data:`MAX_DELIVERY_ATTEMPTS` is reached.
+
+    :param push_notification: the push notification that should be sent
+    :type push_notification: ~cms.models.push_notifications.push_notification.PushNotification
+
+    :param deliveries: the claimed deliveries of the push notification
+    :type deliveries: list [ ~cms.models.push_notifications.push_notification_delivery.PushNotificationDelivery ]
+
+    :return: Whether at least one delivery was successful
+    :rtype: bool
+    """
+    push_sender = PushNotificationSender(push_notification)
+    prepared_pnts = {pnt.id: pnt for pnt in push_sender.prepared_pnts}
+    if push_sender.auth_key is None:
+        results = {}
+    else:
+        results = push_sender.send(
+            [
+                prepared_pnts[delivery.translation_id]
+                for delivery in deliveries
+                if delivery.translation_id in prepared_pnts
+            ]
+        )
+    now = timezone.now()
+    for delivery in deliveries:
+        delivery.attempts += 1
+        delivery.last_updated = now
+        delivery.leased_until = None
+        pnt = prepared_pnts.get(delivery.translation_id)
+        if pnt is None:
+            delivery.status = pnt_const.FAILED
+            delivery.last_error = "The translation is empty"
+        elif results.get(pnt.language.code):
+            delivery.status = pnt_const.SENT
+            delivery.last_error = ""
+        else:
+            if delivery.attempts >= MAX_DELIVERY_ATTEMPTS:
+                delivery.status = pnt_const.FAILED
+            else:
+                delivery.status = pnt_const.PENDING
+                delivery.next_attempt_at = now + RETRY_DELAY * 2 ** (
+                    delivery.attempts - 1
+                )
+            delivery.last_error = push_sender.errors.get(
+                pnt.language.code, "The FCM auth key is missing"
+            )[:1000]
+    return any(results.values())
+
+
+def get_next_scheduled_date():
+    """
+    Get the date and time of the push notification which is scheduled next (this uses the partial index on
+    ``scheduled_for``)
+
+    :return: The next scheduled date (``None`` if no push notification is scheduled)
+    :rtype: ~datetime.datetime
+    """
+    return (
+        PushNotification.objects.filter(scheduled_for__isnull=False)
+        .order_by("scheduled_for")
+        .values_list("scheduled_for", flat=True)
+        .first()
+    )
+
+
+def enqueue_due_push_notifications():
+    """
+    Queue all push notifications whose scheduled date has passed. The scheduled date is cleared in the same transaction
+    in which the deliveries are created and the push notifications are locked with ``SELECT ... FOR UPDATE SKIP
+    LOCKED``, so each scheduled push notification is queued at most once, even with multiple schedulers.
+    Push notifications whose required texts are missing are not queued, just like when they are sent manually.
+
+    :return: The number of queued push notifications
+    :rtype: int
+    """
+    queued = 0
+    with transaction.atomic():
+        due_push_notifications = (
+            PushNotification.objects.select_for_update(skip_locked=True)
+            .filter(scheduled_for__lte=timezone.now())
+            .order_by("scheduled_for")
+        )
+        for push_notification in due_push_notifications:
+            push_notification.scheduled_for = None
+            push_notification.save(update_fields=["scheduled_for"])
+            try:
+                is_valid = PushNotificationSender(push_notification).is_valid()
+            except PushNotificationTranslation.DoesNotExist:
+                is_valid = False
+            if not is_valid:
+                logger.warning(
+                    "Scheduled push notification %d is invalid and was not sent",
+                    push_notification.id,
+                )
+                continue
+            if enqueue_push_notification(push_notification):
+                queued += 1
+    return queued
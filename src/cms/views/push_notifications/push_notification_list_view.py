@@ -7,7 +7,8 @@ from django.utils.translation import ugettext as _
 from django.views.generic import TemplateView
 
 from ...decorators import region_permission_required
-from ...models import Language, Region
+from ...models import Region
+from ...utils.translation_loader import get_translation_loader
 
 
 @method_decorator(login_required, name="dispatch")
@@ -26,7 +27,7 @@ class PushNotificationListView(PermissionRequiredMixin, TemplateView):
         # current language
         language_code = kwargs.get("language_code")
         if language_code:
-            language = Language.objects.get(code=language_code)
+            language = region.get_language_or_404(language_code)
         elif region.default_language:
             return redirect(
                 "push_notifications",
@@ -49,12 +50,16 @@ class PushNotificationListView(PermissionRequiredMixin, TemplateView):
                 }
             )
 
+        push_notifications = region.push_notifications.all()
+        # Load the translations of all push notifications at once
+        get_translation_loader().register(push_notifications)
+
         return render(
             request,
             self.template_name,
             {
                 **self.base_context,
-                "push_notifications": region.push_notifications.all(),
+                "push_notifications": push_notifications,
                 "language": language,
                 "languages": region.languages,
             },
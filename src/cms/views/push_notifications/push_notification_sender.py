@@ -2,23 +2,47 @@
 Module for sending Push Notifications
 """
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import requests
+from requests.adapters import HTTPAdapter
 
 from django.conf import settings
 
-from ...models import Configuration
 from ...models import PushNotificationTranslation
 from ...constants import push_notifications as pnt_const
+from ...utils.configuration_utils import get_configuration
+
+#: The maximum number of concurrent requests to FCM per push notification
+FCM_MAX_WORKERS = 8
+
+#: The HTTP session which is shared between all senders, so connections to FCM are kept alive and reused
+fcm_session = requests.Session()
+fcm_session.mount("http://", HTTPAdapter(pool_maxsize=FCM_MAX_WORKERS))
+fcm_session.mount("https://", HTTPAdapter(pool_maxsize=FCM_MAX_WORKERS))
+
 
 # pylint: disable=too-few-public-methods
 class PushNotificationSender:
     """
     Sends push notifications via FCM HTTP API.
     Definition: https://firebase.google.com/docs/cloud-messaging/http-server-ref#downstream-http-messages-json
+
+    The translations are sent concurrently. Requests which fail because of a connection error, a rate limit (HTTP 429)
+    or a server error (HTTP 5xx) are retried with exponential backoff.
     """
 
     logger = logging.getLogger(__name__)
     fcm_url = "https://fcm.googleapis.com/fcm/send"
+    #: The timeout of a single request (in seconds)
+    timeout = 10
+    #: How often a failed request is retried
+    max_retries = 3
+    #: The delay before the first retry (in seconds), which is doubled for each further retry
+    backoff_factor = 0.5
+    #: The HTTP status codes of responses which are retried
+    retry_status_codes = (429, 500, 502, 503, 504)
 
     def __init__(self, push_notification):
         """
@@ -29,7 +53,13 @@ class PushNotificationSender:
         """
         self.push_notification = push_notification
         self.prepared_pnts = []
-        self.primary_pnt = PushNotificationTranslation.objects.get(
+        #: The outcome of the last call of :meth:`send_all` with the language codes as keys
+        self.results = {}
+        #: The errors of failed deliveries with the language codes as keys
+        self.errors = {}
+        self.primary_pnt = PushNotificationTranslation.objects.select_related(
+            "language"
+        ).get(
             push_notification=push_notification,
             language=push_notification.region.default_language,
         )
@@ -42,9 +72,13 @@ class PushNotificationSender:
         """
         Load push notification translations in other languages
         """
-        secondary_pnts = PushNotificationTranslation.objects.filter(
-            push_notification=self.push_notification
-        ).exclude(id=self.primary_pnt.id)
+        secondary_pnts = (
+            PushNotificationTranslation.objects.filter(
+                push_notification=self.push_notification
+            )
+            .exclude(id=self.primary_pnt.id)
+            .select_related("language")
+        )
         for secondary_pnt in secondary_pnts:
             if (
                 secondary_pnt.title == ""
@@ -52,7 +86,6 @@ class PushNotificationSender:
             ):
                 secondary_pnt.title = self.primary_pnt.title
                 secondary_pnt.text = self.primary_pnt.text
-                self.prepared_pnts.append(secondary_pnt)
             if len(secondary_pnt.title) > 0:
                 self.prepared_pnts.append(secondary_pnt)
 
@@ -65,6 +98,12 @@ class PushNotificationSender:
         """
         if self.auth_key is None:
             return False
+        # The translation in the default language of the region is required
+        if not self.primary_pnt.title:
+            self.logger.info(
+                "Push Notification Translation invalid: %s", str(self.primary_pnt)
+            )
+            return False
         for pnt in self.prepared_pnts:
             if not pnt.title:
                 self.logger.info("Push Notification Translation invalid: %s", str(pnt))
@@ -79,21 +118,24 @@ class PushNotificationSender:
         :rtype: str
         """
         fcm_auth_config_key = "fcm_auth_key"
-        auth_key = Configuration.objects.filter(key=fcm_auth_config_key)
-        if auth_key.exists():
+        auth_key = get_configuration(fcm_auth_config_key)
+        if auth_key is not None:
             self.logger.info("Got fcm_auth_key from database")
-            return auth_key.first().value
+            return auth_key
         self.logger.info(
             "Could not get %s from configuration database", fcm_auth_config_key
         )
         return None
 
-    def send_pn(self, pnt):
+    def get_payload(self, pnt):
         """
-        Send single push notification translation
+        Prepare the FCM message of a single push notification translation
 
         :param pnt: the prepared push notification translation to be sent
         :type pnt: ~cms.models.push_notifications.push_notification_translation.PushNotificationTranslation
+
+        :return: the message which can be sent to FCM
+        :rtype: dict
         """
         if settings.DEBUG:
             blog_id = (
@@ -101,7 +143,7 @@ class PushNotificationSender:
             )  # Testumgebung Blog ID - prevent sending PNs to actual users
         else:
             blog_id = self.push_notification.region.id
-        payload = {
+        return {
             "to": f"/topics/{blog_id}-{pnt.language.code}-{self.push_notification.channel}",
             "notification": {"title": pnt.title, "body": pnt.text},
             "data": {
@@ -109,27 +151,130 @@ class PushNotificationSender:
                 "city": self.push_notification.region.slug,
             },
         }
+
+    def send_pn(self, pnt):
+        """
+        Send single push notification translation
+
+        :param pnt: the prepared push notification translation to be sent
+        :type pnt: ~cms.models.push_notifications.push_notification_translation.PushNotificationTranslation
+
+        :raises ~requests.exceptions.RequestException: If FCM could not be reached after all retries
+
+        :return: The last response of FCM
+        :rtype: ~requests.Response
+        """
+        return self.post_payload(self.get_payload(pnt))
+
+    def post_payload(self, payload):
+        """
+        Post a message to FCM and retry on connection errors, rate limits and server errors.
+        This method does not access the database, so it can be executed in worker threads.
+
+        :param payload: the message which should be sent
+        :type payload: dict
+
+        :raises ~requests.exceptions.RequestException: If FCM could not be reached after all retries
+
+        :return: The last response of FCM
+        :rtype: ~requests.Response
+        """
         headers = {"Authorization": f"key={self.auth_key}"}
-        return requests.post(self.fcm_url, json=payload, headers=headers)
+        for attempt in range(self.max_retries + 1):
+            delay = self.backoff_factor * 2 ** attempt
+            try:
+                response = fcm_session.post(
+                    self.fcm_url, json=payload, headers=headers, timeout=self.timeout
+                )
+            except requests.exceptions.RequestException as e:
+                if attempt == self.max_retries:
+                    raise
+                self.logger.info("Could not reach FCM, retrying: %s", e)
+            else:
+                if (
+                    response.status_code not in self.retry_status_codes
+                    or attempt == self.max_retries
+                ):
+                    return response
+                retry_after = response.headers.get("Retry-After", "")
+                if retry_after.isdigit():
+                    delay = max(delay, int(retry_after))
+                self.logger.info(
+                    "Received status %s from FCM, retrying in %s seconds",
+                    response.status_code,
+                    delay,
+                )
+            time.sleep(delay)
+        return None
+
+    def send_payload(self, language_code, payload):
+        """
+        Send the message of a single language and log the outcome
+
+        :param language_code: the code of the message's language
+        :type language_code: str
+
+        :param payload: the message which should be sent
+        :type payload: dict
+
+        :return: Success status
+        :rtype: bool
+        """
+        try:
+            res = self.post_payload(payload)
+        except requests.exceptions.RequestException as e:
+            self.logger.error(
+                "Could not send push notification in language %s: %s",
+                language_code,
+                e,
+            )
+            self.errors[language_code] = str(e)
+            return False
+        if res.status_code == 200:
+            self.logger.info(
+                "Message in language %s sent, id: %s",
+                language_code,
+                res.json().get("message_id"),
+            )
+            return True
+        self.logger.info(
+            "Received invalid response from FCM for push notification in language %s: %s, response body: %s",
+            language_code,
+            res.status_code,
+            res.text,
+        )
+        self.errors[language_code] = f"HTTP {res.status_code}: {res.text}"
+        return False
 
-    # pylint: disable=too-many-arguments
     def send_all(self):
         """
-        Send all prepared push notification translations
+        Send all prepared push notification translations concurrently.
+        The outcome for each language is stored in :attr:`results`.
 
         :return: Success status
         :rtype: bool
         """
-        status = True
-        for pnt in self.prepared_pnts:
-            res = self.send_pn(pnt)
-            if res.status_code == 200:
-                self.logger.info("Message sent, id: %s", res.json()["message_id"])
-            else:
-                status = False
-                self.logger.info(
-                    "Received invalid response from FCM for push notification: %s, response body: %s",
-                    res.status_code,
-                    res.text,
-                )
-        return status
+        self.results = self.send(self.prepared_pnts)
+        return all(self.results.values())
+
+    def send(self, pnts):
+        """
+        Send the given prepared push notification translations concurrently
+
+        :param pnts: the prepared push notification translations to be sent
+        :type pnts: list [ ~cms.models.push_notifications.push_notification_translation.PushNotificationTranslation ]
+
+        :return: The success status for each language code
+        :rtype: dict
+        """
+        # Prepare the messages in the current thread, so the worker threads do not need database connections
+        messages = [(pnt.language.code, self.get_payload(pnt)) for pnt in pnts]
+        if not messages:
+            return {}
+        with ThreadPoolExecutor(
+            max_workers=min(FCM_MAX_WORKERS, len(messages))
+        ) as executor:
+            outcomes = executor.map(
+                lambda message: self.send_payload(*message), messages
+            )
+            return dict(zip((language_code for language_code, _ in messages), outcomes))
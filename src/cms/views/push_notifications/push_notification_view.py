@@ -1,8 +1,6 @@
 """
 View for editing Push Notifications
 """
-from datetime import datetime
-
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth.mixins import PermissionRequiredMixin
@@ -13,13 +11,14 @@ from django.utils.translation import ugettext as _
 from django.views.generic import TemplateView
 from django.forms import modelformset_factory
 
+from .push_notification_dispatcher import enqueue_push_notification
 from .push_notification_sender import PushNotificationSender
 from ...decorators import region_permission_required
 from ...forms.push_notifications import (
     PushNotificationForm,
     PushNotificationTranslationForm,
 )
-from ...models import Language, PushNotification, PushNotificationTranslation, Region
+from ...models import PushNotification, PushNotificationTranslation, Region
 
 
 @method_decorator(login_required, name="dispatch")
@@ -49,10 +48,12 @@ class PushNotificationView(PermissionRequiredMixin, TemplateView):
             id=kwargs.get("push_notification_id")
         ).first()
         region = Region.get_current_region(request)
-        language = Language.objects.get(code=kwargs.get("language_code"))
+        language = region.get_language_or_404(kwargs.get("language_code"))
         num_languages = len(region.languages)
         if push_notification is not None:
-            pn_form = PushNotificationForm(instance=push_notification)
+            pn_form = PushNotificationForm(
+                instance=push_notification, user=request.user
+            )
             PNTFormset = modelformset_factory(
                 PushNotificationTranslation,
                 form=PushNotificationTranslationForm,
@@ -65,7 +66,7 @@ class PushNotificationView(PermissionRequiredMixin, TemplateView):
                 ).order_by("language")
             )
         else:
-            pn_form = PushNotificationForm()
+            pn_form = PushNotificationForm(user=request.user)
             initial_data = []
             for lang in region.languages:
                 lang_data = {"language": lang.id}
@@ -114,7 +115,7 @@ class PushNotificationView(PermissionRequiredMixin, TemplateView):
             raise PermissionDenied
 
         region = Region.get_current_region(request)
-        language = Language.objects.get(code=kwargs.get("language_code"))
+        language = region.get_language_or_404(kwargs.get("language_code"))
         num_languages = len(region.languages)
 
         PushNewsFormset = modelformset_factory(
@@ -123,7 +124,9 @@ class PushNotificationView(PermissionRequiredMixin, TemplateView):
             max_num=num_languages,
         )
         pnt_formset = PushNewsFormset(request.POST)
-        pn_form = PushNotificationForm(request.POST, instance=push_notification)
+        pn_form = PushNotificationForm(
+            request.POST, instance=push_notification, user=request.user
+        )
         if pn_form.is_valid():
             push_notification = pn_form.save(commit=False)
             push_notification.region = region
@@ -143,12 +146,18 @@ class PushNotificationView(PermissionRequiredMixin, TemplateView):
                 raise PermissionDenied
             push_sender = PushNotificationSender(push_notification)
             if push_sender.is_valid():
-                if push_sender.send_all():
-                    messages.success(request, _("Push Notification send successfully"))
-                    push_notification.sent_date = datetime.now()
-                    push_notification.save()
+                # Sending the push notification immediately replaces the schedule
+                if push_notification.scheduled_for:
+                    push_notification.scheduled_for = None
+                    push_notification.save(update_fields=["scheduled_for"])
+                if enqueue_push_notification(push_notification):
+                    messages.success(
+                        request, _("Push Notification was queued for sending")
+                    )
                 else:
-                    messages.error(request, _("Error while sending Push Notification"))
+                    messages.info(
+                        request, _("Push Notification is already queued for sending")
+                    )
             else:
                 messages.warning(
                     request, _("Required Push Notification texts are missing")
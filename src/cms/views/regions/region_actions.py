@@ -5,7 +5,7 @@ from django.shortcuts import redirect
 from django.utils.translation import ugettext as _
 
 from ...decorators import staff_required
-from ...models import Region
+from ...models import MediaBlob, Region
 
 
 @login_required
@@ -18,6 +18,8 @@ def delete_region(request, *args, **kwargs):
 
     region = Region.get_current_region(request)
     region.delete()
+    # Delete the blobs which were only referenced by the documents of the deleted region
+    MediaBlob.release_unreferenced()
 
     messages.success(request, _("Region was successfully deleted"))
 
@@ -18,7 +18,7 @@ class RegionListView(PermissionRequiredMixin, TemplateView):
     base_context = {"current_menu_item": "regions"}
 
     def get(self, request, *args, **kwargs):
-        regions = Region.objects.all()
+        regions = Region.objects.all().prefetch_related("duplications")
 
         return render(
             request, self.template_name, {**self.base_context, "regions": regions}
@@ -54,6 +54,13 @@ class RegionView(PermissionRequiredMixin, TemplateView):
             messages.success(request, _("Region was saved successfully"))
         else:
             messages.success(request, _("Region was created successfully"))
+            if region.duplications.exists():
+                messages.info(
+                    request,
+                    _(
+                        "The pages and media of the region are duplicated in the background."
+                    ),
+                )
 
         return redirect(
             "edit_region",
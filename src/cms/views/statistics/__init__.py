@@ -2,3 +2,4 @@
 Python standard Init-File
 """
 from .analytics_view import AnalyticsView
+from .statistics_actions import export_statistics_csv
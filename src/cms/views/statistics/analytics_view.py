@@ -1,119 +1,177 @@
 """Views related to the statistics module"""
 from datetime import date, timedelta
 
-# pylint: disable=redefined-builtin
-from requests.exceptions import ConnectionError, InvalidURL
-
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
+from django.db.models import Sum
+from django.db.models.functions import TruncMonth
 from django.shortcuts import render, redirect
 from django.utils.decorators import method_decorator
 from django.utils.translation import ugettext as _
 from django.views.generic import TemplateView
 
-from .matomo_api_manager import MatomoApiManager
 from ...decorators import region_permission_required
-from ...models import Region
+from ...models import Region, VisitorCount
 
 
 @method_decorator(login_required, name="dispatch")
 @method_decorator(region_permission_required, name="dispatch")
 class AnalyticsView(TemplateView):
     """
-    Class to create the statistic page, that can be found via -> "Statistiken"
+    Class to create the statistic page, that can be found via -> "Statistiken". The visitor counts are read from the
+    database, where they are imported by the ``import_statistics`` management command.
     """
 
     template_name = "statistics/statistics_dashboard.html"
     base_context = {"current_menu_item": "statistics"}
+    #: The colors of the languages in the chart
+    colors = [
+        "#7e1e9c",
+        "#15b01a",
+        "#0343df",
+        "#ff81c0",
+        "#653700",
+        "#e50000",
+        "#95d0fc",
+        "#029386",
+        "#f97306",
+        "#929591",
+    ]
 
     @staticmethod
-    def prepare_csv(languages, hits, dates):
+    def get_date_range(request):
+        """
+        Read the selected timerange from the query parameters (defaults to the last 30 days)
+
+        :param request: The current request
+        :type request: ~django.http.HttpRequest
+
+        :raises ValueError: If the start or end date is not a valid ISO date
+
+        :return: The first and the last day of the timerange
+        :rtype: tuple [ ~datetime.date, ~datetime.date ]
+        """
+        start_date = date.fromisoformat(
+            request.GET.get("start_date", str(date.today() - timedelta(days=30)))
+        )
+        end_date = date.fromisoformat(request.GET.get("end_date", str(date.today())))
+        return start_date, end_date
+
+    @staticmethod
+    def iter_visitors(region, languages, start_date, end_date, period):
+        """
+        Iterate over the imported visitor counts of a region. The counts are fetched with a single ordered query and
+        merged with the dates of the timerange, so days without stored counts are reported as zero and long
+        timeranges are never materialized at once.
+
+        :param region: The region
+        :type region: ~cms.models.regions.region.Region
+
+        :param languages: The languages whose visitors should be returned
+        :type languages: list [ ~cms.models.languages.language.Language ]
+
+        :param start_date: The first day of the timerange
+        :type start_date: ~datetime.date
+
+        :param end_date: The last day of the timerange
+        :type end_date: ~datetime.date
+
+        :param period: The granularity of the visitors (``"day"`` or ``"month"``)
+        :type period: str
+
+        :return: An iterator over the dates and the visitors of each language in the given order
+        :rtype: ~collections.abc.Iterator [ tuple [ ~datetime.date, list [ int ] ] ]
         """
-        Method to create CSV String from the API hits
+        visitor_counts = VisitorCount.objects.filter(
+            region=region, language__in=languages, date__range=(start_date, end_date)
+        )
+        if period == "month":
+            current_date = start_date.replace(day=1)
+            visitor_counts = (
+                visitor_counts.annotate(period=TruncMonth("date"))
+                .values_list("period", "language_id")
+                .annotate(Sum("visitors"))
+                .order_by("period")
+            )
+        else:
+            current_date = start_date
+            visitor_counts = visitor_counts.values_list(
+                "date", "language_id", "visitors"
+            ).order_by("date")
+        visitor_counts = visitor_counts.iterator()
+        visitor_count = next(visitor_counts, None)
+        while current_date <= end_date:
+            visitors = {language.id: 0 for language in languages}
+            while visitor_count and visitor_count[0] == current_date:
+                visitors[visitor_count[1]] = visitor_count[2]
+                visitor_count = next(visitor_counts, None)
+            yield current_date, list(visitors.values())
+            if period == "month":
+                current_date = (current_date + timedelta(days=31)).replace(day=1)
+            else:
+                current_date += timedelta(days=1)
+
+    @classmethod
+    def get_visitors(cls, region, languages, start_date, end_date, period):
         """
-        csv_row = "date"
-        csv_raw = ""
-        for l_value in languages:
-            csv_row += "," + l_value[1]
-        csv_raw += csv_row + ";"
-        for date_index, _ in enumerate(dates):
-            csv_row = ""
-            csv_row += str(dates[date_index]) + ","
-            for idy in range(0, len(languages)):
-                csv_row += str(hits[idy][2][date_index])
-                if idy < (len(languages) - 1):
-                    csv_row += ","
-            csv_row += ";"
-            csv_raw += str(csv_row)
-        return csv_raw
-
-    # pylint: disable=too-many-locals
+        Read the imported visitor counts of a region from the database (see :meth:`iter_visitors`)
+
+        :param region: The region
+        :type region: ~cms.models.regions.region.Region
+
+        :param languages: The languages whose visitors should be returned
+        :type languages: list [ ~cms.models.languages.language.Language ]
+
+        :param start_date: The first day of the timerange
+        :type start_date: ~datetime.date
+
+        :param end_date: The last day of the timerange
+        :type end_date: ~datetime.date
+
+        :param period: The granularity of the visitors (``"day"`` or ``"month"``)
+        :type period: str
+
+        :return: The formatted dates and a dict mapping the language ids to the visitors per date
+        :rtype: tuple [ list [ str ], dict ]
+        """
+        date_format = "%m-%Y" if period == "month" else "%d-%m-%Y"
+        dates = []
+        visitors = {language.id: [] for language in languages}
+        for current_date, counts in cls.iter_visitors(
+            region, languages, start_date, end_date, period
+        ):
+            dates.append(current_date.strftime(date_format))
+            for language, count in zip(languages, counts):
+                visitors[language.id].append(count)
+        return dates, visitors
+
     def get(self, request, *args, **kwargs):
         region_slug = kwargs.get("region_slug")
         region = Region.get_current_region(request)
-        start_date = request.GET.get(
-            "start_date", str(date.today() - timedelta(days=30))
-        )
-        end_date = request.GET.get("end_date", str(date.today()))
-        if (start_date == "") or (end_date == ""):
+        try:
+            start_date, end_date = self.get_date_range(request)
+        except ValueError:
             messages.error(request, _("Please enter a correct start and enddate"))
             return redirect("statistics", region_slug=region_slug)
 
-        languages = [
-            ["de", "Deutsch", "#7e1e9c"],
-            ["en", "Englisch", "#15b01a"],
-            ["ar", "Arabisch", "#0343df"],
-        ]
-
-        api_man = MatomoApiManager(
-            matomo_url=region.matomo_url,
-            matomo_api_key=region.matomo_token,
-            ssl_verify=True,
+        languages = region.languages
+        response_dates, visitors = self.get_visitors(
+            region, languages, start_date, end_date, request.GET.get("peri", "day")
         )
-        response_dates = []
-        response_hits = []
-        for lang in languages:
-            try:
-                api_hits = api_man.get_visitors_per_timerange(
-                    date_string=start_date + "," + end_date,
-                    region_id="2",
-                    period=request.GET.get("peri", "day"),
-                    lang=lang[0],
-                )
-                temp_hits = []
-            except ConnectionError:
-                messages.error(
-                    request, _("Connection to Matomo could not be established")
-                )
-                return redirect("dashboard", region_slug=region_slug)
-            except InvalidURL:
-                messages.error(
-                    request,
-                    _(
-                        "The url you have entered is invalid. Please check the corresponding settings."
-                    ),
-                )
-                return redirect("dashboard", region_slug=region_slug)
-            except TypeError:
-                messages.error(
-                    request,
-                    _(
-                        "There was an error during the establishment of a connection. Please check the region and the entered key."
-                    ),
-                )
-                return redirect("dashboard", region_slug=region_slug)
-            for single_day in api_hits:
-                temp_hits.append(single_day[1])
-            response_hits.append([lang[1], lang[2], temp_hits])
-        for single_day in api_hits:
-            response_dates.append(single_day[0])
+        response_hits = [
+            [
+                language.translated_name,
+                self.colors[index % len(self.colors)],
+                visitors[language.id],
+            ]
+            for index, language in enumerate(languages)
+        ]
 
         return render(
             request,
             self.template_name,
             {
                 **self.base_context,
-                "csv": self.prepare_csv(languages, response_hits, response_dates),
                 "dates": response_dates,
                 "hits": response_hits,
             },
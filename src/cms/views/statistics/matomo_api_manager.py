@@ -1,12 +1,33 @@
 """
 Helper class to interact with the Matomo API
 """
+import hashlib
 import re
+from datetime import date
+from urllib.parse import urlencode
+
 import requests
 
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+from django.core.cache import cache
+
+#: The HTTP session which is shared between all API managers, so connections to Matomo are kept alive and reused
+matomo_session = requests.Session()
+matomo_session.mount(
+    "http://", HTTPAdapter(max_retries=Retry(connect=3, backoff_factor=0.5))
+)
+matomo_session.mount(
+    "https://", HTTPAdapter(max_retries=Retry(connect=3, backoff_factor=0.5))
+)
+
+
+class MatomoException(Exception):
+    """
+    Custom exception class for errors returned by the Matomo API
+    """
+
 
 class MatomoApiManager:
     """
@@ -25,6 +46,10 @@ class MatomoApiManager:
     ssl_verify = True
     matomo_url = ""  # URL to Matomo-Instance
     matomo_api_key = ""  # Matomo API-key
+    timeout = 30  # Timeout of API requests in seconds
+    current_cache_timeout = (
+        5 * 60
+    )  # Cache timeout of results which include the current day in seconds
 
     def __init__(self, matomo_url, matomo_api_key, ssl_verify):
         """
@@ -35,9 +60,6 @@ class MatomoApiManager:
         """
         self.matomo_url = matomo_url
         self.matomo_api_key = matomo_api_key
-        self.matomo_api_key = (
-            "&token_auth=" + self.matomo_api_key
-        )  # concats token api-parameter
         self.ssl_verify = ssl_verify
         self.cleanmatomo_url()  # cleans matomo url for proper requests
 
@@ -46,7 +68,7 @@ class MatomoApiManager:
         Cleans Matomo-URL for proper requests.
         Checks ending slash and beginning http(s)://
         """
-        self.matomo_url = re.sub(r"/\/$/", "", self.matomo_url)  # Cuts "/"
+        self.matomo_url = re.sub(r"/$", "", self.matomo_url)  # Cuts "/"
 
         if re.match(r"^http://", self.matomo_url):  # replace it to "https://"
             self.matomo_url = re.sub("^http://", "", self.matomo_url)
@@ -62,8 +84,8 @@ class MatomoApiManager:
         :return: True or False
         """
         try:
-            http_code = requests.get(
-                self.matomo_url, verify=self.ssl_verify
+            http_code = matomo_session.get(
+                self.matomo_url, verify=self.ssl_verify, timeout=self.timeout
             ).status_code
             if http_code == 200:
                 return True
@@ -80,22 +102,146 @@ class MatomoApiManager:
         :param lang: String contains the language, that is called
         :return: List[Date, Hits]
         """
-        domain = self.matomo_url
-        api_key = self.matomo_api_key
-        url = f"""{domain}/index.php?date={date_string}&expanded=1
-        &filter_limit=-1&format=JSON&format_metrics=1
-        &idSite={region_id}&method=API.get&module=API&period={period}
-        &segment=pageUrl%253D@%25252F{lang}
-        %25252Fwp-json%25252F{api_key}"""
+        return self.get_visitors_per_language(date_string, region_id, period, [lang])[
+            lang
+        ]
 
-        session = requests.Session()
-        retry = Retry(connect=3, backoff_factor=0.5)
-        adapter = HTTPAdapter(max_retries=retry)
-        session.mount("http://", adapter)
-        session.mount("https://", adapter)
+    def get_visitors_per_language(self, date_string, region_id, period, languages):
+        """
+        Returns the total unique visitors in a timerange for multiple languages. All languages which are not cached
+        yet are fetched with a single bulk request. Results of closed timeranges are cached indefinitely, results of
+        timeranges which include the current day are cached for :attr:`current_cache_timeout` seconds.
+        :param date_string: String "yyyy-mm-dd,yyyy-mm-dd"
+        :param region_id: String
+        :param period: String "day", "week", "month", "year"
+        :param languages: List of the language codes, that are called
+        :raises MatomoException: If Matomo returns an error
+        :return: Dict of the language codes and their List[Date, Hits]
+        """
+        cache_keys = {
+            lang: "matomo-visitors-{}".format(
+                hashlib.sha256(
+                    "|".join(
+                        [self.matomo_url, str(region_id), date_string, period, lang]
+                    ).encode("utf-8")
+                ).hexdigest()
+            )
+            for lang in languages
+        }
+        cached_results = cache.get_many(cache_keys.values())
+        uncached_languages = [
+            lang for lang in languages if cache_keys[lang] not in cached_results
+        ]
+        results = {
+            lang: cached_results[cache_keys[lang]]
+            for lang in languages
+            if cache_keys[lang] in cached_results
+        }
+        if uncached_languages:
+            responses = self.bulk_request(
+                [
+                    {
+                        "method": "API.get",
+                        "idSite": region_id,
+                        "period": period,
+                        "date": date_string,
+                        "expanded": 1,
+                        "filter_limit": -1,
+                        "format_metrics": 1,
+                        "segment": f"pageUrl%3D@%252F{lang}%252Fwp-json%252F",
+                    }
+                    for lang in uncached_languages
+                ]
+            )
+            fetched_results = {
+                lang: self.parse_visitors(response, period)
+                for lang, response in zip(uncached_languages, responses)
+            }
+            end_date = date_string.split(",")[-1]
+            cache.set_many(
+                {cache_keys[lang]: result for lang, result in fetched_results.items()},
+                self.current_cache_timeout
+                if end_date in ("today", "now") or end_date >= str(date.today())
+                else None,
+            )
+            results.update(fetched_results)
+        return results
 
-        response = session.get(url).json()
+    def get_daily_visitors(self, start_date, end_date, region_id, languages):
+        """
+        Returns the unique visitors per day of multiple languages with a single bulk request. In contrast to
+        :meth:`get_visitors_per_language`, the results are not cached because they are meant to be stored locally.
+        :param start_date: The first day of the timerange
+        :param end_date: The last day of the timerange
+        :param region_id: The id of the site in Matomo
+        :param languages: List of the language codes, that are called
+        :raises MatomoException: If Matomo returns an error
+        :return: Dict of the language codes and their Dict[Date, Hits]
+        """
+        responses = self.bulk_request(
+            [
+                {
+                    "method": "VisitsSummary.getUniqueVisitors",
+                    "idSite": region_id,
+                    "period": "day",
+                    "date": f"{start_date},{end_date}",
+                    "segment": f"pageUrl%3D@%252F{lang}%252Fwp-json%252F",
+                }
+                for lang in languages
+            ]
+        )
+        return {
+            lang: {
+                date.fromisoformat(day): int(
+                    visitors.get("nb_uniq_visitors", 0)
+                    if isinstance(visitors, dict)
+                    else visitors or 0
+                )
+                for day, visitors in response.items()
+            }
+            for lang, response in zip(languages, responses)
+        }
+
+    def bulk_request(self, requests_params):
+        """
+        Sends multiple API requests to Matomo in a single HTTP request (see
+        https://developer.matomo.org/api-reference/reporting-api#advanced-api-request-bulk-request)
+        :param requests_params: List of the query parameters of the single requests
+        :raises MatomoException: If Matomo returns an error
+        :return: List of the responses in the order of the requests
+        """
+        data = {
+            "module": "API",
+            "method": "API.getBulkRequest",
+            "format": "JSON",
+            "token_auth": self.matomo_api_key,
+        }
+        for index, params in enumerate(requests_params):
+            data[f"urls[{index}]"] = urlencode(params)
+        response = matomo_session.post(
+            f"{self.matomo_url}/index.php",
+            data=data,
+            verify=self.ssl_verify,
+            timeout=self.timeout,
+        ).json()
+        if isinstance(response, dict) and response.get("result") == "error":
+            raise MatomoException(response.get("message"))
+        for single_response in response:
+            if (
+                isinstance(single_response, dict)
+                and single_response.get("result") == "error"
+            ):
+                raise MatomoException(single_response.get("message"))
+        return response
 
+    @staticmethod
+    def parse_visitors(response, period):
+        """
+        Converts the response of a visitors request to a list of dates and hits
+        :param response: Dict of the dates and their metrics
+        :param period: String "day", "week", "month", "year"
+        :return: List[Date, Hits]
+        """
         result = []
         for json_object in response:
             if period == "day":
@@ -0,0 +1,48 @@
+"""
+This module contains view actions for the statistics module
+"""
+from django.contrib import messages
+from django.contrib.auth.decorators import login_required
+from django.shortcuts import redirect
+from django.utils.translation import ugettext as _
+
+from .analytics_view import AnalyticsView
+from ...decorators import region_permission_required
+from ...models import Region
+from ...utils.csv_utils import stream_csv
+
+
+@login_required
+@region_permission_required
+def export_statistics_csv(request, region_slug):
+    """
+    Download the visitor statistics of all languages of a region in the selected timerange as CSV document
+
+    :param request: The current request
+    :type request: ~django.http.HttpRequest
+
+    :param region_slug: The slug of the current region
+    :type region_slug: str
+
+    :return: A streaming CSV response or a redirect to the statistics if the timerange is invalid
+    :rtype: ~django.http.StreamingHttpResponse
+    """
+    region = Region.get_current_region(request)
+    try:
+        start_date, end_date = AnalyticsView.get_date_range(request)
+    except ValueError:
+        messages.error(request, _("Please enter a correct start and enddate"))
+        return redirect("statistics", region_slug=region_slug)
+    period = request.GET.get("peri", "day")
+    date_format = "%Y-%m" if period == "month" else "%Y-%m-%d"
+    languages = region.languages
+    header = [_("Date")] + [language.translated_name for language in languages]
+
+    def rows():
+        yield header
+        for current_date, visitors in AnalyticsView.iter_visitors(
+            region, languages, start_date, end_date, period
+        ):
+            yield [current_date.strftime(date_format)] + visitors
+
+    return stream_csv(rows(), f"statistics_{region_slug}_{start_date}_{end_date}.csv")
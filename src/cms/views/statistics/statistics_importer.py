@@ -0,0 +1,112 @@
+"""
+This module contains the import of visitor statistics from Matomo into the local
+:class:`~cms.models.statistics.visitor_count.VisitorCount` table. The import is incremental: for each region and
+language, only the days after the most recent stored day (the high-water mark) are fetched.
+"""
+import logging
+from datetime import date, timedelta
+
+from django.db.models import Max
+
+from .matomo_api_manager import MatomoApiManager
+from ...models import VisitorCount
+
+logger = logging.getLogger(__name__)
+
+
+def get_import_start_dates(region, languages, first_date):
+    """
+    Determine the first day which has to be imported for each language of a region
+
+    :param region: The region
+    :type region: ~cms.models.regions.region.Region
+
+    :param languages: The languages of the region
+    :type languages: list [ ~cms.models.languages.language.Language ]
+
+    :param first_date: The first day which is imported for languages without any stored visitor counts
+    :type first_date: ~datetime.date
+
+    :return: A dict mapping the languages to the day after their high-water mark
+    :rtype: dict
+    """
+    high_water_marks = dict(
+        VisitorCount.objects.filter(region=region)
+        .values_list("language_id")
+        .annotate(Max("date"))
+    )
+    return {
+        language: max(high_water_marks[language.id] + timedelta(days=1), first_date)
+        if language.id in high_water_marks
+        else first_date
+        for language in languages
+    }
+
+
+def import_visitor_counts(region, end_date=None, max_days=365, chunk_days=31):
+    """
+    Import the daily visitor counts of all languages of a region from Matomo. Only closed days are imported, so the
+    stored counts never change afterwards. Languages with the same start date are fetched with a single bulk request
+    per chunk of ``chunk_days`` days.
+
+    :param region: The region whose statistics should be imported
+    :type region: ~cms.models.regions.region.Region
+
+    :param end_date: The last day which should be imported (defaults to yesterday)
+    :type end_date: ~datetime.date
+
+    :param max_days: The maximum number of days which are imported for languages without any stored visitor counts
+    :type max_days: int
+
+    :param chunk_days: The maximum number of days which are requested at once
+    :type chunk_days: int
+
+    :raises ~cms.views.statistics.matomo_api_manager.MatomoException: If Matomo returns an error
+
+    :return: The number of imported visitor counts
+    :rtype: int
+    """
+    if end_date is None:
+        end_date = date.today() - timedelta(days=1)
+    languages = list(region.languages)
+    start_dates = get_import_start_dates(
+        region, languages, end_date - timedelta(days=max_days - 1)
+    )
+    languages_per_start_date = {}
+    for language, start_date in start_dates.items():
+        languages_per_start_date.setdefault(start_date, []).append(language)
+    api_man = MatomoApiManager(
+        matomo_url=region.matomo_url,
+        matomo_api_key=region.matomo_token,
+        ssl_verify=region.matomo_ssl_verify,
+    )
+    imported = 0
+    for chunk_start, chunk_languages in sorted(languages_per_start_date.items()):
+        while chunk_start <= end_date:
+            chunk_end = min(chunk_start + timedelta(days=chunk_days - 1), end_date)
+            visitors = api_man.get_daily_visitors(
+                chunk_start,
+                chunk_end,
+                region.matomo_id,
+                [language.code for language in chunk_languages],
+            )
+            visitor_counts = VisitorCount.objects.bulk_create(
+                [
+                    VisitorCount(
+                        region=region, language=language, date=day, visitors=count
+                    )
+                    for language in chunk_languages
+                    for day, count in visitors[language.code].items()
+                    if chunk_start <= day <= chunk_end
+                ],
+                ignore_conflicts=True,
+            )
+            imported += len(visitor_counts)
+            logger.info(
+                "Imported visitor counts of region %s from %s to %s",
+                region.slug,
+                chunk_start,
+                chunk_end,
+            )
+            chunk_start = chunk_end + timedelta(days=1)
+    return imported
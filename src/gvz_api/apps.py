@@ -1,12 +1,14 @@
 """
 Configuration of GVZ API app
 """
-import sys
 import logging
 import json
+import threading
+
 import requests
 from django.apps import AppConfig
 from django.conf import settings
+from django.core.cache import cache
 
 logger = logging.getLogger(__name__)
 
@@ -17,33 +19,81 @@ class GvzApiConfig(AppConfig):
     """
 
     name = "gvz_api"
-    api_available = False
-
-    def ready(self):
-        """
-        Checking if API is available
-        """
-        # Only check availability if current command is "runserver"
-        if sys.argv[1] == "runserver":
-            if settings.GVZ_API_ENABLED:
-                try:
-                    response = requests.get(
-                        f"{settings.GVZ_API_URL}/search/expect_empty_json", timeout=3
-                    )
-                    # Require the response to be empty, otherwise it's probably an error
-                    assert not json.loads(response.text)
-                except (
-                    json.decoder.JSONDecodeError,
-                    requests.exceptions.RequestException,
-                    requests.exceptions.Timeout,
-                    AssertionError,
-                ):
-                    logger.info(
-                        "GVZ API is not available. You won't be able to "
-                        "automatically import coordinates and region aliases."
-                    )
-                else:
-                    self.api_available = True
-                    logger.debug("GVZ API is available.")
+    #: The cache key of the availability status
+    status_cache_key = "gvz-api-available"
+    #: The number of seconds after which the availability is checked again
+    probe_interval = 5 * 60
+    #: The timeout of the availability check in seconds
+    probe_timeout = 3
+
+    def __init__(self, app_name, app_module):
+        """
+        Initialize the state of the availability probe
+        """
+        super().__init__(app_name, app_module)
+        self.probe_lock = threading.Lock()
+        self.probe_thread = None
+        #: The result of the last probe (``None`` if the API was not probed yet)
+        self.last_status = None
+
+    @property
+    def api_available(self):
+        """
+        Whether the GVZ API is available. The status is cached for :attr:`probe_interval` seconds. If it is expired,
+        a background probe is started and the last known status is returned, so the caller is not blocked. Only if the
+        API was not probed yet in this process, the caller waits for the first probe (at most :attr:`probe_timeout`
+        seconds).
+
+        :return: Whether the GVZ API is enabled and available
+        :rtype: bool
+        """
+        if not settings.GVZ_API_ENABLED:
+            return False
+        status = cache.get(self.status_cache_key)
+        if status is None:
+            probe_thread = self.start_probe()
+            if self.last_status is None:
+                probe_thread.join(self.probe_timeout + 1)
+            return bool(self.last_status)
+        self.last_status = status
+        return status
+
+    def start_probe(self):
+        """
+        Start the availability check in a background thread unless it is already running
+
+        :return: The thread of the running probe
+        :rtype: ~threading.Thread
+        """
+        with self.probe_lock:
+            if not (self.probe_thread and self.probe_thread.is_alive()):
+                self.probe_thread = threading.Thread(target=self.probe, daemon=True)
+                self.probe_thread.start()
+            return self.probe_thread
+
+    def probe(self):
+        """
+        Check if the API is available and cache the result
+        """
+        # pylint: disable=import-outside-toplevel
+        from .utils import GvzApiWrapper, gvz_session
+
+        try:
+            response = gvz_session.get(
+                f"{GvzApiWrapper.api_url}/search/expect_empty_json",
+                timeout=self.probe_timeout,
+            )
+            # Require the response to be empty, otherwise it's probably an error
+            status = not json.loads(response.text)
+        except (json.decoder.JSONDecodeError, requests.exceptions.RequestException):
+            status = False
+        if status != self.last_status:
+            if status:
+                logger.info("GVZ API is available.")
             else:
-                logger.debug("GVZ API is not enabled.")
+                logger.info(
+                    "GVZ API is not available. You won't be able to "
+                    "automatically import coordinates and region aliases."
+                )
+        self.last_status = status
+        cache.set(self.status_cache_key, status, self.probe_interval)
@@ -0,0 +1,3 @@
+"""
+This package contains custom management commands of the GVZ API app (see :doc:`django:howto/custom-management-commands`).
+"""
@@ -0,0 +1,3 @@
+"""
+This package contains all custom management commands which can be executed with ``integreat-cms-cli <command>``.
+"""
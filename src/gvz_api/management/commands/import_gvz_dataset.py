@@ -0,0 +1,105 @@
+"""
+Management command to import the Gemeindeverzeichnis dataset from a local file
+"""
+import csv
+from itertools import islice
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from ...models import GvzDatasetEntry
+
+#: The columns of the dataset file
+COLUMNS = ("key", "name", "type", "longitude", "latitude", "parent_key")
+
+
+class Command(BaseCommand):
+    """
+    Replace the local Gemeindeverzeichnis dataset with the regions of a CSV file. The file needs a header row with the
+    columns ``key``, ``name``, ``type``, ``longitude``, ``latitude`` and ``parent_key``, where ``parent_key`` is the
+    key of the region which contains the row's region (empty for top-level regions).
+    """
+
+    help = "Import the Gemeindeverzeichnis dataset from a CSV file"
+
+    def add_arguments(self, parser):
+        """
+        Define the arguments of this command
+
+        :param parser: The argument parser
+        :type parser: ~django.core.management.base.CommandParser
+        """
+        parser.add_argument("path", help="The path of the CSV file")
+        parser.add_argument(
+            "--delimiter", default=",", help="The delimiter of the CSV file"
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="The number of regions which are inserted at once",
+        )
+
+    def handle(self, *args, **options):
+        """
+        Import the dataset in a single transaction, so lookups never see a partially imported dataset
+
+        :param args: The positional arguments
+        :type args: list
+
+        :param options: The parsed command line options
+        :type options: dict
+
+        :raises ~django.core.management.base.CommandError: If the file cannot be read or has invalid rows
+        """
+        try:
+            with open(options["path"], newline="", encoding="utf-8") as f:
+                reader = csv.DictReader(f, delimiter=options["delimiter"])
+                missing_columns = set(COLUMNS) - set(reader.fieldnames or ())
+                if missing_columns:
+                    raise CommandError(
+                        f"Missing columns: {', '.join(sorted(missing_columns))}"
+                    )
+                entries = (self.parse_row(row, reader.line_num) for row in reader)
+                imported = 0
+                with transaction.atomic():
+                    GvzDatasetEntry.objects.all().delete()
+                    while True:
+                        batch = list(islice(entries, options["batch_size"]))
+                        if not batch:
+                            break
+                        GvzDatasetEntry.objects.bulk_create(batch)
+                        imported += len(batch)
+        except OSError as e:
+            raise CommandError(e) from e
+        self.stdout.write(str(imported))
+
+    @staticmethod
+    def parse_row(row, line_num):
+        """
+        Convert a row of the dataset file to an entry
+
+        :param row: The row of the CSV file
+        :type row: dict
+
+        :param line_num: The line number of the row
+        :type line_num: int
+
+        :raises ~django.core.management.base.CommandError: If the row is invalid
+
+        :return: The (unsaved) entry
+        :rtype: ~gvz_api.models.GvzDatasetEntry
+        """
+        if not row["key"] or not row["name"]:
+            raise CommandError(f"Line {line_num}: Key and name are required")
+        try:
+            return GvzDatasetEntry(
+                key=row["key"],
+                name=row["name"],
+                type=row["type"],
+                longitude=float(row["longitude"]) if row["longitude"] else None,
+                latitude=float(row["latitude"]) if row["latitude"] else None,
+                parent_key=row["parent_key"] or "",
+            )
+        except ValueError as e:
+            raise CommandError(f"Line {line_num}: {e}") from e
@@ -0,0 +1,99 @@
+"""
+Data models of the GVZ API app
+"""
+from django.db import models
+from django.utils import timezone
+
+
+class GvzCacheEntry(models.Model):
+    """
+    Data model representing a cached response of the GVZ API. The entries are keyed by the requested path, which
+    contains the endpoint and the region key (e.g. ``details/09162000``).
+
+    :param id: The database id of the cache entry
+    :param path: The requested path relative to :setting:`GVZ_API_URL`
+    :param response: The JSON response of the GVZ API
+    :param fetched_date: The date and time when the response was fetched
+    """
+
+    path = models.CharField(max_length=255, unique=True)
+    response = models.TextField()
+    fetched_date = models.DateTimeField(default=timezone.now)
+
+    def __str__(self):
+        """
+        This overwrites the default Python __str__ method which would return <GvzCacheEntry object at 0xDEADBEEF>
+
+        :return: The string representation of the cache entry
+        :rtype: str
+        """
+        return self.path
+
+    class Meta:
+        """
+        This class contains additional meta configuration of the model class, see the
+        `official Django docs <https://docs.djangoproject.com/en/2.2/ref/models/options/>`_ for more information.
+
+        :param default_permissions: The default permissions for this model
+        :type default_permissions: tuple
+        """
+
+        default_permissions = ()
+
+
+class GvzDatasetEntry(models.Model):
+    """
+    Data model representing a region of the locally imported Gemeindeverzeichnis dataset (see the management command
+    ``import_gvz_dataset``). If the dataset is imported, region lookups are answered by
+    :class:`~gvz_api.utils.GvzLocalResolver` instead of the remote GVZ API.
+
+    :param id: The database id of the entry
+    :param key: The official ID of the region, i.e. Gemeindeschlüssel
+    :param name: The name of the region
+    :param type: The type of the region (e.g. ``Landkreis`` or ``Gemeinde``)
+    :param longitude: The longitude coordinate of an approximate center of the region
+    :param latitude: The latitude coordinate of an approximate center of the region
+    :param parent_key: The key of the region which contains this region
+    """
+
+    key = models.CharField(max_length=16, unique=True)
+    name = models.CharField(max_length=200, db_index=True)
+    type = models.CharField(max_length=100)
+    longitude = models.FloatField(null=True)
+    latitude = models.FloatField(null=True)
+    parent_key = models.CharField(max_length=16, blank=True, db_index=True)
+
+    def as_dict(self):
+        """
+        Dictionary representation of the entry in the format of the GVZ API
+
+        :return: key, name, type, longitude, latitude
+        :rtype: dict
+        """
+        return {
+            "key": self.key,
+            "name": self.name,
+            "type": self.type,
+            "longitude": self.longitude,
+            "latitude": self.latitude,
+        }
+
+    def __str__(self):
+        """
+        This overwrites the default Python __str__ method which would return <GvzDatasetEntry object at 0xDEADBEEF>
+
+        :return: The string representation of the entry
+        :rtype: str
+        """
+        return f"{self.name} ({self.key})"
+
+    class Meta:
+        """
+        This class contains additional meta configuration of the model class, see the
+        `official Django docs <https://docs.djangoproject.com/en/2.2/ref/models/options/>`_ for more information.
+
+        :param default_permissions: The default permissions for this model
+        :type default_permissions: tuple
+        """
+
+        default_permissions = ()
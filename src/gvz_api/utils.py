@@ -3,16 +3,31 @@ Helper classes for Gemeindeverzeichnis API
 """
 import logging
 import json
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
 import requests
+from requests.adapters import HTTPAdapter
+
+from django.apps import apps
 from django.conf import settings
+from django.utils import timezone
 from cms.constants import administrative_division
 
+from .models import GvzCacheEntry, GvzDatasetEntry
+
 logger = logging.getLogger(__name__)
 
+#: The HTTP session which is shared between all API wrappers, so connections to the GVZ API are kept alive and reused
+gvz_session = requests.Session()
+gvz_session.mount("http://", HTTPAdapter(pool_maxsize=settings.GVZ_API_MAX_WORKERS))
+gvz_session.mount("https://", HTTPAdapter(pool_maxsize=settings.GVZ_API_MAX_WORKERS))
+
 
 class GvzApiWrapper:
     """
-    Class that wraps around the GVZ (Gemeindeverzeichnis) API
+    Class that wraps around the GVZ (Gemeindeverzeichnis) API. All responses are stored in the database (see
+    :class:`~gvz_api.models.GvzCacheEntry`) and are only requested again after :setting:`GVZ_API_CACHE_TTL` seconds.
     """
 
     api_url = settings.GVZ_API_URL
@@ -20,6 +35,100 @@ class GvzApiWrapper:
     The URL to the external GVZ API
     """
 
+    def request_many(self, paths):
+        """
+        Get the responses of multiple API paths. Fresh responses are read from the cache with a single query, the
+        others are requested concurrently and stored in the cache. If a request fails, an expired cached response is
+        used if available.
+
+        :param paths: The requested paths relative to :setting:`GVZ_API_URL`
+        :type paths: list [ str ]
+
+        :raises ~requests.exceptions.RequestException: If a request fails and there is no cached response
+
+        :return: A dict mapping the paths to their decoded JSON responses
+        :rtype: dict
+        """
+        cache_entries = {
+            cache_entry.path: cache_entry
+            for cache_entry in GvzCacheEntry.objects.filter(path__in=set(paths))
+        }
+        expiry_date = timezone.now() - timedelta(seconds=settings.GVZ_API_CACHE_TTL)
+        responses = {
+            path: json.loads(cache_entry.response)
+            for path, cache_entry in cache_entries.items()
+            if cache_entry.fetched_date >= expiry_date
+        }
+        missing_paths = list(set(paths) - set(responses))
+        if not missing_paths:
+            return responses
+        # Only the HTTP requests are run in the worker threads, the cache is updated in the current thread
+        with ThreadPoolExecutor(
+            max_workers=min(settings.GVZ_API_MAX_WORKERS, len(missing_paths))
+        ) as executor:
+            results = executor.map(self.fetch, missing_paths)
+            fetched_entries = []
+            for path, result in zip(missing_paths, results):
+                if isinstance(result, requests.exceptions.RequestException):
+                    if path not in cache_entries:
+                        raise result
+                    logger.warning(
+                        "GVZ API: Using expired response for %s (%s)", path, result
+                    )
+                    responses[path] = json.loads(cache_entries[path].response)
+                    continue
+                responses[path] = result
+                cache_entry = cache_entries.get(path, GvzCacheEntry(path=path))
+                cache_entry.response = json.dumps(result)
+                cache_entry.fetched_date = timezone.now()
+                fetched_entries.append(cache_entry)
+        GvzCacheEntry.objects.bulk_update(
+            [cache_entry for cache_entry in fetched_entries if cache_entry.id],
+            ["response", "fetched_date"],
+        )
+        GvzCacheEntry.objects.bulk_create(
+            [cache_entry for cache_entry in fetched_entries if not cache_entry.id],
+            ignore_conflicts=True,
+        )
+        return responses
+
+    def request(self, path):
+        """
+        Get the response of a single API path (see :meth:`request_many`)
+
+        :param path: The requested path relative to :setting:`GVZ_API_URL`
+        :type path: str
+
+        :raises ~requests.exceptions.RequestException: If the request fails and there is no cached response
+
+        :return: The decoded JSON response
+        :rtype: list
+        """
+        return self.request_many([path])[path]
+
+    def fetch(self, path):
+        """
+        Request a single API path without using the cache. Errors are returned instead of raised, so this method can
+        be run in worker threads.
+
+        :param path: The requested path relative to :setting:`GVZ_API_URL`
+        :type path: str
+
+        :return: The decoded JSON response or the exception of a failed request
+        :rtype: list or ~requests.exceptions.RequestException
+        """
+        logger.info("GVZ API: Requesting %s", path)
+        try:
+            response = gvz_session.get(
+                f"{self.api_url}/{path}", timeout=settings.GVZ_API_TIMEOUT
+            )
+            response.raise_for_status()
+            return json.loads(response.text)
+        except json.decoder.JSONDecodeError as e:
+            return requests.exceptions.RequestException(e)
+        except requests.exceptions.RequestException as e:
+            return e
+
     def search(self, region_name):
         """
         Search for a region and return candidates
@@ -32,9 +141,7 @@ class GvzApiWrapper:
         """
 
         logger.info("Searching for %s", region_name)
-        response = requests.get(f"{self.api_url}/search/{region_name}")
-        regions = json.loads(response.text)
-        return regions
+        return self.request(f"search/{region_name}")
 
     def get_details(self, region_key):
         """
@@ -47,11 +154,22 @@ class GvzApiWrapper:
         :rtype: dict
         """
         logger.info("GVZ API: Details for %s", region_key)
-        response = requests.get(f"{self.api_url}/details/{region_key}")
-        region = json.loads(response.text)
+        return self.parse_details(self.request(f"details/{region_key}"))
+
+    @staticmethod
+    def parse_details(region):
+        """
+        Convert the response of the details endpoint
+
+        :param region: The JSON response of the details endpoint
+        :type region: list
+
+        :return: dictionary containing longitude, latitude, type, key, name
+        :rtype: dict
+        """
         if len(region) != 1:
             return None
-        region = region[0]
+        region = dict(region[0])
         if "," in region["name"]:
             region["name"] = region["name"].split(",")[0]
         return {
@@ -72,12 +190,45 @@ class GvzApiWrapper:
         :return: list of children dictionaries
         :rtype: list
         """
-        response = requests.get(f"{self.api_url}/searchcounty/{region_key}")
-        content = json.loads(response.text)
+        return self.parse_children(self.request(f"searchcounty/{region_key}"))
+
+    @staticmethod
+    def parse_children(content):
+        """
+        Convert the response of the county search endpoint
+
+        :param content: The JSON response of the county search endpoint
+        :type content: list
+
+        :return: list of children dictionaries
+        :rtype: list
+        """
         if content:
             return content[0]["children"]
         return []
 
+    def get_details_and_children(self, region_keys):
+        """
+        Get the details and children of multiple regions with concurrent requests
+
+        :param region_keys: official IDs for regions, i.e. Gemeindeschlüssel
+        :type region_keys: list [ str ]
+
+        :return: dict mapping the region keys to their details and list of children dictionaries
+        :rtype: dict
+        """
+        responses = self.request_many(
+            [f"details/{region_key}" for region_key in region_keys]
+            + [f"searchcounty/{region_key}" for region_key in region_keys]
+        )
+        return {
+            region_key: (
+                self.parse_details(responses[f"details/{region_key}"]),
+                self.parse_children(responses[f"searchcounty/{region_key}"]),
+            )
+            for region_key in region_keys
+        }
+
     @staticmethod
     def translate_type(region_type):
         """
@@ -146,8 +297,11 @@ class GvzApiWrapper:
         if region_type is None:
             return None
         results_type = []
+        responses = self.request_many(
+            [f"details/{region['key']}" for region in results_literal]
+        )
         for region in results_literal:
-            region_details = self.get_details(region["key"])
+            region_details = self.parse_details(responses[f"details/{region['key']}"])
             if region_details is None:
                 continue
             if self.filter_region_types(region_details):
@@ -155,11 +309,79 @@ class GvzApiWrapper:
                     results_type.append(region)
         if len(results_type) == 1:
             return results_type[0]
-        print(results_type)
         logger.info("GVZ API did not find type match for %s", region_name)
         return None
 
 
+class GvzLocalResolver(GvzApiWrapper):
+    """
+    Class that answers GVZ lookups from the locally imported Gemeindeverzeichnis dataset (see
+    :class:`~gvz_api.models.GvzDatasetEntry`). The responses have the same format as the ones of the GVZ API, so all
+    methods of :class:`GvzApiWrapper` return the same results.
+    """
+
+    def request_many(self, paths):
+        """
+        Answer multiple API paths with one query per endpoint
+
+        :param paths: The requested paths relative to :setting:`GVZ_API_URL`
+        :type paths: list [ str ]
+
+        :return: A dict mapping the paths to their responses
+        :rtype: dict
+        """
+        paths_per_endpoint = {}
+        for path in set(paths):
+            endpoint, argument = path.split("/", 1)
+            paths_per_endpoint.setdefault(endpoint, {})[argument] = path
+        responses = {}
+        for region_name, path in paths_per_endpoint.get("search", {}).items():
+            responses[path] = [
+                entry.as_dict()
+                for entry in GvzDatasetEntry.objects.filter(name__icontains=region_name)
+            ]
+        details_paths = paths_per_endpoint.get("details", {})
+        county_paths = paths_per_endpoint.get("searchcounty", {})
+        entries = {
+            entry.key: entry
+            for entry in GvzDatasetEntry.objects.filter(
+                key__in=set(details_paths) | set(county_paths)
+            )
+        }
+        for region_key, path in details_paths.items():
+            responses[path] = (
+                [entries[region_key].as_dict()] if region_key in entries else []
+            )
+        children = {region_key: [] for region_key in county_paths}
+        if county_paths:
+            for entry in GvzDatasetEntry.objects.filter(
+                parent_key__in=county_paths
+            ).order_by("key"):
+                children[entry.parent_key].append(entry.as_dict())
+        for region_key, path in county_paths.items():
+            responses[path] = (
+                [{**entries[region_key].as_dict(), "children": children[region_key]}]
+                if region_key in entries
+                else []
+            )
+        return responses
+
+
+def get_gvz_api():
+    """
+    Return the source for GVZ lookups: the local dataset if it is imported, otherwise the remote GVZ API if it is
+    available.
+
+    :return: The resolver or API wrapper (:obj:`None` if neither is available)
+    :rtype: ~gvz_api.utils.GvzApiWrapper
+    """
+    if GvzDatasetEntry.objects.exists():
+        return GvzLocalResolver()
+    if apps.get_app_config("gvz_api").api_available:
+        return GvzApiWrapper()
+    return None
+
+
 class GvzRegion:
     """
     Represents a region in the GVZ, initial values will be retrieved
@@ -173,40 +395,54 @@ class GvzRegion:
 
     :param region_type: administrative division type of region (choices: :mod:`cms.constants.administrative_division`), defaults to ``None``
     :type region_type: str, optional
+
+    :param api: The source of the region data (see :func:`get_gvz_api`), defaults to :class:`GvzApiWrapper`
+    :type api: ~gvz_api.utils.GvzApiWrapper, optional
     """
 
-    def __init__(self, region_key=None, region_name=None, region_type=None):
+    def __init__(self, region_key=None, region_name=None, region_type=None, api=None):
         """
         Load initial values for region from GVZ API
         """
+        self.key = region_key
+        self.name = None
+        self.longitude = None
+        self.latitude = None
+        self.children = []
+
         if region_key is None and region_name is None:
             return
 
-        api = GvzApiWrapper()
-        self.key = region_key
+        if api is None:
+            api = GvzApiWrapper()
         if region_name is not None and region_key == "":
             best_match = api.best_match(region_name, region_type)
             if best_match is not None:
                 self.key = best_match["key"]
 
-        self.name = None
-        self.longitude = None
-        self.latitude = None
-        self.children = []
-
         if self.key is None or self.key == "":
             return
 
-        details = api.get_details(self.key)
-        if details is None:
-            return
-        self.name = details["name"]
-        self.longitude = details["longitude"]
-        self.latitude = details["latitude"]
-
-        children = api.get_children(self.key)
-        for child in children:
-            self.children.append(GvzRegion(region_key=child["key"]))
+        # Load the region tree level by level, so all regions of one level are requested concurrently
+        level = [self]
+        while level:
+            details_and_children = api.get_details_and_children(
+                [region.key for region in level]
+            )
+            next_level = []
+            for region in level:
+                details, children = details_and_children[region.key]
+                if details is None:
+                    continue
+                region.name = details["name"]
+                region.longitude = details["longitude"]
+                region.latitude = details["latitude"]
+                for child in children:
+                    child_region = GvzRegion()
+                    child_region.key = child["key"]
+                    region.children.append(child_region)
+                next_level.extend(region.children)
+            level = next_level
 
     def as_dict(self):
         """